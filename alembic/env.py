@@ -10,6 +10,8 @@
 # - Importa os models para registrar no metadata
 # - Usa a URL do banco das configurações
 # - Suporta modo offline (gera SQL) e online (executa)
+# - Aceita uma conexão pronta em config.attributes["connection"]
+#   (ex: testes de integração migrando o banco de teste)
 # ===========================================================
 """
 Configuração do ambiente Alembic.
@@ -117,7 +119,16 @@ def run_migrations_online() -> None:
     
     Uso:
         alembic upgrade head
+
+    Com uma conexão em config.attributes["connection"] (chamada
+    pelo código, ex: command.upgrade dentro de run_sync), usa essa
+    conexão em vez de criar uma engine a partir da URL.
     """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     asyncio.run(run_async_migrations())
 
 
@@ -82,17 +82,19 @@ def upgrade() -> None:
     # 3. CRIAR ENUMS (PostgreSQL específico)
     # =========================================================
     # Cria tipos ENUM no PostgreSQL
+    # create_type=False: o create() explícito abaixo já cria o tipo;
+    # com True, o create_table tentaria criá-lo de novo (erro)
     order_status_enum = postgresql.ENUM(
         "pending", "confirmed", "processing", "shipped", "delivered", "cancelled",
         name="order_status",
-        create_type=True,
+        create_type=False,
     )
     order_status_enum.create(op.get_bind(), checkfirst=True)
     
     session_state_enum = postgresql.ENUM(
         "initial", "menu", "products", "order_status", "faq", "human_transfer", "closed",
         name="session_state",
-        create_type=True,
+        create_type=False,
     )
     session_state_enum.create(op.get_bind(), checkfirst=True)
     
@@ -0,0 +1,88 @@
+# ===========================================================
+# alembic/versions/002_order_number.py
+# ===========================================================
+# Adiciona o NÚMERO AMIGÁVEL do pedido (ex: "PED-123456").
+#
+# PASSOS:
+# 1. Cria a sequência order_number_seq (começa em 100000)
+# 2. Adiciona a coluna "number" (nullable, para poder preencher)
+# 3. Backfill: numera pedidos existentes por ordem de criação
+# 4. Ajusta a sequência para continuar após o último número
+# 5. Torna a coluna NOT NULL, com default e índice único
+#
+# REVERSÃO:
+# Remove índice, coluna e sequência (os números são perdidos)
+# ===========================================================
+"""
+Número amigável do pedido.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# Identificadores da revisão
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Mesmos valores de src/domain/services/order_number.py
+ORDER_NUMBER_START = 100000
+NUMBER_DEFAULT = "'PED-' || nextval('order_number_seq')"
+
+
+def upgrade() -> None:
+    """Cria sequência e coluna, e numera os pedidos existentes."""
+
+    # 1. Sequência
+    op.execute(f"CREATE SEQUENCE order_number_seq START WITH {ORDER_NUMBER_START}")
+
+    # 2. Coluna (ainda aceita NULL)
+    op.add_column("orders", sa.Column("number", sa.String(20), nullable=True))
+
+    # 3. Backfill em ordem de criação: pedido mais antigo = menor número
+    op.execute(
+        f"""
+        UPDATE orders AS o
+        SET number = 'PED-' || ({ORDER_NUMBER_START} - 1 + numbered.rn)
+        FROM (
+            SELECT id, row_number() OVER (ORDER BY created_at, id) AS rn
+            FROM orders
+        ) AS numbered
+        WHERE o.id = numbered.id
+        """
+    )
+
+    # 4. Próximo nextval() continua depois do último número usado
+    op.execute(
+        f"""
+        SELECT setval(
+            'order_number_seq',
+            {ORDER_NUMBER_START} - 1 + (SELECT count(*) FROM orders) + 1,
+            false
+        )
+        """
+    )
+
+    # 5. NOT NULL + default + índice único
+    op.alter_column(
+        "orders",
+        "number",
+        nullable=False,
+        server_default=sa.text(NUMBER_DEFAULT),
+    )
+    op.create_index("ix_orders_number", "orders", ["number"], unique=True)
+
+
+def downgrade() -> None:
+    """Remove índice, coluna e sequência."""
+    op.drop_index("ix_orders_number", table_name="orders")
+    op.drop_column("orders", "number")
+    op.execute("DROP SEQUENCE IF EXISTS order_number_seq")
@@ -0,0 +1,54 @@
+# ===========================================================
+# alembic/versions/003_sessions_expires_at_index.py
+# ===========================================================
+# Índice em sessions.expires_at.
+#
+# POR QUE?
+# A limpeza de sessões expiradas filtra por expires_at.
+# Sem índice, cada lote da limpeza varre a tabela inteira.
+#
+# CREATE INDEX CONCURRENTLY:
+# - Não bloqueia INSERT/UPDATE na tabela durante a criação
+# - Não pode rodar dentro de transação: por isso o
+#   autocommit_block() do Alembic
+# ===========================================================
+"""
+Índice para expiração de sessões.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# Identificadores da revisão
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cria o índice sem bloquear escritas."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_sessions_expires_at",
+            "sessions",
+            ["expires_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Remove o índice."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_sessions_expires_at",
+            table_name="sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,99 @@
+# ===========================================================
+# alembic/versions/004_uuid_primary_keys.py
+# ===========================================================
+# Chaves primárias VARCHAR(36) -> UUID nativo.
+#
+# POR QUE?
+# - 16 bytes por chave em vez de 37 (texto + cabeçalho), em
+#   cada índice e em cada chave estrangeira
+# - Comparação de UUID é mais barata que a de texto (collation)
+# - Os IDs novos são UUIDv7 (ordenados por tempo): os INSERTs
+#   vão para o fim do índice em vez de páginas aleatórias
+#
+# DADOS EXISTENTES:
+# Os uuid4 já gravados são convertidos com "id::uuid". Eles não
+# viram v7 (o valor é o mesmo), só mudam de tipo; o índice fica
+# ordenado a partir das linhas novas.
+#
+# ATENÇÃO (tabelas grandes):
+# ALTER COLUMN ... TYPE reescreve a tabela sob lock exclusivo.
+# Rode em janela de manutenção. As chaves estrangeiras são
+# removidas antes e recriadas depois (os dois lados precisam
+# ter o mesmo tipo).
+# ===========================================================
+"""
+Chaves primárias em UUID nativo.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# Identificadores da revisão
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (tabela, coluna) convertidas, na ordem segura de alteração
+_COLUMNS = [
+    ("customers", "id"),
+    ("products", "id"),
+    ("orders", "id"),
+    ("orders", "customer_id"),
+    ("sessions", "id"),
+    ("sessions", "customer_id"),
+]
+
+# Chaves estrangeiras para customers.id (nomes padrão do PostgreSQL)
+_FOREIGN_KEYS = [
+    ("orders_customer_id_fkey", "orders"),
+    ("sessions_customer_id_fkey", "sessions"),
+]
+
+
+def _drop_foreign_keys() -> None:
+    for name, table in _FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+
+
+def _create_foreign_keys() -> None:
+    for name, table in _FOREIGN_KEYS:
+        op.create_foreign_key(
+            name, table, "customers", ["customer_id"], ["id"], ondelete="CASCADE"
+        )
+
+
+def upgrade() -> None:
+    """Converte as chaves de texto para UUID."""
+    _drop_foreign_keys()
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.UUID(as_uuid=False),
+            existing_type=sa.String(36),
+            postgresql_using=f"{column}::uuid",
+        )
+    _create_foreign_keys()
+
+
+def downgrade() -> None:
+    """Volta as chaves para VARCHAR(36)."""
+    _drop_foreign_keys()
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(36),
+            existing_type=postgresql.UUID(as_uuid=False),
+            postgresql_using=f"{column}::text",
+        )
+    _create_foreign_keys()
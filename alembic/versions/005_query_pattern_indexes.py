@@ -0,0 +1,132 @@
+# ===========================================================
+# alembic/versions/005_query_pattern_indexes.py
+# ===========================================================
+# Índices compostos/parciais que seguem as consultas reais dos
+# repositórios (src/infrastructure/database/repositories).
+#
+# CONSULTA -> ÍNDICE
+#
+# sessions  find_by_customer / find_active_by_phone
+#   WHERE customer_id = ? AND expires_at > now()
+#   ORDER BY created_at DESC
+#   -> (customer_id, created_at DESC)
+#   A condição expires_at > now() não pode virar índice parcial
+#   (now() muda); ela filtra as poucas sessões do cliente.
+#
+# orders    find_by_customer / find_recent_by_customer
+#   WHERE customer_id = ? ORDER BY created_at DESC [LIMIT n]
+#   -> (customer_id, created_at DESC): lê só as n primeiras
+#
+# orders    find_by_status / count_by_status
+#   WHERE status = ? ORDER BY created_at DESC
+#   -> (status, created_at DESC)
+#
+# products  find_by_category / find_all_active / list_categories
+#   WHERE active [AND category = ? | AND stock > 0]
+#   ORDER BY category, name
+#   -> (category, name) WHERE active   (parcial: só ativos)
+#
+# Os índices antigos de uma coluna (customer_id, category)
+# viram redundantes: o novo índice começa pela mesma coluna.
+# Eles são removidos DEPOIS que os novos existem.
+#
+# CONCURRENTLY:
+# Cria/remove sem bloquear escritas. Não roda em transação
+# (autocommit_block). Se falhar no meio, o índice pode ficar
+# INVALID: rode a migração de novo (if_not_exists/if_exists).
+# ===========================================================
+"""
+Índices para os padrões de consulta dos repositórios.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# Identificadores da revisão
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (nome, tabela, colunas, condição do índice parcial)
+_NEW_INDEXES = [
+    (
+        "ix_sessions_customer_id_created_at",
+        "sessions",
+        ["customer_id", sa.text("created_at DESC")],
+        None,
+    ),
+    (
+        "ix_orders_customer_id_created_at",
+        "orders",
+        ["customer_id", sa.text("created_at DESC")],
+        None,
+    ),
+    (
+        "ix_orders_status_created_at",
+        "orders",
+        ["status", sa.text("created_at DESC")],
+        None,
+    ),
+    (
+        "ix_products_active_category_name",
+        "products",
+        ["category", "name"],
+        sa.text("active"),
+    ),
+]
+
+# Índices de uma coluna cobertos pelos novos: (nome, tabela, coluna)
+_REDUNDANT_INDEXES = [
+    ("ix_sessions_customer_id", "sessions", "customer_id"),
+    ("ix_orders_customer_id", "orders", "customer_id"),
+    ("ix_products_category", "products", "category"),
+]
+
+
+def upgrade() -> None:
+    """Cria os índices novos e remove os redundantes, sem bloquear."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in _NEW_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=where,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _ in _REDUNDANT_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Recria os índices de uma coluna e remove os compostos."""
+    with op.get_context().autocommit_block():
+        for name, table, column in _REDUNDANT_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _, _ in _NEW_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,142 @@
+# ===========================================================
+# alembic/versions/006_product_full_text_search.py
+# ===========================================================
+# Busca de produtos com full-text search do PostgreSQL.
+#
+# ANTES:
+#   name ILIKE '%texto%' OR description ILIKE '%texto%'
+#   O '%' no começo impede qualquer índice B-tree: toda busca
+#   lia o catálogo inteiro. E "camisetas" não achava "camiseta".
+#
+# AGORA:
+#   search_vector @@ websearch_to_tsquery('chatbot_pt', texto)
+#   - chatbot_pt: cópia da configuração "portuguese" (stemming)
+#     + unaccent, se a extensão existir no servidor
+#   - search_vector: coluna GERADA (STORED) com nome (peso A) e
+#     descrição (peso B); o banco a mantém sozinho
+#   - ix_products_search_vector: índice GIN da coluna
+#
+# TRIGRAMAS (opcional):
+# Se a extensão pg_trgm existir, cria também um índice GIN de
+# trigramas no nome. Ele serve à busca aproximada (erros de
+# digitação: "camizeta"), ligada por PRODUCT_SEARCH_FUZZY_ENABLED.
+#
+# EXTENSÕES:
+# unaccent e pg_trgm vêm no pacote contrib do PostgreSQL (e nos
+# serviços gerenciados). Se não estiverem disponíveis, a migração
+# segue sem elas (com um aviso) em vez de falhar.
+#
+# ATENÇÃO (tabelas grandes):
+# ADD COLUMN ... GENERATED STORED reescreve a tabela sob lock
+# exclusivo. Os índices são criados com CONCURRENTLY depois.
+# ===========================================================
+"""
+Busca textual de produtos (tsvector + GIN).
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# Identificadores da revisão
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_CONFIG = "chatbot_pt"
+
+# Mesmo DDL de src/infrastructure/database/models.py
+_CREATE_SEARCH_CONFIG = f"""
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{SEARCH_CONFIG}') THEN
+        CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = portuguese);
+        IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'unaccent') THEN
+            CREATE EXTENSION IF NOT EXISTS unaccent;
+            ALTER TEXT SEARCH CONFIGURATION {SEARCH_CONFIG}
+                ALTER MAPPING FOR hword, hword_part, word
+                WITH unaccent, portuguese_stem;
+        ELSE
+            RAISE WARNING 'unaccent indisponível: busca de produtos sensível a acentos';
+        END IF;
+    END IF;
+END
+$$
+"""
+
+_SEARCH_VECTOR = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
+
+def _extension_available(name: str) -> bool:
+    """A extensão pode ser instalada neste servidor?"""
+    return bool(
+        op.get_bind().scalar(
+            sa.text("SELECT 1 FROM pg_available_extensions WHERE name = :name"),
+            {"name": name},
+        )
+    )
+
+
+def upgrade() -> None:
+    """Cria a configuração de busca, a coluna gerada e os índices."""
+    op.execute(_CREATE_SEARCH_CONFIG)
+    op.add_column(
+        "products",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(_SEARCH_VECTOR, persisted=True),
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_products_search_vector",
+            "products",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        if not _extension_available("pg_trgm"):
+            op.execute(
+                "DO $$ BEGIN RAISE WARNING "
+                "'pg_trgm indisponível: sem índice para a busca aproximada'; END $$"
+            )
+            return
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_products_name_trgm",
+            "products",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Remove índices, coluna e configuração (as extensões ficam)."""
+    with op.get_context().autocommit_block():
+        for name in ("ix_products_name_trgm", "ix_products_search_vector"):
+            op.drop_index(
+                name,
+                table_name="products",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    op.drop_column("products", "search_vector")
+    op.execute(f"DROP TEXT SEARCH CONFIGURATION IF EXISTS {SEARCH_CONFIG}")
@@ -0,0 +1,65 @@
+# ===========================================================
+# alembic/versions/007_product_sku.py
+# ===========================================================
+# Coluna products.sku: chave do produto no catálogo externo.
+#
+# POR QUE?
+# A importação em lote do catálogo (catalog_import.py) recebe
+# o arquivo do ERP/planilha, que não conhece nossos UUIDs.
+# Cada linha é casada com o produto pelo SKU:
+#   - SKU novo            -> INSERT
+#   - SKU existente       -> UPDATE (só se algo mudou)
+#   - SKU fora do arquivo -> desativado
+#
+# Produtos existentes ficam com sku NULL (o índice UNIQUE aceita
+# vários NULLs) e nunca são tocados pela importação.
+#
+# ATENÇÃO (tabelas grandes):
+# ADD COLUMN sem default é só metadado. O índice é criado com
+# CONCURRENTLY (sem bloquear escritas).
+# ===========================================================
+"""
+SKU dos produtos (importação do catálogo).
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# Identificadores da revisão
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Adiciona products.sku e seu índice único."""
+    op.add_column("products", sa.Column("sku", sa.String(64), nullable=True))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_products_sku",
+            "products",
+            ["sku"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Remove o índice e a coluna."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_products_sku",
+            table_name="products",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("products", "sku")
@@ -0,0 +1,90 @@
+# ===========================================================
+# alembic/versions/008_one_active_session.py
+# ===========================================================
+# Coluna sessions.active e índice único parcial: no máximo UMA
+# sessão ligada por cliente.
+#
+# POR QUE?
+# Duas mensagens simultâneas de um cliente sem sessão faziam
+# "busca -> não achou -> INSERT" ao mesmo tempo: o cliente ficava
+# com duas sessões, e cada mensagem seguia numa delas.
+#
+# Com o índice
+#   UNIQUE (customer_id) WHERE active
+# a criação vira INSERT ... ON CONFLICT (customer_id) WHERE active
+# DO NOTHING: só uma mensagem cria, a outra lê a sessão criada
+# (ver SQLAlchemySessionRepository.get_or_create).
+#
+# DADOS EXISTENTES:
+# Só a sessão mais recente de cada cliente fica ligada; as outras
+# são desligadas antes de criar o índice (senão ele falharia).
+#
+# ATENÇÃO (tabelas grandes):
+# ADD COLUMN com default constante é só metadado (PostgreSQL 11+).
+# O índice é criado com CONCURRENTLY (sem bloquear escritas).
+# ===========================================================
+"""
+Uma sessão ativa por cliente.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# Identificadores da revisão
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Adiciona sessions.active, desliga as sessões antigas e cria o índice."""
+    op.add_column(
+        "sessions",
+        sa.Column(
+            "active", sa.Boolean(), nullable=False, server_default=sa.text("true")
+        ),
+    )
+
+    # Mantém ligada só a mais recente de cada cliente
+    op.execute(
+        """
+        UPDATE sessions AS s
+        SET active = false
+        WHERE EXISTS (
+            SELECT 1
+            FROM sessions AS newer
+            WHERE newer.customer_id = s.customer_id
+              AND (newer.created_at, newer.id) > (s.created_at, s.id)
+        )
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_sessions_customer_id_active",
+            "sessions",
+            ["customer_id"],
+            unique=True,
+            postgresql_where=sa.text("active"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Remove o índice e a coluna."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_sessions_customer_id_active",
+            table_name="sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("sessions", "active")
@@ -0,0 +1,68 @@
+# ===========================================================
+# alembic/versions/009_session_context_jsonb.py
+# ===========================================================
+# sessions.context passa de JSON para JSONB.
+#
+# POR QUE?
+# Com JSON (texto), todo turno que mexia no contexto regravava o
+# dicionário inteiro: carrinho, cursores de navegação e busca,
+# vários KB por mensagem. JSONB aceita os operadores
+#   contexto || '{"cart": [...]}'   (grava/troca chaves)
+#   contexto - '{last_search}'      (remove chaves)
+# e o UPDATE da sessão aplica só as chaves alteradas no turno
+# (ver SQLAlchemySessionRepository.update).
+#
+# DADOS EXISTENTES:
+# USING converte cada linha. Chaves repetidas num mesmo objeto
+# (possíveis em JSON texto) ficam com o último valor. O JSON 'null'
+# (None gravado pelo tipo JSON antigo) vira NULL do SQL, que o
+# delta trata como objeto vazio.
+#
+# ATENÇÃO (tabelas grandes):
+# Trocar o tipo REESCREVE a tabela com bloqueio exclusivo
+# (leituras e escritas de sessões esperam até o fim). Em tabelas
+# grandes, rode a limpeza de expiradas antes e aplique numa janela
+# de pouco tráfego.
+# ===========================================================
+"""
+Contexto da sessão em JSONB.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# Identificadores da revisão
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Converte sessions.context para JSONB."""
+    op.alter_column(
+        "sessions",
+        "context",
+        type_=postgresql.JSONB(),
+        existing_type=postgresql.JSON(),
+        existing_nullable=True,
+        postgresql_using="NULLIF(context::jsonb, 'null'::jsonb)",
+    )
+
+
+def downgrade() -> None:
+    """Volta sessions.context para JSON."""
+    op.alter_column(
+        "sessions",
+        "context",
+        type_=postgresql.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="context::json",
+    )
@@ -0,0 +1,144 @@
+# ===========================================================
+# alembic/versions/010_catalog_version.py
+# ===========================================================
+# Contador catalog_version, avançado pelo próprio banco quando
+# o catálogo muda.
+#
+# POR QUE?
+# A versão do snapshot do catálogo era
+#   (count(*), max(updated_at))
+# com updated_at vindo do relógio do Python ANTES do commit.
+# Uma transação com updated_at mais antigo que commita depois de
+# uma verificação que já viu um max maior não muda a versão: os
+# workers ficavam com preço/active antigos até outra escrita.
+#
+# COMO FUNCIONA:
+# Triggers de COMANDO (FOR EACH STATEMENT) em products, com as
+# linhas alteradas em tabelas de transição, incrementam o
+# contador na MESMA transação da escrita:
+# - INSERT / DELETE com alguma linha
+# - UPDATE que mudou algum campo do catálogo (nome, descrição,
+#   preço, imagem, categoria, active, sku)
+# O contador só aparece para os outros no COMMIT e nunca volta:
+# qualquer mudança commitada gera uma versão nova.
+#
+# ESTOQUE:
+# UPDATE só de estoque (reserve_stock) NÃO avança o contador:
+# o lock da linha do contador seria disputado por todo checkout.
+# O estoque exibido continua seguindo max(updated_at) (ver
+# SQLAlchemyProductRepository.catalog_version).
+#
+# UPSERT:
+# O trigger faz INSERT ... ON CONFLICT: se a linha sumir (ex:
+# TRUNCATE nos testes), a próxima mudança a recria.
+# ===========================================================
+"""
+Versão do catálogo mantida por trigger.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# Identificadores da revisão
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Campos que aparecem no catálogo (estoque fica de fora)
+_CATALOG_COLUMNS = "name, description, price, image_url, category, active, sku"
+
+
+def upgrade() -> None:
+    """Cria o contador, as funções e os triggers de products."""
+    op.create_table(
+        "catalog_version",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.execute("INSERT INTO catalog_version (id, version) VALUES (1, 0)")
+
+    op.execute(
+        """
+        CREATE FUNCTION bump_catalog_version() RETURNS void
+        LANGUAGE sql AS $$
+            INSERT INTO catalog_version (id, version) VALUES (1, 1)
+            ON CONFLICT (id)
+            DO UPDATE SET version = catalog_version.version + 1
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION products_rows_changed() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM changed_rows) THEN
+                PERFORM bump_catalog_version();
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    op.execute(
+        f"""
+        CREATE FUNCTION products_catalog_updated() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1
+                FROM new_rows AS n
+                JOIN old_rows AS o USING (id)
+                WHERE (n.{_CATALOG_COLUMNS.replace(", ", ", n.")})
+                    IS DISTINCT FROM (o.{_CATALOG_COLUMNS.replace(", ", ", o.")})
+            ) THEN
+                PERFORM bump_catalog_version();
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER products_catalog_insert
+        AFTER INSERT ON products
+        REFERENCING NEW TABLE AS changed_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION products_rows_changed()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER products_catalog_delete
+        AFTER DELETE ON products
+        REFERENCING OLD TABLE AS changed_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION products_rows_changed()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER products_catalog_update
+        AFTER UPDATE ON products
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION products_catalog_updated()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove os triggers, as funções e o contador."""
+    op.execute("DROP TRIGGER IF EXISTS products_catalog_update ON products")
+    op.execute("DROP TRIGGER IF EXISTS products_catalog_delete ON products")
+    op.execute("DROP TRIGGER IF EXISTS products_catalog_insert ON products")
+    op.execute("DROP FUNCTION IF EXISTS products_catalog_updated()")
+    op.execute("DROP FUNCTION IF EXISTS products_rows_changed()")
+    op.execute("DROP FUNCTION IF EXISTS bump_catalog_version()")
+    op.drop_table("catalog_version")
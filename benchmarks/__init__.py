@@ -0,0 +1,9 @@
+# ===========================================================
+# benchmarks/__init__.py
+# ===========================================================
+"""
+Micro-benchmarks do chatbot.
+
+Não fazem parte da suíte de testes. Rodar da raiz do projeto:
+    python -m benchmarks.<nome_do_script>
+"""
@@ -0,0 +1,171 @@
+# ===========================================================
+# benchmarks/bench_catalog_import.py
+# ===========================================================
+# Mede a importação do catálogo em lote (catalog_import.py)
+# contra o caminho antigo (repo.save por produto):
+#
+# 1. save():  um INSERT + flush por produto (SAVE_ROWS produtos,
+#             projetado para o tamanho do catálogo)
+# 2. Carga:   CatalogImporter com a tabela vazia (só INSERT)
+# 3. Igual:   o mesmo arquivo de novo (nenhuma linha reescrita)
+# 4. Mudança: 10% dos preços mudam e 5% dos produtos saem
+#
+# O arquivo CSV é gerado em pedaços de 64 KB, como chega do
+# request. A memória é o pico do Python (tracemalloc) durante
+# uma importação: não deve crescer com o tamanho do catálogo.
+#
+# BANCO:
+# Precisa de um PostgreSQL (usa DATABASE_URL). Tudo é criado no
+# schema bench_import, removido no final.
+# ===========================================================
+"""
+Benchmark da importação do catálogo (save por produto x COPY + diff).
+
+Uso:
+    python -m benchmarks.bench_catalog_import
+"""
+
+import asyncio
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Callable
+from decimal import Decimal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.config.settings import get_settings
+from src.domain.entities.product import Product
+from src.infrastructure.database.catalog_import import (
+    CatalogImporter,
+    CatalogImportResult,
+)
+from src.infrastructure.database.models import Base, ProductModel
+from src.infrastructure.database.repositories import SQLAlchemyProductRepository
+
+
+SIZES = [10_000, 100_000]
+SAVE_ROWS = 2_000
+CHUNK_BYTES = 64 * 1024
+SCHEMA = "bench_import"
+
+HEADER = "sku,name,price,category,description,image_url,stock\n"
+
+
+def _line(i: int, changed: bool = False) -> str:
+    """Uma linha do CSV (changed: preço diferente)."""
+    price = Decimal(500 + i % 50_000) / 100 + (1 if changed else 0)
+    return (
+        f"SKU-{i:07d},Produto {i},{price},Categoria {i % 50:02d},"
+        f"\"Descrição do produto {i}, com vírgula\","
+        f"https://cdn.exemplo.com/{i}.jpg,{i % 20}\n"
+    )
+
+
+def _catalog(size: int, changes: bool = False) -> Callable[[], AsyncIterator[bytes]]:
+    """Arquivo gerado sob demanda (nunca inteiro na memória)."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        buffer = [HEADER]
+        length = len(HEADER)
+        for i in range(size):
+            if changes and i % 20 == 0:
+                continue  # 5% saem do catálogo
+            line = _line(i, changed=changes and i % 10 == 1)
+            buffer.append(line)
+            length += len(line)
+            if length >= CHUNK_BYTES:
+                yield "".join(buffer).encode()
+                buffer, length = [], 0
+        yield "".join(buffer).encode()
+
+    return chunks
+
+
+async def _import(engine: AsyncEngine, chunks) -> CatalogImportResult:
+    async with AsyncSession(engine) as db:
+        result = await CatalogImporter(db).run(chunks(), "csv")
+        await db.commit()
+    return result
+
+
+async def _import_peak_mb(engine: AsyncEngine, chunks) -> float:
+    """Pico de memória do Python durante uma importação."""
+    tracemalloc.start()
+    await _import(engine, chunks)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+async def _save_ms_per_product(engine: AsyncEngine) -> float:
+    """O caminho antigo: repo.save por produto, um commit no fim."""
+    async with AsyncSession(engine) as db:
+        repo = SQLAlchemyProductRepository(db)
+        started = time.perf_counter()
+        for i in range(SAVE_ROWS):
+            await repo.save(
+                Product(
+                    name=f"Avulso {i}",
+                    price=Decimal("10.00"),
+                    category="Avulsos",
+                    stock=1,
+                )
+            )
+        await db.commit()
+        elapsed = time.perf_counter() - started
+        await db.execute(ProductModel.__table__.delete())
+        await db.commit()
+    return elapsed / SAVE_ROWS * 1e3
+
+
+async def main() -> None:
+    """Cria o schema, mede cada tamanho de catálogo e remove o schema."""
+    admin = create_async_engine(get_settings().database_url)
+    async with admin.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    # public no search_path: extensões (unaccent) costumam estar lá
+    engine = create_async_engine(
+        get_settings().database_url,
+        connect_args={"server_settings": {"search_path": f"{SCHEMA}, public"}},
+    )
+    try:
+        async with engine.begin() as conn:
+            # checkfirst=False: não confundir com um products de public
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=[ProductModel.__table__],
+                checkfirst=False,
+            )
+
+        save_ms = await _save_ms_per_product(engine)
+        print(f"save(): {save_ms:.2f} ms/produto")
+
+        print(f"{'produtos':>9}{'save() s':>10}{'carga s':>9}{'igual s':>9}"
+              f"{'mudança s':>11}{'alterados':>11}{'desativ.':>10}{'pico MB':>9}")
+        for size in SIZES:
+            async with engine.begin() as conn:
+                await conn.execute(ProductModel.__table__.delete())
+
+            first = await _import(engine, _catalog(size))
+            same = await _import(engine, _catalog(size))
+            peak_mb = await _import_peak_mb(engine, _catalog(size))
+            changed = await _import(engine, _catalog(size, changes=True))
+            assert first.inserted == size and same.unchanged == size
+
+            print(
+                f"{size:>9,}{save_ms * size / 1e3:>10.1f}{first.seconds:>9.2f}"
+                f"{same.seconds:>9.2f}{changed.seconds:>11.2f}{changed.updated:>11,}"
+                f"{changed.deactivated:>10,}{peak_mb:>9.1f}"
+            )
+    finally:
+        await engine.dispose()
+        async with admin.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await admin.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
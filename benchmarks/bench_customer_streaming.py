@@ -0,0 +1,162 @@
+# ===========================================================
+# benchmarks/bench_customer_streaming.py
+# ===========================================================
+# Mede as três formas de percorrer TODOS os clientes:
+#
+# 1. find_all():  uma lista com a tabela inteira na memória
+# 2. iter_all():  cursor do servidor, chunk_size linhas por vez
+#                 (um tamanho de lote por linha da tabela)
+# 3. find_page(): páginas keyset de PAGE_SIZE (caminho da API),
+#                 uma consulta por página
+#
+# Para cada uma: tempo (sem tracemalloc, que deixa o Python
+# mais lento) e pico de memória do Python (tracemalloc, em uma
+# segunda passada). Só o pico de find_all cresce com a tabela.
+#
+# BANCO:
+# Precisa de um PostgreSQL (usa DATABASE_URL). Os CUSTOMERS
+# clientes são criados por COPY no schema bench_streaming,
+# removido no final.
+# ===========================================================
+"""
+Benchmark de leitura de todos os clientes (lista x streaming x páginas).
+
+Uso:
+    python -m benchmarks.bench_customer_streaming
+"""
+
+import asyncio
+import time
+import tracemalloc
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.config.settings import get_settings
+from src.infrastructure.database.models import Base, CustomerModel
+from src.infrastructure.database.repositories import SQLAlchemyCustomerRepository
+from src.shared.utils.ids import new_id
+
+
+CUSTOMERS = 1_000_000
+CHUNK_SIZES = [100, 1_000, 10_000]
+PAGE_SIZE = 500
+SCHEMA = "bench_streaming"
+
+
+async def _seed(engine: AsyncEngine) -> None:
+    """CUSTOMERS clientes via COPY (o ORM levaria minutos)."""
+    now = datetime.now()
+    records = (
+        (
+            uuid.UUID(new_id()),
+            f"55{i:011d}",
+            f"Cliente {i}",
+            f"cliente{i}@exemplo.com",
+            now,
+            now,
+        )
+        for i in range(CUSTOMERS)
+    )
+    async with engine.begin() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            CustomerModel.__tablename__,
+            schema_name=SCHEMA,
+            columns=["id", "phone_number", "name", "email", "created_at", "updated_at"],
+            records=records,
+        )
+        await conn.execute(text(f"ANALYZE {SCHEMA}.{CustomerModel.__tablename__}"))
+
+
+async def _find_all(repo: SQLAlchemyCustomerRepository) -> int:
+    return len(await repo.find_all())
+
+
+def _iter_all(
+    chunk_size: int,
+) -> Callable[[SQLAlchemyCustomerRepository], Awaitable[int]]:
+    async def run(repo: SQLAlchemyCustomerRepository) -> int:
+        count = 0
+        async for _ in repo.iter_all(chunk_size):
+            count += 1
+        return count
+
+    return run
+
+
+async def _pages(repo: SQLAlchemyCustomerRepository) -> int:
+    page = await repo.find_page(limit=PAGE_SIZE)
+    count = len(page.items)
+    while page.next_cursor:
+        page = await repo.find_page(page.next_cursor, limit=PAGE_SIZE)
+        count += len(page.items)
+    return count
+
+
+async def _measure(
+    engine: AsyncEngine,
+    read: Callable[[SQLAlchemyCustomerRepository], Awaitable[int]],
+) -> tuple[float, float]:
+    """(segundos, pico MB) de uma leitura completa."""
+    async with AsyncSession(engine) as db:
+        started = time.perf_counter()
+        count = await read(SQLAlchemyCustomerRepository(db))
+        seconds = time.perf_counter() - started
+    assert count == CUSTOMERS
+
+    tracemalloc.start()
+    async with AsyncSession(engine) as db:
+        await read(SQLAlchemyCustomerRepository(db))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1e6
+
+
+async def main() -> None:
+    """Cria o schema com os clientes, mede cada forma e remove o schema."""
+    admin = create_async_engine(get_settings().database_url)
+    async with admin.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_async_engine(
+        get_settings().database_url,
+        connect_args={"server_settings": {"search_path": f"{SCHEMA}, public"}},
+    )
+    try:
+        async with engine.begin() as conn:
+            # checkfirst=False: não confundir com um customers de public
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=[CustomerModel.__table__],
+                checkfirst=False,
+            )
+
+        started = time.perf_counter()
+        await _seed(engine)
+        print(f"{CUSTOMERS:,} clientes criados em {time.perf_counter() - started:.1f}s")
+
+        cases = [("find_all()", _find_all)]
+        cases += [(f"iter_all({size:,})", _iter_all(size)) for size in CHUNK_SIZES]
+        cases += [(f"find_page({PAGE_SIZE})", _pages)]
+
+        print(f"{'forma':>18}{'s':>8}{'clientes/s':>12}{'pico MB':>10}")
+        for name, read in cases:
+            seconds, peak_mb = await _measure(engine, read)
+            print(
+                f"{name:>18}{seconds:>8.2f}"
+                f"{CUSTOMERS / seconds:>12,.0f}{peak_mb:>10.1f}"
+            )
+    finally:
+        await engine.dispose()
+        async with admin.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await admin.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
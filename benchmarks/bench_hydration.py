@@ -0,0 +1,207 @@
+# ===========================================================
+# benchmarks/bench_hydration.py
+# ===========================================================
+# Compara as duas formas de transformar linhas em entidades:
+#
+# 1. ORM: select(Model) -> objetos Model (identity map)
+#         -> _to_entity -> entidade (roda default_factory)
+# 2. Core: select(colunas) -> tuplas -> RowHydrator -> entidade
+#
+# Mede, para 100k produtos e 100k sessões:
+# - tempo da leitura + hidratação (melhor de N repetições)
+# - pico de memória e memória mantida pelas entidades
+#
+# BANCO:
+# SQLite em memória (síncrono), para não depender de um
+# PostgreSQL rodando. O custo de rede é o mesmo nos dois
+# caminhos; o que muda é o trabalho do Python por linha.
+# A coluna products.search_vector (tsvector, só PostgreSQL)
+# fica fora da tabela: nenhum dos dois caminhos a lê.
+# ===========================================================
+"""
+Benchmark da hidratação de entidades (ORM x Core).
+
+Uso:
+    python -m benchmarks.bench_hydration
+"""
+
+import gc
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.schema import CreateColumn
+
+from src.domain.entities.product import Product
+from src.domain.entities.session import Session
+from src.infrastructure.database.hydration import RowHydrator
+from src.infrastructure.database.models import (
+    Base,
+    CustomerModel,
+    ProductModel,
+    SessionModel,
+)
+from src.infrastructure.database.repositories import (
+    SQLAlchemyProductRepository,
+    SQLAlchemySessionRepository,
+)
+from src.shared.types.enums import SessionState
+
+
+ROWS = 100_000
+REPEAT = 3
+
+PRODUCT = RowHydrator(Product, ProductModel)
+SESSION = RowHydrator(
+    Session,
+    SessionModel,
+    converters={"context": lambda context: context or {}},
+)
+
+# Só os conversores são usados (não vão ao banco)
+_product_repo = SQLAlchemyProductRepository(None)
+_session_repo = SQLAlchemySessionRepository(None)
+
+
+@compiles(CreateColumn, "sqlite")
+def _skip_search_vector(element: CreateColumn, compiler, **kw) -> str | None:
+    """No SQLite, cria a tabela de produtos sem a coluna tsvector."""
+    if element.element is ProductModel.__table__.c.search_vector:
+        return None
+    return compiler.visit_create_column(element, **kw)
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(type_: JSONB, compiler, **kw) -> str:
+    """No SQLite, o contexto da sessão (JSONB) vira JSON."""
+    return "JSON"
+
+
+def _populate(engine: Engine) -> None:
+    """Cria as tabelas e insere ROWS produtos e ROWS sessões."""
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            CustomerModel.__table__,
+            ProductModel.__table__,
+            SessionModel.__table__,
+        ],
+    )
+    now = datetime.now()
+    customer_id = str(uuid.uuid4())
+
+    with engine.begin() as conn:
+        conn.execute(
+            insert(CustomerModel),
+            [{"id": customer_id, "phone_number": "5511999999999",
+              "created_at": now, "updated_at": now}],
+        )
+        conn.execute(insert(ProductModel), [
+            {
+                "id": str(uuid.uuid4()),
+                "name": f"Produto {i}",
+                "description": "Camiseta 100% algodão",
+                "price": Decimal("49.90"),
+                "category": "Vestuário",
+                "stock": 10,
+                "active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(ROWS)
+        ])
+        conn.execute(insert(SessionModel), [
+            {
+                "id": str(uuid.uuid4()),
+                "customer_id": customer_id,
+                "state": SessionState.MENU,
+                "context": {"last_search": "camiseta"},
+                "created_at": now,
+                "updated_at": now,
+                "expires_at": now + timedelta(hours=24),
+                # Uma sessão ligada por cliente (índice único parcial)
+                "active": i == 0,
+            }
+            for i in range(ROWS)
+        ])
+
+
+def orm_products(engine: Engine) -> list[Product]:
+    """Caminho ORM: modelos no identity map, depois entidades."""
+    with OrmSession(engine) as db:
+        models = db.scalars(select(ProductModel)).all()
+        return [_product_repo._to_entity(model) for model in models]
+
+
+def core_products(engine: Engine) -> list[Product]:
+    """Caminho Core: tuplas direto para entidades."""
+    with engine.connect() as conn:
+        return PRODUCT.all(conn.execute(PRODUCT.select()))
+
+
+def orm_sessions(engine: Engine) -> list[Session]:
+    """Caminho ORM para sessões."""
+    with OrmSession(engine) as db:
+        models = db.scalars(select(SessionModel)).all()
+        return [_session_repo._to_entity(model) for model in models]
+
+
+def core_sessions(engine: Engine) -> list[Session]:
+    """Caminho Core para sessões."""
+    with engine.connect() as conn:
+        return SESSION.all(conn.execute(SESSION.select()))
+
+
+def _best_seconds(fn: Callable[[Engine], list], engine: Engine) -> float:
+    """Melhor tempo de N repetições."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        gc.collect()
+        started = time.perf_counter()
+        fn(engine)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _memory_mb(fn: Callable[[Engine], list], engine: Engine) -> tuple[float, float]:
+    """(pico durante a leitura, memória mantida pelas entidades) em MB."""
+    gc.collect()
+    tracemalloc.start()
+    entities = fn(engine)
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(entities) == ROWS
+    return peak / 1e6, kept / 1e6
+
+
+def main() -> None:
+    """Popula o banco e imprime a tabela comparativa."""
+    engine = create_engine("sqlite://")
+    _populate(engine)
+
+    print(f"{ROWS:,} linhas por entidade, melhor de {REPEAT}")
+    print(f"{'caminho':<18}{'ms':>10}{'µs/linha':>11}{'pico MB':>10}{'mantido MB':>12}")
+    for name, fn in (
+        ("ORM produtos", orm_products),
+        ("Core produtos", core_products),
+        ("ORM sessões", orm_sessions),
+        ("Core sessões", core_sessions),
+    ):
+        seconds = _best_seconds(fn, engine)
+        peak, kept = _memory_mb(fn, engine)
+        print(
+            f"{name:<18}{seconds * 1e3:>10.1f}{seconds / ROWS * 1e6:>11.2f}"
+            f"{peak:>10.1f}{kept:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
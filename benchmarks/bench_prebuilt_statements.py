@@ -0,0 +1,263 @@
+# ===========================================================
+# benchmarks/bench_prebuilt_statements.py
+# ===========================================================
+# Mede as buscas de todo turno em duas formas:
+#
+# 1. montada: select(...).where(coluna == valor) a cada chamada
+#    (como os repositórios faziam)
+# 2. pré-montada: o comando do módulo do repositório, montado no
+#    import, com o valor em bindparam
+#
+# O SQL enviado é o mesmo; muda o trabalho em Python antes dele:
+# construir o Select e gerar a chave de cache do SQLAlchemy. O
+# comando pré-montado guarda a chave (memoizada no objeto) e cai
+# direto no SQL compilado do cache.
+#
+# Para cada busca: EXECUTIONS execuções no banco (tempo total e
+# µs por chamada) e um perfil (cProfile) de PROFILE_CALLS chamadas
+# com o tempo de Python gasto dentro de sqlalchemy/sql (construção,
+# coerção e chave de cache) por chamada.
+#
+# BANCO:
+# Precisa de um PostgreSQL (usa DATABASE_URL). As tabelas são
+# criadas no schema bench_statements, removido no final.
+# ===========================================================
+"""
+Benchmark das consultas pré-montadas dos repositórios.
+
+Uso:
+    python -m benchmarks.bench_prebuilt_statements
+"""
+
+import asyncio
+import cProfile
+import os
+import pstats
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.config.settings import get_settings
+from src.infrastructure.database.models import (
+    Base,
+    CustomerModel,
+    OrderModel,
+    ProductModel,
+    SessionModel,
+)
+from src.infrastructure.database.repositories import (
+    sqlalchemy_customer_repository as customers,
+    sqlalchemy_order_repository as orders,
+    sqlalchemy_product_repository as products,
+    sqlalchemy_session_repository as sessions,
+)
+from src.shared.types.enums import OrderStatus, SessionState
+from src.shared.utils.ids import new_id
+
+
+EXECUTIONS = 100_000
+PROFILE_CALLS = 10_000
+PRODUCTS = 20
+SCHEMA = "bench_statements"
+
+PHONE = "5511999999999"
+CUSTOMER_ID = new_id()
+ORDER_ID = new_id()
+
+Query = Callable[[AsyncSession], Awaitable[object]]
+
+
+async def _seed(engine: AsyncEngine) -> None:
+    """Um cliente com sessão e pedido, e PRODUCTS produtos ativos."""
+    now = datetime.now()
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(CustomerModel),
+            [
+                {
+                    "id": CUSTOMER_ID,
+                    "phone_number": PHONE,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            ],
+        )
+        await conn.execute(
+            insert(SessionModel),
+            [{
+                "id": new_id(),
+                "customer_id": CUSTOMER_ID,
+                "state": SessionState.MENU,
+                "context": {},
+                "created_at": now,
+                "updated_at": now,
+                "expires_at": now + timedelta(days=1),
+            }],
+        )
+        await conn.execute(
+            insert(OrderModel),
+            [{
+                "id": ORDER_ID,
+                "customer_id": CUSTOMER_ID,
+                "status": OrderStatus.PENDING,
+                "total": Decimal("99.90"),
+                "created_at": now,
+                "updated_at": now,
+            }],
+        )
+        await conn.execute(
+            insert(ProductModel),
+            [
+                {
+                    "id": new_id(),
+                    "name": f"Produto {i}",
+                    "price": Decimal("49.90"),
+                    "category": "roupas",
+                    "stock": 10,
+                    "active": True,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(PRODUCTS)
+            ],
+        )
+
+
+# ===========================================================
+# AS DUAS FORMAS DE CADA BUSCA
+# ===========================================================
+
+def _cases() -> list[tuple[str, Query, Query]]:
+    """(busca, montada a cada chamada, pré-montada)."""
+
+    async def phone_built(db: AsyncSession):
+        query = customers._CUSTOMER.select().where(CustomerModel.phone_number == PHONE)
+        return customers._CUSTOMER.one(await db.execute(query))
+
+    async def phone_prebuilt(db: AsyncSession):
+        result = await db.execute(customers._FIND_BY_PHONE, {"phone": PHONE})
+        return customers._CUSTOMER.one(result)
+
+    async def session_built(db: AsyncSession):
+        query = (
+            sessions._SESSION.select()
+            .where(SessionModel.customer_id == CUSTOMER_ID)
+            .where(SessionModel.expires_at > datetime.now())
+            .order_by(SessionModel.created_at.desc())
+        )
+        return sessions._SESSION.one(await db.execute(query))
+
+    async def session_prebuilt(db: AsyncSession):
+        result = await db.execute(
+            sessions._FIND_BY_CUSTOMER,
+            {"customer_id": CUSTOMER_ID, "now": datetime.now()},
+        )
+        return sessions._SESSION.one(result)
+
+    async def order_built(db: AsyncSession):
+        query = orders._ORDER.select().where(OrderModel.id == ORDER_ID)
+        return orders._ORDER.one(await db.execute(query))
+
+    async def order_prebuilt(db: AsyncSession):
+        result = await db.execute(orders._FIND_BY_ID, {"id": ORDER_ID})
+        return orders._ORDER.one(result)
+
+    async def products_built(db: AsyncSession):
+        query = (
+            products._PRODUCT.select()
+            .where(ProductModel.active == True)
+            .where(ProductModel.stock > 0)
+            .order_by(ProductModel.category, ProductModel.name)
+        )
+        return products._PRODUCT.all(await db.execute(query))
+
+    async def products_prebuilt(db: AsyncSession):
+        return products._PRODUCT.all(await db.execute(products._FIND_ALL_ACTIVE))
+
+    return [
+        ("customer find_by_phone", phone_built, phone_prebuilt),
+        ("session find_by_customer", session_built, session_prebuilt),
+        ("order find_by_id", order_built, order_prebuilt),
+        ("product find_all_active", products_built, products_prebuilt),
+    ]
+
+
+# ===========================================================
+# MEDIÇÃO
+# ===========================================================
+
+async def _timed(db: AsyncSession, query: Query) -> float:
+    """µs por chamada em EXECUTIONS execuções."""
+    started = time.perf_counter()
+    for _ in range(EXECUTIONS):
+        await query(db)
+    return (time.perf_counter() - started) / EXECUTIONS * 1e6
+
+
+async def _profiled(db: AsyncSession, query: Query) -> float:
+    """µs de Python em sqlalchemy/sql por chamada (cProfile, tottime)."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(PROFILE_CALLS):
+        await query(db)
+    profiler.disable()
+
+    marker = os.sep.join(("sqlalchemy", "sql", ""))
+    stats = pstats.Stats(profiler).stats
+    seconds = sum(
+        tottime
+        for (filename, _, _), (_, _, tottime, _, _) in stats.items()
+        if marker in filename
+    )
+    return seconds / PROFILE_CALLS * 1e6
+
+
+async def main() -> None:
+    """Cria o schema com os dados, mede cada busca e remove o schema."""
+    admin = create_async_engine(get_settings().database_url)
+    async with admin.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_async_engine(
+        get_settings().database_url,
+        connect_args={"server_settings": {"search_path": f"{SCHEMA}, public"}},
+    )
+    try:
+        async with engine.begin() as conn:
+            # checkfirst=False: não confundir com as tabelas de public
+            await conn.run_sync(Base.metadata.create_all, checkfirst=False)
+        await _seed(engine)
+
+        print(
+            f"{EXECUTIONS:,} execuções por busca; "
+            f"perfil de {PROFILE_CALLS:,} chamadas"
+        )
+        print(
+            f"{'busca':>26}{'forma':>13}{'s':>8}{'µs/chamada':>12}"
+            f"{'µs sql/*':>10}"
+        )
+        async with AsyncSession(engine) as db:
+            for name, built, prebuilt in _cases():
+                for label, query in (("montada", built), ("pré-montada", prebuilt)):
+                    await query(db)  # aquece o cache de SQL compilado
+                    per_call = await _timed(db, query)
+                    python_us = await _profiled(db, query)
+                    seconds = per_call * EXECUTIONS / 1e6
+                    print(
+                        f"{name:>26}{label:>13}{seconds:>8.1f}{per_call:>12.1f}"
+                        f"{python_us:>10.1f}"
+                    )
+    finally:
+        await engine.dispose()
+        async with admin.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await admin.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
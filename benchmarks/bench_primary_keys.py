@@ -0,0 +1,112 @@
+# ===========================================================
+# benchmarks/bench_primary_keys.py
+# ===========================================================
+# Compara três formatos de chave primária no PostgreSQL:
+#
+# 1. VARCHAR(36) + uuid4   (como era)
+# 2. UUID nativo + uuid4   (só muda o tipo)
+# 3. UUID nativo + UUIDv7  (tipo + ordem por tempo: como é agora)
+#
+# Para cada um: vazão de INSERT (linhas/s) e tamanho final do
+# índice da chave primária e da tabela.
+#
+# BANCO:
+# Precisa de um PostgreSQL (usa DATABASE_URL). Cria tabelas
+# temporárias bench_pk_* e as remove no final.
+# ===========================================================
+"""
+Benchmark de chaves primárias (texto x UUID x UUIDv7).
+
+Uso:
+    python -m benchmarks.bench_primary_keys
+"""
+
+import asyncio
+import time
+import uuid
+from collections.abc import Callable
+
+from sqlalchemy import Column, MetaData, String, Table, Text, Uuid, insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.config.settings import get_settings
+from src.shared.utils.ids import new_id
+
+
+ROWS = 200_000
+BATCH = 2_000
+
+_metadata = MetaData()
+
+
+def _table(name: str, key_type) -> Table:
+    """Tabela de teste: chave + um texto (simula uma linha pequena)."""
+    return Table(
+        name,
+        _metadata,
+        Column("id", key_type, primary_key=True),
+        Column("payload", Text, nullable=False),
+    )
+
+
+def _uuid4() -> str:
+    return str(uuid.uuid4())
+
+
+# (nome, tabela, gerador de ID)
+VARIANTS: list[tuple[str, Table, Callable[[], str]]] = [
+    ("varchar(36) uuid4", _table("bench_pk_varchar", String(36)), _uuid4),
+    ("uuid uuid4", _table("bench_pk_uuid4", Uuid(as_uuid=False)), _uuid4),
+    ("uuid uuidv7", _table("bench_pk_uuid7", Uuid(as_uuid=False)), new_id),
+]
+
+
+async def _insert_rows(
+    engine: AsyncEngine, table: Table, make_id: Callable[[], str]
+) -> float:
+    """Insere ROWS linhas em lotes (uma transação por lote); devolve segundos."""
+    started = time.perf_counter()
+    for _ in range(ROWS // BATCH):
+        rows = [{"id": make_id(), "payload": "sessão"} for _ in range(BATCH)]
+        async with engine.begin() as conn:
+            await conn.execute(insert(table), rows)
+    return time.perf_counter() - started
+
+
+async def _sizes_mb(engine: AsyncEngine, table: Table) -> tuple[float, float]:
+    """(índice da chave primária, tabela) em MB."""
+    async with engine.connect() as conn:
+        index_bytes = await conn.scalar(
+            text("SELECT pg_relation_size(:index)"), {"index": f"{table.name}_pkey"}
+        )
+        table_bytes = await conn.scalar(
+            text("SELECT pg_table_size(:table)"), {"table": table.name}
+        )
+    return index_bytes / 1e6, table_bytes / 1e6
+
+
+async def main() -> None:
+    """Cria as tabelas, insere, mede e remove as tabelas."""
+    engine = create_async_engine(get_settings().database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(_metadata.drop_all)
+        await conn.run_sync(_metadata.create_all)
+
+    try:
+        print(f"{ROWS:,} linhas em lotes de {BATCH:,}")
+        print(f"{'chave':<20}{'linhas/s':>12}{'índice MB':>12}{'tabela MB':>12}")
+        for name, table, make_id in VARIANTS:
+            seconds = await _insert_rows(engine, table, make_id)
+            index_mb, table_mb = await _sizes_mb(engine, table)
+            print(
+                f"{name:<20}{ROWS / seconds:>12,.0f}"
+                f"{index_mb:>12.1f}{table_mb:>12.1f}"
+            )
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(_metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,140 @@
+# ===========================================================
+# benchmarks/bench_product_catalog.py
+# ===========================================================
+# Mede o snapshot do catálogo em memória (cache/product_catalog):
+#
+# 1. Memória: quanto o snapshot (produtos + índices) ocupa
+# 2. Montagem: tempo de CatalogSnapshot.build
+# 3. Leitura: latência de cada método do CachedProductRepository
+#    (inclui as cópias devolvidas ao chamador)
+#
+# Para catálogos de 1k, 5k e 20k produtos, 50 categorias.
+# Não usa banco: a origem é uma lista pronta.
+# ===========================================================
+"""
+Benchmark do catálogo de produtos em memória.
+
+Uso:
+    python -m benchmarks.bench_product_catalog
+"""
+
+import asyncio
+import gc
+import random
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
+
+from src.domain.entities.product import Product
+from src.infrastructure.cache.product_catalog import (
+    CachedProductRepository,
+    CatalogSnapshot,
+    ProductCatalog,
+)
+
+
+SIZES = [1_000, 5_000, 20_000]
+CATEGORIES = 50
+# Chamadas medidas: buscas pontuais x listas inteiras
+LOOKUP_CALLS = 5_000
+LIST_CALLS = 50
+
+
+def _products(count: int) -> list[Product]:
+    """Catálogo sintético, em ordem de categoria e nome."""
+    rng = random.Random(42)
+    products = [
+        Product(
+            name=f"Produto {i:06d}",
+            description=(
+                "Descrição curta do produto, com uns oitenta caracteres de texto."
+            ),
+            price=Decimal(rng.randint(500, 50_000)) / 100,
+            category=f"Categoria {i % CATEGORIES:02d}",
+            stock=rng.randint(0, 20),
+            image_url=f"https://cdn.exemplo.com/produtos/{i}.jpg",
+        )
+        for i in range(count)
+    ]
+    products.sort(key=lambda p: (p.category, p.name))
+    return products
+
+
+class _ListSource:
+    """Origem em memória."""
+
+    def __init__(self, products: list[Product]) -> None:
+        self._products = products
+
+    async def version(self) -> int:
+        return 1
+
+    async def load(self) -> list[Product]:
+        return self._products
+
+
+def _snapshot_mb(products: list[Product]) -> tuple[float, float, float]:
+    """(MB dos produtos, MB dos índices, ms da montagem)."""
+    gc.collect()
+    tracemalloc.start()
+    copies = [
+        Product(
+            name=p.name, price=p.price, category=p.category, description=p.description,
+            image_url=p.image_url, stock=p.stock, id=p.id,
+        )
+        for p in products
+    ]
+    products_bytes, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    snapshot = CatalogSnapshot.build(1, copies)
+    build_ms = (time.perf_counter() - started) * 1000
+    total_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(snapshot) == len(products)
+    return products_bytes / 1e6, (total_bytes - products_bytes) / 1e6, build_ms
+
+
+async def _latency_us(call: Callable[[], Awaitable[object]], calls: int) -> float:
+    """Latência média (µs) de uma chamada."""
+    started = time.perf_counter()
+    for _ in range(calls):
+        await call()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+async def main() -> None:
+    """Imprime memória, montagem e latência por tamanho de catálogo."""
+    print(f"{'produtos':>9}{'prod MB':>9}{'índ MB':>8}{'build ms':>10}"
+          f"{'by_id µs':>10}{'categ µs':>10}{'preço µs':>10}"
+          f"{'categs µs':>11}{'ativos µs':>11}")
+    for size in SIZES:
+        products = _products(size)
+        products_mb, index_mb, build_ms = _snapshot_mb(products)
+
+        catalog = ProductCatalog(_ListSource(products))
+        await catalog.refresh()
+        repo = CachedProductRepository(None, catalog)
+        ids = [p.id for p in products]
+
+        by_id = await _latency_us(
+            lambda: repo.find_by_id(random.choice(ids)), LOOKUP_CALLS
+        )
+        by_category = await _latency_us(
+            lambda: repo.find_by_category("Categoria 07"), LIST_CALLS
+        )
+        by_price = await _latency_us(
+            lambda: repo.find_by_price_range(Decimal("100.00"), Decimal("110.00")),
+            LIST_CALLS,
+        )
+        categories = await _latency_us(repo.list_categories, LOOKUP_CALLS)
+        active = await _latency_us(repo.find_all_active, LIST_CALLS)
+
+        print(
+            f"{size:>9,}{products_mb:>9.1f}{index_mb:>8.1f}{build_ms:>10.1f}"
+            f"{by_id:>10.2f}{by_category:>10.1f}{by_price:>10.1f}{categories:>11.2f}{active:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,174 @@
+# ===========================================================
+# benchmarks/bench_product_search.py
+# ===========================================================
+# Compara a busca de produtos antiga e a nova em um catálogo de
+# 100k produtos no PostgreSQL:
+#
+# 1. ILIKE: name ILIKE '%texto%' OR description ILIKE '%texto%'
+#           (como era: lê a tabela inteira a cada busca)
+# 2. FTS:   SQLAlchemyProductRepository.search()
+#           (search_vector @@ websearch_to_tsquery, índice GIN)
+#
+# Para cada termo: tempo médio por busca e quantos produtos
+# cada forma encontra (o FTS acha plurais: "camisetas").
+#
+# BANCO:
+# Precisa de um PostgreSQL (usa DATABASE_URL). Tudo é criado no
+# schema bench_search, removido no final.
+# ===========================================================
+"""
+Benchmark da busca de produtos (ILIKE x full-text search).
+
+Uso:
+    python -m benchmarks.bench_product_search
+"""
+
+import asyncio
+import itertools
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.config.settings import get_settings
+from src.infrastructure.database.models import Base, ProductModel
+from src.infrastructure.database.repositories import SQLAlchemyProductRepository
+from src.shared.utils.ids import new_id
+
+
+ROWS = 100_000
+BATCH = 5_000
+REPEAT = 20
+SCHEMA = "bench_search"
+
+TYPES = [
+    "Camiseta", "Calça", "Tênis", "Caneca", "Mochila", "Boné", "Jaqueta", "Meia",
+    "Bermuda", "Vestido", "Saia", "Blusa", "Casaco", "Sandália", "Bota", "Chinelo",
+    "Cinto", "Carteira", "Bolsa", "Relógio", "Óculos", "Luminária", "Almofada",
+    "Toalha", "Lençol", "Travesseiro", "Garrafa", "Copo", "Prato", "Panela",
+    "Faca", "Tigela", "Cadeira", "Mesa", "Tapete", "Cortina", "Espelho", "Vaso",
+    "Quadro", "Relógio de parede",
+]
+COLORS = [
+    "azul", "preta", "branca", "vermelha", "verde", "cinza", "amarela", "rosa",
+    "marrom", "bege", "laranja", "roxa",
+]
+MATERIALS = [
+    "algodão", "poliéster", "couro", "cerâmica", "lã", "madeira", "vidro", "inox",
+]
+
+# Termos como o cliente digita
+QUERIES = [
+    "camiseta", "camisetas pretas", "tênis de couro", "mochila verde", "panelas inox",
+]
+
+
+def _products() -> list[dict]:
+    """Catálogo sintético: combinações de tipo, cor e material."""
+    now = datetime.now()
+    combos = itertools.cycle(itertools.product(TYPES, COLORS, MATERIALS))
+    return [
+        {
+            "id": new_id(),
+            "name": f"{kind} {color} {i}",
+            "description": f"{kind} {color} de {material}, ótima para o dia a dia",
+            "price": Decimal("49.90"),
+            "category": kind,
+            "stock": 10,
+            "active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i, (kind, color, material) in zip(range(ROWS), combos)
+    ]
+
+
+def _ilike(query_text: str):
+    """A busca antiga, reproduzida para comparação."""
+    pattern = f"%{query_text}%"
+    return (
+        select(ProductModel.id)
+        .where(
+            ProductModel.name.ilike(pattern)
+            | ProductModel.description.ilike(pattern)
+        )
+        .where(ProductModel.active == True)
+        .order_by(ProductModel.name)
+        .limit(20)
+    )
+
+
+async def _populate(engine: AsyncEngine) -> None:
+    """Cria a tabela no schema de teste e insere o catálogo."""
+    rows = _products()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[ProductModel.__table__])
+        for start in range(0, ROWS, BATCH):
+            await conn.execute(insert(ProductModel), rows[start:start + BATCH])
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE products"))
+
+
+async def _measure(
+    engine: AsyncEngine, query_text: str
+) -> tuple[float, int, float, int]:
+    """(ms ILIKE, achados ILIKE, ms FTS, achados FTS) para um termo."""
+    async with AsyncSession(engine) as db:
+        repo = SQLAlchemyProductRepository(db)
+
+        ilike_count = await db.scalar(
+            select(func.count()).select_from(_ilike(query_text).limit(None).subquery())
+        )
+        fts_count = len(await repo.search(query_text, limit=ROWS))
+
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            (await db.execute(_ilike(query_text))).all()
+        ilike_ms = (time.perf_counter() - started) / REPEAT * 1e3
+
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            await repo.search(query_text)
+        fts_ms = (time.perf_counter() - started) / REPEAT * 1e3
+
+    return ilike_ms, ilike_count, fts_ms, fts_count
+
+
+async def main() -> None:
+    """Cria o schema, popula, mede e remove o schema."""
+    admin = create_async_engine(get_settings().database_url)
+    async with admin.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    # public no search_path: extensões (unaccent) costumam estar lá
+    engine = create_async_engine(
+        get_settings().database_url,
+        connect_args={"server_settings": {"search_path": f"{SCHEMA}, public"}},
+    )
+    try:
+        await _populate(engine)
+        print(f"{ROWS:,} produtos, média de {REPEAT} buscas (20 por página)")
+        print(
+            f"{'termo':<20}{'ILIKE ms':>10}{'achados':>9}"
+            f"{'FTS ms':>10}{'achados':>9}"
+        )
+        for query_text in QUERIES:
+            measured = await _measure(engine, query_text)
+            ilike_ms, ilike_count, fts_ms, fts_count = measured
+            print(
+                f"{query_text:<20}{ilike_ms:>10.2f}{ilike_count:>9,}"
+                f"{fts_ms:>10.2f}{fts_count:>9,}"
+            )
+    finally:
+        await engine.dispose()
+        async with admin.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await admin.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+# ===========================================================
+# benchmarks/bench_responses.py
+# ===========================================================
+# Compara o custo de montar a resposta de um turno:
+#
+# 1. MessageResponseDTO novo a cada mensagem (validação Pydantic)
+# 2. BotResponse novo a cada mensagem (dataclass, sem validação)
+# 3. Resposta pré-construída do catálogo (nenhuma alocação)
+#
+# FERRAMENTAS:
+# - timeit: mede tempo (melhor de N repetições)
+# - tracemalloc: mede bytes alocados pelo Python
+# ===========================================================
+"""
+Micro-benchmark das respostas do chatbot.
+
+Uso:
+    python -m benchmarks.bench_responses
+"""
+
+import timeit
+import tracemalloc
+from collections.abc import Callable
+
+from src.application.dtos.message_dto import BotResponse, MessageResponseDTO
+from src.application.usecases import responses
+
+
+TURNS = 100_000
+REPEAT = 5
+
+_TEXT = responses.GREETING.text
+
+
+def build_dto() -> object:
+    """Como era: DTO validado montado a cada turno."""
+    return MessageResponseDTO(text=_TEXT)
+
+
+def build_bot_response() -> object:
+    """BotResponse montado a cada turno (sem validação)."""
+    return BotResponse(text=_TEXT)
+
+
+def catalog() -> object:
+    """Resposta pré-construída (caminho atual)."""
+    return responses.GREETING
+
+
+def _time_per_turn(fn: Callable[[], object]) -> float:
+    """Melhor tempo por turno, em nanossegundos."""
+    best = min(timeit.repeat(fn, number=TURNS, repeat=REPEAT))
+    return best / TURNS * 1e9
+
+
+def _bytes_per_turn(fn: Callable[[], object]) -> float:
+    """Bytes alocados por turno (objetos mantidos vivos até o fim)."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [fn() for _ in range(TURNS)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Desconta a própria lista que guarda os resultados
+    list_overhead = kept.__sizeof__()
+    return max(0.0, (after - before - list_overhead) / TURNS)
+
+
+def main() -> None:
+    """Roda as três variações e imprime a tabela."""
+    print(f"{'variação':<22}{'ns/turno':>12}{'bytes/turno':>14}")
+    for name, fn in (
+        ("MessageResponseDTO", build_dto),
+        ("BotResponse", build_bot_response),
+        ("catálogo", catalog),
+    ):
+        print(f"{name:<22}{_time_per_turn(fn):>12.1f}{_bytes_per_turn(fn):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
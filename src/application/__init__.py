@@ -15,6 +15,7 @@ A camada de aplicação:
 """
 
 from src.application.dtos import (
+    BotResponse,
     IncomingMessageDTO,
     MessageResponseDTO,
     OutgoingMessageDTO,
@@ -23,6 +24,7 @@ from src.application.usecases import HandleMessageUseCase
 
 __all__ = [
     # DTOs
+    "BotResponse",
     "IncomingMessageDTO",
     "MessageResponseDTO",
     "OutgoingMessageDTO",
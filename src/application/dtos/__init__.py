@@ -8,12 +8,14 @@ DTOs são objetos simples que transportam dados entre camadas.
 """
 
 from src.application.dtos.message_dto import (
+    BotResponse,
     IncomingMessageDTO,
     MessageResponseDTO,
     OutgoingMessageDTO,
 )
 
 __all__ = [
+    "BotResponse",
     "IncomingMessageDTO",
     "MessageResponseDTO",
     "OutgoingMessageDTO",
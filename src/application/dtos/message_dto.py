@@ -19,6 +19,12 @@
 # - Valida dados automaticamente
 # - Converte tipos (str "123" -> int 123)
 # - Gera schemas JSON automaticamente
+#
+# QUANDO NÃO VALIDAR?
+# Validação tem custo. Ela protege as FRONTEIRAS (dados vindos de
+# fora: webhook, API). A resposta do bot é montada pelo próprio
+# código, então no caminho quente usamos BotResponse: um dataclass
+# congelado, sem validação, que pode ser criado uma vez e reusado.
 # ===========================================================
 """
 DTOs (Data Transfer Objects) para mensagens.
@@ -29,9 +35,14 @@ Usamos Pydantic para validação automática.
 Tipos de DTOs:
 - IncomingMessageDTO: Mensagem recebida do usuário
 - OutgoingMessageDTO: Mensagem enviada ao usuário
-- MessageResponseDTO: Resposta do processamento
+- MessageResponseDTO: Resposta do processamento (validada)
+- BotResponse: Resposta do processamento (leve, imutável)
 """
 
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 from src.shared.types.enums import MessageDirection
@@ -124,3 +135,44 @@ class MessageResponseDTO(BaseModel):
         default=None,
         description="Dados extras sobre o processamento"
     )
+
+
+@dataclass(frozen=True, slots=True)
+class BotResponse:
+    """
+    Resposta do processamento, sem validação (caminho quente).
+    
+    Mesmos campos de MessageResponseDTO, mas:
+    - frozen=True: imutável, pode ser compartilhada entre mensagens
+    - slots=True: sem __dict__, objeto menor e acesso mais rápido
+    - Sem validação: só o código do bot cria estas respostas
+    
+    Respostas fixas (menu, FAQ...) são criadas uma única vez no
+    catálogo (src/application/usecases/responses.py).
+    
+    Attributes:
+        text: Texto da resposta
+        should_transfer_to_human: Se deve transferir para atendente
+        metadata: Dados extras (somente leitura)
+        
+    Example:
+        >>> response = BotResponse(text="Olá! Como posso ajudar?")
+        >>> response.to_dto().text
+        'Olá! Como posso ajudar?'
+    """
+    
+    text: str
+    should_transfer_to_human: bool = False
+    metadata: Mapping[str, Any] | None = None
+    
+    def to_dto(self) -> MessageResponseDTO:
+        """
+        Converte para o DTO validado.
+        
+        Usar ao expor a resposta fora da aplicação (ex: API JSON).
+        """
+        return MessageResponseDTO(
+            text=self.text,
+            should_transfer_to_human=self.should_transfer_to_human,
+            metadata=dict(self.metadata) if self.metadata is not None else None,
+        )
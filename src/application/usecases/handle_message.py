@@ -18,9 +18,15 @@
 # 1. Mensagem chega do WhatsApp
 # 2. Identifica/cria cliente pelo telefone
 # 3. Identifica/cria sessão do cliente
-# 4. Identifica intenção da mensagem
+# 4. Resolve atalho numérico ("1", "2"...) ou identifica intenção
 # 5. Processa baseado no estado atual + intenção
 # 6. Retorna resposta apropriada
+#
+# ATALHOS NUMÉRICOS:
+# Menu e FAQ pedem "Digite o número da opção". As tabelas de
+# atalhos são montadas UMA vez (no import), por estado da sessão.
+# Resolver "1" é uma consulta em dict: O(1), antes de qualquer
+# busca por palavra-chave ou acesso ao banco.
 # ===========================================================
 """
 Caso de uso: Processar mensagem recebida do WhatsApp.
@@ -35,8 +41,12 @@ Responsabilidades:
 - Gerar resposta apropriada
 """
 
-from src.application.dtos.message_dto import IncomingMessageDTO, MessageResponseDTO
+from typing import TypeVar
+
+from src.application.dtos.message_dto import BotResponse, IncomingMessageDTO
+from src.application.usecases import responses
 from src.domain.entities.customer import Customer
+from src.domain.entities.order import Order
 from src.domain.entities.session import Session
 from src.domain.repositories import (
     ICustomerRepository,
@@ -44,9 +54,63 @@ from src.domain.repositories import (
     IProductRepository,
     IOrderRepository,
 )
+from src.domain.services.order_number import extract_order_numbers
 from src.shared.types.enums import SessionState
 
 
+# Status do pedido -> mensagem amigável (montado uma única vez)
+_ORDER_STATUS_MESSAGES: dict[str, str] = {
+    "pending": "⏳ Aguardando confirmação",
+    "confirmed": "✅ Pedido confirmado",
+    "processing": "📦 Em preparação",
+    "shipped": "🚚 Enviado - A caminho",
+    "delivered": "✅ Entregue",
+    "cancelled": "❌ Cancelado",
+}
+
+
+# Formas aceitas para o dígito N: "1", "1.", "1)", "1️⃣"
+# \ufe0f\u20e3 = sufixo do emoji "keycap" (alguns teclados omitem o \ufe0f)
+_CHOICE_SUFFIXES = ("", ".", ")", "\ufe0f\u20e3", "\u20e3")
+
+V = TypeVar("V")
+
+
+def _build_choices(options: dict[str, V]) -> dict[str, V]:
+    """
+    Expande {"1": valor} para todas as formas aceitas do dígito.
+
+    Args:
+        options: Dígito da opção -> valor
+
+    Returns:
+        Dicionário pronto para consulta direta com o texto digitado
+    """
+    return {
+        digit + suffix: value
+        for digit, value in options.items()
+        for suffix in _CHOICE_SUFFIXES
+    }
+
+
+# Pergunta escolhida no FAQ ("1", "1️⃣"...) -> resposta pré-construída
+_FAQ_ANSWERS: dict[str, BotResponse] = _build_choices(dict(responses.FAQ_ANSWERS))
+
+# Estado da sessão -> (texto digitado -> intenção)
+_NUMERIC_SHORTCUTS: dict[SessionState, dict[str, str]] = {
+    SessionState.MENU: _build_choices({
+        "1": "products",
+        "2": "order_status",
+        "3": "faq",
+        "4": "human",
+    }),
+    SessionState.FAQ: dict.fromkeys(_FAQ_ANSWERS, "faq_answer"),
+}
+
+# Estados sem atalhos (evita criar um dict vazio a cada mensagem)
+_NO_SHORTCUTS: dict[str, str] = {}
+
+
 class HandleMessageUseCase:
     """
     Processa uma mensagem recebida do WhatsApp.
@@ -122,7 +186,7 @@ class HandleMessageUseCase:
             ],
         }
     
-    async def execute(self, input_dto: IncomingMessageDTO) -> MessageResponseDTO:
+    async def execute(self, input_dto: IncomingMessageDTO) -> BotResponse:
         """
         Executa o processamento da mensagem.
         
@@ -132,42 +196,56 @@ class HandleMessageUseCase:
             input_dto: Dados da mensagem recebida
             
         Returns:
-            MessageResponseDTO com a resposta a ser enviada
+            BotResponse com a resposta a ser enviada
         """
-        # 1. Buscar ou criar cliente pelo telefone
-        customer = await self._get_or_create_customer(input_dto.phone_number)
+        # 1. Buscar ou criar cliente pelo telefone (só o ID é usado)
+        customer_id = await self._get_or_create_customer_id(input_dto.phone_number)
         
         # 2. Buscar ou criar sessão para o cliente
-        session = await self._get_or_create_session(customer.id)
+        session = await self._get_or_create_session(customer_id)
         
-        # 3. Identificar a intenção da mensagem
-        intent = self._identify_intent(input_dto.text)
+        # 3. Atalho numérico do estado atual ou, se não houver,
+        #    intenção por palavras-chave
+        intent = self._resolve_shortcut(session, input_dto.text)
+        if intent is None:
+            intent = self._identify_intent(input_dto.text)
         
         # 4. Processar mensagem baseado no estado + intenção
         response = await self._process_message(session, intent, input_dto.text)
         
-        # 5. Atualizar sessão (salva mudanças de estado/contexto)
-        await self._session_repo.update(session)
+        # 5. Atualizar sessão apenas se algo mudou (estado/contexto/expiração)
+        # Turnos sem mudança (ex: mensagem não entendida) não geram escrita
+        if session.is_dirty:
+            await self._session_repo.update(session)
         
         return response
     
     # ===== MÉTODOS AUXILIARES (PRIVADOS) =====
     
-    async def _get_or_create_customer(self, phone_number: str) -> Customer:
+    async def _get_or_create_customer_id(self, phone_number: str) -> str:
         """
-        Busca cliente existente ou cria um novo.
+        Busca o ID do cliente ou cria um novo cliente.
         
         O cliente é identificado pelo número de telefone.
         Se não existir, cria automaticamente.
+        
+        Só o ID é buscado: ele nunca muda, e o repositório pode
+        respondê-lo da memória (ver CachedCustomerRepository).
+        
+        Cliente novo via get_or_create: duas mensagens simultâneas do
+        mesmo número novo recebem o mesmo cliente (sem erro de chave
+        duplicada em uma delas).
         """
-        customer = await self._customer_repo.find_by_phone(phone_number)
+        customer_id = await self._customer_repo.find_id_by_phone(phone_number)
         
-        if customer is None:
-            # Cliente novo! Criar registro
-            customer = Customer(phone_number=phone_number)
-            await self._customer_repo.save(customer)
+        if customer_id is None:
+            # Cliente novo! Criar registro (ou receber o da mensagem vizinha)
+            customer, _ = await self._customer_repo.get_or_create(
+                Customer(phone_number=phone_number)
+            )
+            customer_id = customer.id
         
-        return customer
+        return customer_id
     
     async def _get_or_create_session(self, customer_id: str) -> Session:
         """
@@ -175,16 +253,33 @@ class HandleMessageUseCase:
         
         Uma sessão expira após 24 horas de inatividade.
         Se expirada, cria uma nova.
+        
+        get_or_create: mensagens simultâneas do mesmo cliente ficam
+        com a MESMA sessão (só uma delas a cria).
         """
         session = await self._session_repo.find_by_customer(customer_id)
         
         if session is None or session.is_expired:
-            # Criar nova sessão
-            session = Session(customer_id=customer_id)
-            await self._session_repo.save(session)
+            # Criar nova sessão (ou receber a da mensagem vizinha)
+            session, _ = await self._session_repo.get_or_create(
+                Session(customer_id=customer_id)
+            )
         
         return session
     
+    def _resolve_shortcut(self, session: Session, text: str) -> str | None:
+        """
+        Resolve uma opção numérica ("1", "2️⃣"...) do estado atual.
+        
+        Args:
+            session: Sessão (define qual tabela de atalhos vale)
+            text: Texto da mensagem
+            
+        Returns:
+            Intenção do atalho, ou None se o texto não for uma opção
+        """
+        return _NUMERIC_SHORTCUTS.get(session.state, _NO_SHORTCUTS).get(text.strip())
+    
     def _identify_intent(self, text: str) -> str:
         """
         Identifica a intenção da mensagem do usuário.
@@ -215,7 +310,7 @@ class HandleMessageUseCase:
         session: Session, 
         intent: str, 
         text: str
-    ) -> MessageResponseDTO:
+    ) -> BotResponse:
         """
         Processa mensagem baseado no estado atual e intenção.
         
@@ -233,12 +328,20 @@ class HandleMessageUseCase:
         
         # Se quer status do pedido
         if intent == "order_status":
+            # Número já veio junto ("meu pedido é PED-123456")
+            if extract_order_numbers(text):
+                session.update_state(SessionState.ORDER_STATUS)
+                return await self._process_order_number(session, text)
             return await self._handle_order_status(session)
         
         # Se quer FAQ
         if intent == "faq":
             return await self._handle_faq(session)
         
+        # Se escolheu uma pergunta do FAQ
+        if intent == "faq_answer":
+            return self._handle_faq_answer(text)
+        
         # Se quer falar com humano
         if intent == "human":
             return await self._handle_human_transfer(session)
@@ -252,23 +355,13 @@ class HandleMessageUseCase:
     
     # ===== HANDLERS PARA CADA INTENÇÃO =====
     
-    async def _handle_greeting(self, session: Session) -> MessageResponseDTO:
+    async def _handle_greeting(self, session: Session) -> BotResponse:
         """Retorna saudação e menu principal."""
         session.update_state(SessionState.MENU)
         
-        return MessageResponseDTO(
-            text=(
-                "Olá! 👋 Bem-vindo à nossa loja!\n\n"
-                "Como posso ajudar você hoje?\n\n"
-                "1️⃣ Ver produtos\n"
-                "2️⃣ Rastrear pedido\n"
-                "3️⃣ Dúvidas frequentes\n"
-                "4️⃣ Falar com atendente\n\n"
-                "Digite o número da opção desejada ou escreva sua dúvida."
-            )
-        )
+        return responses.GREETING
     
-    async def _handle_products(self, session: Session) -> MessageResponseDTO:
+    async def _handle_products(self, session: Session) -> BotResponse:
         """Retorna lista de produtos/categorias."""
         session.update_state(SessionState.PRODUCTS)
         
@@ -276,9 +369,7 @@ class HandleMessageUseCase:
         products = await self._product_repo.find_all_active()
         
         if not products:
-            return MessageResponseDTO(
-                text="No momento não temos produtos disponíveis. Tente novamente mais tarde!"
-            )
+            return responses.NO_PRODUCTS
         
         # Agrupa produtos por categoria
         categories: dict[str, list] = {}
@@ -297,100 +388,82 @@ class HandleMessageUseCase:
         
         text += "Digite o nome do produto para mais detalhes ou 'menu' para voltar."
         
-        return MessageResponseDTO(text=text)
+        return BotResponse(text=text)
     
-    async def _handle_order_status(self, session: Session) -> MessageResponseDTO:
+    async def _handle_order_status(self, session: Session) -> BotResponse:
         """Inicia fluxo de rastreamento de pedido."""
         session.update_state(SessionState.ORDER_STATUS)
         
-        return MessageResponseDTO(
-            text=(
-                "📦 *Rastrear Pedido*\n\n"
-                "Por favor, digite o número do seu pedido.\n\n"
-                "Exemplo: `PED-123456`"
-            )
-        )
+        return responses.ORDER_STATUS_PROMPT
     
     async def _process_order_number(
         self, 
         session: Session, 
         text: str
-    ) -> MessageResponseDTO:
-        """Processa número do pedido informado."""
-        # Limpa e normaliza o número do pedido
-        order_id = text.strip().upper()
+    ) -> BotResponse:
+        """
+        Processa número(s) do pedido informado(s).
         
-        # Busca pedido no repositório
-        order = await self._order_repo.find_by_id(order_id)
+        Aceita o número escrito de forma livre ("ped 123456") e
+        vários números na mesma mensagem, resolvidos com uma
+        única consulta ao repositório.
+        """
+        numbers = extract_order_numbers(text)
         
-        if order is None:
-            return MessageResponseDTO(
-                text=(
-                    f"❌ Pedido *{order_id}* não encontrado.\n\n"
-                    "Verifique o número e tente novamente, ou digite 'menu' para voltar."
-                )
-            )
+        if not numbers:
+            return responses.NO_ORDER_NUMBER
         
-        # Mapeia status para mensagens amigáveis
-        status_messages = {
-            "pending": "⏳ Aguardando confirmação",
-            "confirmed": "✅ Pedido confirmado",
-            "processing": "📦 Em preparação",
-            "shipped": "🚚 Enviado - A caminho",
-            "delivered": "✅ Entregue",
-            "cancelled": "❌ Cancelado",
-        }
+        # Busca todos os pedidos de uma vez
+        orders = await self._order_repo.find_by_numbers(numbers)
+        orders_by_number = {order.number: order for order in orders}
         
-        status_text = status_messages.get(order.status.value, order.status.value)
+        blocks = [
+            self._format_order(number, orders_by_number.get(number))
+            for number in numbers
+        ]
         
-        return MessageResponseDTO(
-            text=(
-                f"📦 *Pedido {order_id}*\n\n"
-                f"Status: {status_text}\n"
-                f"Valor: R$ {order.total:.2f}\n"
-                f"Data: {order.created_at.strftime('%d/%m/%Y')}\n\n"
-                "Digite 'menu' para voltar."
+        if len(orders_by_number) < len(numbers):
+            footer = (
+                "Verifique o número e tente novamente, "
+                "ou digite 'menu' para voltar."
             )
+        else:
+            footer = "Digite 'menu' para voltar."
+        
+        return BotResponse(text="\n\n".join([*blocks, footer]))
+    
+    def _format_order(self, number: str, order: Order | None) -> str:
+        """Monta o texto de status de um pedido."""
+        if order is None:
+            return f"❌ Pedido *{number}* não encontrado."
+        
+        status_text = _ORDER_STATUS_MESSAGES.get(
+            order.status.value, order.status.value
+        )
+        
+        return (
+            f"📦 *Pedido {number}*\n\n"
+            f"Status: {status_text}\n"
+            f"Valor: R$ {order.total:.2f}\n"
+            f"Data: {order.created_at.strftime('%d/%m/%Y')}"
         )
     
-    async def _handle_faq(self, session: Session) -> MessageResponseDTO:
+    async def _handle_faq(self, session: Session) -> BotResponse:
         """Retorna menu de perguntas frequentes."""
         session.update_state(SessionState.FAQ)
         
-        return MessageResponseDTO(
-            text=(
-                "❓ *Perguntas Frequentes*\n\n"
-                "1️⃣ Qual o prazo de entrega?\n"
-                "2️⃣ Como faço para trocar?\n"
-                "3️⃣ Quais formas de pagamento?\n"
-                "4️⃣ Como cancelar um pedido?\n\n"
-                "Digite o número da pergunta ou 'menu' para voltar."
-            )
-        )
+        return responses.FAQ_MENU
+    
+    def _handle_faq_answer(self, text: str) -> BotResponse:
+        """Responde a pergunta escolhida (sessão continua no FAQ)."""
+        return _FAQ_ANSWERS[text.strip()]
     
-    async def _handle_human_transfer(self, session: Session) -> MessageResponseDTO:
+    async def _handle_human_transfer(self, session: Session) -> BotResponse:
         """Transfere para atendimento humano."""
         session.update_state(SessionState.HUMAN_TRANSFER)
         
-        return MessageResponseDTO(
-            text=(
-                "👤 *Atendimento Humano*\n\n"
-                "Vou transferir você para um de nossos atendentes.\n"
-                "Aguarde um momento, por favor.\n\n"
-                "Horário de atendimento:\n"
-                "Segunda a Sexta: 9h às 18h\n"
-                "Sábado: 9h às 13h"
-            ),
-            should_transfer_to_human=True
-        )
+        return responses.HUMAN_TRANSFER
     
-    async def _handle_unknown(self, session: Session) -> MessageResponseDTO:
+    async def _handle_unknown(self, session: Session) -> BotResponse:
         """Mensagem quando não entende a intenção."""
-        return MessageResponseDTO(
-            text=(
-                "🤔 Desculpe, não entendi sua mensagem.\n\n"
-                "Você pode:\n"
-                "• Digitar 'menu' para ver as opções\n"
-                "• Digitar 'atendente' para falar com uma pessoa\n"
-            )
-        )
+        return responses.UNKNOWN
@@ -0,0 +1,149 @@
+# ===========================================================
+# src/application/usecases/responses.py
+# ===========================================================
+# CATÁLOGO de respostas fixas do chatbot.
+#
+# POR QUE PRÉ-CONSTRUIR?
+# Menu, FAQ, transferência e "não entendi" têm sempre o mesmo
+# texto. Montar um objeto novo (com validação Pydantic) a cada
+# mensagem é trabalho repetido. Aqui cada resposta é criada UMA
+# vez, no import, e reutilizada em todas as conversas.
+#
+# É SEGURO COMPARTILHAR?
+# Sim: BotResponse é frozen (imutável). Ninguém consegue alterar
+# o texto de uma resposta que outra conversa também está usando.
+#
+# MappingProxyType:
+# Visão somente leitura de um dict (o catálogo também não muda).
+# ===========================================================
+"""
+Respostas fixas do chatbot, criadas uma única vez.
+
+Uso:
+    from src.application.usecases import responses
+
+    return responses.GREETING
+"""
+
+from types import MappingProxyType
+
+from src.application.dtos.message_dto import BotResponse
+
+
+# ===== MENU PRINCIPAL =====
+
+GREETING = BotResponse(
+    text=(
+        "Olá! 👋 Bem-vindo à nossa loja!\n\n"
+        "Como posso ajudar você hoje?\n\n"
+        "1️⃣ Ver produtos\n"
+        "2️⃣ Rastrear pedido\n"
+        "3️⃣ Dúvidas frequentes\n"
+        "4️⃣ Falar com atendente\n\n"
+        "Digite o número da opção desejada ou escreva sua dúvida."
+    )
+)
+
+UNKNOWN = BotResponse(
+    text=(
+        "🤔 Desculpe, não entendi sua mensagem.\n\n"
+        "Você pode:\n"
+        "• Digitar 'menu' para ver as opções\n"
+        "• Digitar 'atendente' para falar com uma pessoa\n"
+    )
+)
+
+
+# ===== PRODUTOS =====
+
+NO_PRODUCTS = BotResponse(
+    text="No momento não temos produtos disponíveis. Tente novamente mais tarde!"
+)
+
+
+# ===== PEDIDOS =====
+
+ORDER_STATUS_PROMPT = BotResponse(
+    text=(
+        "📦 *Rastrear Pedido*\n\n"
+        "Por favor, digite o número do seu pedido.\n\n"
+        "Exemplo: `PED-123456`"
+    )
+)
+
+NO_ORDER_NUMBER = BotResponse(
+    text=(
+        "❌ Não encontrei um número de pedido na sua mensagem.\n\n"
+        "Digite no formato `PED-123456` ou 'menu' para voltar."
+    )
+)
+
+
+# ===== PERGUNTAS FREQUENTES =====
+
+FAQ_MENU = BotResponse(
+    text=(
+        "❓ *Perguntas Frequentes*\n\n"
+        "1️⃣ Qual o prazo de entrega?\n"
+        "2️⃣ Como faço para trocar?\n"
+        "3️⃣ Quais formas de pagamento?\n"
+        "4️⃣ Como cancelar um pedido?\n\n"
+        "Digite o número da pergunta ou 'menu' para voltar."
+    )
+)
+
+_FAQ_FOOTER = "\n\nDigite outro número ou 'menu' para voltar."
+
+# Número da pergunta -> resposta (em memória: não há consulta ao banco)
+FAQ_ANSWERS: MappingProxyType[str, BotResponse] = MappingProxyType({
+    "1": BotResponse(
+        text=(
+            "🚚 *Qual o prazo de entrega?*\n\n"
+            "Capitais: 2 a 5 dias úteis.\n"
+            "Demais cidades: 5 a 10 dias úteis.\n"
+            "O prazo começa a contar após a confirmação do pagamento."
+            + _FAQ_FOOTER
+        )
+    ),
+    "2": BotResponse(
+        text=(
+            "🔄 *Como faço para trocar?*\n\n"
+            "Você tem até 7 dias após o recebimento para solicitar a troca.\n"
+            "O produto deve estar sem uso e na embalagem original.\n"
+            "Digite 'atendente' para iniciar a troca."
+            + _FAQ_FOOTER
+        )
+    ),
+    "3": BotResponse(
+        text=(
+            "💳 *Quais formas de pagamento?*\n\n"
+            "• Pix (aprovação imediata)\n"
+            "• Cartão de crédito em até 12x\n"
+            "• Boleto bancário (até 3 dias úteis para compensar)"
+            + _FAQ_FOOTER
+        )
+    ),
+    "4": BotResponse(
+        text=(
+            "❌ *Como cancelar um pedido?*\n\n"
+            "Pedidos ainda não enviados podem ser cancelados sem custo.\n"
+            "Digite 'atendente' informando o número do pedido."
+            + _FAQ_FOOTER
+        )
+    ),
+})
+
+
+# ===== ATENDIMENTO HUMANO =====
+
+HUMAN_TRANSFER = BotResponse(
+    text=(
+        "👤 *Atendimento Humano*\n\n"
+        "Vou transferir você para um de nossos atendentes.\n"
+        "Aguarde um momento, por favor.\n\n"
+        "Horário de atendimento:\n"
+        "Segunda a Sexta: 9h às 18h\n"
+        "Sábado: 9h às 13h"
+    ),
+    should_transfer_to_human=True,
+)
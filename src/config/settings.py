@@ -27,6 +27,7 @@ Uso:
 # functools.lru_cache - Decorator para cachear resultado de função
 # Assim a função get_settings() só lê o .env UMA vez
 from functools import lru_cache
+from typing import Literal
 
 # Pydantic Settings - Configuração baseada em variáveis de ambiente
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -49,6 +50,8 @@ class Settings(BaseSettings):
         debug: Modo debug ativado
         secret_key: Chave secreta para JWT e criptografia
         database_url: URL de conexão com PostgreSQL
+        database_pool_*: Pool de conexões da engine
+        database_replica_*: Réplica de leitura (opcional)
         redis_url: URL de conexão com Redis
         whatsapp_*: Configurações da API do WhatsApp
         api_host: Host onde a API vai rodar
@@ -94,10 +97,132 @@ class Settings(BaseSettings):
     # URL de conexão PostgreSQL (OBRIGATÓRIA)
     database_url: str
     
+    # ===== POOL DE CONEXÕES =====
+    # Conexões mantidas abertas + extras temporárias (sob pico)
+    database_pool_size: int = 5
+    database_pool_max_overflow: int = 10
+    
+    # Espera máxima por uma conexão livre antes de desistir
+    database_pool_timeout_seconds: float = 30.0
+    
+    # Conexões mais velhas que isso são reabertas no checkout
+    # (-1 = nunca). Evita conexões derrubadas por firewall/proxy
+    database_pool_recycle_seconds: int = 1800
+    
+    # Testa a conexão (SELECT 1) antes de entregar: depois de um
+    # failover, conexões mortas são trocadas em vez de dar erro
+    database_pool_pre_ping: bool = True
+    
+    # Modo PgBouncer (pool_mode=transaction): sem prepared statements
+    # nomeados/cacheados, que não sobrevivem à troca de conexão no proxy
+    database_pgbouncer: bool = False
+    
+    # ===== RÉPLICA DE LEITURA =====
+    # Catálogo, consultas de pedidos e count_active leem da réplica
+    # (engine e pool próprios, mesmos parâmetros de pool acima).
+    # Vazio = tudo no primário
+    database_replica_url: str | None = None
+    
+    # Réplica mais atrasada que isso: leituras voltam ao primário
+    database_replica_max_lag_seconds: float = 5.0
+    
+    # Intervalo mínimo entre medições do atraso da réplica
+    database_replica_check_seconds: float = 1.0
+    
     # ===== CACHE REDIS =====
     # URL de conexão Redis (opcional, tem valor padrão)
     redis_url: str = "redis://localhost:6379/0"
     
+    # ===== CACHE DE PEDIDOS =====
+    # Validade (segundos) de um pedido encontrado no cache
+    order_cache_ttl_seconds: float = 60.0
+    
+    # Validade (segundos) de um "pedido não existe" (cache negativo)
+    # Curto: um pedido recém-criado não pode ficar "invisível" por muito tempo
+    order_cache_negative_ttl_seconds: float = 10.0
+    
+    # Máximo de pedidos no cache em memória de cada worker
+    order_cache_max_entries: int = 10_000
+    
+    # Usa o Redis como segundo nível (compartilhado entre workers)
+    order_cache_redis_enabled: bool = False
+    
+    # Com Redis: validade (segundos) da cópia em memória de cada worker.
+    # Alterar um pedido limpa só o L1 de quem alterou; nos outros
+    # workers a cópia antiga vale até este tempo
+    order_cache_local_ttl_seconds: float = 5.0
+    
+    # ===== IDENTIDADE DE CLIENTES (telefone -> ID) =====
+    # Cache telefone -> ID em cada worker, mais um filtro de Bloom
+    # com todos os telefones cadastrados: cliente conhecido não
+    # consulta o banco, número novo vai direto para o INSERT
+    customer_identity_enabled: bool = False
+    
+    # Limite e validade do cache telefone -> ID. A validade é o
+    # tempo que os OUTROS workers levam para ver um cliente
+    # alterado/removido (a limpeza do cache é local)
+    customer_identity_max_entries: int = 100_000
+    customer_identity_ttl_seconds: float = 60.0
+    
+    # Telefones previstos no filtro (~1,8 MB por milhão, 0,1% de
+    # falso positivo). Na carga, cresce para o dobro da tabela
+    customer_identity_bloom_capacity: int = 1_000_000
+    
+    # Intervalo para incluir clientes criados por outros workers
+    customer_identity_sync_seconds: float = 5.0
+    
+    # ===== SESSÕES DE CHAT =====
+    # Onde ficam as sessões: "sql" (PostgreSQL) ou "redis"
+    # Redis expira as sessões sozinho (TTL nativo)
+    session_backend: Literal["sql", "redis"] = "sql"
+    
+    # Cache em memória de cada worker na frente do backend de sessões.
+    # Ideal com roteamento por telefone (cliente sempre no mesmo worker)
+    session_cache_enabled: bool = False
+    
+    # Validade (segundos) de uma cópia local da sessão
+    session_cache_ttl_seconds: float = 30.0
+    
+    # Limites do cache local: quantidade e memória estimada
+    session_cache_max_entries: int = 10_000
+    session_cache_max_bytes: int = 32 * 1024 * 1024
+    
+    # Invalida as cópias dos outros workers via Redis Pub/Sub
+    session_cache_pubsub_enabled: bool = False
+    
+    # Write-behind (só backend "sql"): updates de sessão vão para um
+    # buffer e são gravados em lote.
+    # ATENÇÃO: se o processo morrer sem shutdown, perde-se até
+    # session_write_behind_interval_ms de alterações de sessão.
+    session_write_behind_enabled: bool = False
+    session_write_behind_interval_ms: int = 200
+    session_write_behind_max_batch: int = 500
+    # Tentativas de gravar uma mesma versão antes de descartá-la (com log)
+    session_write_behind_max_attempts: int = 5
+    
+    # Limpeza de sessões expiradas (só backend "sql"; o Redis expira sozinho)
+    session_reaper_enabled: bool = True
+    session_reaper_interval_seconds: float = 60.0
+    session_reaper_batch_size: int = 500
+    session_reaper_pause_ms: int = 50
+    
+    # ===== BUSCA DE PRODUTOS =====
+    # Sem resultado na busca textual, tenta nomes parecidos
+    # (erros de digitação). Requer a extensão pg_trgm (migração 006)
+    product_search_fuzzy_enabled: bool = False
+    
+    # ===== CATÁLOGO DE PRODUTOS EM MEMÓRIA =====
+    # Snapshot de todos os produtos ativos em cada worker.
+    # Verifica a versão da tabela a cada intervalo e reconstrói
+    # quando algo mudou (ideal para catálogos de poucos milhares)
+    product_catalog_enabled: bool = False
+    product_catalog_refresh_seconds: float = 5.0
+    
+    # ===== API ADMINISTRATIVA =====
+    # Token do header X-Admin-Token (importação do catálogo).
+    # Sem valor, os endpoints /admin não existem (404)
+    admin_api_token: str | None = None
+    
     # ===== WHATSAPP CLOUD API =====
     # Todas opcionais (str | None = pode ser None)
     whatsapp_api_token: str | None = None
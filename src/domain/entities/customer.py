@@ -25,12 +25,18 @@
 #
 # O QUE É field(default_factory=...)?
 # Usado para valores padrão que precisam ser calculados:
-#   id: str = field(default_factory=lambda: str(uuid.uuid4()))
-# Cada instância recebe um UUID diferente.
+#   id: str = field(default_factory=new_id)
+# Cada instância recebe um UUID diferente (chamando new_id()).
 #
 # O QUE É __post_init__?
 # Método chamado APÓS o __init__ gerado pelo @dataclass.
 # Usado para validações e processamentos adicionais.
+#
+# O QUE É @dataclass(slots=True)?
+# Os atributos ficam em posições fixas (__slots__) em vez de um
+# __dict__ por objeto: cada instância ocupa menos memória e o
+# acesso aos atributos é mais rápido. Em troca, não é possível
+# criar atributos que não foram declarados.
 # ===========================================================
 """
 Entidade Customer (Cliente).
@@ -54,11 +60,11 @@ from dataclasses import dataclass, field
 # datetime: Trabalhar com datas e horas
 from datetime import datetime
 
-# uuid: Gerar identificadores únicos universais
-import uuid
+# new_id: Gera identificadores únicos ordenados por tempo (UUIDv7)
+from src.shared.utils.ids import new_id
 
 
-@dataclass
+@dataclass(slots=True)
 class Customer:
     """
     Entidade de domínio que representa um cliente.
@@ -96,9 +102,8 @@ class Customer:
     # ===== ATRIBUTOS GERADOS AUTOMATICAMENTE =====
     # field(default_factory=...) gera um valor diferente para cada instância
     
-    # ID único (UUID v4)
-    # lambda: str(uuid.uuid4()) é uma função que gera um novo UUID
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # ID único (UUIDv7: ordenado por tempo, ver src/shared/utils/ids.py)
+    id: str = field(default_factory=new_id)
     
     # Data de criação (momento da instanciação)
     created_at: datetime = field(default_factory=datetime.now)
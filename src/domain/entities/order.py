@@ -23,13 +23,13 @@ Contém o ciclo de vida completo do pedido.
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-import uuid
 
 # Importa o enum de status do pedido
 from src.shared.types.enums import OrderStatus
+from src.shared.utils.ids import new_id
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Entidade de domínio que representa um pedido.
@@ -64,9 +64,13 @@ class Order:
     # Status atual do pedido (começa em PENDING)
     status: OrderStatus = OrderStatus.PENDING
     
+    # Número amigável informado ao cliente (ex: "PED-123456")
+    # Gerado pelo banco (sequência) ao salvar; None até lá
+    number: str | None = None
+    
     # ===== ATRIBUTOS GERADOS =====
     
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     
@@ -28,10 +28,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 # Decimal: Tipo para valores monetários (precisão exata)
 from decimal import Decimal
-import uuid
 
+from src.shared.utils.ids import new_id
 
-@dataclass
+
+@dataclass(slots=True)
 class Product:
     """
     Entidade de domínio que representa um produto.
@@ -83,7 +84,7 @@ class Product:
     
     # ===== ATRIBUTOS GERADOS =====
     
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     
@@ -129,6 +130,10 @@ class Product:
         
         Usado quando um pedido é realizado.
         
+        ATENÇÃO: checa e altera só este objeto. Com compras
+        simultâneas, use IProductRepository.reserve_stock, que
+        faz a checagem e a baixa no banco em um comando só.
+        
         Args:
             quantity: Quantidade a diminuir
             
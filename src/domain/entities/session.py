@@ -19,6 +19,24 @@
 # 3. typing.Any
 #    - Tipo que aceita qualquer valor
 #    - Usado no contexto que pode ter valores variados
+#
+# 4. Dirty tracking (rastreamento de alterações)
+#    - A sessão anota QUAIS campos mudaram desde a última gravação
+#    - O repositório grava apenas esses campos (ou nada!)
+#    - Turnos que não mudam nada não custam escrita no banco
+#
+# 5. Delta do contexto
+#    - set_context/remove_context anotam QUAIS chaves mudaram
+#    - context_delta() devolve (chaves gravadas, chaves removidas):
+#      o repositório aplica só isso ao JSON do banco, em vez de
+#      regravar o contexto inteiro (carrinho, cursores) a cada turno
+#    - clear_context troca o contexto inteiro (context_replaced)
+#
+# 6. Limite do contexto
+#    - O contexto serializado não passa de MAX_CONTEXT_BYTES
+#    - set_context levanta ValueError antes de alterar a sessão
+#    - O tamanho é mantido por chave: set_context serializa só o
+#      valor gravado, não o contexto inteiro (context_size soma)
 # ===========================================================
 """
 Entidade Session (Sessão de Chat).
@@ -28,16 +46,35 @@ A sessão mantém o estado da conversa e um contexto
 com dados temporários (como carrinho, pesquisa atual, etc.).
 """
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 # Any: Tipo que aceita qualquer valor (para o contexto flexível)
 from typing import Any
-import uuid
 
 from src.shared.types.enums import SessionState
+from src.shared.utils.ids import new_id
+
+
+# Tempo de vida da sessão sem interação
+SESSION_TTL = timedelta(hours=24)
+
+# Intervalo mínimo entre duas renovações de expiração.
+# Renovar a cada mensagem geraria uma escrita por turno apenas para
+# empurrar expires_at alguns segundos; com o intervalo, as renovações
+# de mensagens próximas são agrupadas em uma só.
+RENEWAL_INTERVAL = timedelta(minutes=5)
 
+# Tamanho máximo do contexto serializado em JSON (bytes UTF-8).
+# O contexto guarda dados de conversa (carrinho, busca, cursores),
+# não catálogos: acima disso, algo está acumulando sem limpar.
+MAX_CONTEXT_BYTES = 16 * 1024
 
-@dataclass
+# Marca de "chave ausente" no contexto (None é um valor válido)
+_ABSENT = object()
+
+
+@dataclass(slots=True)
 class Session:
     """
     Entidade de domínio que representa uma sessão de chat.
@@ -75,14 +112,42 @@ class Session:
     
     # ===== ATRIBUTOS GERADOS =====
     
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     
-    # Sessão expira em 24 horas por padrão
-    # timedelta(hours=24) cria uma duração de 24 horas
+    # Sessão expira em 24 horas por padrão (SESSION_TTL)
     expires_at: datetime = field(
-        default_factory=lambda: datetime.now() + timedelta(hours=24)
+        default_factory=lambda: datetime.now() + SESSION_TTL
+    )
+    
+    # ===== CONTROLE DE ALTERAÇÕES (dirty tracking) =====
+    # init=False: não fazem parte do construtor
+    # compare=False/repr=False: não afetam __eq__ nem __repr__
+    
+    # Campos persistidos alterados desde a última gravação
+    # ("state", "context", "expires_at")
+    _changed_fields: set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    
+    # Chaves do contexto alteradas/removidas desde a última gravação
+    _changed_context_keys: set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    
+    # Contexto trocado por inteiro (clear_context) desde a última gravação
+    _context_replaced: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
+    
+    # Bytes em JSON de cada chave do contexto ('"chave": valor') e
+    # o dicionário medido (contexto trocado por fora = medir de novo)
+    _context_sizes: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _sized_context: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
     )
     
     # ===== PROPRIEDADES =====
@@ -120,6 +185,70 @@ class Session:
         # Se já expirou, retorna zero
         return max(remaining, timedelta(0))
     
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Verifica se a sessão tem alterações ainda não gravadas.
+        
+        Returns:
+            True se algum campo persistido mudou
+            
+        Example:
+            >>> session.update_state(SessionState.MENU)
+            >>> session.is_dirty
+            True
+        """
+        return bool(self._changed_fields)
+    
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        """Campos persistidos alterados desde a última gravação."""
+        return frozenset(self._changed_fields)
+    
+    @property
+    def changed_context_keys(self) -> frozenset[str]:
+        """Chaves do contexto alteradas desde a última gravação."""
+        return frozenset(self._changed_context_keys)
+    
+    @property
+    def context_replaced(self) -> bool:
+        """True se o contexto foi trocado por inteiro (clear_context)."""
+        return self._context_replaced
+    
+    @property
+    def context_size(self) -> int:
+        """Tamanho do contexto serializado em JSON (bytes UTF-8)."""
+        sizes = self._entry_sizes()
+        return _object_size(sum(sizes.values()), len(sizes))
+    
+    @property
+    def context_delta_size(self) -> int:
+        """Tamanho em JSON das chaves gravadas de context_delta()."""
+        sizes = self._entry_sizes()
+        written = [sizes[key] for key in self._changed_context_keys if key in sizes]
+        return _object_size(sum(written), len(written))
+    
+    def context_delta(self) -> tuple[dict[str, Any], frozenset[str]]:
+        """
+        Alterações do contexto desde a última gravação.
+        
+        Returns:
+            (chaves gravadas com o valor atual, chaves removidas)
+            
+        Example:
+            >>> session.set_context("cart", [])
+            >>> session.remove_context("last_search")
+            >>> session.context_delta()
+            ({'cart': []}, frozenset({'last_search'}))
+        """
+        updated = {
+            key: self.context[key]
+            for key in self._changed_context_keys
+            if key in self.context
+        }
+        removed = frozenset(self._changed_context_keys.difference(updated))
+        return updated, removed
+    
     # ===== MÉTODOS DE ESTADO =====
     
     def update_state(self, new_state: SessionState) -> None:
@@ -127,9 +256,12 @@ class Session:
         Atualiza o estado da sessão.
         
         A cada atualização de estado:
-        - O estado muda para o novo valor
-        - A data de atualização é renovada
-        - A expiração é renovada (+24 horas)
+        - O estado muda para o novo valor (se for diferente)
+        - A expiração é renovada (+24 horas), no máximo uma vez
+          a cada RENEWAL_INTERVAL
+        
+        Repetir o estado atual (ex: pedir o menu estando no menu)
+        não marca a sessão como alterada.
         
         Args:
             new_state: Novo estado da sessão
@@ -139,10 +271,12 @@ class Session:
             >>> session.state == SessionState.MENU
             True
         """
-        self.state = new_state
-        self.updated_at = datetime.now()
-        # Renova expiração a cada interação
-        self.expires_at = datetime.now() + timedelta(hours=24)
+        if new_state != self.state:
+            self.state = new_state
+            self._mark_changed("state")
+        
+        # Renova expiração a cada interação (agrupada)
+        self.renew_if_due()
     
     # ===== MÉTODOS DE CONTEXTO =====
     
@@ -160,9 +294,36 @@ class Session:
         Example:
             >>> session.set_context("cart", [{"product_id": "123", "qty": 2}])
             >>> session.set_context("last_search", "camiseta azul")
+            
+        Raises:
+            ValueError: Se o contexto passar de MAX_CONTEXT_BYTES
+            
+        Note:
+            Alterar um valor mutável "por dentro" (ex: cart.append(...))
+            não é detectado sozinho. Sempre grave com set_context,
+            mesmo passando de volta o mesmo objeto: ele conta como
+            alteração (comparado consigo mesmo, pareceria igual).
         """
+        current = self.context.get(key, _ABSENT)
+        if current == value and (current is not value or _is_immutable(value)):
+            return
+        
+        # Só o valor novo é serializado; as outras chaves já têm tamanho
+        sizes = self._entry_sizes()
+        entry = _entry_size(key, value)
+        size = _object_size(
+            sum(sizes.values()) - sizes.get(key, 0) + entry,
+            len(sizes) + (key not in sizes),
+        )
+        if size > MAX_CONTEXT_BYTES:
+            raise ValueError(
+                f"Contexto da sessão muito grande: {size} bytes "
+                f"(máximo {MAX_CONTEXT_BYTES}) ao gravar '{key}'"
+            )
+        
         self.context[key] = value
-        self.updated_at = datetime.now()
+        sizes[key] = entry
+        self._mark_changed("context", key)
     
     def get_context(self, key: str, default: Any = None) -> Any:
         """
@@ -206,8 +367,13 @@ class Session:
         Note:
             Não levanta erro se a chave não existir.
         """
-        self.context.pop(key, None)
-        self.updated_at = datetime.now()
+        if key not in self.context:
+            return
+        
+        sizes = self._entry_sizes()
+        del self.context[key]
+        del sizes[key]
+        self._mark_changed("context", key)
     
     def clear_context(self) -> None:
         """
@@ -220,15 +386,92 @@ class Session:
             >>> session.context
             {}
         """
+        if not self.context:
+            return
+        
+        keys = list(self.context)
         self.context = {}
-        self.updated_at = datetime.now()
+        self._context_replaced = True
+        self._mark_changed("context", *keys)
     
     def renew(self) -> None:
         """
         Renova a sessão (atualiza expiração).
         
-        Chamado implicitamente em update_state e set_context.
-        Pode ser chamado explicitamente para manter sessão ativa.
+        Sempre renova, independente do intervalo. Pode ser chamado
+        explicitamente para manter sessão ativa.
         """
+        self.expires_at = datetime.now() + SESSION_TTL
+        self._mark_changed("expires_at")
+    
+    def renew_if_due(self) -> bool:
+        """
+        Renova a expiração apenas se a última renovação tiver
+        acontecido há mais de RENEWAL_INTERVAL.
+        
+        A última renovação é deduzida de expires_at - SESSION_TTL,
+        então não precisa de coluna extra no banco.
+        
+        Returns:
+            True se a expiração foi renovada
+        """
+        last_renewal = self.expires_at - SESSION_TTL
+        if datetime.now() - last_renewal < RENEWAL_INTERVAL:
+            return False
+        
+        self.renew()
+        return True
+    
+    # ===== MÉTODOS DE PERSISTÊNCIA =====
+    
+    def mark_clean(self) -> None:
+        """
+        Marca a sessão como gravada (sem alterações pendentes).
+        
+        Chamado pelo repositório após salvar/atualizar.
+        """
+        self._changed_fields.clear()
+        self._changed_context_keys.clear()
+        self._context_replaced = False
+    
+    def _entry_sizes(self) -> dict[str, int]:
+        """
+        Tamanho de cada chave do contexto.
+        
+        Medido de novo só quando o contexto foi trocado ou alterado
+        fora de set_context/remove_context (construtor, leitura do
+        banco, clear_context).
+        """
+        sizes = self._context_sizes
+        context = self.context
+        if self._sized_context is not context or sizes.keys() != context.keys():
+            sizes = {key: _entry_size(key, value) for key, value in context.items()}
+            self._context_sizes = sizes
+            self._sized_context = context
+        return sizes
+    
+    def _mark_changed(self, field_name: str, *context_keys: str) -> None:
+        """Registra alteração de um campo (e chaves de contexto)."""
+        self._changed_fields.add(field_name)
+        self._changed_context_keys.update(context_keys)
         self.updated_at = datetime.now()
-        self.expires_at = datetime.now() + timedelta(hours=24)
+
+
+def _is_immutable(value: Any) -> bool:
+    """True para valores que não podem ser alterados "por dentro"."""
+    return isinstance(value, (str, int, float, bool, type(None), tuple, frozenset))
+
+
+def _json_size(value: Any) -> int:
+    """Bytes do valor serializado (valores não JSON viram str)."""
+    return len(json.dumps(value, default=str, ensure_ascii=False).encode())
+
+
+def _entry_size(key: str, value: Any) -> int:
+    """Bytes de '"chave": valor' dentro do JSON do contexto."""
+    return _json_size(key) + 2 + _json_size(value)
+
+
+def _object_size(entries: int, count: int) -> int:
+    """Bytes de um objeto JSON: chaves, entradas e separadores ", "."""
+    return 2 + entries + 2 * max(count - 1, 0)
@@ -52,9 +52,11 @@ Example:
 
 # abc: Módulo para criar Abstract Base Classes
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 # Importa a entidade Customer do domínio
 from src.domain.entities.customer import Customer
+from src.shared.utils.pagination import Page
 
 
 class ICustomerRepository(ABC):
@@ -94,6 +96,27 @@ class ICustomerRepository(ABC):
         """
         ...  # O "..." indica que o corpo será implementado na subclasse
     
+    @abstractmethod
+    async def find_id_by_phone(self, phone: str) -> str | None:
+        """
+        Busca só o ID do cliente pelo telefone.
+        
+        O ID de um cliente nunca muda: é o que o chatbot precisa a
+        cada mensagem, e pode ser cacheado (ver customer_identity).
+        
+        Feito para o caminho de CRIAÇÃO (seguido de get_or_create):
+        com cache, um número cadastrado há segundos por outro worker
+        pode vir como None (o get_or_create devolve o existente).
+        Para saber se o cliente existe, use find_by_phone.
+        
+        Args:
+            phone: Número de telefone (apenas dígitos)
+            
+        Returns:
+            ID do cliente, ou None se o telefone não estiver cadastrado
+        """
+        ...
+    
     @abstractmethod
     async def find_by_id(self, id: str) -> Customer | None:
         """
@@ -116,7 +139,49 @@ class ICustomerRepository(ABC):
             Lista de todos os clientes cadastrados
             
         Note:
-            Em produção, considere paginação para grandes volumes.
+            Carrega TODOS na memória. Para percorrer a base inteira
+            use iter_all; para telas e APIs, find_page.
+        """
+        ...
+    
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[Customer]:
+        """
+        Percorre todos os clientes sem carregá-los de uma vez.
+        
+        Lê do banco em lotes de chunk_size (cursor do servidor).
+        Ideal para exportações e jobs sobre a base inteira.
+        
+        Args:
+            chunk_size: Clientes lidos do banco por vez
+            
+        Example:
+            async for customer in repo.iter_all():
+                writer.writerow([customer.phone_number, customer.name])
+        """
+        ...
+    
+    @abstractmethod
+    async def find_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Customer]:
+        """
+        Uma página de clientes, em ordem de cadastro.
+        
+        Paginação por cursor (keyset): cada página custa o mesmo,
+        por mais longe que esteja do início.
+        
+        Args:
+            cursor: next_cursor da página anterior (None = primeira)
+            limit: Tamanho da página (1 a MAX_PAGE_SIZE)
+            
+        Returns:
+            Page com os clientes e o cursor da próxima página
+            
+        Raises:
+            ValueError: Cursor inválido ou limit fora da faixa
         """
         ...
     
@@ -135,6 +200,28 @@ class ICustomerRepository(ABC):
         """
         ...
     
+    @abstractmethod
+    async def get_or_create(self, customer: Customer) -> tuple[Customer, bool]:
+        """
+        Salva o cliente, ou devolve o já cadastrado com o mesmo telefone.
+        
+        Seguro com mensagens simultâneas do mesmo número novo:
+        só uma delas cria o cliente, as outras recebem o existente
+        (sem erro de chave duplicada).
+        
+        Args:
+            customer: Cliente a criar (se o telefone for novo)
+        
+        Returns:
+            (cliente gravado, True se foi criado agora)
+        
+        Example:
+            customer, created = await repo.get_or_create(
+                Customer(phone_number="5511999999999")
+            )
+        """
+        ...
+    
     @abstractmethod
     async def update(self, customer: Customer) -> None:
         """
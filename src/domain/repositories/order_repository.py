@@ -16,9 +16,11 @@ Esta interface permite buscar e atualizar pedidos.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from src.domain.entities.order import Order
 from src.shared.types.enums import OrderStatus
+from src.shared.utils.pagination import Page
 
 
 class IOrderRepository(ABC):
@@ -44,6 +46,40 @@ class IOrderRepository(ABC):
         """
         ...
     
+    @abstractmethod
+    async def find_by_number(self, number: str) -> Order | None:
+        """
+        Busca pedido pelo número amigável.
+        
+        É o número que o cliente digita no WhatsApp.
+        
+        Args:
+            number: Número no formato canônico (ex: "PED-123456")
+            
+        Returns:
+            Order se encontrado, None se não existir
+        """
+        ...
+    
+    @abstractmethod
+    async def find_by_numbers(self, numbers: list[str]) -> list[Order]:
+        """
+        Busca vários pedidos pelo número, em uma única consulta.
+        
+        Usado quando o cliente informa mais de um número
+        na mesma mensagem.
+        
+        Args:
+            numbers: Números no formato canônico
+            
+        Returns:
+            Pedidos encontrados (números inexistentes são ignorados)
+            
+        Example:
+            pedidos = await repo.find_by_numbers(["PED-123456", "PED-123457"])
+        """
+        ...
+    
     @abstractmethod
     async def find_by_customer(self, customer_id: str) -> list[Order]:
         """
@@ -81,6 +117,85 @@ class IOrderRepository(ABC):
         """
         ...
     
+    @abstractmethod
+    def iter_by_customer(
+        self,
+        customer_id: str,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Order]:
+        """
+        Percorre os pedidos de um cliente sem carregá-los de uma vez.
+        
+        Mesma ordem de find_by_customer (mais recentes primeiro),
+        lidos do banco em lotes de chunk_size.
+        
+        Args:
+            customer_id: UUID do cliente
+            chunk_size: Pedidos lidos do banco por vez
+        """
+        ...
+    
+    @abstractmethod
+    def iter_by_status(
+        self,
+        status: OrderStatus,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Order]:
+        """
+        Percorre os pedidos de um status sem carregá-los de uma vez.
+        
+        Para jobs sobre muitos pedidos (ex: todos os pendentes).
+        
+        Args:
+            status: Status a filtrar
+            chunk_size: Pedidos lidos do banco por vez
+            
+        Example:
+            async for order in repo.iter_by_status(OrderStatus.PENDING):
+                await notify(order)
+        """
+        ...
+    
+    @abstractmethod
+    async def find_page_by_customer(
+        self,
+        customer_id: str,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Order]:
+        """
+        Uma página dos pedidos de um cliente (mais recentes primeiro).
+        
+        Args:
+            customer_id: UUID do cliente
+            cursor: next_cursor da página anterior (None = primeira)
+            limit: Tamanho da página (1 a MAX_PAGE_SIZE)
+            
+        Raises:
+            ValueError: Cursor inválido ou limit fora da faixa
+        """
+        ...
+    
+    @abstractmethod
+    async def find_page_by_status(
+        self,
+        status: OrderStatus,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Order]:
+        """
+        Uma página dos pedidos de um status (mais recentes primeiro).
+        
+        Args:
+            status: Status a filtrar
+            cursor: next_cursor da página anterior (None = primeira)
+            limit: Tamanho da página (1 a MAX_PAGE_SIZE)
+            
+        Raises:
+            ValueError: Cursor inválido ou limit fora da faixa
+        """
+        ...
+    
     @abstractmethod
     async def find_recent_by_customer(
         self, 
@@ -14,6 +14,8 @@
 # - find_by_category: Filtrar por categoria
 # - search: Busca textual
 # - find_all_active: Só produtos à venda
+# - find_by_price_range: Filtrar por faixa de preço
+# - reserve_stock: Baixa de estoque atômica (checkout)
 # ===========================================================
 """
 Interface (ABC) para repositório de Product.
@@ -22,6 +24,8 @@ Define operações de busca e persistência de produtos.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from decimal import Decimal
 
 from src.domain.entities.product import Product
 
@@ -83,7 +87,12 @@ class IProductRepository(ABC):
         ...
     
     @abstractmethod
-    async def search(self, query: str) -> list[Product]:
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[Product]:
         """
         Busca produtos por nome ou descrição.
         
@@ -92,15 +101,41 @@ class IProductRepository(ABC):
         
         Args:
             query: Termo de busca
+            limit: Máximo de produtos retornados
+            offset: Quantos pular (paginação)
             
         Returns:
-            Lista de produtos que correspondem à busca
+            Produtos ativos que correspondem à busca, os mais
+            relevantes primeiro
             
         Example:
             produtos = await repo.search("camiseta azul")
         """
         ...
     
+    @abstractmethod
+    async def find_by_price_range(
+        self,
+        min_price: Decimal,
+        max_price: Decimal,
+    ) -> list[Product]:
+        """
+        Busca produtos ativos com preço dentro da faixa.
+        
+        Usado quando cliente diz: "Tem algo até 50 reais?"
+        
+        Args:
+            min_price: Preço mínimo (inclusive)
+            max_price: Preço máximo (inclusive)
+            
+        Returns:
+            Produtos da faixa, do mais barato ao mais caro
+            
+        Example:
+            produtos = await repo.find_by_price_range(Decimal("0"), Decimal("50"))
+        """
+        ...
+    
     @abstractmethod
     async def list_categories(self) -> list[str]:
         """
@@ -137,6 +172,49 @@ class IProductRepository(ABC):
         """
         ...
     
+    @abstractmethod
+    async def reserve_stock(self, product_id: str, quantity: int) -> int | None:
+        """
+        Baixa o estoque de forma atômica (checagem e baixa juntas).
+        
+        Diferente de find_by_id + decrease_stock + update, duas
+        compras simultâneas da última unidade não passam as duas.
+        
+        Args:
+            product_id: UUID do produto
+            quantity: Unidades a reservar (> 0)
+            
+        Returns:
+            Estoque restante, ou None se não foi possível reservar
+            (estoque insuficiente, produto inativo ou inexistente)
+            
+        Raises:
+            ValueError: Se quantity <= 0
+        """
+        ...
+    
+    @abstractmethod
+    async def reserve_stock_batch(
+        self, items: Mapping[str, int]
+    ) -> dict[str, int] | None:
+        """
+        Reserva vários produtos de uma vez (carrinho inteiro).
+        
+        Tudo ou nada: se algum item não puder ser reservado,
+        nenhum estoque é alterado.
+        
+        Args:
+            items: Quantidade por UUID de produto
+            
+        Returns:
+            Estoque restante por produto, ou None se o carrinho
+            não pôde ser reservado
+            
+        Raises:
+            ValueError: Se alguma quantidade for <= 0
+        """
+        ...
+    
     @abstractmethod
     async def delete(self, id: str) -> None:
         """
@@ -95,6 +95,23 @@ class ISessionRepository(ABC):
         """
         ...
     
+    @abstractmethod
+    async def get_or_create(self, session: Session) -> tuple[Session, bool]:
+        """
+        Salva a sessão, a menos que o cliente já tenha uma ativa.
+        
+        Seguro com mensagens simultâneas do mesmo cliente: só uma
+        delas cria a sessão, as outras recebem a ativa. Uma sessão
+        expirada do cliente não conta (é substituída).
+        
+        Args:
+            session: Sessão nova (usada se o cliente não tiver ativa)
+        
+        Returns:
+            (sessão ativa do cliente, True se foi criada agora)
+        """
+        ...
+    
     @abstractmethod
     async def update(self, session: Session) -> None:
         """
@@ -105,6 +122,11 @@ class ISessionRepository(ABC):
         - Salvar contexto (carrinho, busca atual)
         - Renovar expiração
         
+        Implementações devem gravar apenas os campos indicados em
+        session.changed_fields e chamar session.mark_clean() ao final.
+        Sessão sem alterações (not session.is_dirty) não precisa
+        de escrita.
+        
         Args:
             session: Entidade Session com dados atualizados
         """
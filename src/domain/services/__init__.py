@@ -11,3 +11,17 @@ Serviços de domínio contêm lógica de negócio que:
 
 Exemplo: MessageService para processar/validar mensagens.
 """
+
+from src.domain.services.order_number import (
+    ORDER_NUMBER_PREFIX,
+    ORDER_NUMBER_START,
+    extract_order_numbers,
+    format_order_number,
+)
+
+__all__ = [
+    "ORDER_NUMBER_PREFIX",
+    "ORDER_NUMBER_START",
+    "extract_order_numbers",
+    "format_order_number",
+]
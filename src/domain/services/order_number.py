@@ -0,0 +1,104 @@
+# ===========================================================
+# src/domain/services/order_number.py
+# ===========================================================
+# Regras do NÚMERO DO PEDIDO (identificador amigável).
+#
+# POR QUE NÃO USAR O ID (UUID)?
+# - O UUID tem 36 caracteres: ninguém digita isso no WhatsApp
+# - O cliente recebe e digita algo como "PED-123456"
+#
+# FORMATO:
+#   PED-<sequência>
+#   A sequência começa em 100000, então sempre tem 6+ dígitos.
+#
+# EXTRAÇÃO TOLERANTE:
+# Clientes escrevem o número de muitos jeitos:
+#   "PED-123456", "ped 123456", "ped123456", "#123456",
+#   "meu pedido é ped 123456", "123456", "123456 e 123457"
+# O extrator encontra TODOS e devolve no formato canônico.
+#
+# NÚMERO SEM PREFIXO:
+# Só vale quando a mensagem é APENAS o(s) número(s). No meio de
+# uma frase, 6 a 9 dígitos soltos podem ser um CEP ou parte de
+# um telefone ("moro no CEP 01310100"): virariam uma consulta
+# (e um "não encontrado" guardado no cache de pedidos).
+#
+# re (expressões regulares):
+#   \b      -> fronteira de palavra
+#   \d{6,9} -> de 6 a 9 dígitos
+#   (?:...) -> grupo sem captura
+# ===========================================================
+"""
+Serviço de domínio para números de pedido.
+
+Uso:
+    >>> format_order_number(123456)
+    'PED-123456'
+    >>> extract_order_numbers("meu pedido é ped 123456")
+    ['PED-123456']
+"""
+
+import re
+
+
+# Prefixo exibido ao cliente
+ORDER_NUMBER_PREFIX = "PED"
+
+# Primeiro valor da sequência (garante pelo menos 6 dígitos)
+ORDER_NUMBER_START = 100_000
+
+# Prefixo ("ped", "PED-", "#") + 6 a 9 dígitos, em qualquer ponto.
+# Limite de 9: telefones (10+ dígitos) não são confundidos com pedidos.
+_ORDER_NUMBER_PATTERN = re.compile(
+    rf"(?:\b{ORDER_NUMBER_PREFIX}\s*[-_:#.]?\s*|#)(\d{{6,9}})\b",
+    re.IGNORECASE,
+)
+
+# Mensagem feita só de números sem prefixo ("123456", "111111 e 222222")
+_BARE_NUMBERS_PATTERN = re.compile(
+    r"\s*\d{6,9}(?:(?:\s*[,;/]\s*|\s+e\s+|\s+)\d{6,9})*[\s.!?]*",
+    re.IGNORECASE,
+)
+_DIGITS_PATTERN = re.compile(r"\d{6,9}")
+
+
+def format_order_number(sequence: int) -> str:
+    """
+    Formata o valor da sequência como número de pedido.
+
+    Args:
+        sequence: Valor gerado pela sequência do banco
+
+    Returns:
+        Número no formato canônico (ex: "PED-123456")
+    """
+    return f"{ORDER_NUMBER_PREFIX}-{sequence}"
+
+
+def extract_order_numbers(text: str) -> list[str]:
+    """
+    Extrai os números de pedido de um texto livre.
+
+    Aceita o prefixo em maiúsculas ou minúsculas, com ou sem
+    separador. Sem prefixo, só quando a mensagem é apenas o(s)
+    número(s). Números repetidos aparecem uma única vez, na
+    ordem em que foram escritos.
+
+    Args:
+        text: Mensagem do cliente
+
+    Returns:
+        Lista de números no formato canônico (pode ser vazia)
+
+    Example:
+        >>> extract_order_numbers("ped 123456 e PED-654321")
+        ['PED-123456', 'PED-654321']
+    """
+    if _BARE_NUMBERS_PATTERN.fullmatch(text):
+        digits = _DIGITS_PATTERN.findall(text)
+    else:
+        digits = [match.group(1) for match in _ORDER_NUMBER_PATTERN.finditer(text)]
+
+    # dict preserva ordem e remove duplicados
+    numbers = {f"{ORDER_NUMBER_PREFIX}-{number}": None for number in digits}
+    return list(numbers)
@@ -1,2 +1,83 @@
+# ===========================================================
 # src/infrastructure/cache/__init__.py
-"""Implementação de cache com Redis para sessões e dados temporários."""
+# ===========================================================
+"""
+Implementação de cache com Redis para sessões e dados temporários.
+
+Exporta:
+- TTLCache: cache em memória (LRU + TTL) do processo
+- OrderCache / CachedOrderRepository: cache de consulta de pedidos
+- CustomerIdentityMap / CachedCustomerRepository: telefone -> ID e filtro de Bloom
+- RedisSessionRepository: sessões de chat no Redis (TTL nativo)
+- SessionCache / CachedSessionRepository: cache de sessões no processo
+- ProductCatalog / CachedProductRepository: catálogo inteiro em memória
+- get_redis_client: cliente Redis compartilhado
+"""
+
+from src.infrastructure.cache.customer_identity import (
+    CachedCustomerRepository,
+    CustomerIdentityMap,
+    CustomerIdentityStats,
+    PhoneSource,
+)
+from src.infrastructure.cache.memory_cache import (
+    MISSING,
+    CacheStats,
+    TTLCache,
+)
+from src.infrastructure.cache.order_cache import (
+    CachedOrderRepository,
+    OrderCache,
+    OrderCacheStats,
+)
+from src.infrastructure.cache.product_catalog import (
+    CachedProductRepository,
+    CatalogSnapshot,
+    CatalogSource,
+    CatalogStats,
+    ProductCatalog,
+)
+from src.infrastructure.cache.redis_client import (
+    close_redis_client,
+    get_redis_client,
+)
+from src.infrastructure.cache.redis_session_repository import (
+    RedisSessionRepository,
+)
+from src.infrastructure.cache.session_cache import (
+    CachedSessionRepository,
+    SessionCache,
+    SessionCacheStats,
+    SessionInvalidationBus,
+)
+
+__all__ = [
+    # Memória
+    "MISSING",
+    "CacheStats",
+    "TTLCache",
+    # Clientes
+    "CachedCustomerRepository",
+    "CustomerIdentityMap",
+    "CustomerIdentityStats",
+    "PhoneSource",
+    # Pedidos
+    "CachedOrderRepository",
+    "OrderCache",
+    "OrderCacheStats",
+    # Produtos
+    "CachedProductRepository",
+    "CatalogSnapshot",
+    "CatalogSource",
+    "CatalogStats",
+    "ProductCatalog",
+    # Sessões
+    "CachedSessionRepository",
+    "RedisSessionRepository",
+    "SessionCache",
+    "SessionCacheStats",
+    "SessionInvalidationBus",
+    # Redis
+    "close_redis_client",
+    "get_redis_client",
+]
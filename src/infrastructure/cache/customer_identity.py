@@ -0,0 +1,445 @@
+# ===========================================================
+# src/infrastructure/cache/customer_identity.py
+# ===========================================================
+# Identidade dos clientes: telefone -> ID, sem ir ao banco.
+#
+# POR QUE?
+# Toda mensagem começa com "quem é este telefone?". O ID de um
+# cliente nunca muda depois de criado, mas a consulta era feita
+# a cada mensagem.
+#
+# DOIS NÍVEIS:
+# 1. Cache telefone -> ID (TTLCache, LRU limitado): cliente que
+#    voltou a escrever não consulta o banco.
+# 2. Filtro de Bloom com TODOS os telefones cadastrados: se o
+#    filtro diz "não está", o número é novo com certeza e o
+#    caso de uso vai direto para o INSERT. Se diz "talvez",
+#    consulta o banco (falso positivo: ~0,1%).
+#
+# ONDE O FILTRO VALE:
+# Só em find_id_by_phone, o caminho de CRIAÇÃO (o caso de uso
+# chama get_or_create quando vem None). Cadastros de outros
+# workers só entram no filtro na sincronização: nesse intervalo,
+# "novo" pode estar errado, e o get_or_create (ON CONFLICT)
+# devolve o cliente existente. find_by_phone, que responde "este
+# telefone está cadastrado?", sempre consulta o banco.
+#
+# CARGA E SINCRONIZAÇÃO:
+# No startup, uma tarefa de fundo monta o filtro com os telefones
+# do banco (streaming, ver phone_source.py), em lotes numa thread:
+# 1 milhão de telefones leva alguns segundos de CPU, sem travar
+# os requests nem o startup. Até lá, tudo vai ao banco.
+# Cadastros deste worker entram no filtro na hora (save). Os de
+# OUTROS workers entram na sincronização periódica: a cada
+# sync_interval_seconds, os clientes criados desde a anterior
+# (faixa de IDs UUIDv7, com SYNC_OVERLAP_SECONDS de folga para
+# transações ainda abertas e relógios desalinhados).
+#
+# O QUE NÃO É CACHEADO:
+# - save() só alimenta o filtro: o INSERT ainda não foi comitado
+#   e pode voltar atrás. O ID entra no cache na próxima leitura.
+# - update()/delete() tiram o ID do cache (telefone pode mudar).
+#
+# OUTROS WORKERS:
+# forget() só limpa o cache DESTE processo: um cliente alterado
+# ou removido por outro worker continua no cache até o TTL (e
+# uma sessão criada para um ID removido falha na FK). Por isso o
+# TTL é curto (60s): cobre a conversa em andamento, que é onde
+# está o ganho, e limita essa janela. O filtro nunca "esquece"
+# (só custa uma consulta).
+#
+# PADRÃO DECORATOR:
+# CachedCustomerRepository implementa ICustomerRepository e
+# "embrulha" o repositório real, como CachedOrderRepository.
+# ===========================================================
+"""
+Cache telefone -> ID de cliente com filtro de Bloom.
+
+Uso:
+    identity = CustomerIdentityMap(SQLAlchemyPhoneSource(AsyncSessionFactory))
+    await identity.start()   # carrega o filtro e passa a sincronizar
+    repo = CachedCustomerRepository(SQLAlchemyCustomerRepository(db), identity)
+    customer_id = await repo.find_id_by_phone("5511999999999")
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from src.domain.entities.customer import Customer
+from src.domain.repositories.customer_repository import ICustomerRepository
+from src.infrastructure.cache.memory_cache import MISSING, CacheStats, TTLCache
+from src.shared.utils.bloom import BloomFilter
+from src.shared.utils.ids import uuid7_floor
+from src.shared.utils.pagination import Page
+
+
+logger = logging.getLogger(__name__)
+
+
+# Folga da sincronização (transações longas, relógios dos workers)
+SYNC_OVERLAP_SECONDS = 60.0
+
+# Taxa de falso positivo do filtro
+BLOOM_ERROR_RATE = 0.001
+
+# Telefones adicionados ao filtro por vez, numa thread, na carga
+LOAD_BATCH_SIZE = 10_000
+
+
+class PhoneSource(Protocol):
+    """De onde vêm os telefones cadastrados (ex: SQLAlchemyPhoneSource)."""
+
+    async def count(self) -> int:
+        """Quantidade de clientes."""
+        ...
+
+    def phones(
+        self,
+        since_id: str | None = None,
+        until_id: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Telefones dos clientes com since_id <= ID < until_id."""
+        ...
+
+
+@dataclass
+class CustomerIdentityStats(CacheStats):
+    """
+    Estatísticas da identidade de clientes.
+
+    Além dos contadores padrão (do cache telefone -> ID):
+        new_numbers: Números que o filtro garantiu novos (sem consulta)
+        false_positives: Filtro disse "talvez", o banco disse "não existe"
+        phones: Telefones adicionados ao filtro
+        syncs: Cargas e sincronizações feitas
+        failures: Cargas/sincronizações que falharam
+        last_load_ms: Tempo da última carga completa
+    """
+
+    new_numbers: int = 0
+    false_positives: int = 0
+    phones: int = 0
+    syncs: int = 0
+    failures: int = 0
+    last_load_ms: float = 0.0
+
+
+class CustomerIdentityMap:
+    """
+    Cache telefone -> ID e filtro de Bloom dos telefones (um por processo).
+
+    Attributes:
+        stats: Contadores de uso (ver CustomerIdentityStats)
+    """
+
+    def __init__(
+        self,
+        source: PhoneSource,
+        max_entries: int = 100_000,
+        ttl_seconds: float = 60.0,
+        bloom_capacity: int = 1_000_000,
+        sync_interval_seconds: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Inicializa (filtro vazio até a primeira carga).
+
+        Args:
+            source: Origem dos telefones
+            max_entries: Limite do cache telefone -> ID
+            ttl_seconds: Validade de um ID no cache (também o tempo
+                que outros workers levam para ver um delete/update)
+            bloom_capacity: Telefones previstos no filtro (mínimo;
+                cresce para o dobro da tabela na carga)
+            sync_interval_seconds: Intervalo da sincronização
+            clock: Relógio de parede (o mesmo dos UUIDv7)
+        """
+        self._source = source
+        self._ids: TTLCache[str, str] = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+        )
+        self._capacity = bloom_capacity
+        self._interval = sync_interval_seconds
+        self._clock = clock
+
+        self._bloom: BloomFilter | None = None
+        self._synced_at = 0.0
+        # Telefones cadastrados durante uma carga (entram no filtro novo)
+        self._pending: list[str] | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+        self._stats = CustomerIdentityStats()
+
+    @property
+    def stats(self) -> CustomerIdentityStats:
+        """Contadores de uso (inclui evictions/expirations do cache)."""
+        self._stats.evictions = self._ids.stats.evictions
+        self._stats.expirations = self._ids.stats.expirations
+        self._stats.phones = len(self._bloom) if self._bloom is not None else 0
+        return self._stats
+
+    # =========================================================
+    # CONSULTA
+    # =========================================================
+
+    def lookup(self, phone: str) -> str | None | Any:
+        """
+        Resolve o telefone sem ir ao banco, se possível.
+
+        Returns:
+            - str: ID do cliente (cache)
+            - None: número com certeza novo (filtro)
+            - MISSING: precisa consultar o banco
+        """
+        customer_id = self._ids.get(phone, record=False)
+        if customer_id is not MISSING:
+            self._stats.hits += 1
+            return customer_id
+
+        if self.is_new(phone):
+            return None
+
+        self._stats.misses += 1
+        return MISSING
+
+    def is_new(self, phone: str) -> bool:
+        """True se o filtro garante que o telefone não está cadastrado."""
+        if self._bloom is None or phone in self._bloom:
+            return False
+        self._stats.new_numbers += 1
+        return True
+
+    def remember(self, phone: str, customer_id: str) -> None:
+        """Guarda um ID lido do banco."""
+        self._ids.set(phone, customer_id)
+        self.add_phone(phone)
+
+    def add_phone(self, phone: str) -> None:
+        """Telefone cadastrado: "talvez" no filtro daqui para frente."""
+        if self._bloom is not None:
+            self._bloom.add(phone)
+        if self._pending is not None:
+            self._pending.append(phone)
+
+    def forget(self, customer_id: str) -> None:
+        """Tira o cliente do cache (alterado ou removido)."""
+        # Raro (update/delete de cliente): varre o cache
+        for phone, cached_id in self._ids.items():
+            if cached_id == customer_id:
+                self._ids.delete(phone)
+
+    def record_false_positive(self) -> None:
+        """O filtro disse "talvez", mas o telefone não existe."""
+        if self._bloom is not None:
+            self._stats.false_positives += 1
+
+    # =========================================================
+    # CARGA E SINCRONIZAÇÃO
+    # =========================================================
+
+    async def load(self) -> None:
+        """
+        Monta um filtro novo com todos os telefones do banco.
+
+        O filtro atual continua respondendo até a troca (uma
+        única atribuição, no fim).
+        """
+        async with self._lock:
+            synced_at = self._clock()
+            started = time.perf_counter()
+
+            self._pending = []
+            try:
+                count = await self._source.count()
+                bloom = BloomFilter(max(self._capacity, 2 * count), BLOOM_ERROR_RATE)
+                batch: list[str] = []
+                async for phone in self._source.phones():
+                    batch.append(phone)
+                    if len(batch) >= LOAD_BATCH_SIZE:
+                        await asyncio.to_thread(bloom.update, batch)
+                        batch = []
+                bloom.update(batch)
+                bloom.update(self._pending)
+            finally:
+                self._pending = None
+
+            self._bloom = bloom
+            self._synced_at = synced_at
+            self._stats.syncs += 1
+            self._stats.last_load_ms = (time.perf_counter() - started) * 1000
+
+    async def sync(self) -> None:
+        """Acrescenta ao filtro os clientes criados desde a última sincronização."""
+        bloom = self._bloom
+        if bloom is None:
+            await self.load()
+            return
+
+        async with self._lock:
+            synced_at = self._clock()
+            since_id = uuid7_floor(self._synced_at - SYNC_OVERLAP_SECONDS)
+            until_id = uuid7_floor(synced_at + SYNC_OVERLAP_SECONDS)
+            async for phone in self._source.phones(since_id, until_id):
+                bloom.add(phone)
+
+            self._synced_at = synced_at
+            self._stats.syncs += 1
+
+    async def start(self) -> None:
+        """
+        Inicia a carga do filtro e a sincronização periódica.
+
+        Não espera a carga: até ela terminar, as consultas vão ao
+        banco (o startup não atrasa com uma tabela grande).
+        """
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Para a sincronização periódica."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Laço: carrega (1ª vez) ou sincroniza, depois espera."""
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                # Sem filtro, toda consulta vai ao banco; o atual
+                # (se houver) continua valendo. Tenta no próximo ciclo
+                self._stats.failures += 1
+                logger.error(f"Identidade de clientes: sincronização falhou: {e}")
+            await asyncio.sleep(self._interval)
+
+
+# ===========================================================
+# DECORATOR DO REPOSITÓRIO
+# ===========================================================
+
+class CachedCustomerRepository(ICustomerRepository):
+    """
+    Decorator de ICustomerRepository com a identidade em memória.
+
+    - find_id_by_phone: cache -> filtro -> origem (caminho de criação:
+      None pode ser cadastro recente de outro worker)
+    - find_by_phone: origem (o ID lido entra no cache)
+    - save: origem, e o telefone entra no filtro
+    - get_or_create: origem; cliente que já existia entra no cache
+    - update/delete: origem, e o ID sai do cache
+    - demais métodos: origem
+
+    Example:
+        >>> repo = CachedCustomerRepository(sql_repo, identity)
+        >>> await repo.find_id_by_phone("5511999999999")  # 1ª vez: banco
+        >>> await repo.find_id_by_phone("5511999999999")  # 2ª vez: cache
+    """
+
+    def __init__(
+        self, inner: ICustomerRepository, identity: CustomerIdentityMap
+    ) -> None:
+        """
+        Args:
+            inner: Repositório real
+            identity: Identidade compartilhada do processo
+        """
+        self._inner = inner
+        self._identity = identity
+
+    # =========================================================
+    # MÉTODOS DE BUSCA
+    # =========================================================
+
+    async def find_by_phone(self, phone: str) -> Customer | None:
+        """
+        Sempre consulta a origem.
+
+        O filtro não é usado aqui: ele só aprende os cadastros de
+        outros workers na sincronização, e quem pergunta "existe?"
+        sem criar em seguida receberia um "não" falso.
+        """
+        customer = await self._inner.find_by_phone(phone)
+        if customer is not None:
+            self._identity.remember(phone, customer.id)
+        return customer
+
+    async def find_id_by_phone(self, phone: str) -> str | None:
+        """ID do cache; número novo resolvido pelo filtro; resto no banco."""
+        customer_id = self._identity.lookup(phone)
+        if customer_id is not MISSING:
+            return customer_id
+
+        customer_id = await self._inner.find_id_by_phone(phone)
+        if customer_id is None:
+            self._identity.record_false_positive()
+        else:
+            self._identity.remember(phone, customer_id)
+        return customer_id
+
+    async def find_by_id(self, id: str) -> Customer | None:
+        """Repassa ao repositório real."""
+        return await self._inner.find_by_id(id)
+
+    async def find_all(self) -> list[Customer]:
+        """Repassa ao repositório real."""
+        return await self._inner.find_all()
+
+    def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[Customer]:
+        """Repassa ao repositório real."""
+        return self._inner.iter_all(chunk_size)
+
+    async def find_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Customer]:
+        """Repassa ao repositório real."""
+        return await self._inner.find_page(cursor, limit)
+
+    # =========================================================
+    # MÉTODOS DE PERSISTÊNCIA
+    # =========================================================
+
+    async def save(self, customer: Customer) -> None:
+        """Salva; o telefone passa a ser "talvez cadastrado" no filtro."""
+        await self._inner.save(customer)
+        self._identity.add_phone(customer.phone_number)
+
+    async def get_or_create(self, customer: Customer) -> tuple[Customer, bool]:
+        """
+        Cria na origem; o cliente que já existia entra no cache.
+
+        O recém-criado só alimenta o filtro (como no save): o INSERT
+        ainda pode ser desfeito com a transação.
+        """
+        customer, created = await self._inner.get_or_create(customer)
+        if created:
+            self._identity.add_phone(customer.phone_number)
+        else:
+            self._identity.remember(customer.phone_number, customer.id)
+        return customer, created
+
+    async def update(self, customer: Customer) -> None:
+        """Atualiza; o telefone antigo (se mudou) sai do cache."""
+        await self._inner.update(customer)
+        self._identity.forget(customer.id)
+        self._identity.add_phone(customer.phone_number)
+
+    async def delete(self, id: str) -> None:
+        """Remove e tira o ID do cache."""
+        await self._inner.delete(id)
+        self._identity.forget(id)
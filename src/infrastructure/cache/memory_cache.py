@@ -0,0 +1,238 @@
+# ===========================================================
+# src/infrastructure/cache/memory_cache.py
+# ===========================================================
+# Cache em memória (dentro do processo) com LRU + TTL.
+#
+# CONCEITOS:
+#
+# 1. LRU (Least Recently Used)
+#    - Cache tem tamanho máximo
+#    - Quando enche, remove o item usado há MAIS tempo
+#    - OrderedDict mantém a ordem de uso: move_to_end() a cada acesso
+#
+# 2. TTL (Time To Live)
+#    - Cada item tem "prazo de validade"
+#    - Após o prazo, o item é tratado como ausente
+#
+# 3. time.monotonic()
+#    - Relógio que nunca "volta no tempo" (ajuste de NTP, fuso)
+#    - Ideal para medir intervalos
+#
+# 4. Limite de memória (opcional)
+#    - Além da quantidade, o cache pode limitar o TOTAL de bytes
+#    - Quem cria o cache informa como estimar o tamanho de um valor
+#
+# POR QUE NÃO functools.lru_cache?
+# - Não tem TTL
+# - Não permite invalidar uma chave específica
+# - Não funciona com funções async
+# ===========================================================
+"""
+Cache em memória com LRU e TTL.
+
+Usado como primeiro nível (L1) de cache: sem I/O, sem
+serialização. Cada processo (worker) tem o seu.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, asdict
+from typing import Any, Generic, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+# Sentinela para "chave ausente".
+# Não dá para usar None, pois None pode ser um valor cacheado
+# (ex: cache negativo de "pedido não existe").
+MISSING: Any = object()
+
+
+@dataclass
+class CacheStats:
+    """
+    Contadores de uso de um cache.
+
+    Attributes:
+        hits: Leituras atendidas pelo cache
+        misses: Leituras que precisaram ir à origem
+        evictions: Itens removidos por falta de espaço (LRU)
+        expirations: Itens descartados por TTL vencido
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Taxa de acerto (0.0 a 1.0).
+
+        Returns:
+            hits / (hits + misses), ou 0.0 sem leituras
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Retorna os contadores (e hit_rate) para logs/métricas."""
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Cache LRU com expiração por item.
+
+    Não é thread-safe, mas é seguro em asyncio: nenhum método
+    faz await, então não há troca de tarefa no meio de uma operação.
+
+    Example:
+        >>> cache: TTLCache[str, int] = TTLCache(max_entries=2, ttl_seconds=60)
+        >>> cache.set("a", 1)
+        >>> cache.get("a")
+        1
+        >>> cache.get("b") is MISSING
+        True
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        max_bytes: int | None = None,
+        sizer: Callable[[V], int] | None = None,
+    ) -> None:
+        """
+        Inicializa o cache.
+
+        Args:
+            max_entries: Quantidade máxima de itens
+            ttl_seconds: Validade padrão de cada item
+            clock: Relógio (injetável para testes)
+            max_bytes: Limite de memória estimada (None = sem limite)
+            sizer: Estima o tamanho de um valor em bytes
+                (obrigatório com max_bytes)
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries deve ser maior que zero")
+        if max_bytes is not None and sizer is None:
+            raise ValueError("max_bytes exige um sizer")
+
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._max_bytes = max_bytes
+        self._sizer = sizer
+
+        # chave -> (expira_em, valor, tamanho)
+        self._data: OrderedDict[K, tuple[float, V, int]] = OrderedDict()
+        self._bytes = 0
+
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size_bytes(self) -> int:
+        """Memória estimada dos itens (0 se o cache não tiver sizer)."""
+        return self._bytes
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, record=False) is not MISSING  # type: ignore[arg-type]
+
+    def get(self, key: K, default: Any = MISSING, record: bool = True) -> V | Any:
+        """
+        Busca um item válido no cache.
+
+        Args:
+            key: Chave buscada
+            default: Retorno se ausente/expirado (padrão: MISSING)
+            record: Se deve contar hit/miss nas estatísticas
+
+        Returns:
+            O valor cacheado, ou default
+        """
+        entry = self._data.get(key)
+
+        if entry is not None:
+            expires_at, value, _ = entry
+            if expires_at > self._clock():
+                self._data.move_to_end(key)  # Marca como usado recentemente
+                if record:
+                    self.stats.hits += 1
+                return value
+
+            # Expirou: remove
+            self._remove(key)
+            self.stats.expirations += 1
+
+        if record:
+            self.stats.misses += 1
+        return default
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        """
+        Grava um item no cache.
+
+        Args:
+            key: Chave
+            value: Valor (pode ser None, ex: cache negativo)
+            ttl_seconds: Validade deste item (padrão: a do cache)
+        """
+        ttl = self._ttl if ttl_seconds is None else ttl_seconds
+        size = self._sizer(value) if self._sizer is not None else 0
+
+        self._remove(key)
+        self._data[key] = (self._clock() + ttl, value, size)
+        self._bytes += size
+
+        # Remove os menos usados até caber (quantidade e memória).
+        # Um item maior que max_bytes sozinho também é descartado.
+        while len(self._data) > self._max_entries or (
+            self._max_bytes is not None and self._bytes > self._max_bytes
+        ):
+            _, (_, _, evicted_size) = self._data.popitem(last=False)
+            self._bytes -= evicted_size
+            self.stats.evictions += 1
+
+    def items(self) -> list[tuple[K, V]]:
+        """
+        Retorna uma cópia dos itens válidos.
+
+        Não altera a ordem LRU nem as estatísticas.
+        """
+        now = self._clock()
+        return [
+            (key, value)
+            for key, (expires_at, value, _) in self._data.items()
+            if expires_at > now
+        ]
+
+    def delete(self, key: K) -> bool:
+        """
+        Remove um item do cache.
+
+        Returns:
+            True se o item existia
+        """
+        return self._remove(key)
+
+    def clear(self) -> None:
+        """Remove todos os itens (estatísticas são mantidas)."""
+        self._data.clear()
+        self._bytes = 0
+
+    def _remove(self, key: K) -> bool:
+        """Remove um item e desconta seu tamanho."""
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[2]
+        return True
@@ -0,0 +1,464 @@
+# ===========================================================
+# src/infrastructure/cache/order_cache.py
+# ===========================================================
+# Cache "read-through" para consulta de pedidos.
+#
+# O QUE É READ-THROUGH?
+# 1. Leitura consulta o cache primeiro
+# 2. Se não achar (miss), busca no banco
+# 3. Guarda o resultado no cache para a próxima leitura
+#
+# CACHE NEGATIVO:
+# Clientes digitam número errado várias vezes seguidas.
+# Guardamos também o "não existe" (por pouco tempo), para que
+# cada nova tentativa com o mesmo número não vá ao banco.
+#
+# NÍVEIS (TIERS):
+# - L1: memória do processo (TTLCache) - mais rápido
+# - L2: Redis (opcional) - compartilhado entre workers
+#
+# INVALIDAÇÃO E TRANSAÇÃO:
+# save/update invalidam o pedido na hora E de novo quando a
+# transação do turno termina (commit ou rollback). Sem a segunda
+# invalidação, uma leitura concorrente feita entre o UPDATE e o
+# COMMIT pegaria a linha antiga e a guardaria por todo o TTL.
+#
+# VÁRIOS WORKERS (com Redis):
+# A invalidação limpa o L1 deste worker e o Redis; o L1 dos outros
+# workers só é descartado quando expira. Por isso, com Redis, o L1
+# usa um TTL curto próprio (local_ttl_seconds): é o tempo máximo
+# que outro worker pode servir um pedido alterado.
+#
+# RÉPLICA DE LEITURA:
+# O que vai para o cache precisa vir do PRIMÁRIO. Uma réplica
+# atrasada (até max_lag) devolveria o status antigo logo depois da
+# invalidação, e ele seria servido por todo o TTL (e, com Redis,
+# a todos os workers). Com réplica, passe `loader`: um repositório
+# sem réplica, usado nas buscas que alimentam o cache.
+#
+# PADRÃO DECORATOR:
+# CachedOrderRepository implementa IOrderRepository e "embrulha"
+# outro IOrderRepository. O caso de uso não percebe a diferença.
+# ===========================================================
+"""
+Cache de pedidos com TTL, cache negativo e Redis opcional.
+
+Uso:
+    cache = OrderCache(ttl_seconds=60, negative_ttl_seconds=10)
+    repo = CachedOrderRepository(SQLAlchemyOrderRepository(session), cache)
+    order = await repo.find_by_id("...")  # 1ª vez: banco
+    order = await repo.find_by_id("...")  # 2ª vez: cache
+"""
+
+import copy
+import json
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.order import Order
+from src.domain.repositories.order_repository import IOrderRepository
+from src.infrastructure.cache.memory_cache import MISSING, CacheStats, TTLCache
+from src.infrastructure.database.transaction_hooks import (
+    after_commit,
+    after_rollback,
+    run_soon,
+)
+from src.shared.types.enums import OrderStatus
+from src.shared.utils.pagination import Page
+
+
+logger = logging.getLogger(__name__)
+
+
+# Valor gravado no Redis para "pedido não existe"
+_NEGATIVE_MARKER = "-"
+
+
+@dataclass
+class OrderCacheStats(CacheStats):
+    """
+    Estatísticas do cache de pedidos.
+
+    Além dos contadores padrão:
+        negative_hits: Hits em "pedido não existe" (já contados em hits)
+        redis_hits: Hits atendidos pelo Redis (já contados em hits)
+    """
+
+    negative_hits: int = 0
+    redis_hits: int = 0
+
+
+class OrderCache:
+    """
+    Armazenamento compartilhado do cache de pedidos.
+
+    Uma instância por processo (os repositórios são criados por
+    request, mas o cache precisa sobreviver entre requests).
+
+    Attributes:
+        stats: Contadores de hit/miss para métricas (ver OrderCacheStats)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        negative_ttl_seconds: float = 10.0,
+        max_entries: int = 10_000,
+        redis: Redis | None = None,
+        key_prefix: str = "order:",
+        local_ttl_seconds: float | None = None,
+    ) -> None:
+        """
+        Inicializa o cache.
+
+        Args:
+            ttl_seconds: Validade de um pedido encontrado
+            negative_ttl_seconds: Validade de um "não encontrado"
+            max_entries: Limite de itens na memória local
+            redis: Cliente Redis para o nível compartilhado (opcional)
+            key_prefix: Prefixo das chaves no Redis
+            local_ttl_seconds: Validade máxima no nível local (None =
+                mesma do Redis). Com Redis, limita por quanto tempo
+                outro worker serve um pedido já alterado.
+        """
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._local_ttl = local_ttl_seconds
+        self._local: TTLCache[str, Order | None] = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+        )
+        self._redis = redis
+        self._prefix = key_prefix
+
+        self._stats = OrderCacheStats()
+
+    @property
+    def stats(self) -> OrderCacheStats:
+        """Contadores de uso (inclui evictions/expirations do nível local)."""
+        self._stats.evictions = self._local.stats.evictions
+        self._stats.expirations = self._local.stats.expirations
+        return self._stats
+
+    async def get(self, order_id: str) -> Order | None:
+        """
+        Busca um pedido no cache.
+
+        Returns:
+            - Order: pedido cacheado (cópia)
+            - None: "não existe" cacheado (cache negativo)
+            - MISSING: não está no cache
+        """
+        value = self._local.get(order_id, record=False)
+
+        if value is MISSING and self._redis is not None:
+            value = await self._get_from_redis(order_id)
+            if value is not MISSING:
+                self._stats.redis_hits += 1
+                self._store_local(order_id, value)
+
+        if value is MISSING:
+            self._stats.misses += 1
+            return MISSING
+
+        self._stats.hits += 1
+        if value is None:
+            self._stats.negative_hits += 1
+            return None
+
+        # Cópia: quem recebe pode alterar a entidade sem afetar o cache
+        return copy.copy(value)
+
+    async def put(self, order_id: str, order: Order | None) -> None:
+        """
+        Grava um pedido (ou "não existe", se order for None).
+
+        Args:
+            order_id: Chave consultada
+            order: Pedido encontrado, ou None para cache negativo
+        """
+        self._store_local(order_id, copy.copy(order))
+
+        if self._redis is not None:
+            ttl = self._ttl if order is not None else self._negative_ttl
+            payload = _NEGATIVE_MARKER if order is None else _serialize(order)
+            try:
+                await self._redis.set(
+                    self._prefix + order_id, payload, ex=max(1, int(ttl))
+                )
+            except RedisError as e:
+                logger.warning(f"Cache de pedidos: falha ao gravar no Redis: {e}")
+
+    async def invalidate(self, order_id: str) -> None:
+        """
+        Remove um pedido do cache (local e Redis).
+
+        Chamado sempre que o pedido é criado ou alterado.
+        """
+        self._local.delete(order_id)
+
+        if self._redis is not None:
+            try:
+                await self._redis.delete(self._prefix + order_id)
+            except RedisError as e:
+                logger.warning(f"Cache de pedidos: falha ao invalidar no Redis: {e}")
+
+    def discard(self, order_id: str) -> None:
+        """
+        Versão síncrona de invalidate (para callbacks de transação).
+
+        O nível local é limpo na hora; a remoção no Redis vai para
+        uma tarefa de fundo.
+        """
+        self._local.delete(order_id)
+        if self._redis is not None:
+            run_soon(self.invalidate(order_id), f"invalidar pedido {order_id}")
+
+    def clear(self) -> None:
+        """Limpa o nível local (o Redis expira sozinho pelo TTL)."""
+        self._local.clear()
+
+    # =========================================================
+    # AUXILIARES
+    # =========================================================
+
+    def _store_local(self, order_id: str, order: Order | None) -> None:
+        """Grava no nível local com o TTL adequado."""
+        ttl = self._ttl if order is not None else self._negative_ttl
+        if self._local_ttl is not None:
+            ttl = min(ttl, self._local_ttl)
+        self._local.set(order_id, order, ttl_seconds=ttl)
+
+    async def _get_from_redis(self, order_id: str) -> Order | None:
+        """Lê do Redis. Falhas de conexão viram miss (vai ao banco)."""
+        try:
+            payload = await self._redis.get(self._prefix + order_id)
+        except RedisError as e:
+            logger.warning(f"Cache de pedidos: Redis indisponível: {e}")
+            return MISSING
+
+        if payload is None:
+            return MISSING
+        if payload == _NEGATIVE_MARKER:
+            return None
+        return _deserialize(payload)
+
+
+class CachedOrderRepository(IOrderRepository):
+    """
+    Decorator de IOrderRepository com cache read-through nas
+    consultas de um pedido específico.
+
+    - find_by_id / find_by_number(s): consultam o cache antes do banco
+      (no miss, buscam pelo `loader`: primário)
+    - save/update: gravam no banco e invalidam o cache do pedido
+      (na hora e de novo no fim da transação do turno)
+    - Demais consultas: repassadas sem cache (listas mudam muito)
+
+    Example:
+        >>> repo = CachedOrderRepository(sql_repo, order_cache)
+        >>> await repo.find_by_number("PED-000000")  # miss -> banco
+        >>> await repo.find_by_number("PED-000000")  # hit negativo
+    """
+
+    def __init__(
+        self,
+        inner: IOrderRepository,
+        cache: OrderCache,
+        db: AsyncSession | None = None,
+        loader: IOrderRepository | None = None,
+    ) -> None:
+        """
+        Args:
+            inner: Repositório real (ex: SQLAlchemyOrderRepository)
+            cache: Cache compartilhado do processo
+            db: Sessão do banco do turno (None = sem invalidação no
+                fim da transação)
+            loader: Repositório das buscas que alimentam o cache;
+                precisa ler do primário (None = o próprio inner)
+        """
+        self._inner = inner
+        self._cache = cache
+        self._db = db
+        self._loader = loader or inner
+
+    # =========================================================
+    # MÉTODOS DE BUSCA
+    # =========================================================
+
+    async def find_by_id(self, id: str) -> Order | None:
+        """Busca pedido por ID (cache -> banco)."""
+        cached = await self._cache.get(id)
+        if cached is not MISSING:
+            return cached
+
+        order = await self._loader.find_by_id(id)
+        await self._cache.put(id, order)
+        return order
+
+    async def find_by_number(self, number: str) -> Order | None:
+        """Busca pedido pelo número amigável (cache -> banco)."""
+        orders = await self.find_by_numbers([number])
+        return orders[0] if orders else None
+
+    async def find_by_numbers(self, numbers: list[str]) -> list[Order]:
+        """
+        Busca vários pedidos pelo número.
+
+        Números já cacheados (inclusive "não existe") não vão ao
+        banco; os demais são buscados juntos, em uma única consulta.
+        """
+        found: dict[str, Order] = {}
+        missing: list[str] = []
+
+        for number in numbers:
+            cached = await self._cache.get(number)
+            if cached is MISSING:
+                missing.append(number)
+            elif cached is not None:
+                found[number] = cached
+
+        if missing:
+            orders = await self._loader.find_by_numbers(missing)
+            loaded = {order.number: order for order in orders}
+            for number in missing:
+                order = loaded.get(number)
+                await self._cache.put(number, order)
+                if order is not None:
+                    found[number] = order
+
+        # Mantém a ordem em que os números foram pedidos
+        return [found[number] for number in numbers if number in found]
+
+    async def find_by_customer(self, customer_id: str) -> list[Order]:
+        """Repassa ao repositório real."""
+        return await self._inner.find_by_customer(customer_id)
+
+    async def find_by_status(self, status: OrderStatus) -> list[Order]:
+        """Repassa ao repositório real."""
+        return await self._inner.find_by_status(status)
+
+    def iter_by_customer(
+        self,
+        customer_id: str,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Order]:
+        """Repassa ao repositório real (listas não passam pelo cache)."""
+        return self._inner.iter_by_customer(customer_id, chunk_size)
+
+    def iter_by_status(
+        self,
+        status: OrderStatus,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Order]:
+        """Repassa ao repositório real (listas não passam pelo cache)."""
+        return self._inner.iter_by_status(status, chunk_size)
+
+    async def find_page_by_customer(
+        self,
+        customer_id: str,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Order]:
+        """Repassa ao repositório real."""
+        return await self._inner.find_page_by_customer(customer_id, cursor, limit)
+
+    async def find_page_by_status(
+        self,
+        status: OrderStatus,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Order]:
+        """Repassa ao repositório real."""
+        return await self._inner.find_page_by_status(status, cursor, limit)
+
+    async def find_recent_by_customer(
+        self,
+        customer_id: str,
+        limit: int = 5
+    ) -> list[Order]:
+        """Repassa ao repositório real."""
+        return await self._inner.find_recent_by_customer(customer_id, limit)
+
+    # =========================================================
+    # MÉTODOS DE PERSISTÊNCIA
+    # =========================================================
+
+    async def save(self, order: Order) -> None:
+        """Salva e remove eventual "não existe" cacheado."""
+        await self._inner.save(order)
+        await self._invalidate(order)
+
+    async def update(self, order: Order) -> None:
+        """Atualiza e invalida o pedido no cache."""
+        await self._inner.update(order)
+        await self._invalidate(order)
+
+    async def _invalidate(self, order: Order) -> None:
+        """
+        Invalida as duas chaves do pedido: ID e número.
+
+        Na hora e de novo no fim da transação: o que for lido (e
+        cacheado) antes do COMMIT, ou dentro de um turno que fez
+        ROLLBACK, é descartado.
+        """
+        keys = [order.id] if order.number is None else [order.id, order.number]
+        for key in keys:
+            await self._cache.invalidate(key)
+
+        if self._db is not None:
+            def discard() -> None:
+                for key in keys:
+                    self._cache.discard(key)
+
+            after_commit(self._db, discard)
+            after_rollback(self._db, discard)
+
+    # =========================================================
+    # MÉTODOS DE RELATÓRIO
+    # =========================================================
+
+    async def count_by_status(self, status: OrderStatus) -> int:
+        """Repassa ao repositório real."""
+        return await self._inner.count_by_status(status)
+
+
+# ===========================================================
+# SERIALIZAÇÃO (Order <-> JSON para o Redis)
+# ===========================================================
+
+def _serialize(order: Order) -> str:
+    """Converte Order em JSON compacto."""
+    return json.dumps(
+        {
+            "id": order.id,
+            "number": order.number,
+            "customer_id": order.customer_id,
+            "status": order.status.value,
+            "total": str(order.total),
+            "created_at": order.created_at.isoformat(),
+            "updated_at": order.updated_at.isoformat(),
+        },
+        separators=(",", ":"),
+    )
+
+
+def _deserialize(payload: str) -> Order:
+    """Converte JSON do Redis em Order."""
+    data = json.loads(payload)
+    return Order(
+        id=data["id"],
+        number=data.get("number"),
+        customer_id=data["customer_id"],
+        status=OrderStatus(data["status"]),
+        total=Decimal(data["total"]),
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+    )
@@ -0,0 +1,439 @@
+# ===========================================================
+# src/infrastructure/cache/product_catalog.py
+# ===========================================================
+# Catálogo de produtos INTEIRO em memória (snapshot imutável).
+#
+# POR QUE?
+# O catálogo tem poucos milhares de produtos e muda pouco, mas
+# toda mensagem de cliente ("ver produtos", "categorias") vira
+# uma consulta ao PostgreSQL. Com o catálogo em memória, essas
+# leituras custam microssegundos e não usam conexão do pool.
+#
+# SNAPSHOT (CatalogSnapshot):
+# Montado uma vez, nunca alterado. Traz índices secundários
+# prontos para cada consulta do repositório:
+#   by_id        dict id -> produto
+#   by_category  categoria -> produtos (ordem de nome)
+#   by_price     produtos em ordem de preço (+ preços para bisect)
+#   available    ativos com estoque (ordem de categoria e nome)
+#   categories   lista pronta para list_categories
+# A ordem vem do banco (ORDER BY category, name), então é a
+# mesma das consultas SQL equivalentes.
+#
+# RECONSTRUÇÃO ATÔMICA:
+# A cada refresh_interval_seconds, uma tarefa de fundo pede ao
+# banco a VERSÃO do catálogo (contador mantido por trigger +
+# último updated_at, ver catalog_source.py). Se mudou, carrega
+# os produtos, monta um snapshot NOVO (em thread) e troca a
+# referência numa única atribuição. Leituras nunca esperam:
+# usam o snapshot atual até a troca.
+#
+# ESCRITAS DESTE WORKER:
+# save/update/delete marcam o snapshot como "sujo": até a
+# próxima reconstrução, as leituras vão ao banco (nunca servem
+# um produto que este worker acabou de alterar). A reconstrução
+# fica para o próximo ciclo, quando a transação da escrita já
+# terminou; se ainda não terminou, a versão muda no commit e o
+# ciclo seguinte reconstrói de novo. Escritas de outros workers
+# aparecem na próxima verificação de versão.
+#
+# RESERVAS DE ESTOQUE:
+# reserve_stock vai sempre ao banco (a checagem é lá) e NÃO suja
+# o snapshot: no checkout contínuo, ele ficaria sempre sujo. O
+# estoque exibido pode atrasar até um ciclo de verificação.
+#
+# CÓPIAS:
+# Entidades são mutáveis. O snapshot guarda os originais e
+# devolve cópias rasas (os campos são imutáveis: str, Decimal...).
+# ===========================================================
+"""
+Snapshot do catálogo de produtos em memória.
+
+Uso:
+    catalog = ProductCatalog(SQLAlchemyCatalogSource(AsyncSessionFactory))
+    await catalog.start()   # carrega e passa a verificar a versão
+    repo = CachedProductRepository(SQLAlchemyProductRepository(db), catalog)
+    produtos = await repo.find_by_category("Vestuário")  # memória
+"""
+
+import asyncio
+import bisect
+import dataclasses
+import logging
+import operator
+import time
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Protocol
+
+from src.domain.entities.product import Product
+from src.domain.repositories.product_repository import IProductRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogSource(Protocol):
+    """De onde o catálogo é carregado (ex: SQLAlchemyCatalogSource)."""
+
+    async def version(self) -> Hashable:
+        """Valor que muda sempre que algum produto muda."""
+        ...
+
+    async def load(self) -> list[Product]:
+        """Produtos ativos (com ou sem estoque), por categoria e nome."""
+        ...
+
+
+# ===========================================================
+# SNAPSHOT
+# ===========================================================
+
+@dataclass(frozen=True, slots=True)
+class CatalogSnapshot:
+    """
+    Catálogo imutável com índices secundários.
+
+    Attributes:
+        version: Versão da origem usada na montagem
+        by_id: Produto por ID
+        by_category: Produtos de cada categoria, por nome
+        by_price: Produtos do mais barato ao mais caro
+        prices: Preços de by_price (mesma ordem, para bisect)
+        available: Ativos com estoque, por categoria e nome
+        categories: Categorias, em ordem
+    """
+
+    version: Hashable
+    by_id: Mapping[str, Product]
+    by_category: Mapping[str, tuple[Product, ...]]
+    by_price: tuple[Product, ...]
+    prices: tuple[Decimal, ...]
+    available: tuple[Product, ...]
+    categories: tuple[str, ...]
+
+    @classmethod
+    def build(cls, version: Hashable, products: Iterable[Product]) -> "CatalogSnapshot":
+        """
+        Monta o snapshot a partir dos produtos ativos.
+
+        Args:
+            version: Versão da origem
+            products: Produtos em ordem de categoria e nome
+        """
+        products = tuple(products)
+
+        grouped: dict[str, list[Product]] = {}
+        for product in products:
+            grouped.setdefault(product.category, []).append(product)
+
+        # sorted() é estável: empates de preço mantêm categoria e nome
+        by_price = tuple(sorted(products, key=lambda p: p.price))
+
+        return cls(
+            version=version,
+            by_id=MappingProxyType({p.id: p for p in products}),
+            by_category=MappingProxyType({c: tuple(ps) for c, ps in grouped.items()}),
+            by_price=by_price,
+            prices=tuple(p.price for p in by_price),
+            available=tuple(p for p in products if p.is_available),
+            categories=tuple(grouped),
+        )
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def price_range(
+        self, min_price: Decimal, max_price: Decimal
+    ) -> tuple[Product, ...]:
+        """Produtos com min_price <= preço <= max_price (busca binária)."""
+        start = bisect.bisect_left(self.prices, min_price)
+        end = bisect.bisect_right(self.prices, max_price)
+        return self.by_price[start:end]
+
+
+# Cópia rasa direto nos slots (metade do custo de copy.copy)
+_PRODUCT_FIELDS = tuple(f.name for f in dataclasses.fields(Product))
+_read_fields = operator.attrgetter(*_PRODUCT_FIELDS)
+_slot_setters = tuple(getattr(Product, name).__set__ for name in _PRODUCT_FIELDS)
+
+
+def _copy(product: Product) -> Product:
+    """Cópia rasa: o chamador pode alterar sem afetar o snapshot."""
+    clone = object.__new__(Product)
+    for set_value, value in zip(_slot_setters, _read_fields(product)):
+        set_value(clone, value)
+    return clone
+
+
+def _copies(products: Iterable[Product]) -> list[Product]:
+    """Cópias rasas de vários produtos."""
+    return list(map(_copy, products))
+
+
+# ===========================================================
+# CATÁLOGO (um por processo)
+# ===========================================================
+
+@dataclass
+class CatalogStats:
+    """
+    Métricas do catálogo.
+
+    Attributes:
+        hits: Leituras atendidas pelo snapshot
+        misses: Leituras que foram ao banco (sem snapshot, sujo, ou
+            produto fora do snapshot)
+        version_checks: Verificações de versão feitas
+        rebuilds: Snapshots montados
+        failures: Verificações/reconstruções que falharam
+        products: Produtos no snapshot atual
+        last_build_ms: Tempo da última reconstrução (carga + montagem)
+    """
+
+    hits: int = 0
+    misses: int = 0
+    version_checks: int = 0
+    rebuilds: int = 0
+    failures: int = 0
+    products: int = 0
+    last_build_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Retorna as métricas para logs."""
+        return asdict(self)
+
+
+class ProductCatalog:
+    """
+    Mantém o snapshot atual do catálogo e o reconstrói em segundo plano.
+
+    Attributes:
+        stats: Métricas (ver CatalogStats)
+    """
+
+    def __init__(
+        self,
+        source: CatalogSource,
+        refresh_interval_seconds: float = 5.0,
+    ) -> None:
+        """
+        Inicializa o catálogo (vazio até o primeiro refresh).
+
+        Args:
+            source: Origem dos produtos e da versão
+            refresh_interval_seconds: Intervalo entre verificações de versão
+        """
+        self._source = source
+        self._interval = refresh_interval_seconds
+        self._snapshot: CatalogSnapshot | None = None
+        self._dirty = False
+        self._writes = 0
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+        self.stats = CatalogStats()
+
+    @property
+    def snapshot(self) -> CatalogSnapshot | None:
+        """Snapshot utilizável (None: sem carga ainda ou sujo)."""
+        return None if self._dirty else self._snapshot
+
+    def mark_dirty(self) -> None:
+        """Este worker alterou um produto: leituras vão ao banco até reconstruir."""
+        self._dirty = True
+        self._writes += 1
+
+    async def refresh(self, force: bool = False) -> bool:
+        """
+        Reconstrói o snapshot se a versão da origem mudou.
+
+        Só uma reconstrução por vez (as leituras não usam o lock).
+
+        Args:
+            force: Reconstrói mesmo com a versão igual
+
+        Returns:
+            True se um snapshot novo foi publicado
+        """
+        async with self._lock:
+            dirty, writes = self._dirty, self._writes
+            version = await self._source.version()
+            self.stats.version_checks += 1
+
+            current = self._snapshot
+            unchanged = current is not None and current.version == version
+            if unchanged and not (force or dirty):
+                return False
+
+            started = time.perf_counter()
+            products = await self._source.load()
+            snapshot = await asyncio.to_thread(CatalogSnapshot.build, version, products)
+
+            # Troca atômica: quem já leu o antigo termina com ele
+            self._snapshot = snapshot
+            # Escrita durante a carga: continua sujo até o próximo ciclo
+            if self._writes == writes:
+                self._dirty = False
+
+            self.stats.rebuilds += 1
+            self.stats.products = len(snapshot)
+            self.stats.last_build_ms = (time.perf_counter() - started) * 1000
+            return True
+
+    async def start(self) -> None:
+        """Carrega o primeiro snapshot e inicia a verificação periódica."""
+        if self._task is not None:
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            # Sem snapshot, as leituras vão ao banco; tenta no próximo ciclo
+            self.stats.failures += 1
+            logger.error(f"Catálogo de produtos: carga inicial falhou: {e}")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Para a verificação periódica."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Laço: espera, verifica a versão, reconstrói se preciso."""
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # Falha pontual: continua servindo o snapshot atual
+                self.stats.failures += 1
+                logger.error(f"Catálogo de produtos: reconstrução falhou: {e}")
+
+
+# ===========================================================
+# DECORATOR DO REPOSITÓRIO
+# ===========================================================
+
+class CachedProductRepository(IProductRepository):
+    """
+    Decorator de IProductRepository que lê do snapshot do catálogo.
+
+    - find_by_id / find_by_category / find_all_active /
+      find_by_price_range / list_categories: snapshot -> origem
+    - search: origem (busca textual fica no PostgreSQL)
+    - reserve_stock / reserve_stock_batch: origem (ver RESERVAS)
+    - save/update/delete: origem, e o snapshot fica sujo
+
+    Example:
+        >>> repo = CachedProductRepository(sql_repo, catalog)
+        >>> await repo.list_categories()  # sem ir ao banco
+    """
+
+    def __init__(self, inner: IProductRepository, catalog: ProductCatalog) -> None:
+        """
+        Args:
+            inner: Repositório real
+            catalog: Catálogo compartilhado do processo
+        """
+        self._inner = inner
+        self._catalog = catalog
+
+    def _snapshot(self) -> CatalogSnapshot | None:
+        """Snapshot atual, contando hit/miss."""
+        snapshot = self._catalog.snapshot
+        if snapshot is None:
+            self._catalog.stats.misses += 1
+        else:
+            self._catalog.stats.hits += 1
+        return snapshot
+
+    # =========================================================
+    # MÉTODOS DE BUSCA
+    # =========================================================
+
+    async def find_by_id(self, id: str) -> Product | None:
+        """Busca por ID (produtos inativos não estão no snapshot)."""
+        snapshot = self._catalog.snapshot
+        product = None if snapshot is None else snapshot.by_id.get(id)
+        if product is None:
+            self._catalog.stats.misses += 1
+            return await self._inner.find_by_id(id)
+
+        self._catalog.stats.hits += 1
+        return _copy(product)
+
+    async def find_by_category(self, category: str) -> list[Product]:
+        """Produtos ativos da categoria."""
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return await self._inner.find_by_category(category)
+        return _copies(snapshot.by_category.get(category, ()))
+
+    async def find_all_active(self) -> list[Product]:
+        """Produtos ativos com estoque."""
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return await self._inner.find_all_active()
+        return _copies(snapshot.available)
+
+    async def find_by_price_range(
+        self,
+        min_price: Decimal,
+        max_price: Decimal,
+    ) -> list[Product]:
+        """Produtos ativos na faixa de preço."""
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return await self._inner.find_by_price_range(min_price, max_price)
+        return _copies(snapshot.price_range(min_price, max_price))
+
+    async def search(
+        self, query_text: str, limit: int = 20, offset: int = 0
+    ) -> list[Product]:
+        """Repassa ao repositório real (full-text search no banco)."""
+        return await self._inner.search(query_text, limit, offset)
+
+    async def list_categories(self) -> list[str]:
+        """Categorias com produtos ativos."""
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return await self._inner.list_categories()
+        return list(snapshot.categories)
+
+    # =========================================================
+    # MÉTODOS DE PERSISTÊNCIA
+    # =========================================================
+
+    async def save(self, product: Product) -> None:
+        """Salva na origem; o snapshot fica sujo."""
+        await self._inner.save(product)
+        self._catalog.mark_dirty()
+
+    async def update(self, product: Product) -> None:
+        """Atualiza na origem; o snapshot fica sujo."""
+        await self._inner.update(product)
+        self._catalog.mark_dirty()
+
+    async def reserve_stock(self, product_id: str, quantity: int) -> int | None:
+        """Reserva na origem (atômica)."""
+        return await self._inner.reserve_stock(product_id, quantity)
+
+    async def reserve_stock_batch(
+        self, items: Mapping[str, int]
+    ) -> dict[str, int] | None:
+        """Reserva o carrinho na origem (tudo ou nada)."""
+        return await self._inner.reserve_stock_batch(items)
+
+    async def delete(self, id: str) -> None:
+        """Remove da origem; o snapshot fica sujo."""
+        await self._inner.delete(id)
+        self._catalog.mark_dirty()
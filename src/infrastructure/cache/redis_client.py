@@ -0,0 +1,56 @@
+# ===========================================================
+# src/infrastructure/cache/redis_client.py
+# ===========================================================
+# Cliente Redis compartilhado pela aplicação.
+#
+# POR QUE UM CLIENTE ÚNICO?
+# - O cliente do redis-py mantém um POOL de conexões
+# - Criar um cliente por request abriria conexões demais
+# - Mesmo padrão do get_settings(): @lru_cache = singleton
+#
+# redis.asyncio:
+# - Versão assíncrona do redis-py (mesma API, com await)
+# ===========================================================
+"""
+Conexão com o Redis.
+
+Uso:
+    from src.infrastructure.cache.redis_client import get_redis_client
+
+    redis = get_redis_client()
+    await redis.set("chave", "valor", ex=60)
+"""
+
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from src.config.settings import get_settings
+
+
+@lru_cache
+def get_redis_client() -> Redis:
+    """
+    Retorna o cliente Redis da aplicação (criado uma única vez).
+
+    A conexão é aberta sob demanda, no primeiro comando.
+    decode_responses=True faz o cliente devolver str em vez de bytes.
+
+    Returns:
+        Cliente redis.asyncio configurado com REDIS_URL
+    """
+    settings = get_settings()
+    return Redis.from_url(settings.redis_url, decode_responses=True)
+
+
+async def close_redis_client() -> None:
+    """
+    Fecha o pool de conexões do Redis (chamado no shutdown).
+
+    Só fecha se o cliente tiver sido criado.
+    """
+    if get_redis_client.cache_info().currsize == 0:
+        return
+
+    await get_redis_client().aclose()
+    get_redis_client.cache_clear()
@@ -0,0 +1,360 @@
+# ===========================================================
+# src/infrastructure/cache/redis_session_repository.py
+# ===========================================================
+# Implementação do ISessionRepository usando REDIS.
+#
+# POR QUE REDIS PARA SESSÕES?
+# - Sessão é lida e escrita a CADA mensagem (dado "quente")
+# - Vive no máximo 24h (dado temporário)
+# - O Redis expira chaves sozinho (EXPIREAT): não é preciso
+#   varrer uma coluna expires_at para apagar sessões velhas
+#
+# LAYOUT DAS CHAVES:
+#   session:customer:{customer_id}  HASH com a sessão do cliente
+#       id, customer_id, state, created_at, updated_at, expires_at
+#       c:{chave} -> valor JSON de cada chave do contexto
+#   session:id:{session_id}         STRING -> customer_id
+#   session:active                  ZSET (score = expires_at)
+#
+# - A busca do turno (find_by_customer) é um único HGETALL
+# - Cada chave do contexto é um campo do hash: o update grava
+#   apenas as chaves alteradas (dirty tracking da entidade)
+# - As duas primeiras chaves expiram junto com a sessão
+# - O ZSET alimenta count_active/delete_expired
+#
+# PIPELINE:
+# Vários comandos enviados de uma vez (uma ida e volta).
+# Com transaction=True viram um MULTI/EXEC atômico.
+#
+# WATCH (transação otimista):
+# No update, "vigiamos" o hash, conferimos que a sessão ainda
+# existe e só então gravamos. Se outro worker alterar o hash no
+# meio, o EXEC falha e redis.transaction() repete a operação.
+# ===========================================================
+"""
+Repositório de sessões no Redis.
+
+Uso:
+    repo = RedisSessionRepository(get_redis_client(), customer_repo)
+    session = await repo.find_by_customer(customer.id)
+"""
+
+import json
+import time
+from datetime import datetime
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from src.domain.entities.session import Session
+from src.domain.repositories.customer_repository import ICustomerRepository
+from src.domain.repositories.session_repository import ISessionRepository
+from src.shared.types.enums import SessionState
+
+
+# Prefixo dos campos de contexto dentro do hash
+_CONTEXT_PREFIX = "c:"
+
+
+def _dumps(value: Any) -> str:
+    """JSON compacto (sem espaços e sem escapar acentos)."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class RedisSessionRepository(ISessionRepository):
+    """
+    Repositório de sessões usando Redis.
+
+    Um cliente tem no máximo UMA sessão ativa: salvar uma nova
+    sessão substitui a anterior no hash do cliente.
+
+    Example:
+        >>> repo = RedisSessionRepository(redis, customer_repo)
+        >>> await repo.save(Session(customer_id="uuid-cliente"))
+        >>> session = await repo.find_by_customer("uuid-cliente")
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        customer_repo: ICustomerRepository,
+        key_prefix: str = "session:",
+    ) -> None:
+        """
+        Inicializa o repositório.
+
+        Args:
+            redis: Cliente redis.asyncio (decode_responses=True)
+            customer_repo: Usado para traduzir telefone -> cliente
+            key_prefix: Prefixo de todas as chaves
+        """
+        self._redis = redis
+        self._customer_repo = customer_repo
+        self._prefix = key_prefix
+        self._active_key = f"{key_prefix}active"
+
+    # =========================================================
+    # MÉTODOS DE BUSCA
+    # =========================================================
+
+    async def find_by_id(self, id: str) -> Session | None:
+        """Busca sessão por ID (ponteiro id -> cliente)."""
+        customer_id = await self._redis.get(self._id_key(id))
+        if customer_id is None:
+            return None
+
+        session = await self.find_by_customer(customer_id)
+
+        # O cliente pode ter aberto outra sessão depois desta
+        if session is None or session.id != id:
+            return None
+
+        return session
+
+    async def find_by_customer(self, customer_id: str) -> Session | None:
+        """Busca sessão ativa de um cliente (um único HGETALL)."""
+        data = await self._redis.hgetall(self._customer_key(customer_id))
+        if not data:
+            return None
+
+        session = self._to_entity(data)
+
+        # O Redis expira em segundos; confere o instante exato
+        if session.is_expired:
+            return None
+
+        return session
+
+    async def find_active_by_phone(self, phone: str) -> Session | None:
+        """
+        Busca sessão ativa pelo telefone do cliente.
+
+        Usa find_by_phone (sempre consulta a origem): find_id_by_phone
+        pode dizer "número novo" pelo filtro de Bloom, o que só é
+        seguro antes de um get_or_create.
+        """
+        customer = await self._customer_repo.find_by_phone(phone)
+        if customer is None:
+            return None
+
+        return await self.find_by_customer(customer.id)
+
+    # =========================================================
+    # MÉTODOS DE PERSISTÊNCIA
+    # =========================================================
+
+    async def save(self, session: Session) -> None:
+        """Grava a sessão inteira (substitui a anterior do cliente)."""
+        key = self._customer_key(session.customer_id)
+        mapping = self._to_hash(session)
+
+        async def _write(pipe: Pipeline) -> None:
+            previous_id = await pipe.hget(key, "id")
+
+            pipe.multi()
+            self._queue_replace(pipe, session, mapping, previous_id)
+
+        await self._redis.transaction(_write, key)
+
+        session.mark_clean()
+
+    async def get_or_create(self, session: Session) -> tuple[Session, bool]:
+        """
+        Grava a sessão, a menos que o cliente já tenha uma ativa.
+
+        WATCH no hash do cliente: se outro worker gravar uma sessão
+        entre a leitura e o EXEC, a operação é repetida e passa a
+        encontrar a sessão dele.
+        """
+        key = self._customer_key(session.customer_id)
+        mapping = self._to_hash(session)
+
+        async def _write(pipe: Pipeline) -> tuple[Session, bool]:
+            data = await pipe.hgetall(key)
+            current = self._to_entity(data) if data else None
+
+            # EXEC vazio: só confirma que o hash não mudou
+            pipe.multi()
+            if current is not None and not current.is_expired:
+                return current, False
+
+            self._queue_replace(pipe, session, mapping, data.get("id"))
+            return session, True
+
+        result, created = await self._redis.transaction(
+            _write, key, value_from_callable=True
+        )
+
+        if created:
+            session.mark_clean()
+        return result, created
+
+    async def update(self, session: Session) -> None:
+        """
+        Atualiza uma sessão existente.
+
+        Grava apenas os campos e chaves de contexto alterados.
+        Sessão sem alterações não vai ao Redis.
+
+        Raises:
+            ValueError: Se a sessão não existir (ou já tiver expirado)
+        """
+        if not session.is_dirty:
+            return
+
+        key = self._customer_key(session.customer_id)
+        fields, removed = self._changed_values(session)
+
+        async def _write(pipe: Pipeline) -> None:
+            # Modo imediato (antes do multi): leitura vigiada
+            if await pipe.hget(key, "id") != session.id:
+                raise ValueError(f"Sessão não encontrada: {session.id}")
+
+            pipe.multi()
+            pipe.hset(key, mapping=fields)
+            if removed:
+                pipe.hdel(key, *removed)
+            if "expires_at" in session.changed_fields:
+                self._queue_expiry(pipe, session)
+
+        await self._redis.transaction(_write, key)
+
+        session.mark_clean()
+
+    async def delete(self, id: str) -> None:
+        """Remove uma sessão específica."""
+        customer_id = await self._redis.get(self._id_key(id))
+        if customer_id is None:
+            raise ValueError(f"Sessão não encontrada: {id}")
+
+        key = self._customer_key(customer_id)
+
+        async def _delete(pipe: Pipeline) -> None:
+            is_current = await pipe.hget(key, "id") == id
+
+            pipe.multi()
+            if is_current:
+                pipe.delete(key)
+            pipe.delete(self._id_key(id))
+            pipe.zrem(self._active_key, id)
+
+        await self._redis.transaction(_delete, key)
+
+    async def delete_expired(self) -> int:
+        """
+        Remove do índice as sessões expiradas.
+
+        Os dados já foram apagados pelo próprio Redis (EXPIREAT);
+        aqui só limpamos o ZSET usado na contagem.
+        """
+        return await self._redis.zremrangebyscore(
+            self._active_key, "-inf", time.time()
+        )
+
+    async def count_active(self) -> int:
+        """Conta sessões ativas (expires_at no futuro)."""
+        return await self._redis.zcount(
+            self._active_key, f"({time.time()}", "+inf"
+        )
+
+    # =========================================================
+    # AUXILIARES
+    # =========================================================
+
+    def _customer_key(self, customer_id: str) -> str:
+        return f"{self._prefix}customer:{customer_id}"
+
+    def _id_key(self, session_id: str) -> str:
+        return f"{self._prefix}id:{session_id}"
+
+    def _queue_replace(
+        self,
+        pipe: Pipeline,
+        session: Session,
+        mapping: dict[str, str],
+        previous_id: str | None,
+    ) -> None:
+        """Enfileira a troca da sessão do cliente por esta."""
+        if previous_id is not None and previous_id != session.id:
+            # Sessão anterior do cliente deixa de existir
+            pipe.delete(self._id_key(previous_id))
+            pipe.zrem(self._active_key, previous_id)
+
+        key = self._customer_key(session.customer_id)
+        pipe.delete(key)
+        pipe.hset(key, mapping=mapping)
+        self._queue_expiry(pipe, session)
+
+    def _queue_expiry(self, pipe: Pipeline, session: Session) -> None:
+        """Enfileira ponteiro, expiração e índice da sessão."""
+        expires_at = session.expires_at.timestamp()
+        expire_at_seconds = int(expires_at) + 1  # nunca antes da entidade
+
+        pipe.expireat(self._customer_key(session.customer_id), expire_at_seconds)
+        pipe.set(
+            self._id_key(session.id),
+            session.customer_id,
+            exat=expire_at_seconds,
+        )
+        pipe.zadd(self._active_key, {session.id: expires_at})
+
+    def _changed_values(self, session: Session) -> tuple[dict[str, str], list[str]]:
+        """
+        Monta os campos do update a partir do dirty tracking.
+
+        Returns:
+            (campos a gravar, campos de contexto a remover)
+        """
+        fields: dict[str, str] = {"updated_at": session.updated_at.isoformat()}
+        removed: list[str] = []
+        changed = session.changed_fields
+
+        if "state" in changed:
+            fields["state"] = session.state.value
+        if "expires_at" in changed:
+            fields["expires_at"] = session.expires_at.isoformat()
+        if "context" in changed:
+            for context_key in session.changed_context_keys:
+                field_name = _CONTEXT_PREFIX + context_key
+                if context_key in session.context:
+                    fields[field_name] = _dumps(session.context[context_key])
+                else:
+                    removed.append(field_name)
+
+        return fields, removed
+
+    # =========================================================
+    # CONVERSORES (Hash <-> Entity)
+    # =========================================================
+
+    def _to_hash(self, session: Session) -> dict[str, str]:
+        """Converte Session -> campos do hash."""
+        data = {
+            "id": session.id,
+            "customer_id": session.customer_id,
+            "state": session.state.value,
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "expires_at": session.expires_at.isoformat(),
+        }
+        for key, value in session.context.items():
+            data[_CONTEXT_PREFIX + key] = _dumps(value)
+        return data
+
+    def _to_entity(self, data: dict[str, str]) -> Session:
+        """Converte campos do hash -> Session."""
+        context: dict[str, Any] = {
+            field_name[len(_CONTEXT_PREFIX):]: json.loads(value)
+            for field_name, value in data.items()
+            if field_name.startswith(_CONTEXT_PREFIX)
+        }
+        return Session(
+            id=data["id"],
+            customer_id=data["customer_id"],
+            state=SessionState(data["state"]),
+            context=context,
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            expires_at=datetime.fromisoformat(data["expires_at"]),
+        )
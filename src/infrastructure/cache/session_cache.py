@@ -0,0 +1,522 @@
+# ===========================================================
+# src/infrastructure/cache/session_cache.py
+# ===========================================================
+# Cache em memória (L1) na frente de QUALQUER ISessionRepository.
+#
+# PROBLEMA:
+# Cada mensagem lê a sessão do cliente. Quase sempre, quem gravou
+# essa sessão segundos antes foi o PRÓPRIO worker (turno anterior).
+# Ainda assim, a leitura faz uma ida e volta ao banco/Redis.
+#
+# SOLUÇÃO:
+# - Leitura: memória do processo primeiro (TTLCache: LRU + TTL)
+# - Escrita: grava na origem e guarda a versão gravada no cache
+#   -> "read-your-writes": o próximo turno lê o que acabou de gravar
+#
+# VÁRIOS WORKERS:
+# O cache é por processo. Para não servir sessão velha:
+# 1. Roteamento por telefone (recomendado): o balanceador envia
+#    sempre o mesmo cliente ao mesmo worker (hash do campo "from"
+#    do webhook). Assim só um worker escreve a sessão do cliente.
+# 2. TTL curto: limita por quanto tempo uma cópia pode ficar velha
+# 3. Barramento de invalidação (opcional): cada escrita publica o
+#    customer_id em um canal Redis Pub/Sub; os outros workers
+#    descartam a cópia local. Remoções (delete) publicam o ID da
+#    sessão ("session:<id>"): quem remove pode nem ter a cópia,
+#    e portanto não saber o cliente.
+#
+# QUEDA DO REDIS (barramento):
+# A escuta tenta de novo com espera crescente (backoff) e se
+# inscreve outra vez no canal. Avisos publicados enquanto ela
+# estava fora se perderam: ao voltar, o cache local é limpo
+# inteiro (stats.bus_resyncs). Falhas contam em stats.bus_failures.
+#
+# TRANSAÇÃO:
+# Com a sessão do banco do turno (db), o que o turno grava só vai
+# para o cache no COMMIT. Até lá, as buscas do próprio turno veem a
+# versão gravada (guardada no repositório, que é do request), e os
+# outros turnos veem a versão anterior. ROLLBACK descarta a cópia
+# do cliente: nada do turno que falhou é servido depois.
+#
+# CÓPIAS:
+# Entidades são mutáveis. O cache guarda uma cópia e devolve outra,
+# para que alterações do caso de uso só valham após o update().
+# ===========================================================
+"""
+Cache de sessões em dois níveis (memória do processo + origem).
+
+Uso:
+    cache = SessionCache(ttl_seconds=30, max_entries=10_000)
+    repo = CachedSessionRepository(SQLAlchemySessionRepository(db), cache)
+    session = await repo.find_by_customer(customer_id)  # 1ª vez: origem
+    session = await repo.find_by_customer(customer_id)  # 2ª vez: memória
+"""
+
+import asyncio
+import copy
+import dataclasses
+import logging
+import uuid
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.session import Session
+from src.domain.repositories.session_repository import ISessionRepository
+from src.infrastructure.cache.memory_cache import MISSING, CacheStats, TTLCache
+from src.infrastructure.database.transaction_hooks import (
+    after_commit,
+    after_rollback,
+    run_soon,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Prefixo dos avisos de remoção (ID da sessão, não do cliente)
+_SESSION_ID_PREFIX = "session:"
+
+# Tamanho aproximado de uma Session sem o contexto (objeto, datas, ids)
+_SESSION_BASE_BYTES = 600
+
+
+def _estimate_size(session: Session) -> int:
+    """Estima a memória de uma sessão (base + contexto serializado)."""
+    return _SESSION_BASE_BYTES + session.context_size
+
+
+def _clone(session: Session) -> Session:
+    """Cópia independente (contexto incluso) e sem alterações pendentes."""
+    return dataclasses.replace(session, context=copy.deepcopy(session.context))
+
+
+@dataclass
+class SessionCacheStats(CacheStats):
+    """
+    Estatísticas do cache de sessões.
+
+    Além dos contadores padrão:
+        invalidations: Cópias descartadas por escrita/remoção
+        remote_invalidations: Descartes pedidos por outros workers
+        bus_failures: Quedas da escuta do barramento
+        bus_resyncs: Limpezas do cache ao voltar a ouvir o canal
+    """
+
+    invalidations: int = 0
+    remote_invalidations: int = 0
+    bus_failures: int = 0
+    bus_resyncs: int = 0
+
+
+class SessionInvalidationBus:
+    """
+    Avisa os outros workers de que uma sessão mudou (Redis Pub/Sub).
+
+    Cada mensagem leva o ID do worker que escreveu, para que ele
+    ignore os próprios avisos. Se a escuta cair, ela volta sozinha
+    (backoff) e limpa o cache local, pois perdeu avisos.
+
+    Example:
+        >>> bus = SessionInvalidationBus(get_redis_client())
+        >>> cache = SessionCache(bus=bus)
+        >>> await cache.start()   # passa a ouvir o canal
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        channel: str = "session:invalidate",
+        retry_min_seconds: float = 0.5,
+        retry_max_seconds: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            redis: Cliente redis.asyncio (decode_responses=True)
+            channel: Canal Pub/Sub compartilhado pelos workers
+            retry_min_seconds: Espera antes da 1ª nova tentativa
+            retry_max_seconds: Espera máxima entre tentativas
+        """
+        self._redis = redis
+        self._channel = channel
+        self._retry_min_seconds = retry_min_seconds
+        self._retry_max_seconds = retry_max_seconds
+        self._worker_id = uuid.uuid4().hex
+        self._task: asyncio.Task | None = None
+        self.failures = 0
+        self.resyncs = 0
+
+    async def publish(self, customer_id: str) -> None:
+        """Publica que a sessão do cliente mudou (falhas só geram log)."""
+        await self._send(customer_id)
+
+    async def publish_session(self, session_id: str) -> None:
+        """Publica que a sessão com este ID foi removida."""
+        await self._send(_SESSION_ID_PREFIX + session_id)
+
+    async def _send(self, key: str) -> None:
+        try:
+            await self._redis.publish(self._channel, f"{self._worker_id} {key}")
+        except RedisError as e:
+            logger.warning(f"Cache de sessões: falha ao publicar invalidação: {e}")
+
+    def start(self, cache: "SessionCache") -> None:
+        """Começa a ouvir o canal em uma tarefa de fundo."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(cache))
+
+    async def stop(self) -> None:
+        """Para de ouvir o canal."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _listen(self, cache: "SessionCache") -> None:
+        """
+        Laço de escuta: descarta a cópia local de cada aviso recebido.
+
+        Quedas do Redis não encerram o laço: espera (backoff),
+        inscreve-se de novo e limpa o cache local (avisos perdidos).
+        """
+        delay = self._retry_min_seconds
+        reconnecting = False
+        while True:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self._channel)
+                if reconnecting:
+                    cache.clear()
+                    self.resyncs += 1
+                    logger.info("Cache de sessões: barramento de invalidação voltou")
+                    reconnecting = False
+                delay = self._retry_min_seconds
+
+                async for message in pubsub.listen():
+                    worker_id, _, key = str(message["data"]).partition(" ")
+                    if worker_id == self._worker_id or not key:
+                        continue
+                    if key.startswith(_SESSION_ID_PREFIX):
+                        session_id = key.removeprefix(_SESSION_ID_PREFIX)
+                        cache.discard_session_id(session_id, remote=True)
+                    else:
+                        cache.invalidate(key, remote=True)
+            except RedisError as e:
+                # Até voltar, vale só o TTL curto do cache
+                self.failures += 1
+                logger.warning(
+                    f"Cache de sessões: barramento de invalidação caiu ({e}); "
+                    f"nova tentativa em {delay:.1f}s"
+                )
+            finally:
+                try:
+                    await pubsub.aclose()
+                except RedisError:
+                    pass
+
+            reconnecting = True
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._retry_max_seconds)
+
+
+class SessionCache:
+    """
+    Armazenamento compartilhado do cache de sessões.
+
+    Uma instância por processo, chaveada pelo customer_id
+    (a busca de todo turno é find_by_customer).
+
+    Attributes:
+        stats: Contadores de hit/miss/eviction (ver SessionCacheStats)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 10_000,
+        max_bytes: int | None = 32 * 1024 * 1024,
+        bus: SessionInvalidationBus | None = None,
+    ) -> None:
+        """
+        Inicializa o cache.
+
+        Args:
+            ttl_seconds: Validade de uma cópia local
+            max_entries: Limite de sessões em memória
+            max_bytes: Limite de memória estimada (None = sem limite)
+            bus: Barramento de invalidação entre workers (opcional)
+        """
+        self._local: TTLCache[str, Session] = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+            sizer=_estimate_size,
+        )
+        self._bus = bus
+        self._stats = SessionCacheStats()
+
+    @property
+    def stats(self) -> SessionCacheStats:
+        """Contadores de uso (inclui evictions/expirations do nível local)."""
+        self._stats.evictions = self._local.stats.evictions
+        self._stats.expirations = self._local.stats.expirations
+        if self._bus is not None:
+            self._stats.bus_failures = self._bus.failures
+            self._stats.bus_resyncs = self._bus.resyncs
+        return self._stats
+
+    @property
+    def size_bytes(self) -> int:
+        """Memória estimada ocupada pelas sessões."""
+        return self._local.size_bytes
+
+    def get(self, customer_id: str) -> Session:
+        """
+        Busca a sessão de um cliente.
+
+        Returns:
+            Cópia da sessão, ou MISSING se não estiver no cache
+        """
+        session = self._local.get(customer_id, record=False)
+
+        # Sessão expirou antes da cópia local: trata como ausente
+        if session is not MISSING and session.is_expired:
+            self._local.delete(customer_id)
+            session = MISSING
+
+        if session is MISSING:
+            self._stats.misses += 1
+            return MISSING
+
+        self._stats.hits += 1
+        return _clone(session)
+
+    async def store(self, session: Session) -> None:
+        """
+        Guarda a versão recém-gravada e avisa os outros workers.
+
+        Chamado após save/update na origem (read-your-writes).
+        """
+        self._local.set(session.customer_id, _clone(session))
+        if self._bus is not None:
+            await self._bus.publish(session.customer_id)
+
+    def store_soon(self, session: Session) -> None:
+        """
+        Versão síncrona de store (para callbacks de transação).
+
+        A cópia local é guardada na hora; o aviso aos outros workers
+        vai para uma tarefa de fundo.
+        """
+        self._local.set(session.customer_id, _clone(session))
+        if self._bus is not None:
+            run_soon(
+                self._bus.publish(session.customer_id),
+                "publicar invalidação de sessão",
+            )
+
+    def invalidate(self, customer_id: str, remote: bool = False) -> None:
+        """
+        Descarta a cópia local da sessão de um cliente.
+
+        Args:
+            customer_id: Cliente dono da sessão
+            remote: True quando o pedido veio de outro worker
+        """
+        if self._local.delete(customer_id):
+            self._stats.invalidations += 1
+            if remote:
+                self._stats.remote_invalidations += 1
+
+    async def invalidate_session_id(self, session_id: str) -> None:
+        """
+        Descarta a sessão com este ID (local e nos outros workers).
+
+        O aviso aos outros workers sai sempre, mesmo sem cópia
+        local: eles podem ter a sessão removida.
+        """
+        self.discard_session_id(session_id)
+        if self._bus is not None:
+            await self._bus.publish_session(session_id)
+
+    def discard_session_id(self, session_id: str, remote: bool = False) -> None:
+        """
+        Descarta a cópia local da sessão com este ID.
+
+        Busca linear: só usado em remoções, que são raras.
+
+        Args:
+            session_id: ID da sessão removida
+            remote: True quando o pedido veio de outro worker
+        """
+        for customer_id, session in self._local.items():
+            if session.id == session_id:
+                self.invalidate(customer_id, remote=remote)
+
+    def clear(self) -> None:
+        """Limpa todas as cópias locais."""
+        self._local.clear()
+
+    async def start(self) -> None:
+        """Liga o barramento de invalidação (se configurado)."""
+        if self._bus is not None:
+            self._bus.start(self)
+
+    async def stop(self) -> None:
+        """Desliga o barramento de invalidação (se configurado)."""
+        if self._bus is not None:
+            await self._bus.stop()
+
+
+class CachedSessionRepository(ISessionRepository):
+    """
+    Decorator de ISessionRepository com cache em memória.
+
+    - find_by_customer: memória -> origem
+    - find_by_id / find_active_by_phone: origem (não há índice local
+      por ID/telefone), preferindo a cópia local da mesma sessão
+    - save/update/get_or_create: origem primeiro, depois guarda a
+      versão gravada (com db: só no COMMIT da transação do turno)
+    - delete: origem e descarte da cópia local
+    - Relatórios (count_active/delete_expired): repassados
+
+    Example:
+        >>> repo = CachedSessionRepository(sql_repo, session_cache)
+        >>> await repo.find_by_customer("uuid")  # miss -> origem
+        >>> await repo.find_by_customer("uuid")  # hit
+    """
+
+    def __init__(
+        self,
+        inner: ISessionRepository,
+        cache: SessionCache,
+        db: AsyncSession | None = None,
+    ) -> None:
+        """
+        Args:
+            inner: Repositório real (SQL ou Redis)
+            cache: Cache compartilhado do processo
+            db: Sessão do banco do turno (None = guarda no cache logo
+                após a escrita, sem esperar o COMMIT)
+        """
+        self._inner = inner
+        self._cache = cache
+        self._db = db
+
+        # customer_id -> versão gravada pelo turno, ainda sem COMMIT
+        self._written: dict[str, Session] = {}
+
+    # =========================================================
+    # MÉTODOS DE BUSCA
+    # =========================================================
+
+    async def find_by_id(self, id: str) -> Session | None:
+        """Busca sessão por ID."""
+        return self._prefer_cached(await self._inner.find_by_id(id))
+
+    async def find_by_customer(self, customer_id: str) -> Session | None:
+        """Busca sessão ativa do cliente (turno -> memória -> origem)."""
+        written = self._written.get(customer_id)
+        if written is not None:
+            return _clone(written)
+
+        cached = self._cache.get(customer_id)
+        if cached is not MISSING:
+            return cached
+
+        session = await self._inner.find_by_customer(customer_id)
+        if session is not None:
+            await self._cache.store(session)
+        return session
+
+    async def find_active_by_phone(self, phone: str) -> Session | None:
+        """Busca sessão pelo telefone (origem resolve o telefone)."""
+        return self._prefer_cached(await self._inner.find_active_by_phone(phone))
+
+    def _prefer_cached(self, session: Session | None) -> Session | None:
+        """Troca a sessão lida da origem pela cópia local, se for a mesma."""
+        if session is None:
+            return None
+
+        written = self._written.get(session.customer_id)
+        if written is not None and written.id == session.id:
+            return _clone(written)
+
+        cached = self._cache.get(session.customer_id)
+        if cached is not MISSING and cached.id == session.id:
+            return cached
+        return session
+
+    # =========================================================
+    # MÉTODOS DE PERSISTÊNCIA
+    # =========================================================
+
+    async def save(self, session: Session) -> None:
+        """Salva na origem e guarda a versão gravada."""
+        await self._inner.save(session)
+        await self._remember(session)
+
+    async def get_or_create(self, session: Session) -> tuple[Session, bool]:
+        """Cria na origem (ou recebe a ativa) e guarda a versão gravada."""
+        session, created = await self._inner.get_or_create(session)
+        await self._remember(session)
+        return session, created
+
+    async def update(self, session: Session) -> None:
+        """Atualiza na origem (só se houver alterações) e guarda a versão."""
+        if not session.is_dirty:
+            return
+
+        await self._inner.update(session)
+        await self._remember(session)
+
+    async def delete(self, id: str) -> None:
+        """Remove da origem e descarta a cópia local."""
+        await self._inner.delete(id)
+        for customer_id, written in list(self._written.items()):
+            if written.id == id:
+                del self._written[customer_id]
+        await self._cache.invalidate_session_id(id)
+
+    async def _remember(self, session: Session) -> None:
+        """
+        Guarda a versão gravada: na hora (sem db) ou no COMMIT.
+
+        Até o COMMIT, a cópia compartilhada do cliente é descartada
+        e só este turno vê a versão nova. No ROLLBACK, a cópia é
+        descartada de novo (pode ter sido relida no meio tempo).
+        """
+        if self._db is None:
+            await self._cache.store(session)
+            return
+
+        customer_id = session.customer_id
+        snapshot = _clone(session)
+        self._written[customer_id] = snapshot
+        self._cache.invalidate(customer_id)
+
+        def committed() -> None:
+            self._written.pop(customer_id, None)
+            self._cache.store_soon(snapshot)
+
+        def rolled_back() -> None:
+            self._written.pop(customer_id, None)
+            self._cache.invalidate(customer_id)
+
+        after_commit(self._db, committed)
+        after_rollback(self._db, rolled_back)
+
+    async def delete_expired(self) -> int:
+        """Repassa ao repositório real (cópias expiradas somem no get)."""
+        return await self._inner.delete_expired()
+
+    async def count_active(self) -> int:
+        """Repassa ao repositório real."""
+        return await self._inner.count_active()
@@ -8,10 +8,20 @@ Exporta:
 - Modelos SQLAlchemy
 - Conexão e factory de sessões
 - Repositórios concretos
+- Removedor de sessões expiradas
+- Origem do snapshot do catálogo de produtos
+- Origem dos telefones cadastrados (identidade de clientes)
+- Importação do catálogo em lote (COPY + diff)
+- Hidratação de entidades (linhas do Core -> entidade)
+- Contagem de comandos SQL por mensagem
+- Pool de conexões com métricas
+- Réplica de leitura (roteamento das leituras)
+- Callbacks de fim de transação (commit/rollback)
 """
 
 from src.infrastructure.database.models import (
     Base,
+    CatalogVersionModel,
     CustomerModel,
     ProductModel,
     OrderModel,
@@ -23,14 +33,42 @@ from src.infrastructure.database.connection import (
     get_db_session,
     create_all_tables,
     drop_all_tables,
+    engine_options,
+    replica_engine,
+    ReplicaSessionFactory,
+)
+from src.infrastructure.database.catalog_import import (
+    CatalogImporter,
+    CatalogImportResult,
+)
+from src.infrastructure.database.catalog_source import SQLAlchemyCatalogSource
+from src.infrastructure.database.hydration import RowHydrator
+from src.infrastructure.database.phone_source import SQLAlchemyPhoneSource
+from src.infrastructure.database.pool import MonitoredQueuePool, PoolStats
+from src.infrastructure.database.replica import ReadReplicaRouter, ReplicaStats
+from src.infrastructure.database.query_stats import (
+    QueryStats,
+    StatementUsage,
+    instrument_engine,
+    track_statements,
 )
 from src.infrastructure.database.repositories import (
     SQLAlchemyCustomerRepository,
 )
+from src.infrastructure.database.transaction_hooks import (
+    after_commit,
+    after_rollback,
+    run_soon,
+)
+from src.infrastructure.database.session_reaper import (
+    ExpiredSessionReaper,
+    ReaperStats,
+)
 
 __all__ = [
     # Models
     "Base",
+    "CatalogVersionModel",
     "CustomerModel",
     "ProductModel",
     "OrderModel",
@@ -41,6 +79,35 @@ __all__ = [
     "get_db_session",
     "create_all_tables",
     "drop_all_tables",
+    "engine_options",
+    # Pool de conexões
+    "MonitoredQueuePool",
+    "PoolStats",
+    # Réplica de leitura
+    "replica_engine",
+    "ReplicaSessionFactory",
+    "ReadReplicaRouter",
+    "ReplicaStats",
+    # Hidratação
+    "RowHydrator",
+    # Comandos SQL por mensagem
+    "QueryStats",
+    "StatementUsage",
+    "instrument_engine",
+    "track_statements",
     # Repositories
     "SQLAlchemyCustomerRepository",
+    # Fim de transação
+    "after_commit",
+    "after_rollback",
+    "run_soon",
+    # Identidade de clientes
+    "SQLAlchemyPhoneSource",
+    # Catálogo de produtos
+    "SQLAlchemyCatalogSource",
+    "CatalogImporter",
+    "CatalogImportResult",
+    # Tarefas de fundo
+    "ExpiredSessionReaper",
+    "ReaperStats",
 ]
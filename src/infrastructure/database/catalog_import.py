@@ -0,0 +1,550 @@
+# ===========================================================
+# src/infrastructure/database/catalog_import.py
+# ===========================================================
+# Importação (sincronização) do catálogo INTEIRO em lote.
+#
+# ANTES:
+#   for linha in arquivo: await repo.save(Product(...))
+#   Um INSERT + flush do ORM por produto. 100k produtos = 100k
+#   idas ao banco, e nada de "atualizar o que mudou" ou
+#   "desativar o que saiu do catálogo".
+#
+# AGORA (uma transação):
+# 1. O arquivo (CSV ou JSONL) é lido em pedaços, direto do corpo
+#    do request, e validado linha a linha: a memória não cresce
+#    com o tamanho do arquivo
+# 2. As linhas vão por COPY (asyncpg) para uma tabela TEMPORÁRIA
+#    de staging, sem objetos do ORM e sem um comando por linha
+# 3. UM comando aplica a diferença (CTEs que alteram dados):
+#    - inserted:    SKU novo                     -> INSERT
+#    - updated:     SKU existente e algo mudou   -> UPDATE
+#                   (IS DISTINCT FROM: linhas iguais não são
+#                   reescritas, nem geram versões mortas)
+#    - deactivated: SKU que não veio no arquivo  -> active = false
+#    Todas as linhas alteradas recebem o MESMO updated_at: a
+#    versão do catálogo (count, max(updated_at)) avança uma vez.
+#
+# ARQUIVO:
+# Colunas sku, name, price, category (obrigatórias) e
+# description, image_url, stock (opcionais). Sem stock (coluna
+# ausente ou vazia), o estoque atual é mantido; produtos novos
+# começam com 0. Se o mesmo SKU aparece duas vezes, vale a última.
+#
+# LINHAS INVÁLIDAS:
+# Não interrompem a importação: são contadas e as primeiras
+# mensagens voltam no resultado. Se a linha tem SKU, o produto
+# não é alterado NEM desativado.
+#
+# CONCORRÊNCIA:
+# Duas importações simultâneas são serializadas por um advisory
+# lock da transação.
+# ===========================================================
+"""
+Importação do catálogo de produtos em lote (COPY + diff).
+
+Uso:
+    async with AsyncSessionFactory() as db:
+        result = await CatalogImporter(db).run(request.stream(), "csv")
+        await db.commit()
+"""
+
+import codecs
+import csv
+import io
+import json
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Literal
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Delete,
+    Integer,
+    MetaData,
+    Numeric,
+    Select,
+    String,
+    Table,
+    Text,
+    Uuid,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import ProductModel
+from src.shared.utils.ids import new_id
+
+
+CatalogFormat = Literal["csv", "jsonl"]
+
+REQUIRED_COLUMNS = ("sku", "name", "price", "category")
+
+# Mensagens de linhas inválidas devolvidas no resultado
+MAX_ERRORS = 20
+
+_MAX_PRICE = Decimal("99999999.99")  # Numeric(10, 2)
+_MAX_STOCK = 2**31 - 1  # Integer
+_CENTS = Decimal("0.01")
+
+_products = ProductModel.__table__
+
+# Staging: some no COMMIT (ou ROLLBACK) da importação
+_STAGING = Table(
+    "catalog_import_staging",
+    MetaData(),
+    Column("line", Integer, nullable=False),
+    Column("valid", Boolean, nullable=False),
+    Column("sku", String(64), nullable=False),
+    Column("id", Uuid(as_uuid=False)),
+    Column("name", String(200)),
+    Column("description", Text),
+    Column("price", Numeric(10, 2)),
+    Column("image_url", String(500)),
+    Column("category", String(100)),
+    Column("stock", Integer),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+_STAGING_COLUMNS = [column.name for column in _STAGING.columns]
+
+
+@dataclass
+class CatalogImportResult:
+    """
+    Resultado de uma importação.
+
+    Attributes:
+        received: Linhas de produto lidas do arquivo
+        rejected: Linhas inválidas (ignoradas)
+        inserted: Produtos criados
+        updated: Produtos alterados (ou reativados)
+        unchanged: Produtos do arquivo que já estavam iguais
+        deactivated: Produtos desativados por não virem no arquivo
+        seconds: Duração da importação
+        errors: Primeiras MAX_ERRORS mensagens de linhas inválidas
+    """
+
+    received: int = 0
+    rejected: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deactivated: int = 0
+    seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    def reject(self, line: int, error: ValueError) -> None:
+        """Registra uma linha inválida."""
+        self.rejected += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(f"linha {line}: {error}")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Retorna o resultado para a resposta da API e logs."""
+        return asdict(self)
+
+
+class CatalogImporter:
+    """
+    Sincroniza a tabela de produtos com um arquivo de catálogo.
+
+    Roda na transação da sessão recebida: quem chama faz o
+    commit (ou o rollback, se algo falhar no meio).
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Args:
+            session: Sessão do banco (PostgreSQL + asyncpg)
+        """
+        self._session = session
+
+    async def run(
+        self,
+        chunks: AsyncIterable[bytes],
+        format: CatalogFormat = "csv",
+        deactivate_missing: bool = True,
+    ) -> CatalogImportResult:
+        """
+        Importa o arquivo e aplica a diferença em um comando.
+
+        Args:
+            chunks: Conteúdo do arquivo em pedaços (UTF-8)
+            format: "csv" (com cabeçalho) ou "jsonl"
+            deactivate_missing: Desativa produtos com SKU que não
+                vieram no arquivo (False: importação parcial)
+
+        Returns:
+            Contagens da importação
+
+        Raises:
+            ValueError: Formato desconhecido, arquivo fora de UTF-8
+                ou CSV sem as colunas obrigatórias
+        """
+        if format not in ("csv", "jsonl"):
+            raise ValueError(f"Formato não suportado: {format}")
+
+        started = time.perf_counter()
+        result = CatalogImportResult()
+
+        await self._session.execute(
+            select(func.pg_advisory_xact_lock(func.hashtext(_STAGING.name)))
+        )
+        connection = await self._session.connection()
+        await connection.run_sync(_STAGING.create)
+
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            _STAGING.name,
+            records=_staging_records(chunks, format, result),
+            columns=_STAGING_COLUMNS,
+        )
+
+        if result.received > result.rejected:
+            await self._session.execute(_drop_duplicates())
+            # Tabela temporária não passa pelo autovacuum: sem
+            # estatísticas, o planejador acha que ela é minúscula
+            await self._session.execute(text(f"ANALYZE {_STAGING.name}"))
+            diff = await self._session.execute(
+                _diff_statement(datetime.now(), deactivate_missing)
+            )
+            inserted, updated, deactivated, valid = diff.one()
+            result.inserted = inserted
+            result.updated = updated
+            result.deactivated = deactivated
+            result.unchanged = valid - inserted - updated
+
+        result.seconds = round(time.perf_counter() - started, 3)
+        return result
+
+
+# ===========================================================
+# DIFF
+# ===========================================================
+
+def _drop_duplicates() -> Delete:
+    """
+    SKU repetido no arquivo: vale a última linha.
+
+    DELETE FROM staging USING staging AS newer
+    WHERE newer.sku = staging.sku AND newer.line > staging.line
+    """
+    newer = _STAGING.alias("newer")
+    return (
+        delete(_STAGING)
+        .where(newer.c.sku == _STAGING.c.sku)
+        .where(newer.c.line > _STAGING.c.line)
+    )
+
+
+def _diff_statement(now: datetime, deactivate_missing: bool) -> Select:
+    """
+    WITH inserted, updated, deactivated: SELECT das contagens.
+
+    Os CTEs enxergam o mesmo snapshot e tocam conjuntos
+    disjuntos de produtos (SKU novo / existente / ausente).
+    O staging já está sem SKUs repetidos (_drop_duplicates).
+    """
+    staging = _STAGING.c
+    now = literal(now, DateTime)
+
+    inserted = (
+        insert(_products)
+        .from_select(
+            [
+                "id", "sku", "name", "description", "price", "image_url",
+                "category", "stock", "active", "created_at", "updated_at",
+            ],
+            select(
+                staging.id,
+                staging.sku,
+                staging.name,
+                staging.description,
+                staging.price,
+                staging.image_url,
+                staging.category,
+                func.coalesce(staging.stock, 0),
+                true(),
+                now,
+                now,
+            )
+            .where(staging.valid)
+            .where(~exists().where(_products.c.sku == staging.sku)),
+        )
+        .returning(_products.c.id)
+        .cte("inserted")
+    )
+
+    stock = func.coalesce(staging.stock, _products.c.stock)
+    current = tuple_(
+        _products.c.name,
+        _products.c.description,
+        _products.c.price,
+        _products.c.image_url,
+        _products.c.category,
+        _products.c.stock,
+        _products.c.active,
+    )
+    incoming = tuple_(
+        staging.name,
+        staging.description,
+        staging.price,
+        staging.image_url,
+        staging.category,
+        stock,
+        true(),
+    )
+    updated = (
+        update(_products)
+        .where(_products.c.sku == staging.sku)
+        .where(staging.valid)
+        .where(current.is_distinct_from(incoming))
+        .values(
+            name=staging.name,
+            description=staging.description,
+            price=staging.price,
+            image_url=staging.image_url,
+            category=staging.category,
+            stock=stock,
+            active=True,
+            updated_at=now,
+        )
+        .returning(_products.c.id)
+        .cte("updated")
+    )
+
+    deactivated = (
+        update(_products)
+        .where(_products.c.active == true())
+        .where(_products.c.sku.is_not(None))
+        .where(~exists().where(staging.sku == _products.c.sku))
+        .values(active=False, updated_at=now)
+        .returning(_products.c.id)
+        .cte("deactivated")
+    )
+
+    def count(cte) -> Any:
+        return select(func.count()).select_from(cte).scalar_subquery()
+
+    valid = select(func.count()).select_from(_STAGING).where(staging.valid)
+    return select(
+        count(inserted),
+        count(updated),
+        count(deactivated) if deactivate_missing else literal(0),
+        valid.scalar_subquery(),
+    )
+
+
+# ===========================================================
+# LEITURA DO ARQUIVO (em pedaços)
+# ===========================================================
+
+async def _staging_records(
+    chunks: AsyncIterable[bytes],
+    format: CatalogFormat,
+    result: CatalogImportResult,
+) -> AsyncIterator[tuple]:
+    """Linhas prontas para o COPY, na ordem de _STAGING_COLUMNS."""
+    async for line, fields in _rows(chunks, format):
+        result.received += 1
+        try:
+            if isinstance(fields, ValueError):
+                raise fields
+            yield _staging_row(line, fields)
+        except ValueError as error:
+            result.reject(line, error)
+            sku = _sku_or_none(fields)
+            if sku is not None:
+                # Protege o produto de ser desativado
+                yield (line, False, sku, None, None, None, None, None, None, None)
+
+
+async def _rows(
+    chunks: AsyncIterable[bytes],
+    format: CatalogFormat,
+) -> AsyncIterator[tuple[int, Mapping[str, Any] | ValueError]]:
+    """(número da linha, campos) de cada produto do arquivo."""
+    if format == "jsonl":
+        line = 0
+        async for block in _blocks(chunks, quoted=False):
+            for text_line in io.StringIO(block):
+                line += 1
+                if text_line.strip():
+                    yield line, _json_fields(text_line)
+        return
+
+    header: list[str] | None = None
+    lines_before = 0
+    async for block in _blocks(chunks, quoted=True):
+        reader = csv.reader(io.StringIO(block))
+        consumed = 0
+        for record in reader:
+            # Primeira linha do registro (um campo pode ocupar várias)
+            line = lines_before + consumed + 1
+            consumed = reader.line_num
+            if not any(value.strip() for value in record):
+                continue
+            if header is None:
+                header = [name.strip().lower() for name in record]
+                missing = [name for name in REQUIRED_COLUMNS if name not in header]
+                if missing:
+                    raise ValueError(
+                        f"Colunas obrigatórias ausentes: {', '.join(missing)}"
+                    )
+                continue
+            if len(record) != len(header):
+                yield line, ValueError("Número de campos diferente do cabeçalho")
+                continue
+            yield line, dict(zip(header, record))
+        lines_before += block.count("\n")
+
+
+async def _blocks(chunks: AsyncIterable[bytes], quoted: bool) -> AsyncIterator[str]:
+    """
+    Texto do arquivo em blocos que terminam no fim de um registro.
+
+    quoted (CSV): uma quebra de linha dentro de um campo entre
+    aspas não encerra o registro; o bloco é cortado na última
+    quebra com número PAR de aspas antes dela.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            cut = _record_boundary(pending, quoted)
+            if cut:
+                yield pending[:cut]
+                pending = pending[cut:]
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as error:
+        raise ValueError("Arquivo não está em UTF-8") from error
+    if pending:
+        yield pending
+
+
+def _record_boundary(text_block: str, quoted: bool) -> int:
+    """
+    Posição logo após a última quebra de linha que fecha um registro.
+
+    0 se nenhuma linha do pedaço fecha um registro.
+    """
+    cut = text_block.rfind("\n") + 1
+    if quoted:
+        # "" (aspas escapadas) conta 2: não muda a paridade
+        while cut and text_block.count('"', 0, cut) % 2:
+            cut = text_block.rfind("\n", 0, cut - 1) + 1
+    return cut
+
+
+def _json_fields(text_line: str) -> Mapping[str, Any] | ValueError:
+    """Campos de uma linha JSONL (ou o erro da linha)."""
+    try:
+        fields = json.loads(text_line)
+    except json.JSONDecodeError:
+        return ValueError("JSON inválido")
+    if not isinstance(fields, dict):
+        return ValueError("Linha não é um objeto JSON")
+    return fields
+
+
+# ===========================================================
+# VALIDAÇÃO DE CADA LINHA
+# ===========================================================
+
+def _staging_row(line: int, fields: Mapping[str, Any]) -> tuple:
+    """
+    Linha válida para o staging.
+
+    Raises:
+        ValueError: Campo obrigatório vazio ou valor inválido
+    """
+    return (
+        line,
+        True,
+        _text(fields, "sku", 64, required=True),
+        new_id(),
+        _text(fields, "name", 200, required=True),
+        _text(fields, "description"),
+        _price(fields.get("price")),
+        _text(fields, "image_url", 500),
+        _text(fields, "category", 100, required=True),
+        _stock(fields.get("stock")),
+    )
+
+
+def _sku_or_none(fields: Mapping[str, Any] | ValueError) -> str | None:
+    """SKU de uma linha inválida, se ele próprio for válido."""
+    if isinstance(fields, ValueError):
+        return None
+    try:
+        return _text(fields, "sku", 64, required=True)
+    except ValueError:
+        return None
+
+
+def _text(
+    fields: Mapping[str, Any],
+    name: str,
+    max_length: int | None = None,
+    required: bool = False,
+) -> str | None:
+    """Texto sem espaços nas pontas; vazio vira None."""
+    value = fields.get(name)
+    value = "" if value is None else str(value).strip()
+    if not value:
+        if required:
+            raise ValueError(f"Campo obrigatório vazio: {name}")
+        return None
+    if max_length is not None and len(value) > max_length:
+        raise ValueError(f"{name} com mais de {max_length} caracteres")
+    return value
+
+
+def _price(value: Any) -> Decimal:
+    """Preço com 2 casas ("49.90" ou "49,90")."""
+    if value is None or str(value).strip() == "":
+        raise ValueError("Campo obrigatório vazio: price")
+    try:
+        price = Decimal(str(value).strip().replace(",", "."))
+    except InvalidOperation:
+        raise ValueError(f"Preço inválido: {value!r}") from None
+    if not price.is_finite():
+        raise ValueError(f"Preço inválido: {value!r}")
+    if price < 0:
+        raise ValueError("Preço não pode ser negativo")
+    price = price.quantize(_CENTS)
+    if price > _MAX_PRICE:
+        raise ValueError(f"Preço acima do limite: {value!r}")
+    return price
+
+
+def _stock(value: Any) -> int | None:
+    """Estoque inteiro; vazio (None) mantém o estoque atual."""
+    if value is None or str(value).strip() == "":
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"Estoque inválido: {value!r}")
+    try:
+        stock = int(str(value).strip())
+    except ValueError:
+        raise ValueError(f"Estoque inválido: {value!r}") from None
+    if stock < 0:
+        raise ValueError("Estoque não pode ser negativo")
+    if stock > _MAX_STOCK:
+        raise ValueError(f"Estoque inválido: {value!r}")
+    return stock
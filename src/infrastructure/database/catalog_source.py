@@ -0,0 +1,52 @@
+# ===========================================================
+# src/infrastructure/database/catalog_source.py
+# ===========================================================
+# Origem do snapshot do catálogo (cache/product_catalog.py).
+#
+# Cada chamada abre uma sessão PRÓPRIA do banco: a verificação
+# de versão e a carga rodam numa tarefa de fundo, fora do ciclo
+# de qualquer request.
+#
+# VERSÃO:
+# (catalog_version.version, max(products.updated_at))
+# O contador é avançado por trigger (migração 010) na transação
+# de qualquer mudança de catálogo, inclusive feita direto no
+# banco, e só cresce. O max(updated_at) acompanha o estoque.
+# ===========================================================
+"""
+Carga do catálogo de produtos a partir do PostgreSQL.
+
+Uso:
+    source = SQLAlchemyCatalogSource(AsyncSessionFactory)
+    catalog = ProductCatalog(source)
+"""
+
+from collections.abc import Hashable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.entities.product import Product
+from src.infrastructure.database.repositories.sqlalchemy_product_repository import (
+    SQLAlchemyProductRepository,
+)
+
+
+class SQLAlchemyCatalogSource:
+    """Versão e produtos do catálogo, lidos em sessões próprias."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """
+        Args:
+            session_factory: Cria uma sessão do banco por chamada
+        """
+        self._session_factory = session_factory
+
+    async def version(self) -> Hashable:
+        """Versão atual da tabela de produtos."""
+        async with self._session_factory() as db:
+            return await SQLAlchemyProductRepository(db).catalog_version()
+
+    async def load(self) -> list[Product]:
+        """Produtos ativos, por categoria e nome."""
+        async with self._session_factory() as db:
+            return await SQLAlchemyProductRepository(db).find_all_listed()
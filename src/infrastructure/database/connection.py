@@ -24,6 +24,21 @@
 #    - Conjunto de conexões reutilizáveis
 #    - pool_size: conexões mantidas abertas
 #    - max_overflow: conexões extras temporárias
+#    - pool_timeout: espera máxima por conexão livre
+#    - pool_recycle / pool_pre_ping: trocam conexões velhas ou
+#      mortas (ex: depois de um failover do banco)
+#    - Tudo vem de Settings (DATABASE_POOL_*); métricas em pool.py
+#
+# 4. PGBOUNCER (DATABASE_PGBOUNCER=true):
+#    - Em pool_mode=transaction, cada transação pode cair numa
+#      conexão diferente do servidor: prepared statements criados
+#      numa não existem na outra
+#    - Desliga os caches de prepared statements (asyncpg e
+#      SQLAlchemy) e dá nomes únicos aos que o asyncpg ainda cria
+#
+# 5. RÉPLICA DE LEITURA (DATABASE_REPLICA_URL, opcional):
+#    - Engine própria (pool próprio, mesmos parâmetros)
+#    - Usada só pelas leituras roteadas (ver replica.py)
 # ===========================================================
 """
 Configuração da conexão com o banco de dados PostgreSQL.
@@ -31,10 +46,12 @@ Configuração da conexão com o banco de dados PostgreSQL.
 Este módulo cria:
 - Engine assíncrona para conectar ao banco
 - Factory de sessões para criar sessões sob demanda
+- Engine e factory da réplica de leitura (se configurada)
 - Dependency injection para FastAPI
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -42,7 +59,9 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
 )
 
-from src.config.settings import get_settings
+from src.config.settings import Settings, get_settings
+from src.infrastructure.database.pool import MonitoredQueuePool
+from src.infrastructure.database.query_stats import instrument_engine
 
 
 # Carrega configurações do ambiente
@@ -53,18 +72,47 @@ settings = get_settings()
 # ENGINE - Ponto de conexão com o banco
 # ===========================================================
 
+def _unique_statement_name() -> str:
+    """Nome único por prepared statement (não colide no PgBouncer)."""
+    return f"__asyncpg_{uuid4()}__"
+
+
+def engine_options(settings: Settings) -> dict[str, Any]:
+    """
+    Argumentos de create_async_engine a partir das configurações.
+    
+    Args:
+        settings: Configurações da aplicação
+        
+    Returns:
+        dict: echo, pool (classe e parâmetros) e connect_args
+    """
+    options: dict[str, Any] = {
+        "echo": settings.debug,  # Log SQL apenas em desenvolvimento
+        "poolclass": MonitoredQueuePool,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_pool_max_overflow,
+        "pool_timeout": settings.database_pool_timeout_seconds,
+        "pool_recycle": settings.database_pool_recycle_seconds,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+    }
+    if settings.database_pgbouncer:
+        options["connect_args"] = {
+            "statement_cache_size": 0,           # cache do asyncpg
+            "prepared_statement_cache_size": 0,  # cache do SQLAlchemy
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    return options
+
+
 # create_async_engine: Cria engine ASSÍNCRONA
 # - url: string de conexão (postgresql+asyncpg://...)
-# - echo: se True, loga todas as queries SQL (útil em dev)
-# - pool_size: conexões mantidas no pool
-# - max_overflow: conexões extras permitidas
-
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,  # Log SQL apenas em desenvolvimento
-    pool_size=5,          # 5 conexões permanentes
-    max_overflow=10,      # Até 10 extras temporárias
-)
+# - demais argumentos: ver engine_options()
+
+engine = create_async_engine(settings.database_url, **engine_options(settings))
+
+# Comandos, linhas e tempo de banco por mensagem (ver query_stats.py)
+instrument_engine(engine)
 
 
 # ===========================================================
@@ -85,6 +133,26 @@ AsyncSessionFactory = async_sessionmaker(
 )
 
 
+# ===========================================================
+# RÉPLICA DE LEITURA (opcional)
+# ===========================================================
+
+replica_engine = (
+    create_async_engine(settings.database_replica_url, **engine_options(settings))
+    if settings.database_replica_url
+    else None
+)
+
+ReplicaSessionFactory: async_sessionmaker[AsyncSession] | None = None
+if replica_engine is not None:
+    instrument_engine(replica_engine)
+    ReplicaSessionFactory = async_sessionmaker(
+        bind=replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
 # ===========================================================
 # DEPENDENCY INJECTION - Para uso com FastAPI
 # ===========================================================
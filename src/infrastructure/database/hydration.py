@@ -0,0 +1,190 @@
+# ===========================================================
+# src/infrastructure/database/hydration.py
+# ===========================================================
+# Caminho RÁPIDO de leitura: linha do banco -> entidade.
+#
+# CAMINHO ORM (o tradicional):
+#   select(CustomerModel) -> CustomerModel -> _to_entity -> Customer
+#   - Dois objetos por linha (modelo + entidade)
+#   - O modelo entra no identity map da sessão (mais controle)
+#   - Customer(...) roda as default_factory (new_id, datetime.now)
+#     e o __post_init__, só para sobrescrever tudo em seguida
+#
+# CAMINHO CORE (este módulo):
+#   select(CustomerModel.id, CustomerModel.phone_number, ...)
+#   -> tuplas -> Customer montado direto nos __slots__
+#   - Um objeto por linha, nada no identity map
+#   - Sem __init__: sem default_factory e sem validação
+#     (o dado já foi validado quando foi gravado)
+#
+# SLOTS:
+# As entidades são @dataclass(slots=True). Cada atributo é um
+# descritor da classe; guardamos o __set__ de cada um e
+# preenchemos o objeto vazio criado com object.__new__.
+#
+# Campos com init=False (ex: dirty tracking da Session) recebem
+# um valor novo da própria default_factory (um set() vazio) ou o
+# default simples (ex: False).
+#
+# STREAMING:
+# stream() lê por um cursor do servidor (yield_per), em lotes de
+# chunk_size linhas: a memória fica em um lote, não no resultado
+# inteiro (exportações, jobs sobre todos os clientes).
+# ===========================================================
+"""
+Hidratação de entidades a partir de linhas do SQLAlchemy Core.
+
+Uso:
+    _PRODUCT = RowHydrator(Product, ProductModel)
+
+    query = _PRODUCT.select().where(ProductModel.active == True)
+    products = _PRODUCT.all(await session.execute(query))
+
+    async for product in _PRODUCT.stream(session, query, chunk_size=1000):
+        ...
+"""
+
+import dataclasses
+import functools
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import Result, Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+E = TypeVar("E")
+
+
+class RowHydrator(Generic[E]):
+    """
+    Monta entidades (slots) direto das tuplas de um SELECT de colunas.
+
+    As colunas selecionadas são os campos do construtor da entidade,
+    na ordem em que foram declarados, lidos do modelo de mesmo nome.
+
+    Example:
+        >>> hydrator = RowHydrator(Customer, CustomerModel)
+        >>> result = await session.execute(
+        ...     hydrator.select().where(CustomerModel.id == id)
+        ... )
+        >>> customer = hydrator.one(result)
+    """
+
+    def __init__(
+        self,
+        entity_cls: type[E],
+        model: type,
+        converters: Mapping[str, Callable[[Any], Any]] | None = None,
+    ) -> None:
+        """
+        Prepara o hidratador (uma vez, no import do repositório).
+
+        Args:
+            entity_cls: Dataclass com slots=True
+            model: Modelo SQLAlchemy com colunas de mesmo nome
+            converters: Ajustes por campo (ex: None -> {})
+
+        Raises:
+            TypeError: Se a entidade não tiver __slots__
+        """
+        if "__slots__" not in vars(entity_cls):
+            raise TypeError(f"{entity_cls.__name__} precisa ser @dataclass(slots=True)")
+
+        converters = converters or {}
+        fields = dataclasses.fields(entity_cls)
+
+        self._entity_cls = entity_cls
+        self.columns = tuple(getattr(model, f.name) for f in fields if f.init)
+
+        # Descritor de slot de cada coluna, na ordem do SELECT
+        setters: list[Callable[[Any, Any], None]] = []
+        for f in fields:
+            if not f.init:
+                continue
+            setter = getattr(entity_cls, f.name).__set__
+            if f.name in converters:
+                setter = _converting(setter, converters[f.name])
+            setters.append(setter)
+        self._setters = tuple(setters)
+
+        # Campos fora do construtor: valor novo a cada entidade
+        fresh: list[tuple[Callable[[Any, Any], None], Callable[[], Any]]] = []
+        for f in fields:
+            if f.init:
+                continue
+            if f.default_factory is not dataclasses.MISSING:
+                factory = f.default_factory
+            elif f.default is not dataclasses.MISSING:
+                factory = functools.partial(_constant, f.default)
+            else:
+                continue
+            fresh.append((getattr(entity_cls, f.name).__set__, factory))
+        self._fresh = tuple(fresh)
+
+    def select(self) -> Select:
+        """SELECT das colunas da entidade (complete com where/order_by)."""
+        return select(*self.columns)
+
+    def __call__(self, row: Row | tuple) -> E:
+        """Monta uma entidade a partir de uma linha."""
+        entity = object.__new__(self._entity_cls)
+        for set_value, value in zip(self._setters, row):
+            set_value(entity, value)
+        for set_value, factory in self._fresh:
+            set_value(entity, factory())
+        return entity
+
+    def one(self, result: Result) -> E | None:
+        """Primeira linha do resultado como entidade (ou None)."""
+        row = result.first()
+        return None if row is None else self(row)
+
+    def all(self, result: Result | Iterable[Row]) -> list[E]:
+        """Todas as linhas do resultado como entidades."""
+        return list(map(self, result))
+
+    async def stream(
+        self,
+        session: AsyncSession,
+        query: Select,
+        chunk_size: int,
+    ) -> AsyncIterator[E]:
+        """
+        Entidades lidas por cursor do servidor, chunk_size linhas por vez.
+
+        O cursor fica aberto (na transação da sessão) até o fim da
+        iteração; sair antes (break) fecha o cursor.
+
+        Raises:
+            ValueError: Se chunk_size não for positivo
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size deve ser maior que zero")
+
+        result = await session.stream(
+            query, execution_options={"yield_per": chunk_size}
+        )
+        try:
+            async for rows in result.partitions():
+                for row in rows:
+                    yield self(row)
+        finally:
+            await result.close()
+
+
+def _constant(value: Any) -> Any:
+    """Devolve o default simples de um campo (init=False)."""
+    return value
+
+
+def _converting(
+    setter: Callable[[Any, Any], None],
+    convert: Callable[[Any], Any],
+) -> Callable[[Any, Any], None]:
+    """Envolve o setter para converter o valor antes de atribuir."""
+
+    def set_converted(entity: Any, value: Any) -> None:
+        setter(entity, convert(value))
+
+    return set_converted
@@ -33,21 +33,47 @@ from decimal import Decimal
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
+    Computed,
+    DDL,
     DateTime,
     Enum as SQLEnum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
+    Sequence,
     String,
     Text,
-    JSON,
+    Uuid,
+    event,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from src.domain.services.order_number import (
+    ORDER_NUMBER_PREFIX,
+    ORDER_NUMBER_START,
+)
 from src.shared.types.enums import OrderStatus, SessionState
 
 
+# ===========================================================
+# CHAVES PRIMÁRIAS
+# ===========================================================
+# Coluna UUID nativa (16 bytes), em vez de VARCHAR(36).
+# as_uuid=False: o Python continua vendo str (as entidades usam
+# str como ID); a conversão texto <-> UUID fica com o driver.
+# Os valores novos são UUIDv7, ordenados por tempo (new_id).
+# ===========================================================
+
+def _uuid_pk() -> Uuid:
+    """Tipo das chaves primárias (UUID nativo, lido como str)."""
+    return Uuid(as_uuid=False)
+
+
 # ===========================================================
 # CLASSE BASE - Todas as outras herdam dela
 # ===========================================================
@@ -96,7 +122,7 @@ class CustomerModel(Base):
     # mapped_column(...): Configura a coluna SQL
     
     id: Mapped[str] = mapped_column(
-        String(36),  # UUID tem 36 caracteres
+        _uuid_pk(),  # UUID nativo: 16 bytes em vez de 36 caracteres
         primary_key=True,
     )
     
@@ -133,14 +159,60 @@ class CustomerModel(Base):
     orders: Mapped[list["OrderModel"]] = relationship(
         back_populates="customer",
         cascade="all, delete-orphan",  # Deleta orders quando customer é deletado
+        passive_deletes=True,  # ...mas deixa o banco fazer (ON DELETE CASCADE)
     )
     
     sessions: Mapped[list["SessionModel"]] = relationship(
         back_populates="customer",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
+# ===========================================================
+# BUSCA TEXTUAL DE PRODUTOS (full-text search)
+# ===========================================================
+# Configuração própria do PostgreSQL: cópia da "portuguese"
+# (stemming: "camisetas" e "camiseta" viram "camiset").
+# Se a extensão unaccent existir, as palavras também perdem os
+# acentos ("algodão" == "algodao"); sem ela, a busca funciona,
+# só que sensível a acentos.
+#
+# O texto é indexado na coluna gerada products.search_vector
+# (nome com peso A, descrição com peso B) com índice GIN.
+# A migração 006 cria o mesmo; o DDL abaixo cobre o create_all.
+# ===========================================================
+
+PRODUCT_SEARCH_CONFIG = "chatbot_pt"
+
+# Só cria se não existir (create_all pode rodar mais de uma vez)
+_CREATE_SEARCH_CONFIG = DDL(f"""
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_ts_config WHERE cfgname = '{PRODUCT_SEARCH_CONFIG}'
+    ) THEN
+        CREATE TEXT SEARCH CONFIGURATION {PRODUCT_SEARCH_CONFIG} (COPY = portuguese);
+        IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'unaccent') THEN
+            CREATE EXTENSION IF NOT EXISTS unaccent;
+            ALTER TEXT SEARCH CONFIGURATION {PRODUCT_SEARCH_CONFIG}
+                ALTER MAPPING FOR hword, hword_part, word
+                WITH unaccent, portuguese_stem;
+        ELSE
+            RAISE WARNING 'unaccent indisponível: busca de produtos sensível a acentos';
+        END IF;
+    END IF;
+END
+$$
+""")
+
+# Texto indexado: nome pesa mais que a descrição no ranking
+_PRODUCT_SEARCH_VECTOR = (
+    f"setweight(to_tsvector('{PRODUCT_SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+    f"setweight(to_tsvector('{PRODUCT_SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
+
 # ===========================================================
 # ProductModel - Tabela 'products'
 # ===========================================================
@@ -158,12 +230,14 @@ class ProductModel(Base):
         category: Categoria do produto (indexado)
         stock: Quantidade em estoque
         active: Se está ativo para venda
+        search_vector: Texto de busca (gerado pelo banco)
+        sku: Código do produto no sistema de origem (importação)
     """
     
     __tablename__ = "products"
     
     id: Mapped[str] = mapped_column(
-        String(36),
+        _uuid_pk(),
         primary_key=True,
     )
     
@@ -191,8 +265,7 @@ class ProductModel(Base):
     
     category: Mapped[str] = mapped_column(
         String(100),
-        index=True,  # Indexado para busca por categoria
-        nullable=False,
+        nullable=False,  # Indexada com o nome (ver ÍNDICES, no fim)
     )
     
     stock: Mapped[int] = mapped_column(
@@ -215,18 +288,83 @@ class ProductModel(Base):
         default=datetime.now,
         onupdate=datetime.now,
     )
+    
+    # Coluna GERADA pelo banco a partir de name/description
+    # (nunca é escrita pelo Python). deferred: não vem nos SELECTs
+    # do ORM; só é usada no WHERE/ORDER BY da busca.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(_PRODUCT_SEARCH_VECTOR, persisted=True),
+        deferred=True,
+    )
+    
+    # Chave do produto no catálogo externo (ERP, planilha).
+    # A importação em lote (catalog_import.py) casa as linhas por
+    # ela; produtos criados à mão ficam sem SKU e fora da importação
+    sku: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        unique=True,
+        index=True,
+    )
+
+
+# A configuração de busca precisa existir antes da tabela
+event.listen(
+    ProductModel.__table__,
+    "before_create",
+    _CREATE_SEARCH_CONFIG.execute_if(dialect="postgresql"),
+)
+
+
+# ===========================================================
+# CatalogVersionModel - Tabela 'catalog_version'
+# ===========================================================
+
+class CatalogVersionModel(Base):
+    """
+    Contador de versão do catálogo (uma linha, id = 1).
+
+    Avançado por triggers em products (migração 010) na mesma
+    transação de qualquer mudança de catálogo; nunca escrito
+    pelo Python.
+
+    Attributes:
+        id: Sempre 1
+        version: Contador (só cresce)
+    """
+
+    __tablename__ = "catalog_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default="0",
+    )
 
 
 # ===========================================================
 # OrderModel - Tabela 'orders'
 # ===========================================================
 
+# Sequência que gera os números amigáveis dos pedidos.
+# Associada ao metadata para ser criada junto com as tabelas.
+ORDER_NUMBER_SEQUENCE = Sequence(
+    "order_number_seq",
+    start=ORDER_NUMBER_START,
+    metadata=Base.metadata,
+)
+
+
 class OrderModel(Base):
     """
     Modelo de pedido no banco de dados.
     
     Attributes:
         id: Identificador único do pedido
+        number: Número amigável (ex: "PED-123456"), único e indexado
         customer_id: FK para cliente
         status: Status atual do pedido (enum)
         total: Valor total do pedido
@@ -235,14 +373,29 @@ class OrderModel(Base):
     
     __tablename__ = "orders"
     
+    # eager_defaults: busca valores gerados pelo banco (number)
+    # no próprio INSERT, via RETURNING - sem SELECT extra
+    __mapper_args__ = {"eager_defaults": True}
+    
     id: Mapped[str] = mapped_column(
-        String(36),
+        _uuid_pk(),
         primary_key=True,
     )
     
+    # Gerado pelo banco: 'PED-' || nextval('order_number_seq')
+    number: Mapped[str] = mapped_column(
+        String(20),
+        unique=True,  # Número é único
+        index=True,   # Índice único: ix_orders_number
+        nullable=False,
+        server_default=text(
+            f"'{ORDER_NUMBER_PREFIX}-' || nextval('{ORDER_NUMBER_SEQUENCE.name}')"
+        ),
+    )
+    
     # ForeignKey: Chave estrangeira para customers.id
     customer_id: Mapped[str] = mapped_column(
-        ForeignKey("customers.id"),
+        ForeignKey("customers.id", ondelete="CASCADE"),
         nullable=False,
     )
     
@@ -292,19 +445,20 @@ class SessionModel(Base):
         id: Identificador único
         customer_id: FK para cliente
         state: Estado atual da conversa (enum)
-        context: Dados de contexto (JSON)
+        context: Dados de contexto (JSONB)
         expires_at: Quando a sessão expira
+        active: Se é a sessão atual do cliente
     """
     
     __tablename__ = "sessions"
     
     id: Mapped[str] = mapped_column(
-        String(36),
+        _uuid_pk(),
         primary_key=True,
     )
     
     customer_id: Mapped[str] = mapped_column(
-        ForeignKey("customers.id"),
+        ForeignKey("customers.id", ondelete="CASCADE"),
         nullable=False,
     )
     
@@ -317,9 +471,13 @@ class SessionModel(Base):
         default=SessionState.INITIAL,
     )
     
-    # JSON: Armazena dicionário Python como JSON no banco
+    # JSONB: dicionário Python em JSON binário no banco. Ao contrário
+    # do JSON (texto), aceita os operadores || e - : o update aplica
+    # só as chaves alteradas, sem regravar o contexto inteiro.
+    # none_as_null: None vira NULL do SQL (e não o JSON 'null', que
+    # o COALESCE do delta não trocaria por um objeto vazio).
     context: Mapped[Optional[dict]] = mapped_column(
-        JSON,
+        JSONB(none_as_null=True),
         nullable=True,
     )
     
@@ -334,12 +492,81 @@ class SessionModel(Base):
         onupdate=datetime.now,
     )
     
+    # Indexado: a limpeza de expiradas filtra por esta coluna
     expires_at: Mapped[datetime] = mapped_column(
         DateTime,
         nullable=False,
+        index=True,
+    )
+    
+    # Sessão atual do cliente (só do banco; a entidade não tem).
+    # Criar outra sessão desliga a anterior. O índice único parcial
+    # ix_sessions_customer_id_active garante no máximo UMA ligada
+    # por cliente, mesmo com mensagens simultâneas.
+    active: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=True,
+        server_default=text("true"),
     )
     
     # Relacionamento N:1 com Customer
     customer: Mapped["CustomerModel"] = relationship(
         back_populates="sessions",
     )
+
+
+# ===========================================================
+# ÍNDICES COMPOSTOS - um para cada padrão de consulta
+# ===========================================================
+# Declarados aqui (e não com index=True) porque combinam
+# colunas, ordem DESC e condição parcial. A migração 005 cria
+# os mesmos índices no banco; ver lá qual consulta usa cada um.
+# ===========================================================
+
+# Sessão ativa do cliente: customer_id = ? ORDER BY created_at DESC
+Index(
+    "ix_sessions_customer_id_created_at",
+    SessionModel.customer_id,
+    SessionModel.created_at.desc(),
+)
+
+# No máximo uma sessão ligada por cliente (alvo do ON CONFLICT
+# de SQLAlchemySessionRepository.get_or_create)
+Index(
+    "ix_sessions_customer_id_active",
+    SessionModel.customer_id,
+    unique=True,
+    postgresql_where=text("active"),
+    sqlite_where=text("active"),
+)
+
+# Pedidos do cliente (mais recentes primeiro, com LIMIT)
+Index(
+    "ix_orders_customer_id_created_at",
+    OrderModel.customer_id,
+    OrderModel.created_at.desc(),
+)
+
+# Pedidos por status (mais recentes primeiro)
+Index(
+    "ix_orders_status_created_at",
+    OrderModel.status,
+    OrderModel.created_at.desc(),
+)
+
+# Catálogo: só produtos ativos, em ordem de categoria e nome
+Index(
+    "ix_products_active_category_name",
+    ProductModel.category,
+    ProductModel.name,
+    postgresql_where=text("active"),
+)
+
+# Busca textual: search_vector @@ websearch_to_tsquery(...)
+# (GIN só existe no PostgreSQL)
+Index(
+    "ix_products_search_vector",
+    ProductModel.search_vector,
+    postgresql_using="gin",
+).ddl_if(dialect="postgresql")
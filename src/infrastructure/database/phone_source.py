@@ -0,0 +1,80 @@
+# ===========================================================
+# src/infrastructure/database/phone_source.py
+# ===========================================================
+# Origem dos telefones cadastrados (cache/customer_identity.py).
+#
+# Cada chamada abre uma sessão PRÓPRIA do banco: a carga inicial
+# e a sincronização rodam numa tarefa de fundo, fora do ciclo
+# de qualquer request.
+#
+# STREAMING:
+# A carga inicial lê a tabela inteira por cursor do servidor,
+# em lotes de CHUNK_SIZE: só os telefones entram no filtro de
+# Bloom, nada fica acumulado na memória.
+#
+# FAIXA DE ID:
+# IDs são UUIDv7 (ordenados pelo instante de criação). "Clientes
+# criados desde X" é uma faixa da chave primária:
+#   WHERE id >= :since AND id < :until
+# O limite de cima deixa de fora IDs antigos em uuid4 (aleatórios,
+# quase todos "maiores" que qualquer UUIDv7 de hoje).
+# ===========================================================
+"""
+Telefones dos clientes, lidos do PostgreSQL.
+
+Uso:
+    source = SQLAlchemyPhoneSource(AsyncSessionFactory)
+    identity = CustomerIdentityMap(source)
+"""
+
+from collections.abc import AsyncIterator
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.models import CustomerModel
+
+
+# Linhas buscadas do banco por vez
+CHUNK_SIZE = 10_000
+
+
+class SQLAlchemyPhoneSource:
+    """Telefones cadastrados, lidos em sessões próprias."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """
+        Args:
+            session_factory: Cria uma sessão do banco por chamada
+        """
+        self._session_factory = session_factory
+
+    async def count(self) -> int:
+        """Quantidade de clientes (dimensiona o filtro)."""
+        async with self._session_factory() as db:
+            return await db.scalar(select(func.count()).select_from(CustomerModel))
+
+    async def phones(
+        self,
+        since_id: str | None = None,
+        until_id: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Telefones dos clientes, opcionalmente de uma faixa de ID.
+
+        Args:
+            since_id: Só IDs >= since_id (None = desde o início)
+            until_id: Só IDs < until_id (None = até o fim)
+        """
+        query = select(CustomerModel.phone_number)
+        if since_id is not None:
+            query = query.where(CustomerModel.id >= since_id)
+        if until_id is not None:
+            query = query.where(CustomerModel.id < until_id)
+
+        async with self._session_factory() as db:
+            result = await db.stream_scalars(
+                query, execution_options={"yield_per": CHUNK_SIZE}
+            )
+            async for phone in result:
+                yield phone
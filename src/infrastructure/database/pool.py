@@ -0,0 +1,136 @@
+# ===========================================================
+# src/infrastructure/database/pool.py
+# ===========================================================
+# Pool de conexões da engine, com métricas.
+#
+# POR QUE?
+# Sob carga, "a mensagem demorou no banco" pode ser duas coisas:
+# - a query foi lenta (db_ms em query_stats.py)
+# - a mensagem ESPEROU uma conexão livre no pool
+# Sem medir a espera, as duas parecem iguais e a correção
+# (índice vs pool_size/max_overflow) vira chute.
+#
+# COMO FUNCIONA:
+# MonitoredQueuePool é o pool padrão da engine assíncrona com
+# connect() cronometrado:
+# 1. Cada checkout soma o tempo até a conexão chegar (fila do
+#    pool + abertura de conexão nova + pre-ping, se ligado)
+# 2. Checkouts que estouram pool_timeout contam como timeouts
+# 3. A espera também vai para o StatementUsage da mensagem atual
+#    (pool_wait_ms), ao lado do tempo de banco
+#
+# metrics() junta os contadores com o estado atual do pool:
+# conexões em uso, extras (overflow) e paradas no pool.
+#
+# DISPOSE:
+# engine.dispose() troca o pool por um novo (recreate()); os
+# contadores passam para o novo pool e não zeram.
+# ===========================================================
+"""
+Pool de conexões com métricas de checkout.
+
+Uso:
+    engine = create_async_engine(url, poolclass=MonitoredQueuePool)
+    engine.pool.metrics()
+    # {"checkouts": 120, "timeouts": 0, "wait_ms": 35.2, ..., "in_use": 2}
+"""
+
+import time
+from dataclasses import asdict, dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from src.infrastructure.database.query_stats import record_pool_wait
+
+
+@dataclass
+class PoolStats:
+    """
+    Contadores de checkout do pool.
+
+    Attributes:
+        checkouts: Conexões entregues
+        timeouts: Checkouts que desistiram (pool_timeout)
+        wait_ms: Espera total por conexão
+        max_wait_ms: Maior espera num checkout
+    """
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        """Espera média por checkout (0.0 sem checkouts)."""
+        return self.wait_ms / self.checkouts if self.checkouts else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Retorna os contadores (e a média) para logs."""
+        return {
+            **asdict(self),
+            "wait_ms": round(self.wait_ms, 2),
+            "max_wait_ms": round(self.max_wait_ms, 2),
+            "avg_wait_ms": round(self.avg_wait_ms, 2),
+        }
+
+
+class MonitoredQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool que mede a espera por conexão.
+
+    Attributes:
+        stats: Contadores de checkout (sobrevivem ao dispose())
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self) -> PoolProxiedConnection:
+        """Entrega uma conexão, somando a espera nas métricas."""
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            self._record_wait(started)
+            raise
+
+        self.stats.checkouts += 1
+        self._record_wait(started)
+        return connection
+
+    def recreate(self) -> "MonitoredQueuePool":
+        """Pool novo (engine.dispose()) com os mesmos contadores."""
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def metrics(self) -> dict[str, float]:
+        """
+        Contadores + estado atual do pool.
+
+        Returns:
+            dict com os campos de PoolStats e:
+            - size: pool_size configurado
+            - in_use: conexões emprestadas agora
+            - overflow: conexões extras abertas agora (além de size)
+            - idle: conexões paradas no pool
+        """
+        return {
+            **self.stats.as_dict(),
+            "size": self.size(),
+            "in_use": self.checkedout(),
+            # _overflow começa negativo (conexões que ainda cabem em size)
+            "overflow": max(self.overflow(), 0),
+            "idle": self.checkedin(),
+        }
+
+    def _record_wait(self, started: float) -> None:
+        """Soma a espera de um checkout (pool e mensagem atual)."""
+        wait_ms = (time.perf_counter() - started) * 1000
+        self.stats.wait_ms += wait_ms
+        self.stats.max_wait_ms = max(self.stats.max_wait_ms, wait_ms)
+        record_pool_wait(wait_ms)
@@ -0,0 +1,218 @@
+# ===========================================================
+# src/infrastructure/database/query_stats.py
+# ===========================================================
+# Quantos comandos SQL cada mensagem custa.
+#
+# POR QUE?
+# Um turno do chatbot passa por vários repositórios (cliente,
+# sessão, produtos, pedidos). Sem medir, um SELECT a mais num
+# caminho novo (ou um "SELECT antes do UPDATE" do ORM) só aparece
+# como latência no banco, sem dizer de qual mensagem veio.
+#
+# COMO FUNCIONA:
+# 1. process_message abre track_statements(): um StatementUsage
+#    novo vira o valor de uma ContextVar
+# 2. Eventos da engine (before/after_cursor_execute) somam
+#    comandos, linhas e tempo no StatementUsage da mensagem atual
+#    (ContextVar: cada tarefa asyncio vê só a sua mensagem)
+# 3. Ao final, o uso vai para o log e para QueryStats (métricas
+#    do processo, como as dos caches)
+#
+# Fora de track_statements() (startup, tarefas de fundo) os
+# eventos não fazem nada além de ler a ContextVar.
+# BEGIN/COMMIT/ROLLBACK não passam pelo cursor e não contam.
+#
+# LINHAS:
+# cursor.rowcount: linhas devolvidas (SELECT) ou afetadas
+# (INSERT/UPDATE/DELETE). Cursores do servidor (stream/yield_per)
+# não sabem o total na execução e não somam linhas.
+#
+# ESPERA POR CONEXÃO:
+# O pool (pool.py) chama record_pool_wait() a cada checkout:
+# pool_wait_ms separa "esperou conexão" de "query lenta".
+#
+# ORÇAMENTO NOS TESTES:
+# A fixture statement_budget (tests/conftest.py) usa o mesmo
+# track_statements() e falha se um caminho passar do limite.
+# ===========================================================
+"""
+Contagem de comandos SQL, linhas e tempo de banco por mensagem.
+
+Uso:
+    instrument_engine(engine)  # uma vez, na criação da engine
+
+    with track_statements() as usage:
+        await handler.handle(message)
+    logger.info(usage.as_dict())
+    # {"statements": 3, "rows": 2, "db_ms": 1.8, "pool_wait_ms": 0.1}
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass
+class StatementUsage:
+    """
+    Uso do banco por UMA mensagem.
+
+    Attributes:
+        statements: Comandos enviados ao banco
+        rows: Linhas devolvidas ou afetadas
+        db_ms: Tempo dentro do driver (envio + resposta)
+        pool_wait_ms: Tempo esperando conexão do pool
+    """
+
+    statements: int = 0
+    rows: int = 0
+    db_ms: float = 0.0
+    pool_wait_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Retorna o uso para logs."""
+        return {
+            **asdict(self),
+            "db_ms": round(self.db_ms, 2),
+            "pool_wait_ms": round(self.pool_wait_ms, 2),
+        }
+
+
+@dataclass
+class QueryStats:
+    """
+    Métricas do processo: soma do uso de todas as mensagens.
+
+    Attributes:
+        messages: Mensagens medidas
+        statements: Comandos no total
+        rows: Linhas no total
+        db_ms: Tempo de banco no total
+        pool_wait_ms: Espera por conexão no total
+        max_statements: Maior quantidade de comandos numa mensagem
+    """
+
+    messages: int = 0
+    statements: int = 0
+    rows: int = 0
+    db_ms: float = 0.0
+    pool_wait_ms: float = 0.0
+    max_statements: int = 0
+
+    @property
+    def avg_statements(self) -> float:
+        """Comandos por mensagem (0.0 sem mensagens)."""
+        return self.statements / self.messages if self.messages else 0.0
+
+    def record(self, usage: StatementUsage) -> None:
+        """Soma o uso de uma mensagem."""
+        self.messages += 1
+        self.statements += usage.statements
+        self.rows += usage.rows
+        self.db_ms += usage.db_ms
+        self.pool_wait_ms += usage.pool_wait_ms
+        self.max_statements = max(self.max_statements, usage.statements)
+
+    def as_dict(self) -> dict[str, float]:
+        """Retorna as métricas (e a média) para logs."""
+        return {
+            **asdict(self),
+            "db_ms": round(self.db_ms, 2),
+            "pool_wait_ms": round(self.pool_wait_ms, 2),
+            "avg_statements": round(self.avg_statements, 2),
+        }
+
+
+# Uso da mensagem atual (None = nada sendo medido)
+_current_usage: ContextVar[StatementUsage | None] = ContextVar(
+    "current_statement_usage", default=None
+)
+
+
+@contextmanager
+def track_statements() -> Iterator[StatementUsage]:
+    """
+    Mede os comandos SQL executados dentro do bloco.
+
+    Blocos aninhados: o de dentro mede só a sua parte (o de fora
+    não soma o que o de dentro mediu).
+    """
+    usage = StatementUsage()
+    token = _current_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _current_usage.reset(token)
+
+
+def instrument_engine(engine: Engine | AsyncEngine) -> None:
+    """
+    Liga a contagem na engine (idempotente).
+
+    Args:
+        engine: Engine síncrona ou assíncrona
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def record_pool_wait(wait_ms: float) -> None:
+    """
+    Soma uma espera por conexão na mensagem atual (se houver).
+
+    Args:
+        wait_ms: Tempo do checkout no pool
+    """
+    usage = _current_usage.get()
+    if usage is not None:
+        usage.pool_wait_ms += wait_ms
+
+
+# ===========================================================
+# EVENTOS DA ENGINE
+# ===========================================================
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Marca o início do comando (só se há mensagem sendo medida)."""
+    if _current_usage.get() is not None:
+        conn.info["statement_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Soma o comando no uso da mensagem atual."""
+    usage = _current_usage.get()
+    if usage is None:
+        return
+
+    started = conn.info.pop("statement_started", None)
+    if started is not None:
+        usage.db_ms += (time.perf_counter() - started) * 1000
+
+    usage.statements += 1
+    if cursor.rowcount > 0:
+        usage.rows += cursor.rowcount
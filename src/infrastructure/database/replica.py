@@ -0,0 +1,284 @@
+# ===========================================================
+# src/infrastructure/database/replica.py
+# ===========================================================
+# Leituras na RÉPLICA (read replica), escritas no primário.
+#
+# POR QUE?
+# Navegar no catálogo, consultar pedidos e contar sessões são
+# leituras puras, mas dividiam a engine (e o pool) do primário
+# com as escritas de sessão. Com DATABASE_REPLICA_URL, essas
+# leituras vão para uma engine própria, com pool próprio.
+#
+# COMO FUNCIONA:
+# Os repositórios SQL mandam as leituras por execute_read():
+# 1. Sem réplica configurada: sessão do turno (primário), como antes
+# 2. Turno que já ESCREVEU no primário: primário (ver abaixo)
+# 3. Réplica atrasada ou fora do ar: primário
+# 4. Senão: uma sessão curta na réplica (resultado já bufferizado,
+#    a conexão volta para o pool no fim da leitura)
+#
+# LER O QUE ESCREVEU (read-your-writes):
+# A réplica recebe as escritas com atraso. Depois do primeiro
+# INSERT/UPDATE/DELETE (ou flush) da sessão do turno, todas as
+# leituras dessa sessão vão para o primário, que já tem (ou tem
+# na transação aberta) o que foi escrito. Conservador de propósito:
+# qualquer escrita prende o turno, não só a da mesma tabela.
+# Entre turnos, o limite é max_lag_seconds.
+#
+# ATRASO E FALHAS:
+# - O atraso da réplica é medido no máximo a cada check_seconds
+#   (PostgreSQL: pg_last_xact_replay_timestamp; outros bancos,
+#   como SQLite nos testes, não têm replicação: atraso zero)
+# - Acima de max_lag_seconds, as leituras vão para o primário
+# - Erro de conexão/consulta na réplica: a leitura é refeita no
+#   primário e a réplica fica de fora até a próxima medição
+#
+# FORA DA RÉPLICA:
+# Cursores do servidor (iter_*), SELECT ... FOR UPDATE e leituras
+# usadas para decidir escritas (get_or_create, catalog_version).
+# ===========================================================
+"""
+Roteamento de leituras para a réplica, com volta ao primário.
+
+Uso:
+    router = ReadReplicaRouter(ReplicaSessionFactory, max_lag_seconds=5)
+    repo = SQLAlchemyOrderRepository(session, replica=router)
+
+    # dentro do repositório:
+    result = await execute_read(self._session, query, self._replica)
+"""
+
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy import Executable, Result, event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
+
+
+logger = logging.getLogger(__name__)
+
+# Marca, em session.info, que a sessão do turno já escreveu
+_WROTE = "replica_pinned"
+
+# Atraso da réplica em segundos (0 no primário ou em dia)
+_PG_LAG = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+@dataclass
+class ReplicaStats:
+    """
+    Para onde foram as leituras.
+
+    Attributes:
+        replica_reads: Leituras feitas na réplica
+        pinned_reads: No primário (turno já tinha escrito)
+        lag_fallbacks: No primário (réplica atrasada)
+        error_fallbacks: No primário (réplica com erro ou fora do ar)
+        lag_checks: Medições de atraso
+        last_lag_seconds: Último atraso medido
+    """
+
+    replica_reads: int = 0
+    pinned_reads: int = 0
+    lag_fallbacks: int = 0
+    error_fallbacks: int = 0
+    lag_checks: int = 0
+    last_lag_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Retorna as métricas para logs."""
+        return {**asdict(self), "last_lag_seconds": round(self.last_lag_seconds, 3)}
+
+
+class ReadReplicaRouter:
+    """
+    Decide, leitura a leitura, entre réplica e primário.
+
+    Uma instância por processo (a réplica e as medições de atraso
+    são compartilhadas por todos os turnos).
+
+    Attributes:
+        stats: Métricas (ver ReplicaStats)
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_lag_seconds: float = 5.0,
+        check_seconds: float = 1.0,
+    ) -> None:
+        """
+        Inicializa o roteador.
+
+        Args:
+            session_factory: Cria sessões na réplica (engine própria)
+            max_lag_seconds: Atraso máximo aceito na réplica
+            check_seconds: Intervalo mínimo entre medições de atraso
+        """
+        if max_lag_seconds < 0:
+            raise ValueError("max_lag_seconds não pode ser negativo")
+
+        self._session_factory = session_factory
+        self._max_lag = max_lag_seconds
+        self._check_seconds = check_seconds
+
+        # Resultado da última medição (None = nunca medido)
+        self._checked_at: float | None = None
+        self._lagging = False
+        self._down = False
+
+        self.stats = ReplicaStats()
+        track_writes()
+
+    async def execute(
+        self,
+        primary: AsyncSession,
+        query: Executable,
+        params: Mapping[str, Any] | None = None,
+    ) -> Result[Any]:
+        """
+        Executa uma leitura na réplica ou, se preciso, no primário.
+
+        Args:
+            primary: Sessão do turno (primário)
+            query: SELECT a executar
+            params: Valores dos bindparam da consulta
+
+        Returns:
+            Result bufferizado (pode ser lido depois da sessão fechar)
+        """
+        if is_pinned(primary):
+            self.stats.pinned_reads += 1
+            return await primary.execute(query, params)
+
+        await self._check_lag()
+        if self._down:
+            self.stats.error_fallbacks += 1
+            return await primary.execute(query, params)
+        if self._lagging:
+            self.stats.lag_fallbacks += 1
+            return await primary.execute(query, params)
+
+        try:
+            async with self._session_factory() as replica:
+                result = await replica.execute(query, params)
+        except (SQLAlchemyError, OSError) as e:
+            logger.warning(f"⚠️ Réplica falhou, lendo do primário: {e}")
+            self._mark_down()
+            self.stats.error_fallbacks += 1
+            return await primary.execute(query, params)
+
+        self.stats.replica_reads += 1
+        return result
+
+    async def _check_lag(self) -> None:
+        """Mede o atraso da réplica (no máximo a cada check_seconds)."""
+        now = time.monotonic()
+        last = self._checked_at
+        if last is not None and now - last < self._check_seconds:
+            return
+        self._checked_at = now
+        self.stats.lag_checks += 1
+
+        try:
+            async with self._session_factory() as replica:
+                lag = await self._lag_seconds(replica)
+        except (SQLAlchemyError, OSError) as e:
+            logger.warning(f"⚠️ Réplica fora do ar: {e}")
+            self._down = True
+            return
+
+        self._down = False
+        self._lagging = lag > self._max_lag
+        self.stats.last_lag_seconds = lag
+        if self._lagging:
+            logger.warning(f"⚠️ Réplica atrasada {lag:.1f}s, lendo do primário")
+
+    async def _lag_seconds(self, replica: AsyncSession) -> float:
+        """Atraso atual da réplica em segundos."""
+        if replica.bind.dialect.name != "postgresql":
+            return 0.0  # sem replicação para medir (ex: SQLite nos testes)
+        return float(await replica.scalar(_PG_LAG))
+
+    def _mark_down(self) -> None:
+        """Tira a réplica do ar até a próxima medição."""
+        self._down = True
+        self._checked_at = time.monotonic()
+
+
+async def execute_read(
+    session: AsyncSession,
+    query: Executable,
+    replica: ReadReplicaRouter | None = None,
+    params: Mapping[str, Any] | None = None,
+) -> Result[Any]:
+    """
+    Executa uma leitura pura (candidata à réplica).
+
+    Args:
+        session: Sessão do turno (primário)
+        query: SELECT a executar
+        replica: Roteador (None = sempre a sessão do turno)
+        params: Valores dos bindparam da consulta
+
+    Returns:
+        Result da consulta
+    """
+    if replica is None:
+        return await session.execute(query, params)
+    return await replica.execute(session, query, params)
+
+
+# ===========================================================
+# LER O QUE ESCREVEU (sessão do turno presa ao primário)
+# ===========================================================
+
+def is_pinned(session: AsyncSession) -> bool:
+    """
+    True se a sessão já escreveu (ou tem escrita pendente de flush).
+
+    Pendências do ORM (add() sem flush) também contam: no primário
+    o autoflush as gravaria antes da leitura; na réplica, não.
+    """
+    return bool(
+        session.info.get(_WROTE)
+        or session.new
+        or session.dirty
+        or session.deleted
+    )
+
+
+def track_writes() -> None:
+    """Liga a marcação de escritas nas sessões (idempotente)."""
+    if event.contains(Session, "do_orm_execute", _on_execute):
+        return
+    event.listen(Session, "do_orm_execute", _on_execute)
+    event.listen(Session, "after_flush", _on_flush)
+
+
+def _on_execute(state: ORMExecuteState) -> None:
+    """
+    Qualquer comando que não seja SELECT prende a sessão ao primário.
+
+    text() conta como escrita (não dá para saber o que ele faz).
+    """
+    if not state.is_select:
+        state.session.info[_WROTE] = True
+
+
+def _on_flush(session: Session, flush_context: Any) -> None:
+    """Flush do ORM (INSERT/UPDATE/DELETE de objetos) prende a sessão."""
+    session.info[_WROTE] = True
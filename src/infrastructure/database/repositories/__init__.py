@@ -18,6 +18,11 @@ from src.infrastructure.database.repositories.sqlalchemy_order_repository import
 )
 from src.infrastructure.database.repositories.sqlalchemy_session_repository import (
     SQLAlchemySessionRepository,
+    SessionContextStats,
+)
+from src.infrastructure.database.repositories.write_behind_session_repository import (
+    SessionWriteBuffer,
+    WriteBehindSessionRepository,
 )
 
 __all__ = [
@@ -25,4 +30,7 @@ __all__ = [
     "SQLAlchemyProductRepository",
     "SQLAlchemyOrderRepository",
     "SQLAlchemySessionRepository",
+    "SessionContextStats",
+    "SessionWriteBuffer",
+    "WriteBehindSessionRepository",
 ]
@@ -25,12 +25,37 @@ Esta classe implementa ICustomerRepository usando
 SQLAlchemy para persistência no PostgreSQL.
 """
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.customer import Customer
 from src.domain.repositories.customer_repository import ICustomerRepository
+from src.infrastructure.database.hydration import RowHydrator
 from src.infrastructure.database.models import CustomerModel
+from src.shared.utils.ids import canonical_id
+from src.shared.utils.pagination import Page, check_limit, decode_cursor, page_of
+
+
+# Leituras: linhas do Core -> Customer (sem passar por CustomerModel)
+_CUSTOMER = RowHydrator(Customer, CustomerModel)
+
+# Consultas de todo turno, montadas UMA vez (valores via bindparam).
+# Montar select(...).where(...) a cada chamada custa a construção e
+# a chave de cache do SQLAlchemy; o objeto pronto guarda a chave
+# e vai direto ao SQL compilado (ver benchmarks/bench_prebuilt_statements.py)
+_FIND_BY_PHONE = _CUSTOMER.select().where(
+    CustomerModel.phone_number == bindparam("phone")
+)
+_FIND_ID_BY_PHONE = select(CustomerModel.id).where(
+    CustomerModel.phone_number == bindparam("phone")
+)
+
+# Tentativas de get_or_create (INSERT que não insere + cliente que
+# sumiu antes da leitura: só com remoções simultâneas)
+GET_OR_CREATE_ATTEMPTS = 3
 
 
 class SQLAlchemyCustomerRepository(ICustomerRepository):
@@ -77,21 +102,21 @@ class SQLAlchemyCustomerRepository(ICustomerRepository):
             >>> if customer:
             ...     print(f"Encontrado: {customer.name}")
         """
-        # select(Model): Cria query SELECT
-        # where(...): Adiciona condição WHERE
-        query = select(CustomerModel).where(CustomerModel.phone_number == phone)
-        
-        # execute(): Executa a query
-        # scalars(): Extrai objetos do resultado
-        # first(): Pega primeiro ou None
-        result = await self._session.execute(query)
-        model = result.scalars().first()
-        
-        if model is None:
-            return None
+        # _FIND_BY_PHONE: SELECT das colunas da entidade WHERE
+        # phone_number = :phone (montado uma vez, no import)
+        # execute(): Executa a query com o valor de :phone
+        # one(): Primeira linha -> Customer (ou None)
+        result = await self._session.execute(_FIND_BY_PHONE, {"phone": phone})
+        return _CUSTOMER.one(result)
+    
+    async def find_id_by_phone(self, phone: str) -> str | None:
+        """
+        Busca só o ID pelo telefone.
         
-        # Converte Model -> Entity
-        return self._to_entity(model)
+        SELECT id WHERE phone_number = :phone: o índice único do
+        telefone responde sem montar a entidade.
+        """
+        return await self._session.scalar(_FIND_ID_BY_PHONE, {"phone": phone})
     
     async def find_by_id(self, id: str) -> Customer | None:
         """
@@ -103,14 +128,9 @@ class SQLAlchemyCustomerRepository(ICustomerRepository):
         Returns:
             Customer se encontrado, None caso contrário
         """
-        query = select(CustomerModel).where(CustomerModel.id == id)
+        query = _CUSTOMER.select().where(CustomerModel.id == id)
         result = await self._session.execute(query)
-        model = result.scalars().first()
-        
-        if model is None:
-            return None
-        
-        return self._to_entity(model)
+        return _CUSTOMER.one(result)
     
     async def find_all(self) -> list[Customer]:
         """
@@ -119,11 +139,51 @@ class SQLAlchemyCustomerRepository(ICustomerRepository):
         Returns:
             Lista de todos os clientes cadastrados
         """
-        query = select(CustomerModel)
+        query = _CUSTOMER.select()
         result = await self._session.execute(query)
-        models = result.scalars().all()
+        return _CUSTOMER.all(result)
+    
+    async def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[Customer]:
+        """
+        Percorre todos os clientes, chunk_size por vez.
+        
+        Cursor do servidor: só um lote fica na memória. A
+        iteração segura a conexão da sessão até terminar.
+        
+        Args:
+            chunk_size: Linhas buscadas do banco por vez
+        """
+        query = _CUSTOMER.select()
+        async for customer in _CUSTOMER.stream(self._session, query, chunk_size):
+            yield customer
+    
+    async def find_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Customer]:
+        """
+        Uma página de clientes, em ordem de ID.
         
-        return [self._to_entity(model) for model in models]
+        IDs são UUIDv7 (ordenados por tempo): a ordem de ID é a
+        ordem de cadastro, e a chave primária serve de índice:
+        WHERE id > :ultimo ORDER BY id LIMIT :limit + 1
+        
+        Args:
+            cursor: next_cursor da página anterior (None = primeira)
+            limit: Tamanho da página
+            
+        Raises:
+            ValueError: Cursor inválido ou limit fora da faixa
+        """
+        check_limit(limit)
+        query = _CUSTOMER.select().order_by(CustomerModel.id).limit(limit + 1)
+        if cursor is not None:
+            [after_id] = decode_cursor(cursor, canonical_id)
+            query = query.where(CustomerModel.id > after_id)
+        
+        result = await self._session.execute(query)
+        return page_of(_CUSTOMER.all(result), limit, lambda c: (c.id,))
     
     # =========================================================
     # MÉTODOS DE PERSISTÊNCIA
@@ -147,6 +207,52 @@ class SQLAlchemyCustomerRepository(ICustomerRepository):
         # Útil para obter IDs gerados, etc.
         await self._session.flush()
     
+    async def get_or_create(self, customer: Customer) -> tuple[Customer, bool]:
+        """
+        Cria o cliente, ou devolve o já cadastrado com o telefone.
+        
+        INSERT ... ON CONFLICT (phone_number) DO NOTHING RETURNING id
+        
+        - Telefone novo: a linha é inserida e o id volta
+        - Telefone já cadastrado: nada é inserido e nada volta; o
+          cliente existente é lido em seguida
+        - Outra transação inserindo o mesmo telefone: o INSERT espera
+          ela terminar (sem IntegrityError e sem abortar a transação)
+        
+        Args:
+            customer: Cliente a criar
+            
+        Returns:
+            (cliente gravado, True se foi criado agora)
+            
+        Raises:
+            ValueError: Se o cliente sumir entre o INSERT e a leitura
+                em todas as tentativas
+        """
+        query = (
+            insert(CustomerModel)
+            .values(
+                id=customer.id,
+                phone_number=customer.phone_number,
+                name=customer.name,
+                email=customer.email,
+                created_at=customer.created_at,
+                updated_at=customer.updated_at,
+            )
+            .on_conflict_do_nothing(index_elements=[CustomerModel.phone_number])
+            .returning(CustomerModel.id)
+        )
+        
+        for _ in range(GET_OR_CREATE_ATTEMPTS):
+            if await self._session.scalar(query) is not None:
+                return customer, True
+            
+            existing = await self.find_by_phone(customer.phone_number)
+            if existing is not None:
+                return existing, False
+        
+        raise ValueError(f"Cliente não pôde ser criado: {customer.phone_number}")
+    
     async def update(self, customer: Customer) -> None:
         """
         Atualiza um cliente existente.
@@ -156,22 +262,28 @@ class SQLAlchemyCustomerRepository(ICustomerRepository):
             
         Raises:
             ValueError: Se cliente não existe no banco
+        
+        Note:
+            Um único comando: UPDATE ... WHERE id = :id RETURNING id.
+            Se nenhuma linha voltar, o cliente não existe.
         """
-        # Busca o modelo existente
-        query = select(CustomerModel).where(CustomerModel.id == customer.id)
+        query = (
+            update(CustomerModel)
+            .where(CustomerModel.id == customer.id)
+            .values(
+                phone_number=customer.phone_number,
+                name=customer.name,
+                email=customer.email,
+                updated_at=customer.updated_at,
+            )
+            .returning(CustomerModel.id)
+            # Não procura objetos carregados na sessão para sincronizar
+            .execution_options(synchronize_session=False)
+        )
         result = await self._session.execute(query)
-        model = result.scalars().first()
         
-        if model is None:
+        if result.first() is None:
             raise ValueError(f"Cliente não encontrado: {customer.id}")
-        
-        # Atualiza os campos
-        model.phone_number = customer.phone_number
-        model.name = customer.name
-        model.email = customer.email
-        model.updated_at = customer.updated_at
-        
-        await self._session.flush()
     
     async def delete(self, id: str) -> None:
         """
@@ -182,16 +294,21 @@ class SQLAlchemyCustomerRepository(ICustomerRepository):
             
         Raises:
             ValueError: Se cliente não existe
+        
+        Note:
+            Pedidos e sessões do cliente são removidos pelo banco
+            (ON DELETE CASCADE), sem carregá-los na memória.
         """
-        query = select(CustomerModel).where(CustomerModel.id == id)
+        query = (
+            delete(CustomerModel)
+            .where(CustomerModel.id == id)
+            .returning(CustomerModel.id)
+            .execution_options(synchronize_session=False)
+        )
         result = await self._session.execute(query)
-        model = result.scalars().first()
         
-        if model is None:
+        if result.first() is None:
             raise ValueError(f"Cliente não encontrado: {id}")
-        
-        await self._session.delete(model)
-        await self._session.flush()
     
     # =========================================================
     # CONVERSORES (Model <-> Entity)
@@ -206,6 +323,10 @@ class SQLAlchemyCustomerRepository(ICustomerRepository):
             
         Returns:
             Entidade de domínio Customer
+        
+        Note:
+            As buscas não passam por aqui: leem tuplas do Core e
+            montam a entidade com _CUSTOMER (ver hydration.py).
         """
         return Customer(
             id=model.id,
@@ -8,15 +8,33 @@ Implementação do repositório de pedidos com SQLAlchemy.
 
 Esta classe implementa IOrderRepository usando
 SQLAlchemy para persistência no PostgreSQL.
+
+As consultas de pedidos (buscas, páginas e contagem) podem ir
+para a réplica de leitura (ver replica.py); os cursores do
+servidor (iter_*) e as escritas ficam no primário.
 """
 
-from sqlalchemy import select, func
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from sqlalchemy import Select, bindparam, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.order import Order
 from src.domain.repositories.order_repository import IOrderRepository
+from src.infrastructure.database.hydration import RowHydrator
 from src.infrastructure.database.models import OrderModel
+from src.infrastructure.database.replica import ReadReplicaRouter, execute_read
 from src.shared.types.enums import OrderStatus
+from src.shared.utils.ids import canonical_id
+from src.shared.utils.pagination import Page, check_limit, decode_cursor, page_of
+
+
+# Leituras: linhas do Core -> Order (sem passar por OrderModel)
+_ORDER = RowHydrator(Order, OrderModel)
+
+# Busca por ID (rastreio, pedido recém-criado): montada uma vez
+_FIND_BY_ID = _ORDER.select().where(OrderModel.id == bindparam("id"))
 
 
 class SQLAlchemyOrderRepository(IOrderRepository):
@@ -27,9 +45,20 @@ class SQLAlchemyOrderRepository(IOrderRepository):
     persistência real no PostgreSQL.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Inicializa o repositório com uma sessão do banco."""
+    def __init__(
+        self,
+        session: AsyncSession,
+        replica: ReadReplicaRouter | None = None,
+    ) -> None:
+        """
+        Inicializa o repositório com uma sessão do banco.
+
+        Args:
+            session: Sessão do banco (primário)
+            replica: Roteador das consultas para a réplica (opcional)
+        """
         self._session = session
+        self._replica = replica
 
     # =========================================================
     # MÉTODOS DE BUSCA
@@ -37,38 +66,97 @@ class SQLAlchemyOrderRepository(IOrderRepository):
 
     async def find_by_id(self, id: str) -> Order | None:
         """Busca pedido por ID único."""
-        query = select(OrderModel).where(OrderModel.id == id)
-        result = await self._session.execute(query)
-        model = result.scalars().first()
+        result = await execute_read(
+            self._session, _FIND_BY_ID, self._replica, {"id": id}
+        )
+        return _ORDER.one(result)
 
-        if model is None:
-            return None
+    async def find_by_number(self, number: str) -> Order | None:
+        """Busca pedido pelo número amigável (índice único)."""
+        query = _ORDER.select().where(OrderModel.number == number)
+        result = await execute_read(self._session, query, self._replica)
+        return _ORDER.one(result)
 
-        return self._to_entity(model)
+    async def find_by_numbers(self, numbers: list[str]) -> list[Order]:
+        """Busca vários pedidos com um único WHERE number IN (...)."""
+        if not numbers:
+            return []
+
+        query = _ORDER.select().where(OrderModel.number.in_(numbers))
+        result = await execute_read(self._session, query, self._replica)
+        return _ORDER.all(result)
 
     async def find_by_customer(self, customer_id: str) -> list[Order]:
         """Busca todos os pedidos de um cliente."""
         query = (
-            select(OrderModel)
+            _ORDER.select()
             .where(OrderModel.customer_id == customer_id)
             .order_by(OrderModel.created_at.desc())
         )
-        result = await self._session.execute(query)
-        models = result.scalars().all()
-
-        return [self._to_entity(model) for model in models]
+        result = await execute_read(self._session, query, self._replica)
+        return _ORDER.all(result)
 
     async def find_by_status(self, status: OrderStatus) -> list[Order]:
         """Busca pedidos por status."""
         query = (
-            select(OrderModel)
+            _ORDER.select()
             .where(OrderModel.status == status)
             .order_by(OrderModel.created_at.desc())
         )
-        result = await self._session.execute(query)
-        models = result.scalars().all()
+        result = await execute_read(self._session, query, self._replica)
+        return _ORDER.all(result)
+
+    async def iter_by_customer(
+        self,
+        customer_id: str,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Order]:
+        """Percorre os pedidos de um cliente (cursor do servidor)."""
+        query = (
+            _ORDER.select()
+            .where(OrderModel.customer_id == customer_id)
+            .order_by(OrderModel.created_at.desc())
+        )
+        async for order in _ORDER.stream(self._session, query, chunk_size):
+            yield order
+
+    async def iter_by_status(
+        self,
+        status: OrderStatus,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Order]:
+        """Percorre os pedidos de um status (cursor do servidor)."""
+        query = (
+            _ORDER.select()
+            .where(OrderModel.status == status)
+            .order_by(OrderModel.created_at.desc())
+        )
+        async for order in _ORDER.stream(self._session, query, chunk_size):
+            yield order
+
+    async def find_page_by_customer(
+        self,
+        customer_id: str,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Order]:
+        """Uma página dos pedidos de um cliente (keyset, mais recentes primeiro)."""
+        query = _ORDER.select().where(OrderModel.customer_id == customer_id)
+        query = _newest_first(query, cursor, limit)
+        result = await execute_read(self._session, query, self._replica)
+        return page_of(_ORDER.all(result), limit, _cursor_values)
 
-        return [self._to_entity(model) for model in models]
+    async def find_page_by_status(
+        self,
+        status: OrderStatus,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[Order]:
+        """Uma página dos pedidos de um status (keyset, mais recentes primeiro)."""
+        query = _ORDER.select().where(OrderModel.status == status)
+        query = _newest_first(query, cursor, limit)
+        result = await execute_read(self._session, query, self._replica)
+        return page_of(_ORDER.all(result), limit, _cursor_values)
 
     async def find_recent_by_customer(
         self,
@@ -77,41 +165,49 @@ class SQLAlchemyOrderRepository(IOrderRepository):
     ) -> list[Order]:
         """Busca os pedidos mais recentes de um cliente."""
         query = (
-            select(OrderModel)
+            _ORDER.select()
             .where(OrderModel.customer_id == customer_id)
             .order_by(OrderModel.created_at.desc())
             .limit(limit)
         )
-        result = await self._session.execute(query)
-        models = result.scalars().all()
-
-        return [self._to_entity(model) for model in models]
+        result = await execute_read(self._session, query, self._replica)
+        return _ORDER.all(result)
 
     # =========================================================
     # MÉTODOS DE PERSISTÊNCIA
     # =========================================================
 
     async def save(self, order: Order) -> None:
-        """Salva um novo pedido no banco."""
+        """
+        Salva um novo pedido no banco.
+
+        O número amigável é gerado pelo banco e copiado de volta
+        para a entidade (RETURNING no próprio INSERT).
+        """
         model = self._to_model(order)
         self._session.add(model)
         await self._session.flush()
 
+        order.number = model.number
+
     async def update(self, order: Order) -> None:
-        """Atualiza um pedido existente."""
-        query = select(OrderModel).where(OrderModel.id == order.id)
+        """Atualiza um pedido existente (UPDATE ... RETURNING)."""
+        query = (
+            update(OrderModel)
+            .where(OrderModel.id == order.id)
+            .values(
+                status=order.status,
+                total=order.total,
+                updated_at=order.updated_at,
+            )
+            .returning(OrderModel.id)
+            .execution_options(synchronize_session=False)
+        )
         result = await self._session.execute(query)
-        model = result.scalars().first()
 
-        if model is None:
+        if result.first() is None:
             raise ValueError(f"Pedido não encontrado: {order.id}")
 
-        model.status = order.status
-        model.total = order.total
-        model.updated_at = order.updated_at
-
-        await self._session.flush()
-
     # =========================================================
     # MÉTODOS DE RELATÓRIO
     # =========================================================
@@ -123,7 +219,7 @@ class SQLAlchemyOrderRepository(IOrderRepository):
             .select_from(OrderModel)
             .where(OrderModel.status == status)
         )
-        result = await self._session.execute(query)
+        result = await execute_read(self._session, query, self._replica)
         count = result.scalar()
 
         return count or 0
@@ -133,9 +229,10 @@ class SQLAlchemyOrderRepository(IOrderRepository):
     # =========================================================
 
     def _to_entity(self, model: OrderModel) -> Order:
-        """Converte OrderModel (banco) -> Order (entidade)."""
+        """Converte OrderModel (banco) -> Order (entidade); as buscas usam _ORDER."""
         return Order(
             id=model.id,
+            number=model.number,
             customer_id=model.customer_id,
             status=model.status,
             total=model.total,
@@ -145,7 +242,7 @@ class SQLAlchemyOrderRepository(IOrderRepository):
 
     def _to_model(self, entity: Order) -> OrderModel:
         """Converte Order (entidade) -> OrderModel (banco)."""
-        return OrderModel(
+        model = OrderModel(
             id=entity.id,
             customer_id=entity.customer_id,
             status=entity.status,
@@ -153,3 +250,39 @@ class SQLAlchemyOrderRepository(IOrderRepository):
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
+
+        # Sem número: deixa o banco gerar (atribuir None gravaria NULL)
+        if entity.number is not None:
+            model.number = entity.number
+
+        return model
+
+
+# ===========================================================
+# PAGINAÇÃO (keyset por created_at DESC, id DESC)
+# ===========================================================
+
+def _newest_first(query: Select, cursor: str | None, limit: int) -> Select:
+    """
+    Completa a consulta com a página pedida.
+
+    O id desempata pedidos do mesmo instante. A condição
+    created_at <= :c usa os índices (cliente|status, created_at
+    DESC); o OR só filtra os empates dentro dessa faixa.
+    """
+    check_limit(limit)
+    if cursor is not None:
+        created_at, before_id = decode_cursor(
+            cursor, datetime.fromisoformat, canonical_id
+        )
+        query = query.where(OrderModel.created_at <= created_at).where(
+            or_(OrderModel.created_at < created_at, OrderModel.id < before_id)
+        )
+    return query.order_by(
+        OrderModel.created_at.desc(), OrderModel.id.desc()
+    ).limit(limit + 1)
+
+
+def _cursor_values(order: Order) -> tuple[str, str]:
+    """Valores de ordenação do último pedido da página."""
+    return order.created_at.isoformat(), order.id
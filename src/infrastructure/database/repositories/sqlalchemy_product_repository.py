@@ -8,16 +8,57 @@ Implementação do repositório de produtos com SQLAlchemy.
 
 Esta classe implementa IProductRepository usando
 SQLAlchemy para persistência no PostgreSQL.
+
+A busca textual usa o full-text search do PostgreSQL (coluna
+products.search_vector, índice GIN; ver migração 006).
+
+A reserva de estoque é um UPDATE condicional: a checagem
+(stock >= quantidade) e a baixa acontecem no mesmo comando,
+sob o lock da linha. Não há janela entre ler e gravar.
+
+A navegação no catálogo (buscas e listagens) pode ir para a
+réplica de leitura (ver replica.py); catalog_version e as
+escritas ficam no primário.
 """
 
+from collections.abc import Mapping
+from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import select, func, distinct
+from sqlalchemy import (
+    Integer,
+    Uuid,
+    column,
+    delete,
+    distinct,
+    func,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.product import Product
 from src.domain.repositories.product_repository import IProductRepository
-from src.infrastructure.database.models import ProductModel
+from src.infrastructure.database.hydration import RowHydrator
+from src.infrastructure.database.models import (
+    PRODUCT_SEARCH_CONFIG,
+    CatalogVersionModel,
+    ProductModel,
+)
+from src.infrastructure.database.replica import ReadReplicaRouter, execute_read
+
+
+# Leituras: linhas do Core -> Product (sem passar por ProductModel)
+_PRODUCT = RowHydrator(Product, ProductModel)
+
+# Lista do menu "Ver produtos" (sem parâmetros): montada uma vez
+_FIND_ALL_ACTIVE = (
+    _PRODUCT.select()
+    .where(ProductModel.active == True)
+    .where(ProductModel.stock > 0)
+    .order_by(ProductModel.category, ProductModel.name)
+)
 
 
 class SQLAlchemyProductRepository(IProductRepository):
@@ -28,9 +69,24 @@ class SQLAlchemyProductRepository(IProductRepository):
     persistência real no PostgreSQL.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Inicializa o repositório com uma sessão do banco."""
+    def __init__(
+        self,
+        session: AsyncSession,
+        fuzzy_fallback: bool = False,
+        replica: ReadReplicaRouter | None = None,
+    ) -> None:
+        """
+        Inicializa o repositório com uma sessão do banco.
+
+        Args:
+            session: Sessão do banco (primário)
+            fuzzy_fallback: Se a busca textual não achar nada, tenta
+                por semelhança de trigramas no nome (requer pg_trgm)
+            replica: Roteador das buscas para a réplica (opcional)
+        """
         self._session = session
+        self._fuzzy_fallback = fuzzy_fallback
+        self._replica = replica
 
     # =========================================================
     # MÉTODOS DE BUSCA
@@ -38,57 +94,96 @@ class SQLAlchemyProductRepository(IProductRepository):
 
     async def find_by_id(self, id: str) -> Product | None:
         """Busca produto por ID único."""
-        query = select(ProductModel).where(ProductModel.id == id)
-        result = await self._session.execute(query)
-        model = result.scalars().first()
-
-        if model is None:
-            return None
-
-        return self._to_entity(model)
+        query = _PRODUCT.select().where(ProductModel.id == id)
+        result = await execute_read(self._session, query, self._replica)
+        return _PRODUCT.one(result)
 
     async def find_by_category(self, category: str) -> list[Product]:
         """Busca produtos por categoria."""
         query = (
-            select(ProductModel)
+            _PRODUCT.select()
             .where(ProductModel.category == category)
             .where(ProductModel.active == True)
             .order_by(ProductModel.name)
         )
-        result = await self._session.execute(query)
-        models = result.scalars().all()
-
-        return [self._to_entity(model) for model in models]
+        result = await execute_read(self._session, query, self._replica)
+        return _PRODUCT.all(result)
 
     async def find_all_active(self) -> list[Product]:
         """Lista todos os produtos ativos (disponíveis para venda)."""
+        result = await execute_read(self._session, _FIND_ALL_ACTIVE, self._replica)
+        return _PRODUCT.all(result)
+
+    async def search(
+        self,
+        query_text: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[Product]:
+        """
+        Busca produtos por nome ou descrição (full-text search).
+
+        websearch_to_tsquery aceita o texto do cliente como veio
+        ("camiseta azul", "camiseta -infantil", "\"tênis branco\"").
+        Os resultados vêm por relevância (ts_rank_cd: nome pesa
+        mais que a descrição), desempatados pelo nome.
+
+        Sem nenhum resultado na primeira página, e com fuzzy_fallback,
+        tenta a busca aproximada por trigramas (erros de digitação).
+        """
+        tsquery = func.websearch_to_tsquery(PRODUCT_SEARCH_CONFIG, query_text)
         query = (
-            select(ProductModel)
+            _PRODUCT.select()
+            .where(ProductModel.search_vector.bool_op("@@")(tsquery))
             .where(ProductModel.active == True)
-            .where(ProductModel.stock > 0)
-            .order_by(ProductModel.category, ProductModel.name)
+            .order_by(
+                func.ts_rank_cd(ProductModel.search_vector, tsquery).desc(),
+                ProductModel.name,
+            )
+            .limit(limit)
+            .offset(offset)
         )
-        result = await self._session.execute(query)
-        models = result.scalars().all()
+        result = await execute_read(self._session, query, self._replica)
+        products = _PRODUCT.all(result)
 
-        return [self._to_entity(model) for model in models]
+        if products or offset or not self._fuzzy_fallback:
+            return products
+        return await self._search_similar(query_text, limit)
 
-    async def search(self, query_text: str) -> list[Product]:
-        """Busca produtos por nome ou descrição."""
-        search_pattern = f"%{query_text}%"
+    async def _search_similar(self, query_text: str, limit: int) -> list[Product]:
+        """Busca aproximada: nomes parecidos com o texto (pg_trgm)."""
         query = (
-            select(ProductModel)
-            .where(
-                (ProductModel.name.ilike(search_pattern)) |
-                (ProductModel.description.ilike(search_pattern))
+            _PRODUCT.select()
+            .where(ProductModel.name.bool_op("%")(query_text))
+            .where(ProductModel.active == True)
+            .order_by(
+                func.similarity(ProductModel.name, query_text).desc(),
+                ProductModel.name,
             )
+            .limit(limit)
+        )
+        result = await execute_read(self._session, query, self._replica)
+        return _PRODUCT.all(result)
+
+    async def find_by_price_range(
+        self,
+        min_price: Decimal,
+        max_price: Decimal,
+    ) -> list[Product]:
+        """Busca produtos ativos dentro da faixa de preço (mais baratos primeiro)."""
+        query = (
+            _PRODUCT.select()
+            .where(ProductModel.price.between(min_price, max_price))
             .where(ProductModel.active == True)
-            .order_by(ProductModel.name)
+            .order_by(
+                ProductModel.price,
+                ProductModel.category,
+                ProductModel.name,
+                ProductModel.id,
+            )
         )
-        result = await self._session.execute(query)
-        models = result.scalars().all()
-
-        return [self._to_entity(model) for model in models]
+        result = await execute_read(self._session, query, self._replica)
+        return _PRODUCT.all(result)
 
     async def list_categories(self) -> list[str]:
         """Lista todas as categorias disponíveis."""
@@ -97,11 +192,48 @@ class SQLAlchemyProductRepository(IProductRepository):
             .where(ProductModel.active == True)
             .order_by(ProductModel.category)
         )
-        result = await self._session.execute(query)
+        result = await execute_read(self._session, query, self._replica)
         categories = result.scalars().all()
 
         return list(categories)
 
+    # =========================================================
+    # SNAPSHOT DO CATÁLOGO (ver cache/product_catalog.py)
+    # =========================================================
+
+    async def find_all_listed(self) -> list[Product]:
+        """Todos os produtos ativos, com ou sem estoque, por categoria e nome."""
+        query = (
+            _PRODUCT.select()
+            .where(ProductModel.active == True)
+            .order_by(ProductModel.category, ProductModel.name, ProductModel.id)
+        )
+        result = await execute_read(self._session, query, self._replica)
+        return _PRODUCT.all(result)
+
+    async def catalog_version(self) -> tuple:
+        """
+        Versão barata do catálogo: (contador, última alteração).
+
+        - contador (catalog_version, migração 010): avançado por
+          trigger na transação de qualquer mudança de catálogo;
+          visível só no commit e nunca volta, então nenhuma
+          mudança commitada passa despercebida
+        - max(updated_at): acompanha o estoque (reservas não
+          avançam o contador); pode atrasar uma reserva, nunca
+          o catálogo
+        """
+        counter = (
+            select(CatalogVersionModel.version)
+            .where(CatalogVersionModel.id == 1)
+            .scalar_subquery()
+        )
+        query = select(
+            func.coalesce(counter, 0), func.max(ProductModel.updated_at)
+        )
+        result = await self._session.execute(query)
+        return tuple(result.one())
+
     # =========================================================
     # MÉTODOS DE PERSISTÊNCIA
     # =========================================================
@@ -113,43 +245,129 @@ class SQLAlchemyProductRepository(IProductRepository):
         await self._session.flush()
 
     async def update(self, product: Product) -> None:
-        """Atualiza um produto existente."""
-        query = select(ProductModel).where(ProductModel.id == product.id)
+        """Atualiza um produto existente (UPDATE ... RETURNING)."""
+        query = (
+            update(ProductModel)
+            .where(ProductModel.id == product.id)
+            .values(
+                name=product.name,
+                description=product.description,
+                price=product.price,
+                image_url=product.image_url,
+                category=product.category,
+                stock=product.stock,
+                active=product.active,
+                updated_at=product.updated_at,
+            )
+            .returning(ProductModel.id)
+            .execution_options(synchronize_session=False)
+        )
         result = await self._session.execute(query)
-        model = result.scalars().first()
 
-        if model is None:
+        if result.first() is None:
             raise ValueError(f"Produto não encontrado: {product.id}")
 
-        model.name = product.name
-        model.description = product.description
-        model.price = product.price
-        model.image_url = product.image_url
-        model.category = product.category
-        model.stock = product.stock
-        model.active = product.active
-        model.updated_at = product.updated_at
+    async def reserve_stock(self, product_id: str, quantity: int) -> int | None:
+        """
+        Baixa atômica de estoque (um comando só).
 
-        await self._session.flush()
+        UPDATE products SET stock = stock - :q
+        WHERE id = :id AND stock >= :q AND active
+        RETURNING stock
+        """
+        _check_quantity(quantity)
+
+        query = (
+            update(ProductModel)
+            .where(ProductModel.id == product_id)
+            .where(ProductModel.stock >= quantity)
+            .where(ProductModel.active == True)
+            .values(stock=ProductModel.stock - quantity, updated_at=datetime.now())
+            .returning(ProductModel.stock)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def reserve_stock_batch(
+        self, items: Mapping[str, int]
+    ) -> dict[str, int] | None:
+        """
+        Reserva um carrinho inteiro em um comando (tudo ou nada).
+
+        1. locked: trava as linhas do carrinho EM ORDEM DE ID
+           (carrinhos simultâneos não travam em ordens cruzadas:
+           sem deadlock) e lê o estoque mais recente
+        2. Só atualiza se TODOS os itens têm estoque; senão,
+           nenhuma linha é alterada
+        """
+        for quantity in items.values():
+            _check_quantity(quantity)
+        if not items:
+            return {}
+
+        wanted = (
+            values(
+                column("id", Uuid(as_uuid=False)),
+                column("quantity", Integer),
+                name="wanted",
+            )
+            .data(sorted(items.items()))
+            .cte("wanted")
+        )
+        locked = (
+            select(ProductModel.id, ProductModel.stock)
+            .where(ProductModel.id.in_(sorted(items)))
+            .where(ProductModel.active == True)
+            .order_by(ProductModel.id)
+            .with_for_update()
+            .cte("locked")
+        )
+        all_available = (
+            select(func.count() == len(items))
+            .select_from(locked.join(wanted, wanted.c.id == locked.c.id))
+            .where(locked.c.stock >= wanted.c.quantity)
+            .scalar_subquery()
+        )
+        query = (
+            update(ProductModel)
+            .where(ProductModel.id == wanted.c.id)
+            .where(all_available)
+            .values(
+                stock=ProductModel.stock - wanted.c.quantity,
+                updated_at=datetime.now(),
+            )
+            .returning(ProductModel.id, ProductModel.stock)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(query)
+
+        remaining = {id: stock for id, stock in result.all()}
+        return remaining or None
 
     async def delete(self, id: str) -> None:
-        """Remove um produto do banco."""
-        query = select(ProductModel).where(ProductModel.id == id)
+        """Remove um produto do banco (DELETE ... RETURNING)."""
+        query = (
+            delete(ProductModel)
+            .where(ProductModel.id == id)
+            .returning(ProductModel.id)
+            .execution_options(synchronize_session=False)
+        )
         result = await self._session.execute(query)
-        model = result.scalars().first()
 
-        if model is None:
+        if result.first() is None:
             raise ValueError(f"Produto não encontrado: {id}")
 
-        await self._session.delete(model)
-        await self._session.flush()
-
     # =========================================================
     # CONVERSORES (Model <-> Entity)
     # =========================================================
 
     def _to_entity(self, model: ProductModel) -> Product:
-        """Converte ProductModel (banco) -> Product (entidade)."""
+        """
+        Converte ProductModel (banco) -> Product (entidade).
+
+        As buscas usam _PRODUCT (linhas do Core, sem o ORM).
+        """
         return Product(
             id=model.id,
             name=model.name,
@@ -177,3 +395,9 @@ class SQLAlchemyProductRepository(IProductRepository):
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
+
+
+def _check_quantity(quantity: int) -> None:
+    """Reserva precisa de pelo menos uma unidade."""
+    if quantity <= 0:
+        raise ValueError("Quantidade deve ser maior que zero")
@@ -12,16 +12,122 @@ SQLAlchemy para persistência no PostgreSQL.
 NOTA: Em produção, sessões geralmente ficam no Redis
 para melhor performance. Esta implementação SQL é
 para desenvolvimento e casos onde Redis não está disponível.
+
+Só count_active (relatório) pode ir para a réplica de leitura:
+as buscas do turno decidem escritas e ficam no primário.
+
+O contexto (JSONB) é gravado por DELTA: o UPDATE aplica só as
+chaves que o turno gravou (||) e removeu (-), em vez de regravar
+o dicionário inteiro. Ver _context_value.
 """
 
+from dataclasses import asdict, dataclass
 from datetime import datetime
-
-from sqlalchemy import select, func, delete
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Text,
+    any_,
+    bindparam,
+    delete,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.session import Session
 from src.domain.repositories.session_repository import ISessionRepository
+from src.infrastructure.database.hydration import RowHydrator
 from src.infrastructure.database.models import SessionModel, CustomerModel
+from src.infrastructure.database.replica import ReadReplicaRouter, execute_read
+
+
+# Tamanho dos lotes de delete_expired
+EXPIRED_BATCH_SIZE = 1000
+
+# Tentativas de get_or_create (INSERT que não insere + sessão que
+# foi desligada antes da leitura)
+GET_OR_CREATE_ATTEMPTS = 3
+
+# Leituras: linhas do Core -> Session (sem passar por SessionModel).
+# Contexto NULL no banco vira dicionário vazio.
+_SESSION = RowHydrator(
+    Session,
+    SessionModel,
+    converters={"context": lambda context: context or {}},
+)
+
+# Buscas do turno, montadas uma vez (valores em bindparam)
+_FIND_BY_CUSTOMER = (
+    _SESSION.select()
+    .where(SessionModel.customer_id == bindparam("customer_id"))
+    .where(SessionModel.expires_at > bindparam("now"))
+    .order_by(SessionModel.created_at.desc())
+)
+_FIND_ACTIVE = (
+    _SESSION.select()
+    .where(SessionModel.customer_id == bindparam("customer_id"))
+    .where(SessionModel.active)
+)
+
+# Contexto NULL no banco, para aplicar o delta por cima
+_EMPTY_CONTEXT = literal({}, JSONB)
+
+
+@dataclass
+class SessionContextStats:
+    """
+    Gravações do contexto das sessões.
+
+    Attributes:
+        delta_writes: UPDATEs que aplicaram só as chaves alteradas
+        full_writes: UPDATEs que trocaram o contexto inteiro (clear_context)
+        keys_set: Chaves gravadas pelos deltas
+        keys_removed: Chaves removidas pelos deltas
+        delta_bytes: Bytes de JSON enviados nos deltas
+        context_bytes: Soma do tamanho do contexto após cada gravação
+        max_context_bytes: Maior contexto gravado
+    """
+
+    delta_writes: int = 0
+    full_writes: int = 0
+    keys_set: int = 0
+    keys_removed: int = 0
+    delta_bytes: int = 0
+    context_bytes: int = 0
+    max_context_bytes: int = 0
+
+    @property
+    def avg_context_bytes(self) -> float:
+        """Tamanho médio do contexto gravado."""
+        writes = self.delta_writes + self.full_writes
+        return self.context_bytes / writes if writes else 0.0
+
+    def record(
+        self,
+        size: int,
+        delta_bytes: int | None,
+        keys_set: int = 0,
+        keys_removed: int = 0,
+    ) -> None:
+        """Registra uma gravação (delta_bytes None = contexto inteiro)."""
+        if delta_bytes is None:
+            self.full_writes += 1
+        else:
+            self.delta_writes += 1
+            self.delta_bytes += delta_bytes
+            self.keys_set += keys_set
+            self.keys_removed += keys_removed
+        self.context_bytes += size
+        self.max_context_bytes = max(self.max_context_bytes, size)
+
+    def as_dict(self) -> dict[str, float]:
+        """Retorna as métricas para logs."""
+        return {**asdict(self), "avg_context_bytes": round(self.avg_context_bytes, 1)}
 
 
 class SQLAlchemySessionRepository(ISessionRepository):
@@ -32,9 +138,24 @@ class SQLAlchemySessionRepository(ISessionRepository):
     persistência real no PostgreSQL.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Inicializa o repositório com uma sessão do banco."""
+    def __init__(
+        self,
+        session: AsyncSession,
+        replica: ReadReplicaRouter | None = None,
+        context_stats: SessionContextStats | None = None,
+    ) -> None:
+        """
+        Inicializa o repositório com uma sessão do banco.
+
+        Args:
+            session: Sessão do banco (primário)
+            replica: Roteador de count_active para a réplica (opcional)
+            context_stats: Métricas das gravações do contexto (opcional,
+                compartilhadas pelo processo)
+        """
         self._session = session
+        self._replica = replica
+        self._context_stats = context_stats
 
     # =========================================================
     # MÉTODOS DE BUSCA
@@ -42,37 +163,23 @@ class SQLAlchemySessionRepository(ISessionRepository):
 
     async def find_by_id(self, id: str) -> Session | None:
         """Busca sessão por ID único."""
-        query = select(SessionModel).where(SessionModel.id == id)
+        query = _SESSION.select().where(SessionModel.id == id)
         result = await self._session.execute(query)
-        model = result.scalars().first()
-
-        if model is None:
-            return None
-
-        entity = self._to_entity(model)
+        entity = _SESSION.one(result)
 
         # Retorna None se expirada
-        if entity.is_expired:
+        if entity is None or entity.is_expired:
             return None
 
         return entity
 
     async def find_by_customer(self, customer_id: str) -> Session | None:
         """Busca sessão ativa de um cliente."""
-        now = datetime.now()
-        query = (
-            select(SessionModel)
-            .where(SessionModel.customer_id == customer_id)
-            .where(SessionModel.expires_at > now)
-            .order_by(SessionModel.created_at.desc())
+        result = await self._session.execute(
+            _FIND_BY_CUSTOMER,
+            {"customer_id": customer_id, "now": datetime.now()},
         )
-        result = await self._session.execute(query)
-        model = result.scalars().first()
-
-        if model is None:
-            return None
-
-        return self._to_entity(model)
+        return _SESSION.one(result)
 
     async def find_active_by_phone(self, phone: str) -> Session | None:
         """Busca sessão ativa pelo telefone do cliente."""
@@ -80,77 +187,176 @@ class SQLAlchemySessionRepository(ISessionRepository):
 
         # Join com customers para buscar por telefone
         query = (
-            select(SessionModel)
-            .join(CustomerModel)
+            _SESSION.select()
+            .join(CustomerModel, CustomerModel.id == SessionModel.customer_id)
             .where(CustomerModel.phone_number == phone)
             .where(SessionModel.expires_at > now)
             .order_by(SessionModel.created_at.desc())
         )
         result = await self._session.execute(query)
-        model = result.scalars().first()
-
-        if model is None:
-            return None
-
-        return self._to_entity(model)
+        return _SESSION.one(result)
 
     # =========================================================
     # MÉTODOS DE PERSISTÊNCIA
     # =========================================================
 
     async def save(self, session_entity: Session) -> None:
-        """Salva uma nova sessão no banco."""
+        """
+        Salva uma nova sessão no banco.
+
+        A sessão ligada do cliente (se houver) é desligada antes:
+        a nova substitui a anterior, como no Redis.
+        """
+        await self._deactivate(session_entity.customer_id)
+
         model = self._to_model(session_entity)
         self._session.add(model)
         await self._session.flush()
+        session_entity.mark_clean()
+
+    async def get_or_create(self, session_entity: Session) -> tuple[Session, bool]:
+        """
+        Cria a sessão, ou devolve a sessão ligada do cliente.
+
+        1. UPDATE ... SET active = false
+           WHERE customer_id = :c AND active AND expires_at <= now
+           (sessão expirada não impede a nova)
+        2. INSERT ... ON CONFLICT (customer_id) WHERE active
+           DO NOTHING RETURNING id
+           (conflito no índice único parcial ix_sessions_customer_id_active)
+        3. Nada voltou: lê a sessão ligada que venceu a corrida
+
+        Outra transação criando a sessão do mesmo cliente: o INSERT
+        espera ela terminar, sem IntegrityError.
+
+        Raises:
+            ValueError: Se a sessão ligada sumir antes da leitura em
+                todas as tentativas
+        """
+        customer_id = session_entity.customer_id
+        await self._deactivate(customer_id, expired_only=True)
+
+        query = (
+            insert(SessionModel)
+            .values(
+                id=session_entity.id,
+                customer_id=customer_id,
+                state=session_entity.state,
+                context=session_entity.context,
+                created_at=session_entity.created_at,
+                updated_at=session_entity.updated_at,
+                expires_at=session_entity.expires_at,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[SessionModel.customer_id],
+                index_where=SessionModel.active,
+            )
+            .returning(SessionModel.id)
+        )
+
+        for _ in range(GET_OR_CREATE_ATTEMPTS):
+            if await self._session.scalar(query) is not None:
+                session_entity.mark_clean()
+                return session_entity, True
+
+            result = await self._session.execute(
+                _FIND_ACTIVE, {"customer_id": customer_id}
+            )
+            existing = _SESSION.one(result)
+            if existing is not None:
+                return existing, False
+
+        raise ValueError(f"Sessão não pôde ser criada para o cliente: {customer_id}")
 
     async def update(self, session_entity: Session) -> None:
-        """Atualiza uma sessão existente."""
-        query = select(SessionModel).where(SessionModel.id == session_entity.id)
+        """
+        Atualiza uma sessão existente.
+
+        Grava apenas as colunas que a entidade marcou como alteradas
+        (dirty tracking). Sessão sem alterações não vai ao banco.
+        O contexto vai como delta (ver _context_value), no mesmo UPDATE.
+        """
+        if not session_entity.is_dirty:
+            return
+
+        query = (
+            update(SessionModel)
+            .where(SessionModel.id == session_entity.id)
+            .values(**self._changed_values(session_entity))
+            .returning(SessionModel.id)
+            .execution_options(synchronize_session=False)
+        )
         result = await self._session.execute(query)
-        model = result.scalars().first()
 
-        if model is None:
+        if result.first() is None:
             raise ValueError(f"Sessão não encontrada: {session_entity.id}")
 
-        model.state = session_entity.state
-        model.context = session_entity.context
-        model.expires_at = session_entity.expires_at
-        model.updated_at = session_entity.updated_at
-
-        await self._session.flush()
+        session_entity.mark_clean()
 
     async def delete(self, id: str) -> None:
-        """Remove uma sessão específica."""
-        query = select(SessionModel).where(SessionModel.id == id)
+        """Remove uma sessão específica (DELETE ... RETURNING)."""
+        query = (
+            delete(SessionModel)
+            .where(SessionModel.id == id)
+            .returning(SessionModel.id)
+            .execution_options(synchronize_session=False)
+        )
         result = await self._session.execute(query)
-        model = result.scalars().first()
 
-        if model is None:
+        if result.first() is None:
             raise ValueError(f"Sessão não encontrada: {id}")
 
-        await self._session.delete(model)
-        await self._session.flush()
-
     async def delete_expired(self) -> int:
-        """Remove todas as sessões expiradas."""
-        now = datetime.now()
-
-        # Conta antes de deletar
-        count_query = (
-            select(func.count())
-            .select_from(SessionModel)
-            .where(SessionModel.expires_at <= now)
+        """
+        Remove todas as sessões expiradas, em lotes.
+
+        Para limpeza contínua em produção, prefira o
+        ExpiredSessionReaper (um lote por transação).
+        """
+        total = 0
+        while True:
+            deleted = await self.delete_expired_batch(EXPIRED_BATCH_SIZE)
+            total += deleted
+            if deleted < EXPIRED_BATCH_SIZE:
+                return total
+
+    async def delete_expired_batch(self, limit: int) -> int:
+        """
+        Remove até `limit` sessões expiradas em um único comando.
+
+        DELETE ... WHERE id = ANY(ARRAY(SELECT ... LIMIT n
+                                        FOR UPDATE SKIP LOCKED))
+        RETURNING id
+
+        - O SELECT usa o índice ix_sessions_expires_at
+        - ANY(ARRAY(...)): os IDs viram uma lista calculada uma vez,
+          e o DELETE busca cada um pela chave primária (com IN, o
+          planejador pode preferir um hash join varrendo a tabela)
+        - SKIP LOCKED: linhas em uso por outra transação ficam
+          para o próximo lote (sem espera)
+        - RETURNING: a contagem vem do próprio DELETE
+
+        Args:
+            limit: Tamanho máximo do lote
+
+        Returns:
+            Quantidade de sessões removidas
+        """
+        expired_ids = (
+            select(SessionModel.id)
+            .where(SessionModel.expires_at <= datetime.now())
+            .order_by(SessionModel.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
-        result = await self._session.execute(count_query)
-        count = result.scalar() or 0
-
-        # Deleta expiradas
-        delete_query = delete(SessionModel).where(SessionModel.expires_at <= now)
-        await self._session.execute(delete_query)
-        await self._session.flush()
-
-        return count
+        query = (
+            delete(SessionModel)
+            .where(SessionModel.id == any_(func.array(expired_ids.scalar_subquery())))
+            .returning(SessionModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(query)
+        return len(result.all())
 
     async def count_active(self) -> int:
         """Conta sessões ativas (não expiradas)."""
@@ -160,17 +366,34 @@ class SQLAlchemySessionRepository(ISessionRepository):
             .select_from(SessionModel)
             .where(SessionModel.expires_at > now)
         )
-        result = await self._session.execute(query)
+        result = await execute_read(self._session, query, self._replica)
         count = result.scalar()
 
         return count or 0
 
+    async def _deactivate(self, customer_id: str, expired_only: bool = False) -> None:
+        """Desliga a sessão ligada do cliente (ou só se já expirou)."""
+        query = (
+            update(SessionModel)
+            .where(SessionModel.customer_id == customer_id)
+            .where(SessionModel.active)
+            .values(active=False)
+            .execution_options(synchronize_session=False)
+        )
+        if expired_only:
+            query = query.where(SessionModel.expires_at <= datetime.now())
+        await self._session.execute(query)
+
     # =========================================================
     # CONVERSORES (Model <-> Entity)
     # =========================================================
 
     def _to_entity(self, model: SessionModel) -> Session:
-        """Converte SessionModel (banco) -> Session (entidade)."""
+        """
+        Converte SessionModel (banco) -> Session (entidade).
+
+        As buscas usam _SESSION (linhas do Core, sem o ORM).
+        """
         return Session(
             id=model.id,
             customer_id=model.customer_id,
@@ -181,6 +404,60 @@ class SQLAlchemySessionRepository(ISessionRepository):
             expires_at=model.expires_at,
         )
 
+    def _changed_values(self, entity: Session) -> dict:
+        """Monta os valores do UPDATE apenas com os campos alterados."""
+        values: dict = {"updated_at": entity.updated_at}
+        changed = entity.changed_fields
+
+        if "state" in changed:
+            values["state"] = entity.state
+        if "context" in changed:
+            values["context"] = self._context_value(entity)
+        if "expires_at" in changed:
+            values["expires_at"] = entity.expires_at
+
+        return values
+
+    def _context_value(self, entity: Session) -> Any:
+        """
+        Valor de SET context = ... com as alterações do contexto.
+
+        Delta (set_context/remove_context):
+            (COALESCE(context, '{}') || :gravadas) - :removidas
+        - || troca/acrescenta só as chaves gravadas no turno
+        - - (text[]) remove as chaves removidas
+        - Chaves que o turno não tocou ficam como estão no banco
+
+        O formato é sempre o mesmo (delta vazio = '{}' e '{}'::text[]):
+        o SQL compilado é reaproveitado entre turnos.
+
+        clear_context troca o contexto inteiro (o dicionário atual).
+
+        Os tamanhos das estatísticas vêm da entidade, que mede cada
+        chave no set_context: nada é serializado de novo aqui.
+        """
+        if entity.context_replaced:
+            if self._context_stats is not None:
+                self._context_stats.record(entity.context_size, None)
+            return entity.context
+
+        updated, removed = entity.context_delta()
+        if self._context_stats is not None:
+            self._context_stats.record(
+                entity.context_size,
+                entity.context_delta_size,
+                keys_set=len(updated),
+                keys_removed=len(removed),
+            )
+
+        merged: ColumnElement[Any] = func.coalesce(SessionModel.context, _EMPTY_CONTEXT)
+        merged = merged.op("||", return_type=JSONB)(
+            bindparam("context_set", updated, type_=JSONB)
+        )
+        return merged.op("-", return_type=JSONB)(
+            bindparam("context_removed", sorted(removed), type_=ARRAY(Text))
+        )
+
     def _to_model(self, entity: Session) -> SessionModel:
         """Converte Session (entidade) -> SessionModel (banco)."""
         return SessionModel(
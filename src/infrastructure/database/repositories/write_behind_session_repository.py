@@ -0,0 +1,440 @@
+# ===========================================================
+# src/infrastructure/database/repositories/write_behind_session_repository.py
+# ===========================================================
+# Gravação "WRITE-BEHIND" (adiada e agrupada) das sessões.
+#
+# PROBLEMA:
+# Todo turno termina com um UPDATE da sessão. Com milhares de
+# mensagens por segundo, esses UPDATEs viram a maior carga do banco.
+#
+# SOLUÇÃO:
+# 1. update() não vai ao banco: guarda a sessão em um buffer
+#    em memória (só a ÚLTIMA versão de cada sessão)
+# 2. Uma tarefa de fundo grava o buffer a cada N ms, ou antes
+#    se juntar M sessões, em UM comando:
+#      WITH v(id, state, ...) AS (VALUES (...), (...))
+#      UPDATE sessions SET ... FROM v WHERE sessions.id = v.id
+#    Sessão que já não existe (removida/expirada) simplesmente não
+#    casa com nenhuma linha: o resto do lote é gravado normalmente
+# 3. No shutdown, o buffer é gravado antes de fechar
+#
+# SÓ DEPOIS DO COMMIT:
+# Com a sessão do banco do turno (db), update() guarda a versão no
+# repositório (que é do request) e ela só entra no buffer no COMMIT.
+# Turno que termina em ROLLBACK não grava nada depois.
+#
+# FALHAS:
+# Lote com erro volta ao buffer; cada sessão tem no máximo
+# max_attempts tentativas e depois é descartada (com log de erro),
+# para que um erro persistente não segure o buffer para sempre.
+#
+# JANELA DE DURABILIDADE (leia antes de ligar!):
+# - Se o processo morrer sem shutdown (kill -9, falta de energia,
+#   OOM), as alterações dos últimos flush_interval_ms (mais o
+#   tempo do flush em andamento) são PERDIDAS.
+# - O pior caso é o cliente voltar um passo na conversa
+#   (ex: menu em vez de FAQ). Pedidos e clientes NÃO passam por
+#   aqui: continuam gravados na hora.
+# - Sessões NOVAS (save) são gravadas na hora: outras tabelas
+#   dependem delas e o INSERT precisa existir.
+#
+# LEITURAS:
+# Enquanto uma versão está no buffer, o banco está "atrasado".
+# As buscas consultam o buffer por cima do resultado do banco,
+# então o próprio processo sempre lê a versão mais nova.
+# ===========================================================
+"""
+Repositório de sessões com gravação adiada e agrupada.
+
+Uso:
+    buffer = SessionWriteBuffer(AsyncSessionFactory, flush_interval_ms=200)
+    await buffer.start()
+    repo = WriteBehindSessionRepository(SQLAlchemySessionRepository(db), buffer)
+    ...
+    await buffer.stop()  # grava o que falta
+"""
+
+import asyncio
+import copy
+import dataclasses
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import Update, column, update, values
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.entities.session import Session
+from src.domain.repositories.session_repository import ISessionRepository
+from src.infrastructure.database.models import SessionModel
+from src.infrastructure.database.transaction_hooks import after_commit, after_rollback
+
+
+logger = logging.getLogger(__name__)
+
+# Colunas gravadas pelo flush (id primeiro: chave do UPDATE ... FROM)
+_COLUMNS = ("id", "state", "context", "expires_at", "updated_at")
+
+# Máximo de linhas por comando (limite de parâmetros do driver:
+# 5 colunas x 1000 linhas bem abaixo dos 32767 do asyncpg)
+_STATEMENT_ROWS = 1000
+
+
+@dataclass
+class WriteBufferStats:
+    """
+    Contadores do buffer de escrita.
+
+    Attributes:
+        buffered: Updates recebidos
+        coalesced: Updates que substituíram uma versão ainda não gravada
+        flushes: Gravações em lote realizadas
+        rows_written: Sessões gravadas no total
+        failures: Gravações que falharam (as sessões voltam ao buffer)
+        dropped: Sessões descartadas após max_attempts falhas
+    """
+
+    buffered: int = 0
+    coalesced: int = 0
+    flushes: int = 0
+    rows_written: int = 0
+    failures: int = 0
+    dropped: int = 0
+
+
+class SessionWriteBuffer:
+    """
+    Buffer de sessões pendentes de gravação (um por processo).
+
+    Guarda cópias: o caso de uso pode continuar alterando a
+    entidade sem afetar a versão que será gravada.
+
+    Attributes:
+        stats: Contadores (ver WriteBufferStats)
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        flush_interval_ms: int = 200,
+        max_batch: int = 500,
+        max_attempts: int = 5,
+    ) -> None:
+        """
+        Inicializa o buffer.
+
+        Args:
+            session_factory: Cria as sessões do banco usadas no flush
+            flush_interval_ms: Intervalo máximo entre gravações
+                (= janela de perda em caso de queda do processo)
+            max_batch: Quantidade que antecipa a gravação
+            max_attempts: Tentativas de gravação de uma mesma versão
+                antes de descartá-la
+        """
+        if flush_interval_ms <= 0:
+            raise ValueError("flush_interval_ms deve ser maior que zero")
+        if max_batch <= 0:
+            raise ValueError("max_batch deve ser maior que zero")
+        if max_attempts <= 0:
+            raise ValueError("max_attempts deve ser maior que zero")
+
+        self._session_factory = session_factory
+        self._interval = flush_interval_ms / 1000
+        self._max_batch = max_batch
+        self._max_attempts = max_attempts
+
+        # session_id -> última versão ainda não gravada
+        self._pending: dict[str, Session] = {}
+        # session_id -> falhas da versão pendente
+        self._attempts: dict[str, int] = {}
+        self._batch_ready = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+        self.stats = WriteBufferStats()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, session: Session) -> None:
+        """Enfileira a versão atual da sessão (substitui a anterior)."""
+        if session.id in self._pending:
+            self.stats.coalesced += 1
+        # Versão nova: recomeça a contagem de tentativas
+        self._attempts.pop(session.id, None)
+        self._pending[session.id] = _clone(session)
+        self.stats.buffered += 1
+
+        if len(self._pending) >= self._max_batch:
+            self._batch_ready.set()
+
+    def get(self, session_id: str) -> Session | None:
+        """Cópia da versão pendente da sessão, se houver."""
+        pending = self._pending.get(session_id)
+        return _clone(pending) if pending is not None else None
+
+    def discard(self, session_id: str) -> None:
+        """Descarta a versão pendente (ex: sessão removida)."""
+        self._pending.pop(session_id, None)
+        self._attempts.pop(session_id, None)
+
+    async def flush(self) -> int:
+        """
+        Grava todas as sessões pendentes em um único comando
+        (um por _STATEMENT_ROWS sessões), na mesma transação.
+
+        Sessões que já não existem no banco são ignoradas. Em caso
+        de erro, as sessões voltam ao buffer (a menos que já exista
+        versão mais nova) até max_attempts tentativas.
+
+        Returns:
+            Quantidade de sessões gravadas
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            # Troca o buffer antes do await: updates que chegarem
+            # durante a gravação vão para o buffer novo
+            batch, self._pending = self._pending, {}
+            self._batch_ready.clear()
+
+            rows = [_to_row(session) for session in batch.values()]
+            try:
+                async with self._session_factory() as db:
+                    for start in range(0, len(rows), _STATEMENT_ROWS):
+                        chunk = rows[start:start + _STATEMENT_ROWS]
+                        await db.execute(_batch_update(chunk))
+                    await db.commit()
+            except Exception as e:
+                self.stats.failures += 1
+                logger.error(f"Write-behind de sessões: falha ao gravar lote: {e}")
+                self._requeue(batch)
+                return 0
+
+            for session_id in batch:
+                self._attempts.pop(session_id, None)
+            self.stats.flushes += 1
+            self.stats.rows_written += len(batch)
+            return len(batch)
+
+    def _requeue(self, batch: dict[str, Session]) -> None:
+        """Devolve o lote ao buffer, descartando quem esgotou as tentativas."""
+        dropped = []
+        for session_id, session in batch.items():
+            if session_id in self._pending:
+                continue  # já existe versão mais nova (recomeça a contagem)
+
+            attempts = self._attempts.get(session_id, 0) + 1
+            if attempts >= self._max_attempts:
+                self._attempts.pop(session_id, None)
+                dropped.append(session_id)
+                continue
+
+            self._attempts[session_id] = attempts
+            self._pending[session_id] = session
+
+        if dropped:
+            self.stats.dropped += len(dropped)
+            logger.error(
+                f"Write-behind de sessões: {len(dropped)} sessões descartadas "
+                f"após {self._max_attempts} tentativas: {dropped}"
+            )
+
+    async def start(self) -> None:
+        """Inicia a tarefa de gravação periódica."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Para a tarefa periódica e grava o que estiver pendente."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+        if self._pending:
+            logger.error(
+                f"Write-behind de sessões: {len(self._pending)} sessões "
+                "não puderam ser gravadas no shutdown"
+            )
+
+    async def _run(self) -> None:
+        """Grava a cada intervalo, ou antes se o lote encher."""
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self._interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+
+class WriteBehindSessionRepository(ISessionRepository):
+    """
+    Decorator de ISessionRepository com update adiado.
+
+    - update: vai para o buffer (gravação em lote); com db, só
+      depois do COMMIT da transação do turno
+    - save/get_or_create: gravado na hora (sessão nova precisa
+      existir no banco)
+    - buscas: resultado do banco, trocado pela versão pendente
+      (do turno ou do buffer)
+    - delete: descarta a versão pendente e remove no banco
+
+    NOTA: sem o SELECT de conferência, update() de uma sessão que
+    já não existe é ignorado no flush (não levanta ValueError).
+    """
+
+    def __init__(
+        self,
+        inner: ISessionRepository,
+        buffer: SessionWriteBuffer,
+        db: AsyncSession | None = None,
+    ) -> None:
+        """
+        Args:
+            inner: Repositório SQL real
+            buffer: Buffer compartilhado do processo
+            db: Sessão do banco do turno (None = enfileira na hora,
+                sem esperar o COMMIT)
+        """
+        self._inner = inner
+        self._buffer = buffer
+        self._db = db
+
+        # session_id -> versão atualizada pelo turno, ainda sem COMMIT
+        self._uncommitted: dict[str, Session] = {}
+
+    # =========================================================
+    # MÉTODOS DE BUSCA
+    # =========================================================
+
+    async def find_by_id(self, id: str) -> Session | None:
+        """Busca por ID (versão pendente tem prioridade)."""
+        return self._overlay(await self._inner.find_by_id(id))
+
+    async def find_by_customer(self, customer_id: str) -> Session | None:
+        """Busca sessão ativa do cliente (versão pendente tem prioridade)."""
+        return self._overlay(await self._inner.find_by_customer(customer_id))
+
+    async def find_active_by_phone(self, phone: str) -> Session | None:
+        """Busca pelo telefone (versão pendente tem prioridade)."""
+        return self._overlay(await self._inner.find_active_by_phone(phone))
+
+    def _overlay(self, session: Session | None) -> Session | None:
+        """Troca a versão do banco pela pendente (turno ou buffer), se houver."""
+        if session is None:
+            return None
+
+        pending = self._pending(session.id)
+        if pending is None:
+            return session
+        return None if pending.is_expired else pending
+
+    # =========================================================
+    # MÉTODOS DE PERSISTÊNCIA
+    # =========================================================
+
+    async def save(self, session: Session) -> None:
+        """Salva sessão nova imediatamente."""
+        await self._inner.save(session)
+
+    async def get_or_create(self, session: Session) -> tuple[Session, bool]:
+        """Cria imediatamente; a ativa que já existia vem com a versão pendente."""
+        session, created = await self._inner.get_or_create(session)
+        if created:
+            return session, True
+
+        pending = self._pending(session.id)
+        return (session if pending is None else pending), False
+
+    async def update(self, session: Session) -> None:
+        """Enfileira a sessão para a próxima gravação em lote (após o COMMIT)."""
+        if not session.is_dirty:
+            return
+
+        if self._db is None:
+            self._buffer.add(session)
+        else:
+            if not self._uncommitted:
+                after_commit(self._db, self._enqueue_uncommitted)
+                after_rollback(self._db, self._uncommitted.clear)
+            self._uncommitted[session.id] = _clone(session)
+        session.mark_clean()
+
+    async def delete(self, id: str) -> None:
+        """Remove a sessão (e a versão pendente)."""
+        self._uncommitted.pop(id, None)
+        self._buffer.discard(id)
+        await self._inner.delete(id)
+
+    def _pending(self, session_id: str) -> Session | None:
+        """Versão ainda não gravada: a do turno, senão a do buffer."""
+        uncommitted = self._uncommitted.get(session_id)
+        if uncommitted is not None:
+            return _clone(uncommitted)
+        return self._buffer.get(session_id)
+
+    def _enqueue_uncommitted(self) -> None:
+        """COMMIT do turno: as versões atualizadas entram no buffer."""
+        for session in self._uncommitted.values():
+            self._buffer.add(session)
+        self._uncommitted.clear()
+
+    async def delete_expired(self) -> int:
+        """Repassa ao repositório real."""
+        return await self._inner.delete_expired()
+
+    async def count_active(self) -> int:
+        """Repassa ao repositório real."""
+        return await self._inner.count_active()
+
+
+# ===========================================================
+# AUXILIARES
+# ===========================================================
+
+def _clone(session: Session) -> Session:
+    """Cópia independente (contexto incluso) e sem alterações pendentes."""
+    return dataclasses.replace(session, context=copy.deepcopy(session.context))
+
+
+def _to_row(session: Session) -> dict:
+    """
+    Valores do UPDATE de uma sessão (linha inteira, versão final).
+
+    O contexto vai inteiro, não como delta: a versão no buffer junta
+    vários turnos, e o VALUES do lote precisa do mesmo formato para
+    todas as sessões.
+    """
+    return {
+        "id": session.id,
+        "state": session.state,
+        "context": session.context,
+        "expires_at": session.expires_at,
+        "updated_at": session.updated_at,
+    }
+
+
+def _batch_update(rows: list[dict]) -> Update:
+    """
+    UPDATE de várias sessões em um comando (UPDATE ... FROM VALUES).
+
+    O VALUES vai em uma CTE (WITH v(id, ...) AS (VALUES ...)): a
+    lista de nomes de colunas em "AS v (...)" não existe no SQLite.
+    IDs sem linha no banco não casam com o WHERE e são ignorados.
+    """
+    table = SessionModel.__table__
+    batch = (
+        values(*(column(name, table.c[name].type) for name in _COLUMNS), name="v")
+        .data([tuple(row[name] for name in _COLUMNS) for row in rows])
+        .cte("v")
+    )
+    return (
+        update(table)
+        .where(table.c.id == batch.c.id)
+        .values({name: batch.c[name] for name in _COLUMNS[1:]})
+    )
@@ -0,0 +1,173 @@
+# ===========================================================
+# src/infrastructure/database/session_reaper.py
+# ===========================================================
+# Limpeza INCREMENTAL de sessões expiradas (tarefa de fundo).
+#
+# POR QUE NÃO UM ÚNICO DELETE?
+# "DELETE FROM sessions WHERE expires_at <= now()" em uma tabela
+# grande segura locks por muito tempo e gera um pico de I/O.
+#
+# COMO FUNCIONA:
+# 1. A cada interval_seconds, começa uma rodada
+# 2. Cada lote remove até batch_size sessões (índice em
+#    expires_at + LIMIT + SKIP LOCKED), em transação PRÓPRIA
+# 3. Entre lotes, uma pausa curta deixa o banco respirar
+# 4. A rodada termina quando um lote vem incompleto
+#
+# MÉTRICAS:
+# Linhas removidas e latência de cada lote (ReaperStats).
+# ===========================================================
+"""
+Removedor periódico de sessões expiradas.
+
+Uso:
+    reaper = ExpiredSessionReaper(AsyncSessionFactory)
+    await reaper.start()   # no startup
+    await reaper.stop()    # no shutdown
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.repositories.sqlalchemy_session_repository import (
+    SQLAlchemySessionRepository,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReaperStats:
+    """
+    Métricas do removedor.
+
+    Attributes:
+        runs: Rodadas completas
+        batches: Lotes executados
+        rows_reaped: Sessões removidas no total
+        failures: Lotes que falharam
+        last_batch_ms: Latência do último lote
+        max_batch_ms: Maior latência de lote observada
+        total_batch_ms: Soma das latências (para a média)
+    """
+
+    runs: int = 0
+    batches: int = 0
+    rows_reaped: int = 0
+    failures: int = 0
+    last_batch_ms: float = 0.0
+    max_batch_ms: float = 0.0
+    total_batch_ms: float = 0.0
+
+    @property
+    def avg_batch_ms(self) -> float:
+        """Latência média por lote (0.0 sem lotes)."""
+        return self.total_batch_ms / self.batches if self.batches else 0.0
+
+    def record_batch(self, rows: int, elapsed_ms: float) -> None:
+        """Registra um lote concluído."""
+        self.batches += 1
+        self.rows_reaped += rows
+        self.last_batch_ms = elapsed_ms
+        self.max_batch_ms = max(self.max_batch_ms, elapsed_ms)
+        self.total_batch_ms += elapsed_ms
+
+    def as_dict(self) -> dict[str, float]:
+        """Retorna as métricas (e a média) para logs."""
+        return {**asdict(self), "avg_batch_ms": round(self.avg_batch_ms, 2)}
+
+
+class ExpiredSessionReaper:
+    """
+    Tarefa de fundo que remove sessões expiradas em lotes.
+
+    Attributes:
+        stats: Métricas (ver ReaperStats)
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval_seconds: float = 60.0,
+        batch_size: int = 500,
+        pause_seconds: float = 0.05,
+    ) -> None:
+        """
+        Inicializa o removedor.
+
+        Args:
+            session_factory: Cria uma sessão do banco por lote
+            interval_seconds: Espera entre rodadas
+            batch_size: Sessões removidas por lote
+            pause_seconds: Pausa entre lotes da mesma rodada
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size deve ser maior que zero")
+
+        self._session_factory = session_factory
+        self._interval = interval_seconds
+        self._batch_size = batch_size
+        self._pause = pause_seconds
+        self._task: asyncio.Task | None = None
+
+        self.stats = ReaperStats()
+
+    async def run_once(self) -> int:
+        """
+        Executa uma rodada completa (lotes até esvaziar).
+
+        Returns:
+            Sessões removidas nesta rodada
+        """
+        total = 0
+        while True:
+            started = time.perf_counter()
+            async with self._session_factory() as db:
+                deleted = await SQLAlchemySessionRepository(db).delete_expired_batch(
+                    self._batch_size
+                )
+                await db.commit()
+            self.stats.record_batch(deleted, (time.perf_counter() - started) * 1000)
+
+            total += deleted
+            if deleted < self._batch_size:
+                break
+            await asyncio.sleep(self._pause)
+
+        self.stats.runs += 1
+        if total:
+            logger.info(f"🧹 Sessões expiradas removidas: {total}")
+        return total
+
+    async def start(self) -> None:
+        """Inicia a tarefa periódica."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Para a tarefa (um lote em andamento é cancelado e desfeito)."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Laço: rodada, espera, rodada..."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                # Falha pontual (ex: banco indisponível): tenta na próxima
+                self.stats.failures += 1
+                logger.error(f"Limpeza de sessões falhou: {e}")
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,143 @@
+# ===========================================================
+# src/infrastructure/database/transaction_hooks.py
+# ===========================================================
+# Ações que só podem acontecer DEPOIS que a transação termina.
+#
+# POR QUE?
+# Caches e o buffer de write-behind são do processo inteiro, mas
+# as escritas do turno só valem quando a transação do turno faz
+# COMMIT. Guardar no cache (ou enfileirar) logo após o UPDATE:
+# - expõe estado não commitado a outros turnos
+# - mantém esse estado se o turno der ROLLBACK (erro no handler)
+#
+# COMO FUNCIONA:
+# Os repositórios registram callbacks na sessão do banco do turno
+# (session.info). Eventos da Session do SQLAlchemy chamam:
+# - after_commit(): os callbacks de commit, na ordem do registro
+# - after_rollback(): os de rollback (também quando a transação
+#   termina sem commit, ex: sessão fechada no meio)
+# Ao fim da transação, as duas listas são descartadas.
+#
+# CALLBACKS SÃO SÍNCRONOS:
+# Os eventos do SQLAlchemy não podem esperar (await). O trabalho
+# em memória acontece na hora; o que precisa de I/O (Redis) vai
+# para run_soon(), uma tarefa de fundo cujas falhas só geram log.
+# ===========================================================
+"""
+Callbacks de fim de transação para a sessão do turno.
+
+Uso:
+    await repo.update(order)
+    after_commit(db, lambda: cache.discard(order.id))
+    after_rollback(db, lambda: cache.discard(order.id))
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+
+logger = logging.getLogger(__name__)
+
+# Listas de callbacks em session.info
+_ON_COMMIT = "after_commit_callbacks"
+_ON_ROLLBACK = "after_rollback_callbacks"
+
+# Tarefas de run_soon ainda em andamento (referência forte: sem
+# ela, o coletor de lixo poderia cancelar a tarefa no meio)
+_background: set[asyncio.Task] = set()
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Executa `callback` depois do COMMIT da transação atual.
+
+    Args:
+        session: Sessão do banco do turno
+        callback: Função síncrona (I/O: use run_soon dentro dela)
+    """
+    _track_transactions()
+    session.info.setdefault(_ON_COMMIT, []).append(callback)
+
+
+def after_rollback(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Executa `callback` se a transação atual terminar sem COMMIT.
+
+    Args:
+        session: Sessão do banco do turno
+        callback: Função síncrona (I/O: use run_soon dentro dela)
+    """
+    _track_transactions()
+    session.info.setdefault(_ON_ROLLBACK, []).append(callback)
+
+
+def run_soon(work: Awaitable[Any], description: str) -> None:
+    """
+    Executa `work` em uma tarefa de fundo (a partir de um callback).
+
+    Args:
+        work: Corrotina a executar (ex: remoção de chave no Redis)
+        description: Texto do log em caso de falha
+    """
+    task = asyncio.ensure_future(work)
+    _background.add(task)
+
+    def _done(finished: asyncio.Task) -> None:
+        _background.discard(finished)
+        if not finished.cancelled() and finished.exception() is not None:
+            logger.warning(
+                f"⚠️ Falha após a transação ({description}): {finished.exception()}"
+            )
+
+    task.add_done_callback(_done)
+
+
+# ===========================================================
+# EVENTOS DA SESSION
+# ===========================================================
+
+_tracking = False
+
+
+def _track_transactions() -> None:
+    """Liga os eventos de fim de transação (uma vez por processo)."""
+    global _tracking
+    if _tracking:
+        return
+    event.listen(Session, "after_commit", _on_commit)
+    event.listen(Session, "after_transaction_end", _on_transaction_end)
+    _tracking = True
+
+
+def _on_commit(session: Session) -> None:
+    """COMMIT: roda os callbacks de commit e esquece os de rollback."""
+    session.info.pop(_ON_ROLLBACK, None)
+    _run(session.info.pop(_ON_COMMIT, ()))
+
+
+def _on_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    """
+    Fim da transação raiz sem COMMIT (rollback ou fechamento).
+
+    Depois de um commit, _on_commit já esvaziou as listas.
+    Savepoints (transações aninhadas) não contam.
+    """
+    if transaction.parent is not None:
+        return
+    session.info.pop(_ON_COMMIT, None)
+    _run(session.info.pop(_ON_ROLLBACK, ()))
+
+
+def _run(callbacks: list[Callable[[], None]]) -> None:
+    """Chama cada callback; a falha de um não impede os seguintes."""
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"❌ Callback de fim de transação falhou: {e}", exc_info=True)
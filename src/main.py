@@ -26,7 +26,20 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config.settings import get_settings
-from src.presentation.api.routes import webhook_router
+from src.infrastructure.cache import close_redis_client
+from src.infrastructure.database.connection import engine, replica_engine
+from src.presentation.api.dependencies import (
+    get_customer_identity,
+    get_order_cache,
+    get_product_catalog,
+    get_query_stats,
+    get_read_replica,
+    get_session_cache,
+    get_session_context_stats,
+    get_session_reaper,
+    get_session_write_buffer,
+)
+from src.presentation.api.routes import catalog_router, webhook_router
 
 
 # Configuração de logging
@@ -62,10 +75,55 @@ async def lifespan(app: FastAPI):
     
     # TODO: Verificar conexões com banco/redis
     
+    if settings.session_cache_enabled:
+        await get_session_cache().start()
+    
+    if settings.customer_identity_enabled:
+        await get_customer_identity().start()
+    
+    if settings.product_catalog_enabled:
+        await get_product_catalog().start()
+    
+    write_behind = (
+        settings.session_write_behind_enabled and settings.session_backend == "sql"
+    )
+    if write_behind:
+        await get_session_write_buffer().start()
+    
+    reaper = settings.session_reaper_enabled and settings.session_backend == "sql"
+    if reaper:
+        await get_session_reaper().start()
+    
     yield  # Aplicação rodando
     
     # === SHUTDOWN ===
     logger.info("👋 Encerrando aplicação...")
+    if reaper:
+        await get_session_reaper().stop()
+        logger.info(f"📊 Limpeza de sessões: {get_session_reaper().stats.as_dict()}")
+    if write_behind:
+        # Antes de tudo: grava as sessões pendentes
+        await get_session_write_buffer().stop()
+        logger.info(f"📊 Write-behind de sessões: {get_session_write_buffer().stats}")
+    if settings.session_backend == "sql":
+        logger.info(f"📊 Contexto das sessões: {get_session_context_stats().as_dict()}")
+    logger.info(f"📊 Cache de pedidos: {get_order_cache().stats.as_dict()}")
+    logger.info(f"📊 Comandos SQL por mensagem: {get_query_stats().as_dict()}")
+    logger.info(f"📊 Pool de conexões: {engine.pool.metrics()}")
+    if replica_engine is not None:
+        logger.info(f"📊 Réplica de leitura: {get_read_replica().stats.as_dict()}")
+        logger.info(f"📊 Pool da réplica: {replica_engine.pool.metrics()}")
+    if settings.customer_identity_enabled:
+        identity = get_customer_identity()
+        await identity.stop()
+        logger.info(f"📊 Identidade de clientes: {identity.stats.as_dict()}")
+    if settings.product_catalog_enabled:
+        await get_product_catalog().stop()
+        logger.info(f"📊 Catálogo de produtos: {get_product_catalog().stats.as_dict()}")
+    if settings.session_cache_enabled:
+        await get_session_cache().stop()
+        logger.info(f"📊 Cache de sessões: {get_session_cache().stats.as_dict()}")
+    await close_redis_client()
 
 
 # ===========================================================
@@ -151,6 +209,7 @@ async def root():
 
 # Registrar routers
 app.include_router(webhook_router)
+app.include_router(catalog_router)
 
 
 # ===========================================================
@@ -23,16 +23,42 @@ Centraliza a criação de repositórios e handlers.
 Usa implementações SQLAlchemy reais para produção.
 """
 
+from functools import lru_cache
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.database.connection import AsyncSessionFactory
+from src.config.settings import get_settings
+from src.infrastructure.cache import (
+    CachedCustomerRepository,
+    CachedOrderRepository,
+    CachedProductRepository,
+    CachedSessionRepository,
+    CustomerIdentityMap,
+    OrderCache,
+    ProductCatalog,
+    RedisSessionRepository,
+    SessionCache,
+    SessionInvalidationBus,
+    get_redis_client,
+)
+from src.infrastructure.database.catalog_source import SQLAlchemyCatalogSource
+from src.infrastructure.database.connection import (
+    AsyncSessionFactory,
+    ReplicaSessionFactory,
+)
+from src.infrastructure.database.phone_source import SQLAlchemyPhoneSource
+from src.infrastructure.database.query_stats import QueryStats
+from src.infrastructure.database.replica import ReadReplicaRouter
+from src.infrastructure.database.session_reaper import ExpiredSessionReaper
 from src.infrastructure.database.repositories import (
     SQLAlchemyCustomerRepository,
     SQLAlchemyProductRepository,
     SQLAlchemyOrderRepository,
     SQLAlchemySessionRepository,
+    SessionContextStats,
+    SessionWriteBuffer,
+    WriteBehindSessionRepository,
 )
 from src.domain.repositories import (
     ICustomerRepository,
@@ -66,6 +92,143 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+# ===========================================================
+# CACHES (uma instância por processo)
+# ===========================================================
+
+@lru_cache
+def get_order_cache() -> OrderCache:
+    """
+    Retorna o cache de pedidos do processo.
+
+    Os repositórios são criados a cada request, mas o cache
+    precisa sobreviver entre requests: por isso é um singleton.
+    """
+    settings = get_settings()
+    redis_enabled = settings.order_cache_redis_enabled
+    local_ttl = settings.order_cache_local_ttl_seconds if redis_enabled else None
+    return OrderCache(
+        ttl_seconds=settings.order_cache_ttl_seconds,
+        negative_ttl_seconds=settings.order_cache_negative_ttl_seconds,
+        max_entries=settings.order_cache_max_entries,
+        redis=get_redis_client() if redis_enabled else None,
+        local_ttl_seconds=local_ttl,
+    )
+
+
+@lru_cache
+def get_customer_identity() -> CustomerIdentityMap:
+    """
+    Retorna a identidade de clientes (telefone -> ID) do processo.
+
+    A carga do filtro e a sincronização usam sessões próprias
+    do banco (tarefa de fundo, fora dos requests).
+    """
+    settings = get_settings()
+    return CustomerIdentityMap(
+        SQLAlchemyPhoneSource(AsyncSessionFactory),
+        max_entries=settings.customer_identity_max_entries,
+        ttl_seconds=settings.customer_identity_ttl_seconds,
+        bloom_capacity=settings.customer_identity_bloom_capacity,
+        sync_interval_seconds=settings.customer_identity_sync_seconds,
+    )
+
+
+@lru_cache
+def get_session_cache() -> SessionCache:
+    """
+    Retorna o cache de sessões do processo.
+
+    Com SESSION_CACHE_PUBSUB_ENABLED, as escritas são avisadas
+    aos outros workers pelo Redis.
+    """
+    settings = get_settings()
+    bus = (
+        SessionInvalidationBus(get_redis_client())
+        if settings.session_cache_pubsub_enabled
+        else None
+    )
+    return SessionCache(
+        ttl_seconds=settings.session_cache_ttl_seconds,
+        max_entries=settings.session_cache_max_entries,
+        max_bytes=settings.session_cache_max_bytes,
+        bus=bus,
+    )
+
+
+@lru_cache
+def get_product_catalog() -> ProductCatalog:
+    """
+    Retorna o catálogo de produtos em memória do processo.
+
+    A carga e a verificação de versão usam sessões próprias
+    do banco (tarefa de fundo, fora dos requests).
+    """
+    return ProductCatalog(
+        SQLAlchemyCatalogSource(AsyncSessionFactory),
+        refresh_interval_seconds=get_settings().product_catalog_refresh_seconds,
+    )
+
+
+@lru_cache
+def get_session_write_buffer() -> SessionWriteBuffer:
+    """
+    Retorna o buffer de write-behind de sessões do processo.
+
+    Usa sessões próprias do banco (não a do request): o flush
+    acontece fora do ciclo de qualquer request.
+    """
+    settings = get_settings()
+    return SessionWriteBuffer(
+        AsyncSessionFactory,
+        flush_interval_ms=settings.session_write_behind_interval_ms,
+        max_batch=settings.session_write_behind_max_batch,
+        max_attempts=settings.session_write_behind_max_attempts,
+    )
+
+
+@lru_cache
+def get_session_context_stats() -> SessionContextStats:
+    """Retorna as métricas de gravação do contexto das sessões do processo."""
+    return SessionContextStats()
+
+
+@lru_cache
+def get_query_stats() -> QueryStats:
+    """Retorna as métricas de comandos SQL por mensagem do processo."""
+    return QueryStats()
+
+
+@lru_cache
+def get_read_replica() -> ReadReplicaRouter | None:
+    """
+    Retorna o roteador de leituras para a réplica (None sem réplica).
+
+    Um por processo: a medição de atraso e o estado da réplica
+    valem para todos os requests.
+    """
+    if ReplicaSessionFactory is None:
+        return None
+    settings = get_settings()
+    return ReadReplicaRouter(
+        ReplicaSessionFactory,
+        max_lag_seconds=settings.database_replica_max_lag_seconds,
+        check_seconds=settings.database_replica_check_seconds,
+    )
+
+
+@lru_cache
+def get_session_reaper() -> ExpiredSessionReaper:
+    """Retorna o removedor de sessões expiradas do processo."""
+    settings = get_settings()
+    return ExpiredSessionReaper(
+        AsyncSessionFactory,
+        interval_seconds=settings.session_reaper_interval_seconds,
+        batch_size=settings.session_reaper_batch_size,
+        pause_seconds=settings.session_reaper_pause_ms / 1000,
+    )
+
+
 # ===========================================================
 # REPOSITÓRIOS (Implementações reais SQLAlchemy)
 # ===========================================================
@@ -73,29 +236,93 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
 async def get_customer_repository(
     session: AsyncSession,
 ) -> ICustomerRepository:
-    """Cria repositório de clientes."""
-    return SQLAlchemyCustomerRepository(session)
+    """
+    Cria repositório de clientes.
+
+    Com CUSTOMER_IDENTITY_ENABLED, telefone -> ID vem da
+    identidade em memória (cache + filtro de Bloom).
+    """
+    repo: ICustomerRepository = SQLAlchemyCustomerRepository(session)
+    if get_settings().customer_identity_enabled:
+        repo = CachedCustomerRepository(repo, get_customer_identity())
+    return repo
 
 
 async def get_product_repository(
     session: AsyncSession,
 ) -> IProductRepository:
-    """Cria repositório de produtos."""
-    return SQLAlchemyProductRepository(session)
+    """
+    Cria repositório de produtos.
+
+    Com PRODUCT_CATALOG_ENABLED, as leituras vêm do snapshot
+    do catálogo em memória. Com DATABASE_REPLICA_URL, as buscas
+    que chegam ao banco vão para a réplica.
+    """
+    settings = get_settings()
+
+    repo: IProductRepository = SQLAlchemyProductRepository(
+        session,
+        fuzzy_fallback=settings.product_search_fuzzy_enabled,
+        replica=get_read_replica(),
+    )
+    if settings.product_catalog_enabled:
+        repo = CachedProductRepository(repo, get_product_catalog())
+    return repo
 
 
 async def get_order_repository(
     session: AsyncSession,
 ) -> IOrderRepository:
-    """Cria repositório de pedidos."""
-    return SQLAlchemyOrderRepository(session)
+    """
+    Cria repositório de pedidos (com cache de consulta e réplica).
+
+    As listas podem vir da réplica; as buscas que alimentam o
+    cache de pedidos vêm sempre do primário (loader).
+    """
+    return CachedOrderRepository(
+        SQLAlchemyOrderRepository(session, replica=get_read_replica()),
+        get_order_cache(),
+        db=session,
+        loader=SQLAlchemyOrderRepository(session),
+    )
 
 
 async def get_session_repository(
     session: AsyncSession,
 ) -> ISessionRepository:
-    """Cria repositório de sessões de chat."""
-    return SQLAlchemySessionRepository(session)
+    """
+    Cria repositório de sessões de chat.
+
+    SESSION_BACKEND escolhe onde as sessões ficam:
+    - "sql": tabela sessions no PostgreSQL
+    - "redis": hash por cliente, expirado pelo próprio Redis
+
+    Com SESSION_WRITE_BEHIND_ENABLED (sql), os updates são gravados
+    em lote. Com SESSION_CACHE_ENABLED, o backend ganha um cache
+    em memória.
+    """
+    settings = get_settings()
+
+    repo: ISessionRepository
+    if settings.session_backend == "redis":
+        repo = RedisSessionRepository(
+            get_redis_client(),
+            await get_customer_repository(session),
+        )
+    else:
+        repo = SQLAlchemySessionRepository(
+            session,
+            replica=get_read_replica(),
+            context_stats=get_session_context_stats(),
+        )
+        if settings.session_write_behind_enabled:
+            repo = WriteBehindSessionRepository(
+                repo, get_session_write_buffer(), db=session
+            )
+
+    if settings.session_cache_enabled:
+        repo = CachedSessionRepository(repo, get_session_cache(), db=session)
+    return repo
 
 
 # ===========================================================
@@ -110,10 +337,10 @@ async def get_handle_message_use_case(
     com todas as dependências reais.
     """
     return HandleMessageUseCase(
-        customer_repo=SQLAlchemyCustomerRepository(session),
-        session_repo=SQLAlchemySessionRepository(session),
-        product_repo=SQLAlchemyProductRepository(session),
-        order_repo=SQLAlchemyOrderRepository(session),
+        customer_repo=await get_customer_repository(session),
+        session_repo=await get_session_repository(session),
+        product_repo=await get_product_repository(session),
+        order_repo=await get_order_repository(session),
     )
 
 
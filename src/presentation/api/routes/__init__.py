@@ -6,10 +6,13 @@ Rotas da API FastAPI.
 
 Exporta:
 - webhook_router: Endpoints do webhook do WhatsApp
+- catalog_router: Importação do catálogo (admin)
 """
 
+from src.presentation.api.routes.catalog import router as catalog_router
 from src.presentation.api.routes.webhook import router as webhook_router
 
 __all__ = [
     "webhook_router",
+    "catalog_router",
 ]
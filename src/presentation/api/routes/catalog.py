@@ -0,0 +1,123 @@
+# ===========================================================
+# src/presentation/api/routes/catalog.py
+# ===========================================================
+# Endpoint administrativo de importação do catálogo.
+#
+# POST /admin/catalog/import
+#   Header X-Admin-Token: ADMIN_API_TOKEN do .env
+#   Corpo: o arquivo inteiro (CSV com cabeçalho ou JSONL),
+#   lido em pedaços direto do request (sem multipart, sem
+#   carregar o arquivo na memória)
+#
+# Exemplo:
+#   curl -X POST "http://localhost:8000/admin/catalog/import" \
+#        -H "X-Admin-Token: $ADMIN_API_TOKEN" \
+#        -H "Content-Type: text/csv" \
+#        --data-binary @catalogo.csv
+#
+# Sem ADMIN_API_TOKEN configurado, o endpoint não existe (404).
+# ===========================================================
+"""
+Endpoints administrativos do catálogo de produtos.
+"""
+
+import hmac
+import logging
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+
+from src.infrastructure.database.catalog_import import CatalogFormat, CatalogImporter
+
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin/catalog", tags=["Catálogo"])
+
+# Content-Type -> formato (quando ?format= não é informado)
+_FORMATS: dict[str, CatalogFormat] = {
+    "text/csv": "csv",
+    "application/x-ndjson": "jsonl",
+    "application/jsonl": "jsonl",
+    "application/jsonlines": "jsonl",
+}
+
+
+@router.post("/import")
+async def import_catalog(
+    request: Request,
+    format: CatalogFormat | None = Query(None),
+    deactivate_missing: bool = Query(True),
+    x_admin_token: str | None = Header(None),
+) -> dict:
+    """
+    Sincroniza os produtos com o arquivo enviado.
+
+    Produtos novos são criados, os alterados são atualizados e
+    os que têm SKU mas não vieram no arquivo são desativados
+    (deactivate_missing=false para importações parciais).
+
+    Args:
+        request: Requisição FastAPI (corpo = arquivo)
+        format: "csv" ou "jsonl" (padrão: pelo Content-Type)
+        deactivate_missing: Desativa SKUs ausentes do arquivo
+        x_admin_token: Token administrativo
+
+    Returns:
+        Contagens da importação (ver CatalogImportResult)
+
+    Raises:
+        HTTPException 404: Endpoint desabilitado (sem token configurado)
+        HTTPException 401: Token ausente ou inválido
+        HTTPException 415: Formato não reconhecido
+        HTTPException 422: Arquivo ilegível (encoding, cabeçalho)
+    """
+    from src.config.settings import get_settings
+    from src.infrastructure.database.connection import AsyncSessionFactory
+    from src.presentation.api.dependencies import get_product_catalog
+
+    settings = get_settings()
+
+    if not settings.admin_api_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    # SEGURANCA: comparação em tempo constante
+    if not x_admin_token or not hmac.compare_digest(
+        x_admin_token.encode(), settings.admin_api_token.encode()
+    ):
+        logger.warning("SECURITY: Invalid admin token on catalog import")
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    if format is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip()
+        format = _FORMATS.get(content_type.lower())
+        if format is None:
+            raise HTTPException(
+                status_code=415, detail="Use text/csv or application/x-ndjson"
+            )
+
+    async with AsyncSessionFactory() as session:
+        try:
+            result = await CatalogImporter(session).run(
+                request.stream(),
+                format,
+                deactivate_missing=deactivate_missing,
+            )
+            await session.commit()
+        except ValueError as e:
+            await session.rollback()
+            raise HTTPException(status_code=422, detail=str(e))
+        except Exception:
+            await session.rollback()
+            raise
+
+    logger.info(
+        f"📦 Catálogo importado: {result.inserted} novos, {result.updated} alterados, "
+        f"{result.deactivated} desativados, {result.rejected} rejeitados "
+        f"em {result.seconds}s"
+    )
+
+    # Este worker reconstrói o snapshot já; os outros percebem a
+    # nova versão na próxima verificação
+    if settings.product_catalog_enabled:
+        await get_product_catalog().refresh()
+
+    return result.as_dict()
@@ -161,48 +161,58 @@ async def process_message(message_data: dict[str, Any]) -> None:
     Chamado via BackgroundTasks para não bloquear
     a resposta ao WhatsApp.
 
+    Os comandos SQL da mensagem (quantidade, linhas e tempo) vão
+    para o log e para as métricas do processo (get_query_stats).
+
     Args:
         message_data: Dados extraídos da mensagem
     """
     from src.infrastructure.database.connection import AsyncSessionFactory
-    from src.presentation.api.dependencies import get_message_handler
+    from src.infrastructure.database.query_stats import track_statements
+    from src.presentation.api.dependencies import get_message_handler, get_query_stats
 
     # Log SEM dados sensiveis (telefone parcialmente oculto)
     phone = message_data.get('from', '')
     masked_phone = phone[:4] + '****' + phone[-2:] if len(phone) > 6 else '****'
     logger.info(f"Processing message from {masked_phone}")
 
-    try:
-        # Cria sessão do banco para este processamento
-        logger.info("📊 Creating database session...")
-        async with AsyncSessionFactory() as session:
-            try:
-                # Usa o handler com a sessão real do banco
-                logger.info("🔧 Getting message handler...")
-                handler = await get_message_handler(session)
-                logger.info("✅ Handler obtained successfully")
-
-                # Verifica se é resposta de botão
-                if message_data.get("button_id"):
-                    logger.info("🔘 Processing button reply...")
-                    await handler.handle_button_reply(
-                        phone=message_data.get("from", ""),
-                        button_id=message_data["button_id"],
-                        message_id=message_data.get("message_id"),
-                    )
-                else:
-                    logger.info("💬 Processing text message...")
-                    await handler.handle(message_data)
-
-                # Commit das alterações no banco
-                logger.info("💾 Committing to database...")
-                await session.commit()
-                logger.info("✅ Message processed successfully!")
-
-            except Exception as e:
-                logger.error(f"❌ Error in handler: {e}", exc_info=True)
-                await session.rollback()
-                raise
-
-    except Exception as e:
-        logger.error(f"❌ Error processing message: {e}", exc_info=True)
+    # Comandos SQL, linhas e tempo de banco desta mensagem
+    with track_statements() as usage:
+        try:
+            # Cria sessão do banco para este processamento
+            logger.info("📊 Creating database session...")
+            async with AsyncSessionFactory() as session:
+                try:
+                    # Usa o handler com a sessão real do banco
+                    logger.info("🔧 Getting message handler...")
+                    handler = await get_message_handler(session)
+                    logger.info("✅ Handler obtained successfully")
+
+                    # Verifica se é resposta de botão
+                    if message_data.get("button_id"):
+                        logger.info("🔘 Processing button reply...")
+                        await handler.handle_button_reply(
+                            phone=message_data.get("from", ""),
+                            button_id=message_data["button_id"],
+                            message_id=message_data.get("message_id"),
+                        )
+                    else:
+                        logger.info("💬 Processing text message...")
+                        await handler.handle(message_data)
+
+                    # Commit das alterações no banco
+                    logger.info("💾 Committing to database...")
+                    await session.commit()
+                    logger.info("✅ Message processed successfully!")
+
+                except Exception as e:
+                    logger.error(f"❌ Error in handler: {e}", exc_info=True)
+                    await session.rollback()
+                    raise
+
+        except Exception as e:
+            logger.error(f"❌ Error processing message: {e}", exc_info=True)
+
+    get_query_stats().record(usage)
+    sql_usage = usage.as_dict()
+    logger.info(f"📊 SQL da mensagem: {sql_usage}", extra={"sql": sql_usage})
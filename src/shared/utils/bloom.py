@@ -0,0 +1,124 @@
+# ===========================================================
+# src/shared/utils/bloom.py
+# ===========================================================
+# Filtro de Bloom: "este item com certeza NÃO está no conjunto?"
+#
+# COMO FUNCIONA:
+# Um vetor de m bits, todos zerados. Para adicionar um item,
+# k funções de hash escolhem k posições e ligam esses bits.
+# Para consultar, olha as mesmas k posições:
+#   - algum bit desligado -> o item NUNCA foi adicionado
+#   - todos ligados       -> PROVAVELMENTE foi (pode ser
+#                            coincidência: falso positivo)
+#
+# Não há falso negativo, e não dá para remover itens.
+#
+# TAMANHO:
+# Para n itens e taxa de falso positivo p:
+#   m = -n * ln(p) / ln(2)^2     k = m / n * ln(2)
+# 1 milhão de telefones com p = 0,1%: ~1,8 MB e k = 10.
+# Passar de n itens não quebra o filtro, só aumenta p.
+#
+# HASH:
+# Um único blake2b de 128 bits dá dois valores de 64 bits
+# (h1, h2); as k posições são h1 + i * h2 (Kirsch-Mitzenmacher),
+# sem calcular k hashes diferentes.
+# ===========================================================
+"""
+Filtro de Bloom para textos.
+
+Uso:
+    known = BloomFilter(capacity=1_000_000, error_rate=0.001)
+    known.add("5511999999999")
+    "5511999999999" in known  # True
+    "5511000000000" in known  # False (com certeza não adicionado)
+"""
+
+import hashlib
+import math
+from collections.abc import Iterable
+
+
+_LOW_64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """
+    Conjunto probabilístico: sem falsos negativos, com poucos
+    falsos positivos.
+
+    Attributes:
+        capacity: Itens previstos no dimensionamento
+        error_rate: Taxa de falso positivo prevista para capacity itens
+    """
+
+    __slots__ = ("capacity", "error_rate", "_bits", "_size", "_hashes", "_count")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """
+        Dimensiona o filtro.
+
+        Args:
+            capacity: Quantidade de itens prevista
+            error_rate: Taxa de falso positivo aceita (0 < p < 1)
+
+        Raises:
+            ValueError: Se capacity ou error_rate estiverem fora da faixa
+        """
+        if capacity <= 0:
+            raise ValueError("capacity deve ser maior que zero")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate deve estar entre 0 e 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Itens adicionados (repetidos contam de novo)."""
+        return self._count
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        size = self._size
+        position, step = self._hash(item)
+        for _ in range(self._hashes):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position += step
+            if position >= size:
+                position -= size
+        return True
+
+    @property
+    def size_bytes(self) -> int:
+        """Memória do vetor de bits."""
+        return len(self._bits)
+
+    def add(self, item: str) -> None:
+        """Adiciona um item."""
+        bits = self._bits
+        size = self._size
+        position, step = self._hash(item)
+        for _ in range(self._hashes):
+            bits[position >> 3] |= 1 << (position & 7)
+            position += step
+            if position >= size:
+                position -= size
+        self._count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        """Adiciona vários itens (ex: um lote, numa thread)."""
+        for item in items:
+            self.add(item)
+
+    def _hash(self, item: str) -> tuple[int, int]:
+        """
+        (h1, h2) já reduzidos ao tamanho m: a posição i é
+        h1 + i * h2 (módulo m), somando sem multiplicar.
+        """
+        value = int.from_bytes(hashlib.blake2b(item.encode(), digest_size=16).digest())
+        return (value >> 64) % self._size, ((value & _LOW_64) | 1) % self._size
@@ -0,0 +1,131 @@
+# ===========================================================
+# src/shared/utils/ids.py
+# ===========================================================
+# Geração de IDs ordenados por tempo (UUID versão 7, RFC 9562).
+#
+# POR QUE NÃO uuid4?
+# O uuid4 é 100% aleatório. Como chave primária, cada INSERT cai
+# em um ponto qualquer do índice B-tree: páginas se dividem pela
+# metade, o índice incha e o cache do banco rende menos.
+#
+# UUIDv7:
+#   48 bits  timestamp em milissegundos  -> IDs novos vão para o
+#                                           FIM do índice
+#    4 bits  versão (7)
+#   12 bits  contador dentro do mesmo milissegundo
+#    2 bits  variante
+#   62 bits  aleatórios                   -> continua imprevisível
+#
+# Continua sendo um UUID válido (coluna UUID nativa do
+# PostgreSQL, 16 bytes em vez dos 36 do texto).
+#
+# TEXTO:
+# As entidades guardam o ID como str (chaves de Redis, caches e
+# DTOs). new_id() monta o texto direto dos 16 bytes, sem criar
+# um objeto uuid.UUID no caminho.
+# ===========================================================
+"""
+Geração de IDs UUIDv7.
+
+Uso:
+    from src.shared.utils.ids import new_id
+
+    id = new_id()  # "0192b6f0-8a3c-7d21-9f4e-3b0c5a1d2e7f"
+"""
+
+import os
+import time
+import uuid
+
+
+# Último milissegundo usado e contador dentro dele
+_last_ms = 0
+_counter = 0
+
+# Valor inicial do contador fica na metade de baixo (11 bits),
+# deixando espaço para ~2000 IDs no mesmo milissegundo
+_COUNTER_SEED_MASK = 0x7FF
+_COUNTER_MAX = 0xFFF
+
+_VERSION = 0x7 << 76
+_VARIANT = 0b10 << 62
+_RAND_B_MASK = (1 << 62) - 1
+
+
+def _uuid7_int() -> int:
+    """
+    Próximo UUIDv7 como inteiro de 128 bits.
+
+    Monotônico dentro do processo: no mesmo milissegundo o
+    contador sobe; se estourar, avança o timestamp em 1 ms.
+    """
+    global _last_ms, _counter
+
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms > _last_ms:
+        _last_ms = now_ms
+        _counter = int.from_bytes(os.urandom(2)) & _COUNTER_SEED_MASK
+    else:
+        # Mesmo milissegundo (ou relógio voltou): mantém a ordem
+        _counter += 1
+        if _counter > _COUNTER_MAX:
+            _last_ms += 1
+            _counter = 0
+
+    rand_b = int.from_bytes(os.urandom(8)) & _RAND_B_MASK
+    return (_last_ms << 80) | _VERSION | (_counter << 64) | _VARIANT | rand_b
+
+
+def uuid7() -> uuid.UUID:
+    """Novo UUIDv7 (objeto uuid.UUID)."""
+    return uuid.UUID(int=_uuid7_int())
+
+
+def new_id() -> str:
+    """
+    Novo UUIDv7 no formato texto canônico (36 caracteres).
+
+    Usado como default_factory dos IDs das entidades.
+
+    Example:
+        >>> a, b = new_id(), new_id()
+        >>> a < b
+        True
+    """
+    h = _uuid7_int().to_bytes(16).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def uuid7_timestamp(value: str | uuid.UUID) -> float:
+    """
+    Instante (epoch, em segundos) embutido em um UUIDv7.
+
+    Útil para depuração: "quando esta sessão foi criada?".
+    """
+    if isinstance(value, uuid.UUID):
+        as_int = value.int
+    else:
+        as_int = int(value.replace("-", ""), 16)
+    return (as_int >> 80) / 1000
+
+
+def canonical_id(value: str) -> str:
+    """
+    Valida um ID vindo de fora (ex: cursor de paginação) e o
+    devolve no texto canônico.
+
+    Raises:
+        ValueError: Se não for um UUID
+    """
+    return str(uuid.UUID(value))
+
+
+def uuid7_floor(timestamp: float) -> str:
+    """
+    Menor ID possível do instante (epoch, em segundos).
+
+    Todo UUIDv7 gerado a partir desse instante é maior: serve de
+    limite em consultas por faixa de ID ("criados desde ...").
+    """
+    h = (int(timestamp * 1000) << 80).to_bytes(16).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
@@ -0,0 +1,115 @@
+# ===========================================================
+# src/shared/utils/pagination.py
+# ===========================================================
+# Paginação por cursor (keyset) para listas da API.
+#
+# POR QUE NÃO OFFSET?
+# "LIMIT 50 OFFSET 100000" lê e descarta 100 mil linhas antes de
+# devolver as 50: cada página fica mais lenta que a anterior, e
+# uma linha inserida no meio faz itens pularem ou repetirem.
+#
+# KEYSET:
+# A página seguinte começa DEPOIS da última linha vista, pela
+# mesma ordem do índice: "WHERE id > :ultimo ORDER BY id LIMIT 50".
+# Toda página custa o mesmo, seja a primeira ou a milésima.
+#
+# CURSOR:
+# Os valores da última linha (ex: created_at e id) viram um texto
+# opaco (JSON em base64 url-safe). O cliente só devolve o texto
+# recebido em next_cursor; None = não há mais páginas.
+# ===========================================================
+"""
+Página de resultados com cursor para a próxima.
+
+Uso:
+    page = await repo.find_page(limit=50)
+    while page.next_cursor:
+        page = await repo.find_page(page.next_cursor, limit=50)
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+
+T = TypeVar("T")
+
+# Maior página aceita (protege a API de "limit=1000000")
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True, slots=True)
+class Page(Generic[T]):
+    """
+    Uma página de resultados.
+
+    Attributes:
+        items: Itens da página, na ordem da consulta
+        next_cursor: Cursor da próxima página (None na última)
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def check_limit(limit: int) -> None:
+    """
+    Valida o tamanho da página.
+
+    Raises:
+        ValueError: Se limit estiver fora de 1..MAX_PAGE_SIZE
+    """
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"Tamanho de página deve estar entre 1 e {MAX_PAGE_SIZE}")
+
+
+def page_of(
+    rows: Sequence[T],
+    limit: int,
+    cursor_values: Callable[[T], Sequence[str]],
+) -> Page[T]:
+    """
+    Monta a página a partir de uma consulta feita com LIMIT limit + 1.
+
+    A linha extra só indica que existe uma próxima página; ela
+    não é devolvida.
+
+    Args:
+        rows: Até limit + 1 itens
+        limit: Tamanho da página
+        cursor_values: Valores de ordenação de um item (para o cursor)
+    """
+    if len(rows) <= limit:
+        return Page(list(rows))
+    items = list(rows[:limit])
+    return Page(items, encode_cursor(*cursor_values(items[-1])))
+
+
+def encode_cursor(*values: str) -> str:
+    """Valores de ordenação -> texto opaco."""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, *converters: Callable[[str], Any]) -> list[Any]:
+    """
+    Texto opaco -> valores de ordenação.
+
+    Args:
+        cursor: Texto recebido em next_cursor
+        converters: Um por valor esperado (ex: datetime.fromisoformat)
+
+    Raises:
+        ValueError: Cursor adulterado ou de outra listagem
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(converters):
+            raise ValueError(cursor)
+        return [convert(str(value)) for convert, value in zip(converters, values)]
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Cursor de paginação inválido") from None
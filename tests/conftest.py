@@ -0,0 +1,47 @@
+# ===========================================================
+# tests/conftest.py
+# ===========================================================
+# Fixtures compartilhadas por todas as pastas de testes.
+#
+# ORÇAMENTO DE COMANDOS SQL:
+# statement_budget(n) mede os comandos SQL do bloco (mesmo
+# track_statements() do webhook) e falha o teste se passar de n.
+# A engine usada no teste precisa de instrument_engine(engine).
+# ===========================================================
+"""
+Fixtures globais dos testes.
+
+Uso:
+    async def test_turno(statement_budget, ...):
+        with statement_budget(3):
+            await use_case.execute(dto)
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
+
+from src.infrastructure.database.query_stats import StatementUsage, track_statements
+
+
+@pytest.fixture
+def statement_budget() -> Callable[[int], AbstractContextManager[StatementUsage]]:
+    """
+    Falha o teste se o bloco passar do orçamento de comandos SQL.
+
+    Returns:
+        Fábrica de context managers: statement_budget(max_statements)
+    """
+
+    @contextmanager
+    def budget(max_statements: int) -> Iterator[StatementUsage]:
+        with track_statements() as usage:
+            yield usage
+        if usage.statements > max_statements:
+            pytest.fail(
+                f"{usage.statements} comandos SQL, orçamento de {max_statements} "
+                f"({usage.as_dict()})"
+            )
+
+    return budget
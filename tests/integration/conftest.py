@@ -0,0 +1,148 @@
+# ===========================================================
+# tests/integration/conftest.py
+# ===========================================================
+# Banco PostgreSQL REAL para os testes de integração.
+#
+# BANCO:
+# Os testes que usam as fixtures abaixo só rodam com
+# TEST_DATABASE_URL (e TEST_REPLICA_DATABASE_URL, para os de
+# réplica); sem elas, são pulados. O esquema é APAGADO e recriado
+# pelas migrações do Alembic (001 -> head) uma vez por execução,
+# e as tabelas são esvaziadas antes de cada teste: nunca aponte
+# para um banco real.
+#   TEST_DATABASE_URL=postgresql+asyncpg://.../chatbot_test pytest tests/integration
+#
+# POR QUE MIGRAÇÕES (E NÃO create_all)?
+# O esquema testado é o de produção: índices parciais, constraints
+# e tipos criados pelas migrações (ex: 005, 006, 008, 009), e não
+# só o que os models declaram. Bancos de teste antigos também
+# deixam de precisar de DROP manual quando uma coluna muda.
+#
+# ENGINE:
+# A fixture engine usa as opções de engine_options(); módulos que
+# precisam de outro pool (ex: concorrência) sobrescrevem a fixture.
+# ===========================================================
+"""
+Fixtures dos testes de integração (PostgreSQL).
+
+Uso:
+    async def test_algo(engine):
+        async with AsyncSession(engine) as db:
+            ...
+
+    @pytest.fixture
+    def engine_options() -> dict[str, Any]:
+        return {"pool_size": 40, "max_overflow": 0}
+"""
+
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Connection, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.infrastructure.database.models import Base
+
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+TEST_REPLICA_DATABASE_URL = os.environ.get("TEST_REPLICA_DATABASE_URL")
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+
+# ===========================================================
+# ESQUEMA
+# ===========================================================
+
+def _upgrade(connection: Connection) -> None:
+    """
+    Apaga o esquema public e roda as migrações até head.
+
+    A conexão fica fora de transação: o Alembic abre as suas
+    (migrações com CREATE INDEX CONCURRENTLY fazem COMMIT no meio).
+    """
+    connection.execute(text("DROP SCHEMA public CASCADE"))
+    connection.execute(text("CREATE SCHEMA public"))
+    connection.commit()
+
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    config.attributes["connection"] = connection
+    command.upgrade(config, "head")
+
+
+async def _migrate(url: str) -> None:
+    engine = create_async_engine(url, poolclass=NullPool)
+    try:
+        async with engine.connect() as conn:
+            await conn.run_sync(_upgrade)
+    finally:
+        await engine.dispose()
+
+
+async def _truncate(engine: AsyncEngine) -> None:
+    """Esvazia todas as tabelas dos models."""
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} CASCADE"))
+
+
+# ===========================================================
+# FIXTURES
+# ===========================================================
+
+@pytest.fixture(scope="session")
+def database_url() -> str:
+    """URL do banco de teste (pula o teste sem TEST_DATABASE_URL)."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL não definido (precisa de PostgreSQL)")
+    return TEST_DATABASE_URL
+
+
+@pytest.fixture(scope="session")
+def migrated_database_url(database_url: str) -> str:
+    """URL do banco de teste com o esquema das migrações (uma vez por execução)."""
+    asyncio.run(_migrate(database_url))
+    return database_url
+
+
+@pytest.fixture(scope="session")
+def replica_database_url() -> str:
+    """URL do banco que faz papel de réplica, já migrado."""
+    if not TEST_REPLICA_DATABASE_URL:
+        pytest.skip("TEST_REPLICA_DATABASE_URL não definido (precisa de PostgreSQL)")
+    asyncio.run(_migrate(TEST_REPLICA_DATABASE_URL))
+    return TEST_REPLICA_DATABASE_URL
+
+
+@pytest.fixture
+def engine_options() -> dict[str, Any]:
+    """Opções de create_async_engine para a fixture engine."""
+    return {}
+
+
+@pytest.fixture
+async def engine(
+    migrated_database_url: str, engine_options: dict[str, Any]
+) -> AsyncIterator[AsyncEngine]:
+    """Engine do banco de teste, com as tabelas vazias."""
+    engine = create_async_engine(migrated_database_url, **engine_options)
+    await _truncate(engine)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def replica_engine(replica_database_url: str) -> AsyncIterator[AsyncEngine]:
+    """Engine da "réplica", com as tabelas vazias."""
+    engine = create_async_engine(replica_database_url)
+    await _truncate(engine)
+    yield engine
+    await engine.dispose()
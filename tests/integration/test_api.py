@@ -164,3 +164,43 @@ class TestWebhookPost:
         response = client.post("/webhook", json={})
         
         assert response.status_code == 200
+
+
+class TestCatalogImportAuth:
+    """Testes de acesso a POST /admin/catalog/import (sem banco)."""
+    
+    @pytest.fixture
+    def admin_token(self, monkeypatch):
+        """Configura o token administrativo."""
+        from src.config.settings import get_settings
+        monkeypatch.setattr(get_settings(), "admin_api_token", "token-admin")
+        return "token-admin"
+    
+    def test_disabled_without_token_configured(self, client, monkeypatch):
+        """Sem ADMIN_API_TOKEN, o endpoint não existe."""
+        from src.config.settings import get_settings
+        monkeypatch.setattr(get_settings(), "admin_api_token", None)
+        
+        response = client.post("/admin/catalog/import", content=b"")
+        
+        assert response.status_code == 404
+    
+    def test_rejects_wrong_token(self, client, admin_token):
+        """Token errado ou ausente: 401."""
+        response = client.post(
+            "/admin/catalog/import",
+            content=b"sku,name,price,category\n",
+            headers={"X-Admin-Token": "outro", "Content-Type": "text/csv"},
+        )
+        
+        assert response.status_code == 401
+    
+    def test_rejects_unknown_format(self, client, admin_token):
+        """Sem formato reconhecível: 415."""
+        response = client.post(
+            "/admin/catalog/import",
+            content=b"<xml/>",
+            headers={"X-Admin-Token": admin_token, "Content-Type": "application/xml"},
+        )
+        
+        assert response.status_code == 415
@@ -0,0 +1,184 @@
+# ===========================================================
+# tests/integration/test_catalog_import.py
+# ===========================================================
+# Importação do catálogo no PostgreSQL REAL (COPY + diff).
+#
+# CENÁRIOS:
+# 1. Primeira carga: tudo inserido, versão do catálogo avança
+# 2. Mesmo arquivo de novo: nada reescrito, versão igual
+# 3. Arquivo alterado: só o que mudou é atualizado, o que saiu
+#    é desativado, o que voltou é reativado
+# 4. SKU repetido: vale a última linha
+# 5. Linha inválida não desativa o produto; produto sem SKU
+#    (criado à mão) nunca é tocado
+#
+# BANCO:
+# Só roda com TEST_DATABASE_URL (PostgreSQL; ver conftest.py).
+# As tabelas são limpas: nunca aponte para um banco real.
+# ===========================================================
+"""
+Testes de integração da importação do catálogo.
+
+Requer PostgreSQL em TEST_DATABASE_URL (pulado sem ele).
+"""
+
+from collections.abc import AsyncIterator
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from src.domain.entities.product import Product
+from src.infrastructure.database.catalog_import import (
+    CatalogImporter,
+    CatalogImportResult,
+)
+from src.infrastructure.database.models import ProductModel
+from src.infrastructure.database.repositories import SQLAlchemyProductRepository
+
+
+CATALOG = (
+    "sku,name,price,category,description,stock\n"
+    "CAN-1,Caneca,30.00,Casa,Caneca de cerâmica,10\n"
+    "VAS-2,Vaso,80.00,Casa,,4\n"
+    "BON-3,Boné,45.00,Vestuário,,7\n"
+)
+
+
+async def _chunks(data: str) -> AsyncIterator[bytes]:
+    raw = data.encode()
+    for start in range(0, len(raw), 16):
+        yield raw[start:start + 16]
+
+
+async def _import(engine: AsyncEngine, data: str, **options) -> CatalogImportResult:
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as db:
+        result = await CatalogImporter(db).run(_chunks(data), "csv", **options)
+        await db.commit()
+    return result
+
+
+async def _products(engine: AsyncEngine) -> dict[str, tuple]:
+    """SKU -> (nome, preço, estoque, ativo, updated_at)."""
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(
+                ProductModel.sku,
+                ProductModel.name,
+                ProductModel.price,
+                ProductModel.stock,
+                ProductModel.active,
+                ProductModel.updated_at,
+            )
+        )
+        return {sku: tuple(rest) for sku, *rest in result.all()}
+
+
+async def _version(engine: AsyncEngine) -> tuple:
+    factory = async_sessionmaker(engine)
+    async with factory() as db:
+        return await SQLAlchemyProductRepository(db).catalog_version()
+
+
+class TestCatalogImport:
+    """Sincronização da tabela de produtos com o arquivo."""
+
+    @pytest.mark.asyncio
+    async def test_first_import_inserts_everything(self, engine: AsyncEngine):
+        """Catálogo vazio: todos os produtos criados, com o mesmo updated_at."""
+        result = await _import(engine, CATALOG)
+
+        assert (result.received, result.inserted, result.updated) == (3, 3, 0)
+        products = await _products(engine)
+        assert products["CAN-1"][:4] == ("Caneca", Decimal("30.00"), 10, True)
+        assert len({updated_at for *_, updated_at in products.values()}) == 1
+
+    @pytest.mark.asyncio
+    async def test_same_file_changes_nothing(self, engine: AsyncEngine):
+        """Reimportar o mesmo arquivo não reescreve linhas nem muda a versão."""
+        await _import(engine, CATALOG)
+        version = await _version(engine)
+
+        result = await _import(engine, CATALOG)
+
+        assert (result.inserted, result.updated, result.unchanged) == (0, 0, 3)
+        assert await _version(engine) == version
+
+    @pytest.mark.asyncio
+    async def test_diff_updates_deactivates_and_reactivates(self, engine: AsyncEngine):
+        """Só o que mudou é gravado; o que saiu é desativado e pode voltar."""
+        await _import(engine, CATALOG)
+        before = await _products(engine)
+
+        # Vaso mudou de preço, Boné saiu, Copo é novo
+        changed = (
+            "sku,name,price,category,description,stock\n"
+            "CAN-1,Caneca,30.00,Casa,Caneca de cerâmica,10\n"
+            "VAS-2,Vaso,75.00,Casa,,4\n"
+            "COP-4,Copo,12.50,Casa,,20\n"
+        )
+        result = await _import(engine, changed)
+
+        counts = (result.inserted, result.updated, result.unchanged, result.deactivated)
+        assert counts == (1, 1, 1, 1)
+        after = await _products(engine)
+        assert after["CAN-1"] == before["CAN-1"]
+        assert after["VAS-2"][1] == Decimal("75.00")
+        assert after["BON-3"][3] is False
+
+        result = await _import(engine, CATALOG)
+
+        assert result.updated == 2  # Vaso volta ao preço antigo, Boné reativado
+        assert (await _products(engine))["BON-3"][3] is True
+
+    @pytest.mark.asyncio
+    async def test_repeated_sku_keeps_last_line(self, engine: AsyncEngine):
+        """Mesmo SKU duas vezes no arquivo: vale a última linha."""
+        result = await _import(engine, CATALOG + "CAN-1,Caneca Grande,35.00,Casa,,10\n")
+
+        assert (result.received, result.inserted) == (4, 3)
+        name_and_price = (await _products(engine))["CAN-1"][:2]
+        assert name_and_price == ("Caneca Grande", Decimal("35.00"))
+
+    @pytest.mark.asyncio
+    async def test_missing_stock_keeps_current_stock(self, engine: AsyncEngine):
+        """Sem a coluna stock, o estoque (ex: já reservado) é mantido."""
+        await _import(engine, CATALOG)
+
+        result = await _import(
+            engine,
+            "sku,name,price,category\nCAN-1,Caneca,30.00,Casa\n",
+            deactivate_missing=False,
+        )
+
+        products = await _products(engine)
+        assert products["CAN-1"][2] == 10
+        assert products["VAS-2"][3] is True  # importação parcial
+        assert result.deactivated == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_rows_and_manual_products_are_kept(self, engine: AsyncEngine):
+        """Linha inválida não desativa; produto sem SKU fica de fora."""
+        await _import(engine, CATALOG)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as db:
+            await SQLAlchemyProductRepository(db).save(
+                Product(name="Avulso", price=Decimal("5.00"), category="Casa")
+            )
+            await db.commit()
+
+        result = await _import(
+            engine,
+            "sku,name,price,category\n"
+            "CAN-1,Caneca,30.00,Casa\n"
+            "VAS-2,Vaso,caro,Casa\n"
+            "BON-3,Boné,45.00,Vestuário\n",
+        )
+
+        assert result.rejected == 1
+        assert result.deactivated == 0
+        products = await _products(engine)
+        assert products["VAS-2"][3] is True
+        assert products[None][0] == "Avulso"
@@ -0,0 +1,115 @@
+# ===========================================================
+# tests/integration/test_catalog_version.py
+# ===========================================================
+# Versão do catálogo (contador por trigger, migração 010) no
+# PostgreSQL REAL.
+#
+# CENÁRIOS:
+# 1. Escrita com updated_at MAIS ANTIGO que o max da tabela
+#    (relógio de outro worker, commit fora de ordem): a versão
+#    muda mesmo assim
+# 2. Alteração feita direto no banco também muda a versão
+# 3. Reserva de estoque e UPDATE sem mudança real não avançam
+#    o contador
+#
+# BANCO:
+# Só roda com TEST_DATABASE_URL (PostgreSQL; ver conftest.py).
+# As tabelas são limpas: nunca aponte para um banco real.
+# ===========================================================
+"""
+Testes de integração de catalog_version.
+
+Requer PostgreSQL em TEST_DATABASE_URL (pulado sem ele).
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.infrastructure.database.models import ProductModel
+from src.infrastructure.database.repositories import SQLAlchemyProductRepository
+from src.shared.utils.ids import new_id
+
+
+async def _products(engine: AsyncEngine) -> tuple[str, str]:
+    """Dois produtos; o segundo com updated_at no futuro (max da tabela)."""
+    now = datetime.now()
+    ids = new_id(), new_id()
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(ProductModel),
+            [
+                {
+                    "id": id,
+                    "name": f"Produto {i}",
+                    "price": Decimal("10.00"),
+                    "category": "Teste",
+                    "stock": 10,
+                    "active": True,
+                    "created_at": now,
+                    "updated_at": now + timedelta(hours=i),
+                }
+                for i, id in enumerate(ids)
+            ],
+        )
+    return ids
+
+
+async def _version(engine: AsyncEngine) -> tuple:
+    async with AsyncSession(engine) as db:
+        return await SQLAlchemyProductRepository(db).catalog_version()
+
+
+class TestCatalogVersion:
+    """O contador muda a cada mudança de catálogo commitada."""
+
+    async def test_older_updated_at_still_changes_version(self, engine):
+        """Preço alterado com relógio atrasado: max(updated_at) igual, versão não."""
+        product_id, _ = await _products(engine)
+        before = await _version(engine)
+
+        async with AsyncSession(engine) as db:
+            repo = SQLAlchemyProductRepository(db)
+            product = await repo.find_by_id(product_id)
+            product.price = Decimal("12.00")
+            await repo.update(product)
+            # Antes do commit, os outros não veem a versão nova
+            assert await _version(engine) == before
+            await db.commit()
+
+        after = await _version(engine)
+        assert after[1] == before[1]  # o max(updated_at) não mudou
+        assert after != before
+
+    async def test_direct_sql_change_changes_version(self, engine):
+        """UPDATE feito fora do repositório (sem updated_at) também conta."""
+        product_id, _ = await _products(engine)
+        before = await _version(engine)
+
+        async with engine.begin() as conn:
+            await conn.execute(
+                update(ProductModel)
+                .where(ProductModel.id == product_id)
+                .values(active=False)
+            )
+
+        assert (await _version(engine))[0] > before[0]
+
+    async def test_stock_and_noop_updates_keep_counter(self, engine):
+        """Reserva (só estoque) e UPDATE com os mesmos valores: contador igual."""
+        product_id, _ = await _products(engine)
+        before = await _version(engine)
+
+        async with AsyncSession(engine) as db:
+            assert await SQLAlchemyProductRepository(db).reserve_stock(product_id, 2)
+            await db.commit()
+        async with engine.begin() as conn:
+            await conn.execute(
+                update(ProductModel)
+                .where(ProductModel.id == product_id)
+                .values(price=Decimal("10.00"))
+            )
+
+        assert (await _version(engine))[0] == before[0]
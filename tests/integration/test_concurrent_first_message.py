@@ -0,0 +1,150 @@
+# ===========================================================
+# tests/integration/test_concurrent_first_message.py
+# ===========================================================
+# Primeiras mensagens SIMULTÂNEAS no PostgreSQL REAL.
+#
+# O PROBLEMA:
+# Um número novo manda várias mensagens de uma vez (ou o
+# WhatsApp reenvia o webhook). Cada mensagem roda numa transação
+# própria e fazia "busca -> não achou -> INSERT":
+#   - o 2º INSERT do cliente quebrava com IntegrityError
+#     (telefone único) e a mensagem se perdia
+#   - a sessão era criada duas vezes (sem índice que impedisse)
+#
+# CENÁRIOS:
+# 1. Vários números novos, várias mensagens de cada, todas ao
+#    mesmo tempo: nenhuma falha, um cliente e UMA sessão por número
+# 2. Cliente com sessão expirada: as mensagens simultâneas
+#    desligam a velha e ficam com a mesma sessão nova
+#
+# BANCO:
+# Só roda com TEST_DATABASE_URL (PostgreSQL; ver conftest.py).
+# As tabelas são limpas: nunca aponte para um banco real.
+# ===========================================================
+"""
+Testes de integração de get_or_create (clientes e sessões).
+
+Requer PostgreSQL em TEST_DATABASE_URL (pulado sem ele).
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.application.dtos.message_dto import IncomingMessageDTO
+from src.application.usecases.handle_message import HandleMessageUseCase
+from src.infrastructure.database.models import CustomerModel, SessionModel
+from src.infrastructure.database.repositories import (
+    SQLAlchemyCustomerRepository,
+    SQLAlchemyOrderRepository,
+    SQLAlchemyProductRepository,
+    SQLAlchemySessionRepository,
+)
+from src.shared.types.enums import SessionState
+from src.shared.utils.ids import new_id
+
+
+PHONES = 20
+MESSAGES_PER_PHONE = 5
+
+
+@pytest.fixture
+def engine_options() -> dict[str, Any]:
+    # Uma conexão por mensagem simultânea (sem fila no pool)
+    return {"pool_size": PHONES * MESSAGES_PER_PHONE, "max_overflow": 0}
+
+
+async def _handle(engine: AsyncEngine, barrier: asyncio.Barrier, phone: str) -> None:
+    """Uma mensagem: transação própria, como um request do webhook."""
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        use_case = HandleMessageUseCase(
+            customer_repo=SQLAlchemyCustomerRepository(db),
+            session_repo=SQLAlchemySessionRepository(db),
+            product_repo=SQLAlchemyProductRepository(db),
+            order_repo=SQLAlchemyOrderRepository(db),
+        )
+        await barrier.wait()  # todas começam juntas
+        await use_case.execute(IncomingMessageDTO(phone_number=phone, text="Oi"))
+        await db.commit()
+
+
+async def _burst(engine: AsyncEngine, phones: list[str]) -> list[BaseException | None]:
+    """MESSAGES_PER_PHONE mensagens de cada telefone, ao mesmo tempo."""
+    messages = [phone for phone in phones for _ in range(MESSAGES_PER_PHONE)]
+    barrier = asyncio.Barrier(len(messages))
+    return await asyncio.gather(
+        *(_handle(engine, barrier, phone) for phone in messages),
+        return_exceptions=True,
+    )
+
+
+async def _sessions_per_phone(engine: AsyncEngine) -> dict[str, tuple[int, int]]:
+    """telefone -> (sessões, sessões ligadas)."""
+    query = (
+        select(
+            CustomerModel.phone_number,
+            func.count(SessionModel.id),
+            func.count(SessionModel.id).filter(SessionModel.active),
+        )
+        .join(SessionModel, SessionModel.customer_id == CustomerModel.id)
+        .group_by(CustomerModel.phone_number)
+    )
+    async with engine.connect() as conn:
+        rows = (await conn.execute(query)).all()
+    return {phone: (total, active) for phone, total, active in rows}
+
+
+class TestConcurrentFirstMessage:
+    """Mensagens simultâneas de números novos."""
+
+    async def test_one_customer_and_one_session_per_phone(self, engine: AsyncEngine):
+        """Nenhuma mensagem falha; um cliente e uma sessão por número."""
+        phones = [f"5511{i:09d}" for i in range(PHONES)]
+
+        results = await _burst(engine, phones)
+
+        assert [r for r in results if r is not None] == []
+        async with engine.connect() as conn:
+            customers = await conn.scalar(
+                select(func.count()).select_from(CustomerModel)
+            )
+        assert customers == PHONES
+        assert await _sessions_per_phone(engine) == {phone: (1, 1) for phone in phones}
+
+    async def test_expired_session_is_replaced_once(self, engine: AsyncEngine):
+        """Sessão expirada: desligada, e todas as mensagens ficam com a mesma nova."""
+        phone = "5511999999999"
+        customer_id = new_id()
+        now = datetime.now()
+        async with engine.begin() as conn:
+            await conn.execute(
+                insert(CustomerModel),
+                [
+                    {
+                        "id": customer_id,
+                        "phone_number": phone,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                ],
+            )
+            await conn.execute(
+                insert(SessionModel),
+                [{
+                    "id": new_id(),
+                    "customer_id": customer_id,
+                    "state": SessionState.MENU,
+                    "created_at": now - timedelta(days=2),
+                    "updated_at": now - timedelta(days=2),
+                    "expires_at": now - timedelta(days=1),
+                }],
+            )
+
+        results = await _burst(engine, [phone])
+
+        assert [r for r in results if r is not None] == []
+        assert await _sessions_per_phone(engine) == {phone: (2, 1)}
@@ -0,0 +1,132 @@
+# ===========================================================
+# tests/integration/test_connection_pool.py
+# ===========================================================
+# Pool de conexões da engine no PostgreSQL REAL.
+#
+# CENÁRIOS:
+# 1. Mais mensagens simultâneas que conexões: as que esperam
+#    mostram a espera em pool_wait_ms (e não em db_ms)
+# 2. Conexão morta (ex: failover): com pre-ping, o checkout troca
+#    a conexão em vez de devolver erro para a mensagem
+# 3. Modo PgBouncer: queries com parâmetros funcionam sem cache de
+#    prepared statements
+#
+# BANCO:
+# Só roda com TEST_DATABASE_URL (PostgreSQL; ver conftest.py).
+# Não grava nada.
+# ===========================================================
+"""
+Testes de integração do pool de conexões.
+
+Requer PostgreSQL em TEST_DATABASE_URL (pulado sem ele).
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.config.settings import Settings
+from src.infrastructure.database.connection import engine_options
+from src.infrastructure.database.query_stats import (
+    StatementUsage,
+    instrument_engine,
+    track_statements,
+)
+
+
+def _engine(database_url: str, **overrides) -> AsyncEngine:
+    """Engine com as opções de produção (engine_options)."""
+    settings = Settings(
+        _env_file=None,
+        secret_key="x",
+        database_url=database_url,
+        **overrides,
+    )
+    engine = create_async_engine(database_url, **engine_options(settings))
+    instrument_engine(engine)
+    return engine
+
+
+async def _message(engine: AsyncEngine, sleep_seconds: float) -> StatementUsage:
+    """Uma "mensagem" que segura a conexão por sleep_seconds."""
+    with track_statements() as usage:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT pg_sleep(:s)"), {"s": sleep_seconds})
+    return usage
+
+
+class TestConnectionPool:
+    """Pool configurado por Settings, com métricas."""
+
+    async def test_pool_wait_is_separate_from_db_time(self, database_url: str):
+        """Pool de 1 conexão: a 2ª mensagem espera no pool, não no banco."""
+        engine = _engine(
+            database_url, database_pool_size=1, database_pool_max_overflow=0
+        )
+        try:
+            usages = await asyncio.gather(_message(engine, 0.2), _message(engine, 0.2))
+            metrics = engine.pool.metrics()
+        finally:
+            await engine.dispose()
+
+        waits = sorted(usage.pool_wait_ms for usage in usages)
+        assert waits[1] >= 150  # esperou a outra terminar
+        assert all(usage.db_ms >= 150 for usage in usages)
+        assert metrics["checkouts"] == 2
+        assert metrics["max_wait_ms"] >= 150
+        assert metrics["in_use"] == 0
+
+    async def test_pool_timeout_is_counted(self, database_url: str):
+        """Pool esgotado: desiste após pool_timeout e conta o timeout."""
+        engine = _engine(
+            database_url,
+            database_pool_size=1,
+            database_pool_max_overflow=0,
+            database_pool_timeout_seconds=0.1,
+        )
+        try:
+            async with engine.connect():
+                with pytest.raises(exc.TimeoutError):
+                    async with engine.connect():
+                        pass
+            assert engine.pool.stats.timeouts == 1
+        finally:
+            await engine.dispose()
+
+    async def test_pre_ping_replaces_dead_connection(self, database_url: str):
+        """Conexão derrubada no servidor: o próximo checkout abre outra."""
+        engine = _engine(
+            database_url, database_pool_size=1, database_pool_pre_ping=True
+        )
+        admin = create_async_engine(database_url)
+        try:
+            async with engine.connect() as conn:
+                old_pid = await conn.scalar(text("SELECT pg_backend_pid()"))
+            async with admin.connect() as conn:
+                # Simula o failover: mata a conexão parada no pool
+                await conn.execute(
+                    text("SELECT pg_terminate_backend(:pid)"), {"pid": old_pid}
+                )
+
+            async with engine.connect() as conn:
+                new_pid = await conn.scalar(text("SELECT pg_backend_pid()"))
+        finally:
+            await engine.dispose()
+            await admin.dispose()
+
+        assert new_pid != old_pid
+
+    async def test_pgbouncer_mode_runs_queries(self, database_url: str):
+        """Modo PgBouncer: a mesma query várias vezes, sem cache de statements."""
+        engine = _engine(database_url, database_pgbouncer=True)
+        try:
+            async with engine.connect() as conn:
+                for i in range(3):
+                    assert await conn.scalar(text("SELECT :i + 1"), {"i": i}) == i + 1
+                cache = (await conn.get_raw_connection()).driver_connection._stmt_cache
+        finally:
+            await engine.dispose()
+
+        assert len(cache) == 0
@@ -0,0 +1,338 @@
+# ===========================================================
+# tests/integration/test_query_plans.py
+# ===========================================================
+# Prova, com EXPLAIN, que as consultas quentes dos repositórios
+# usam os índices das migrações 005 e 006 (e não varrem a tabela).
+#
+# COMO FUNCIONA:
+# 1. Usa o esquema das migrações (conftest.py) e insere dados com
+#    distribuição realista (muitos pedidos entregues, poucos
+#    pendentes; poucas sessões expiradas; alguns inativos)
+# 2. VACUUM ANALYZE: o planejador passa a conhecer os dados
+# 3. Cada caso chama o método REAL do repositório; o SQL enviado
+#    é capturado e reexecutado como EXPLAIN (FORMAT JSON)
+# 4. O plano precisa citar o índice esperado e não pode ter
+#    Seq Scan na tabela consultada
+#
+# BANCO:
+# Só roda com TEST_DATABASE_URL (PostgreSQL; ver conftest.py).
+# As tabelas são limpas: nunca aponte para um banco real.
+# ===========================================================
+"""
+Testes de plano de execução das consultas dos repositórios.
+
+Requer PostgreSQL em TEST_DATABASE_URL (pulado sem ele).
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.infrastructure.database.models import (
+    CustomerModel,
+    OrderModel,
+    ProductModel,
+    SessionModel,
+)
+from src.infrastructure.database.repositories import (
+    SQLAlchemyCustomerRepository,
+    SQLAlchemyOrderRepository,
+    SQLAlchemyProductRepository,
+    SQLAlchemySessionRepository,
+)
+from src.shared.types.enums import OrderStatus, SessionState
+from src.shared.utils.ids import new_id
+
+
+CUSTOMERS = 2_000
+ORDERS_PER_CUSTOMER = 10
+SESSIONS_PER_CUSTOMER = 2
+PRODUCTS = 5_000
+CATEGORIES = 50
+
+# Cliente, telefone, categoria e busca usados nas consultas
+PROBE_PHONE = "5511900000000"
+PROBE_CATEGORY = "categoria-7"
+PROBE_SEARCH = "camisetas de algodão"
+
+
+# ===========================================================
+# DADOS DE TESTE
+# ===========================================================
+
+def _order_status(i: int) -> OrderStatus:
+    """Distribuição realista: quase tudo entregue, poucos pendentes."""
+    if i % 50 == 0:
+        return OrderStatus.PENDING
+    if i % 50 == 1:
+        return OrderStatus.SHIPPED
+    return OrderStatus.DELIVERED
+
+
+async def _seed(database_url: str) -> None:
+    """Limpa as tabelas, insere os dados e atualiza as estatísticas."""
+    engine = create_async_engine(database_url, poolclass=NullPool)
+    now = datetime.now()
+
+    customers, orders, sessions = [], [], []
+    for c in range(CUSTOMERS):
+        customer_id = new_id()
+        customers.append({
+            "id": customer_id,
+            "phone_number": f"55119{c:08d}",
+            "created_at": now,
+            "updated_at": now,
+        })
+        for o in range(ORDERS_PER_CUSTOMER):
+            i = c * ORDERS_PER_CUSTOMER + o
+            orders.append({
+                "id": new_id(),
+                "customer_id": customer_id,
+                "status": _order_status(i),
+                "total": Decimal("99.90"),
+                "created_at": now - timedelta(days=o),
+                "updated_at": now,
+            })
+        for s in range(SESSIONS_PER_CUSTOMER):
+            # 1 em cada 10 sessões já expirou
+            expired = (c * SESSIONS_PER_CUSTOMER + s) % 10 == 0
+            sessions.append({
+                "id": new_id(),
+                "customer_id": customer_id,
+                "state": SessionState.MENU,
+                "context": {},
+                "created_at": now - timedelta(hours=s),
+                "updated_at": now,
+                "expires_at": now + timedelta(hours=-1 if expired else 23),
+                "active": s == 0,
+            })
+
+    products = [
+        {
+            "id": new_id(),
+            "name": f"Produto {p}",
+            # Poucos produtos casam com a busca (1 em 100)
+            "description": (
+                "Camiseta de algodão" if p % 100 == 0 else "Caneca de cerâmica"
+            ),
+            "price": Decimal("49.90"),
+            "category": f"categoria-{p % CATEGORIES}",
+            "stock": p % 7,
+            "active": p % 5 != 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for p in range(PRODUCTS)
+    ]
+
+    async with engine.begin() as conn:
+        for model in (SessionModel, OrderModel, CustomerModel, ProductModel):
+            await conn.execute(model.__table__.delete())
+        await conn.execute(insert(CustomerModel), customers)
+        await conn.execute(insert(OrderModel), orders)
+        await conn.execute(insert(SessionModel), sessions)
+        await conn.execute(insert(ProductModel), products)
+
+    # VACUUM não roda dentro de transação
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE"))
+
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def seeded_database(migrated_database_url: str) -> Iterator[str]:
+    """Popula o banco de teste uma vez para o módulo; devolve a URL."""
+    asyncio.run(_seed(migrated_database_url))
+    yield migrated_database_url
+
+
+# ===========================================================
+# HARNESS: captura o SQL do repositório e roda EXPLAIN
+# ===========================================================
+
+RepoCall = Callable[[AsyncSession], Awaitable[object]]
+
+
+async def _explain(database_url: str, call: RepoCall) -> list[dict]:
+    """
+    Executa a chamada do repositório e devolve o plano de cada SQL.
+
+    O SQL é capturado já no formato do driver e reenviado com os
+    mesmos parâmetros, prefixado por EXPLAIN. Tudo é desfeito
+    no final (rollback).
+    """
+    engine = create_async_engine(database_url, poolclass=NullPool)
+    captured: list[tuple[str, object]] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith("EXPLAIN"):
+            captured.append((statement, parameters))
+
+    plans = []
+    async with AsyncSession(engine) as db:
+        await call(db)
+        conn = await db.connection()
+        for statement, parameters in captured:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            plans.append(result.scalar()[0]["Plan"])
+        await db.rollback()
+
+    await engine.dispose()
+    return plans
+
+
+def _nodes(plan: dict) -> Iterator[dict]:
+    """Percorre todos os nós do plano (profundidade)."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child)
+
+
+def _describe(plans: list[dict]) -> list[str]:
+    """Resumo legível do plano para mensagens de erro."""
+    return [
+        f"{node['Node Type']} "
+        f"{node.get('Index Name') or node.get('Relation Name') or ''}"
+        for plan in plans
+        for node in _nodes(plan)
+    ]
+
+
+# ===========================================================
+# CASOS: (nome, chamada, índices esperados, tabelas sem Seq Scan)
+# ===========================================================
+# Fora da lista, de propósito:
+# - products.find_all_active / list_categories: leem a maior
+#   parte do catálogo; varrer a tabela é o plano certo
+# ===========================================================
+
+async def _probe_customer_id(db: AsyncSession) -> str:
+    customer = await SQLAlchemyCustomerRepository(db).find_by_phone(PROBE_PHONE)
+    return customer.id
+
+
+async def _sessions_by_customer(db: AsyncSession) -> object:
+    customer_id = await _probe_customer_id(db)
+    return await SQLAlchemySessionRepository(db).find_by_customer(customer_id)
+
+
+async def _orders_by_customer(db: AsyncSession) -> object:
+    customer_id = await _probe_customer_id(db)
+    return await SQLAlchemyOrderRepository(db).find_by_customer(customer_id)
+
+
+async def _recent_orders(db: AsyncSession) -> object:
+    customer_id = await _probe_customer_id(db)
+    return await SQLAlchemyOrderRepository(db).find_recent_by_customer(customer_id, 5)
+
+
+CASES = [
+    (
+        "customers.find_by_phone",
+        lambda db: SQLAlchemyCustomerRepository(db).find_by_phone(PROBE_PHONE),
+        {"ix_customers_phone_number"},
+        {"customers"},
+    ),
+    (
+        "sessions.find_by_customer",
+        _sessions_by_customer,
+        {"ix_sessions_customer_id_created_at"},
+        {"sessions"},
+    ),
+    (
+        "sessions.find_active_by_phone",
+        lambda db: SQLAlchemySessionRepository(db).find_active_by_phone(PROBE_PHONE),
+        {"ix_customers_phone_number", "ix_sessions_customer_id_created_at"},
+        {"customers", "sessions"},
+    ),
+    (
+        "sessions.delete_expired_batch",
+        lambda db: SQLAlchemySessionRepository(db).delete_expired_batch(100),
+        {"ix_sessions_expires_at"},
+        {"sessions"},
+    ),
+    (
+        "sessions.count_active",
+        lambda db: SQLAlchemySessionRepository(db).count_active(),
+        {"ix_sessions_expires_at"},
+        {"sessions"},
+    ),
+    (
+        "orders.find_by_customer",
+        _orders_by_customer,
+        {"ix_orders_customer_id_created_at"},
+        {"orders"},
+    ),
+    (
+        "orders.find_recent_by_customer",
+        _recent_orders,
+        {"ix_orders_customer_id_created_at"},
+        {"orders"},
+    ),
+    (
+        "orders.find_by_status",
+        lambda db: SQLAlchemyOrderRepository(db).find_by_status(OrderStatus.PENDING),
+        {"ix_orders_status_created_at"},
+        {"orders"},
+    ),
+    (
+        "orders.count_by_status",
+        lambda db: SQLAlchemyOrderRepository(db).count_by_status(OrderStatus.PENDING),
+        {"ix_orders_status_created_at"},
+        {"orders"},
+    ),
+    (
+        "orders.find_by_number",
+        lambda db: SQLAlchemyOrderRepository(db).find_by_number("PED-100010"),
+        {"ix_orders_number"},
+        {"orders"},
+    ),
+    (
+        "products.find_by_category",
+        lambda db: SQLAlchemyProductRepository(db).find_by_category(PROBE_CATEGORY),
+        {"ix_products_active_category_name"},
+        {"products"},
+    ),
+    (
+        "products.search",
+        lambda db: SQLAlchemyProductRepository(db).search(PROBE_SEARCH),
+        {"ix_products_search_vector"},
+        {"products"},
+    ),
+]
+
+
+class TestQueryPlans:
+    """Cada consulta quente deve usar o índice feito para ela."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "call,indexes,tables",
+        [case[1:] for case in CASES],
+        ids=[case[0] for case in CASES],
+    )
+    async def test_uses_index(
+        self, seeded_database: str, call: RepoCall, indexes: set, tables: set
+    ):
+        """O plano cita os índices esperados e não varre as tabelas."""
+        plans = await _explain(seeded_database, call)
+        nodes = [node for plan in plans for node in _nodes(plan)]
+
+        used = {node["Index Name"] for node in nodes if "Index Name" in node}
+        seq_scans = {
+            node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"
+        }
+
+        assert indexes <= used, _describe(plans)
+        assert not (tables & seq_scans), _describe(plans)
@@ -0,0 +1,170 @@
+# ===========================================================
+# tests/integration/test_read_replica.py
+# ===========================================================
+# Réplica de leitura com dois PostgreSQL REAIS (dois bancos
+# fazendo papel de primário e réplica, sem replicação entre eles).
+#
+# Os catálogos são DIFERENTES nos dois bancos: o texto da
+# resposta mostra de onde a leitura veio.
+#
+# CENÁRIOS:
+# 1. Turno só de leitura (lista de produtos): catálogo da réplica
+# 2. Turno que escreveu (reserva de estoque): releitura no primário
+# 3. Pedido gravado no turno: achado pelo mesmo turno (primário),
+#    mesmo sem existir na réplica
+#
+# BANCO:
+# Só roda com TEST_DATABASE_URL e TEST_REPLICA_DATABASE_URL
+# (PostgreSQL, bancos diferentes; ver conftest.py). As tabelas
+# são limpas: nunca aponte para bancos reais.
+# ===========================================================
+"""
+Testes de integração da réplica de leitura.
+
+Requer PostgreSQL em TEST_DATABASE_URL e TEST_REPLICA_DATABASE_URL
+(pulado sem eles).
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.application.dtos.message_dto import BotResponse, IncomingMessageDTO
+from src.application.usecases.handle_message import HandleMessageUseCase
+from src.domain.entities.order import Order
+from src.domain.entities.session import Session
+from src.infrastructure.database.models import CustomerModel, ProductModel, SessionModel
+from src.infrastructure.database.replica import ReadReplicaRouter
+from src.infrastructure.database.repositories import (
+    SQLAlchemyCustomerRepository,
+    SQLAlchemyOrderRepository,
+    SQLAlchemyProductRepository,
+    SQLAlchemySessionRepository,
+)
+from src.shared.types.enums import SessionState
+from src.shared.utils.ids import new_id
+
+
+RETURNING_PHONE = "5511999999999"
+NEW_PHONE = "5511888888888"
+
+
+async def _seed(engine: AsyncEngine, product_name: str) -> None:
+    """Um cliente no MENU e um produto."""
+    now = datetime.now()
+    customer_id = new_id()
+    session = Session(customer_id=customer_id, state=SessionState.MENU)
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(CustomerModel),
+            [
+                {
+                    "id": customer_id,
+                    "phone_number": RETURNING_PHONE,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            ],
+        )
+        await conn.execute(
+            insert(SessionModel),
+            [{
+                "id": session.id,
+                "customer_id": customer_id,
+                "state": session.state,
+                "context": {},
+                "created_at": session.created_at,
+                "updated_at": session.updated_at,
+                "expires_at": session.expires_at,
+            }],
+        )
+        await conn.execute(
+            insert(ProductModel),
+            [{
+                "id": new_id(),
+                "name": product_name,
+                "price": Decimal("49.90"),
+                "category": "roupas",
+                "stock": 10,
+                "active": True,
+                "created_at": now,
+                "updated_at": now,
+            }],
+        )
+
+
+@pytest.fixture
+async def primary(engine: AsyncEngine) -> AsyncEngine:
+    await _seed(engine, "Camiseta do primário")
+    return engine
+
+
+@pytest.fixture
+async def router(replica_engine: AsyncEngine) -> ReadReplicaRouter:
+    await _seed(replica_engine, "Camiseta da réplica")
+    return ReadReplicaRouter(async_sessionmaker(replica_engine, expire_on_commit=False))
+
+
+async def _send(
+    primary: AsyncEngine, router: ReadReplicaRouter, phone: str, text: str
+) -> BotResponse:
+    """Uma mensagem pelo caso de uso, com leituras roteadas."""
+    async with AsyncSession(primary, expire_on_commit=False) as db:
+        use_case = HandleMessageUseCase(
+            customer_repo=SQLAlchemyCustomerRepository(db),
+            session_repo=SQLAlchemySessionRepository(db, replica=router),
+            product_repo=SQLAlchemyProductRepository(db, replica=router),
+            order_repo=SQLAlchemyOrderRepository(db, replica=router),
+        )
+        response = await use_case.execute(
+            IncomingMessageDTO(phone_number=phone, text=text)
+        )
+        await db.commit()
+    return response
+
+
+class TestReadReplica:
+    """Leituras roteadas entre dois bancos."""
+
+    async def test_read_only_turn_uses_replica(self, primary, router):
+        """Lista de produtos sem escrita antes: catálogo da réplica."""
+        response = await _send(primary, router, RETURNING_PHONE, "produtos")
+
+        assert "Camiseta da réplica" in response.text
+        assert router.stats.replica_reads >= 1
+        assert router.stats.last_lag_seconds == 0.0  # não é standby
+
+    async def test_turn_that_wrote_uses_primary(self, primary, router):
+        """Estoque reservado no turno: a releitura vem do primário (não commitado)."""
+        async with AsyncSession(primary, expire_on_commit=False) as db:
+            repo = SQLAlchemyProductRepository(db, replica=router)
+            product_id = await db.scalar(select(ProductModel.id))
+
+            await repo.reserve_stock(product_id, 3)
+            product = await repo.find_by_id(product_id)
+
+            await db.rollback()
+
+        assert (product.name, product.stock) == ("Camiseta do primário", 7)
+        assert router.stats.pinned_reads == 1
+        assert router.stats.replica_reads == 0
+
+    async def test_order_saved_in_turn_is_found(self, primary, router):
+        """Pedido gravado no turno: o próprio turno o encontra (primário)."""
+        async with AsyncSession(primary, expire_on_commit=False) as db:
+            customers = SQLAlchemyCustomerRepository(db)
+            customer = await customers.find_by_phone(RETURNING_PHONE)
+            repo = SQLAlchemyOrderRepository(db, replica=router)
+            order = Order(customer_id=customer.id, total=Decimal("49.90"))
+
+            await repo.save(order)
+            found = await repo.find_by_id(order.id)
+
+            await db.rollback()
+
+        assert found is not None and found.id == order.id
+        assert router.stats.pinned_reads == 1
+        assert router.stats.replica_reads == 0
@@ -0,0 +1,110 @@
+# ===========================================================
+# tests/integration/test_session_context.py
+# ===========================================================
+# Contexto da sessão (JSONB) gravado por delta no PostgreSQL REAL.
+#
+# CENÁRIOS:
+# 1. O update aplica só as chaves do turno: uma chave gravada por
+#    outra mensagem entre a leitura e o update continua no banco
+# 2. Contexto NULL no banco recebe o delta
+# 3. clear_context troca o contexto inteiro
+#
+# BANCO:
+# Só roda com TEST_DATABASE_URL (PostgreSQL; ver conftest.py).
+# As tabelas são limpas: nunca aponte para um banco real.
+# ===========================================================
+"""
+Testes de integração do contexto da sessão em JSONB.
+
+Requer PostgreSQL em TEST_DATABASE_URL (pulado sem ele).
+"""
+
+from datetime import datetime
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.domain.entities.session import Session
+from src.infrastructure.database.models import CustomerModel, SessionModel
+from src.infrastructure.database.repositories import SQLAlchemySessionRepository
+from src.shared.utils.ids import new_id
+
+
+async def _create(engine: AsyncEngine, context: dict | None) -> Session:
+    """Grava um cliente e uma sessão com o contexto dado; devolve a sessão lida."""
+    now = datetime.now()
+    customer_id = new_id()
+    session = Session(customer_id=customer_id)
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(CustomerModel),
+            [
+                {
+                    "id": customer_id,
+                    "phone_number": "5511999999999",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            ],
+        )
+        await conn.execute(
+            insert(SessionModel),
+            [{
+                "id": session.id,
+                "customer_id": customer_id,
+                "state": session.state,
+                "context": context,
+                "created_at": session.created_at,
+                "updated_at": session.updated_at,
+                "expires_at": session.expires_at,
+            }],
+        )
+    async with AsyncSession(engine) as db:
+        return await SQLAlchemySessionRepository(db).find_by_id(session.id)
+
+
+async def _update(engine: AsyncEngine, session: Session) -> dict | None:
+    """Grava a sessão pelo repositório e devolve o contexto do banco."""
+    async with AsyncSession(engine) as db:
+        await SQLAlchemySessionRepository(db).update(session)
+        await db.commit()
+        return await db.scalar(
+            select(SessionModel.context).where(SessionModel.id == session.id)
+        )
+
+
+class TestSessionContext:
+    """Delta do contexto aplicado com || e -."""
+
+    async def test_delta_keeps_untouched_keys(self, engine):
+        """Chave gravada por outra mensagem depois da leitura não é apagada."""
+        session = await _create(engine, {"cart": [1], "search": "camiseta"})
+        async with engine.begin() as conn:
+            await conn.execute(
+                update(SessionModel)
+                .where(SessionModel.id == session.id)
+                .values(context={"cart": [1], "search": "camiseta", "page": 3})
+            )
+
+        session.set_context("cart", [1, 2])
+        session.remove_context("search")
+
+        assert await _update(engine, session) == {"cart": [1, 2], "page": 3}
+
+    async def test_delta_on_null_context(self, engine):
+        """Contexto NULL no banco: o delta parte de um objeto vazio."""
+        session = await _create(engine, None)
+
+        session.set_context("cart", [{"product_id": "p1", "qty": 2}])
+
+        stored = await _update(engine, session)
+        assert stored == {"cart": [{"product_id": "p1", "qty": 2}]}
+
+    async def test_clear_context_replaces_all(self, engine):
+        """clear_context grava o contexto vazio inteiro."""
+        session = await _create(engine, {"cart": [1], "search": "camiseta"})
+
+        session.clear_context()
+        session.set_context("page", 1)
+
+        assert await _update(engine, session) == {"page": 1}
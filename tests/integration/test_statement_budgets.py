@@ -0,0 +1,142 @@
+# ===========================================================
+# tests/integration/test_statement_budgets.py
+# ===========================================================
+# Orçamento de comandos SQL por caminho do HandleMessageUseCase,
+# no PostgreSQL REAL.
+#
+# POR QUE?
+# Um SELECT a mais por mensagem (ex: o ORM lendo a linha antes
+# do UPDATE) não quebra teste funcional nenhum: só aparece como
+# carga no banco em produção. Aqui cada caminho declara quantos
+# comandos pode custar; passar disso falha o teste.
+#
+# Aumentar um orçamento é uma decisão explícita (diff no BUDGETS),
+# não um efeito colateral.
+#
+# BANCO:
+# Só roda com TEST_DATABASE_URL (PostgreSQL; ver conftest.py).
+# As tabelas são limpas: nunca aponte para um banco real.
+# ===========================================================
+"""
+Testes de orçamento de comandos SQL por mensagem.
+
+Requer PostgreSQL em TEST_DATABASE_URL (pulado sem ele).
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.application.dtos.message_dto import IncomingMessageDTO
+from src.application.usecases.handle_message import HandleMessageUseCase
+from src.domain.entities.session import Session
+from src.infrastructure.database.models import CustomerModel, ProductModel, SessionModel
+from src.infrastructure.database.query_stats import instrument_engine
+from src.infrastructure.database.repositories import (
+    SQLAlchemyCustomerRepository,
+    SQLAlchemyOrderRepository,
+    SQLAlchemyProductRepository,
+    SQLAlchemySessionRepository,
+)
+from src.shared.types.enums import SessionState
+from src.shared.utils.ids import new_id
+
+
+RETURNING_PHONE = "5511999999999"
+NEW_PHONE = "5511888888888"
+
+# Comandos SQL permitidos por caminho (uma mensagem)
+BUDGETS = {
+    # id do cliente, sessão ativa (já no MENU: nada a gravar)
+    "returning_greeting": 2,
+    # id do cliente, INSERT do cliente, sessão ativa, sessão
+    # expirada desligada, INSERT da sessão, UPDATE da sessão
+    "new_customer_greeting": 6,
+    # id do cliente, sessão ativa, produtos ativos, UPDATE da sessão
+    "product_list": 4,
+}
+
+
+@pytest.fixture(autouse=True)
+async def seeded_database(engine: AsyncEngine) -> None:
+    """Cliente que volta (sessão no MENU) e alguns produtos."""
+    instrument_engine(engine)
+    now = datetime.now()
+    async with engine.begin() as conn:
+        customer_id = new_id()
+        await conn.execute(
+            insert(CustomerModel),
+            [
+                {
+                    "id": customer_id,
+                    "phone_number": RETURNING_PHONE,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            ],
+        )
+        session = Session(customer_id=customer_id, state=SessionState.MENU)
+        await conn.execute(
+            insert(SessionModel),
+            [{
+                "id": session.id,
+                "customer_id": customer_id,
+                "state": session.state,
+                "context": {},
+                "created_at": session.created_at,
+                "updated_at": session.updated_at,
+                "expires_at": session.expires_at,
+            }],
+        )
+        await conn.execute(
+            insert(ProductModel),
+            [
+                {
+                    "id": new_id(),
+                    "name": f"Produto {i}",
+                    "price": Decimal("49.90"),
+                    "category": "roupas",
+                    "stock": 10,
+                    "active": True,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(5)
+            ],
+        )
+
+
+async def _send(engine: AsyncEngine, phone: str, text: str) -> None:
+    """Uma mensagem pelo caso de uso, com os repositórios SQL."""
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        use_case = HandleMessageUseCase(
+            customer_repo=SQLAlchemyCustomerRepository(db),
+            session_repo=SQLAlchemySessionRepository(db),
+            product_repo=SQLAlchemyProductRepository(db),
+            order_repo=SQLAlchemyOrderRepository(db),
+        )
+        await use_case.execute(IncomingMessageDTO(phone_number=phone, text=text))
+        await db.commit()
+
+
+class TestStatementBudgets:
+    """Cada caminho cabe no seu orçamento de comandos."""
+
+    @pytest.mark.parametrize(
+        "path, phone, text",
+        [
+            ("returning_greeting", RETURNING_PHONE, "Oi"),
+            ("new_customer_greeting", NEW_PHONE, "Oi"),
+            ("product_list", RETURNING_PHONE, "produtos"),
+        ],
+    )
+    async def test_path_fits_budget(self, engine, statement_budget, path, phone, text):
+        """Comandos da mensagem dentro do orçamento (BEGIN/COMMIT não contam)."""
+        with statement_budget(BUDGETS[path]) as usage:
+            await _send(engine, phone, text)
+
+        assert usage.statements > 0
+        assert usage.db_ms > 0
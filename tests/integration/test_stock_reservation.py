@@ -0,0 +1,174 @@
+# ===========================================================
+# tests/integration/test_stock_reservation.py
+# ===========================================================
+# Prova, com concorrência REAL no PostgreSQL, que a reserva de
+# estoque não vende mais do que existe.
+#
+# CENÁRIOS:
+# 1. Centenas de compradores simultâneos da mesma peça
+#    (estoque menor que a procura): exatamente "estoque"
+#    reservas dão certo e o estoque termina em zero
+# 2. Carrinhos com os mesmos produtos em ordens diferentes:
+#    sem deadlock, tudo ou nada, nenhum estoque negativo
+# 3. O caminho antigo (find_by_id + decrease_stock + update)
+#    vende a mais no mesmo cenário (documenta o problema)
+#
+# Cada reserva usa sua própria sessão/transação, como requests
+# diferentes. A vazão (reservas/s) é impressa (pytest -s).
+#
+# BANCO:
+# Só roda com TEST_DATABASE_URL (PostgreSQL; ver conftest.py).
+# As tabelas são limpas: nunca aponte para um banco real.
+# ===========================================================
+"""
+Testes de concorrência da reserva de estoque.
+
+Requer PostgreSQL em TEST_DATABASE_URL (pulado sem ele).
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from src.domain.entities.product import Product
+from src.infrastructure.database.models import ProductModel
+from src.infrastructure.database.repositories import SQLAlchemyProductRepository
+
+
+BUYERS = 300
+STOCK = 100
+CARTS = 200
+CONNECTIONS = 40
+
+
+@pytest.fixture
+def engine_options() -> dict[str, Any]:
+    """Conexões suficientes para a disputa ser real."""
+    return {"pool_size": CONNECTIONS, "max_overflow": 0}
+
+
+async def _create(engine: AsyncEngine, *stocks: int) -> list[str]:
+    """Cria produtos com os estoques dados; devolve os IDs."""
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    products = [
+        Product(
+            name=f"Produto {i}", price=Decimal("10.00"), category="Teste", stock=stock
+        )
+        for i, stock in enumerate(stocks)
+    ]
+    async with factory() as db:
+        repo = SQLAlchemyProductRepository(db)
+        for product in products:
+            await repo.save(product)
+        await db.commit()
+    return [product.id for product in products]
+
+
+async def _stocks(engine: AsyncEngine, ids: list[str]) -> list[int]:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(ProductModel.id, ProductModel.stock).where(ProductModel.id.in_(ids))
+        )
+        stock_by_id = dict(result.all())
+    return [stock_by_id[id] for id in ids]
+
+
+async def _run_all(
+    engine: AsyncEngine,
+    attempts: list[Callable[[SQLAlchemyProductRepository], Awaitable[object]]],
+) -> tuple[list[object], float]:
+    """Roda cada tentativa em transação própria, todas ao mesmo tempo."""
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def attempt(call):
+        async with factory() as db:
+            outcome = await call(SQLAlchemyProductRepository(db))
+            await db.commit()
+            return outcome
+
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(*(attempt(call) for call in attempts))
+    return outcomes, time.perf_counter() - started
+
+
+class TestReserveStockConcurrency:
+    """Reservas simultâneas não vendem a mais."""
+
+    @pytest.mark.asyncio
+    async def test_no_oversell_single_item(self, engine: AsyncEngine):
+        """BUYERS compradores para STOCK unidades: só STOCK levam."""
+        [product_id] = await _create(engine, STOCK)
+
+        outcomes, seconds = await _run_all(
+            engine,
+            [lambda repo: repo.reserve_stock(product_id, 1)] * BUYERS,
+        )
+
+        reserved = [remaining for remaining in outcomes if remaining is not None]
+        assert len(reserved) == STOCK
+        assert sorted(reserved) == list(range(STOCK))
+        assert await _stocks(engine, [product_id]) == [0]
+        print(f"\nreserve_stock: {BUYERS} tentativas em {seconds:.2f}s "
+              f"({BUYERS / seconds:,.0f}/s)")
+
+    @pytest.mark.asyncio
+    async def test_no_oversell_or_deadlock_with_carts(self, engine: AsyncEngine):
+        """Carrinhos cruzados: sem deadlock, tudo ou nada."""
+        ids = await _create(engine, 50, 80, 120)
+        rng = random.Random(7)
+
+        carts = []
+        for _ in range(CARTS):
+            chosen = rng.sample(ids, k=rng.randint(1, 3))
+            rng.shuffle(chosen)  # ordens diferentes de propósito
+            carts.append({id: rng.randint(1, 2) for id in chosen})
+
+        outcomes, seconds = await _run_all(
+            engine,
+            [lambda repo, cart=cart: repo.reserve_stock_batch(cart) for cart in carts],
+        )
+
+        # Estoque consumido = soma exata dos carrinhos aceitos
+        consumed = dict.fromkeys(ids, 0)
+        for cart, remaining in zip(carts, outcomes):
+            if remaining is not None:
+                assert remaining.keys() == cart.keys()
+                for id, quantity in cart.items():
+                    consumed[id] += quantity
+
+        final = await _stocks(engine, ids)
+        assert final == [
+            50 - consumed[ids[0]],
+            80 - consumed[ids[1]],
+            120 - consumed[ids[2]],
+        ]
+        assert min(final) >= 0
+        accepted = sum(remaining is not None for remaining in outcomes)
+        print(f"\nreserve_stock_batch: {CARTS} carrinhos em {seconds:.2f}s "
+              f"({CARTS / seconds:,.0f}/s), {accepted} aceitos")
+
+    @pytest.mark.asyncio
+    async def test_read_modify_write_oversells(self, engine: AsyncEngine):
+        """O caminho antigo aceita mais compras do que o estoque."""
+        [product_id] = await _create(engine, 5)
+
+        async def buy(repo: SQLAlchemyProductRepository) -> bool:
+            product = await repo.find_by_id(product_id)
+            await asyncio.sleep(0)  # outro comprador lê o mesmo estoque
+            try:
+                product.decrease_stock(1)
+            except ValueError:
+                return False
+            await repo.update(product)
+            return True
+
+        outcomes, _ = await _run_all(engine, [buy] * 50)
+
+        assert sum(outcomes) > 5
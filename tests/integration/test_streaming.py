@@ -0,0 +1,152 @@
+# ===========================================================
+# tests/integration/test_streaming.py
+# ===========================================================
+# Leitura em streaming e paginação keyset no PostgreSQL REAL.
+#
+# CENÁRIOS:
+# 1. iter_all com lote menor que a tabela: todos os clientes,
+#    uma vez cada
+# 2. find_page percorrida até o fim: mesma lista de
+#    find_all, em ordem de ID, sem repetir nem pular
+# 3. Pedidos com o MESMO created_at (empates): as páginas
+#    (created_at DESC, id DESC) não perdem nenhum
+# 4. iter_by_status / find_page_by_status só veem o status
+#
+# BANCO:
+# Só roda com TEST_DATABASE_URL (PostgreSQL; ver conftest.py).
+# As tabelas são limpas: nunca aponte para um banco real.
+# ===========================================================
+"""
+Testes de integração de iter_* e find_page*.
+
+Requer PostgreSQL em TEST_DATABASE_URL (pulado sem ele).
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.infrastructure.database.models import CustomerModel, OrderModel
+from src.infrastructure.database.repositories import (
+    SQLAlchemyCustomerRepository,
+    SQLAlchemyOrderRepository,
+)
+from src.shared.types.enums import OrderStatus
+from src.shared.utils.ids import new_id
+
+
+CUSTOMERS = 250
+ORDERS = 60
+NOW = datetime(2024, 1, 15, 10, 30)
+
+
+@pytest.fixture
+async def customer_ids(engine: AsyncEngine) -> list[str]:
+    """Clientes criados em lote; o primeiro tem ORDERS pedidos."""
+    ids = [new_id() for _ in range(CUSTOMERS)]
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(CustomerModel),
+            [
+                {
+                    "id": id,
+                    "phone_number": f"5511{i:09d}",
+                    "created_at": NOW,
+                    "updated_at": NOW,
+                }
+                for i, id in enumerate(ids)
+            ],
+        )
+        # Três pedidos por instante: o desempate é pelo id
+        await conn.execute(
+            insert(OrderModel),
+            [
+                {
+                    "id": new_id(),
+                    "customer_id": ids[0],
+                    "status": (
+                        OrderStatus.CONFIRMED if i % 3 == 0 else OrderStatus.PENDING
+                    ),
+                    "total": Decimal("10.00"),
+                    "created_at": NOW + timedelta(minutes=i // 3),
+                    "updated_at": NOW,
+                }
+                for i in range(ORDERS)
+            ],
+        )
+    return ids
+
+
+class TestCustomers:
+    """Streaming e páginas de clientes."""
+
+    @pytest.mark.asyncio
+    async def test_iter_all_reads_every_customer(
+        self, engine: AsyncEngine, customer_ids: list[str]
+    ):
+        """Lotes de 32: todos os clientes, sem repetição."""
+        async with AsyncSession(engine) as db:
+            repo = SQLAlchemyCustomerRepository(db)
+            ids = [c.id async for c in repo.iter_all(chunk_size=32)]
+
+        assert sorted(ids) == sorted(customer_ids)
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_table_in_id_order(
+        self, engine: AsyncEngine, customer_ids: list[str]
+    ):
+        """Percorrer as páginas dá todos os clientes, em ordem de ID."""
+        async with AsyncSession(engine) as db:
+            repo = SQLAlchemyCustomerRepository(db)
+            page = await repo.find_page(limit=40)
+            ids = [c.id for c in page.items]
+            while page.next_cursor:
+                page = await repo.find_page(page.next_cursor, limit=40)
+                ids += [c.id for c in page.items]
+
+        assert ids == sorted(customer_ids)
+
+
+class TestOrders:
+    """Streaming e páginas de pedidos (mais recentes primeiro)."""
+
+    @pytest.mark.asyncio
+    async def test_pages_with_ties_lose_nothing(
+        self, engine: AsyncEngine, customer_ids: list[str]
+    ):
+        """Página cortando um grupo de mesmo created_at continua no id certo."""
+        async with AsyncSession(engine) as db:
+            repo = SQLAlchemyOrderRepository(db)
+            expected = await repo.find_by_customer(customer_ids[0])
+
+            page = await repo.find_page_by_customer(customer_ids[0], limit=7)
+            orders = list(page.items)
+            while page.next_cursor:
+                page = await repo.find_page_by_customer(
+                    customer_ids[0], page.next_cursor, limit=7
+                )
+                orders += page.items
+
+        keys = [(o.created_at, o.id) for o in orders]
+        assert len(orders) == ORDERS
+        assert keys == sorted(keys, reverse=True)
+        assert {o.id for o in orders} == {o.id for o in expected}
+
+    @pytest.mark.asyncio
+    async def test_status_variants_filter(
+        self, engine: AsyncEngine, customer_ids: list[str]
+    ):
+        """iter_by_status e find_page_by_status veem só o status pedido."""
+        async with AsyncSession(engine) as db:
+            repo = SQLAlchemyOrderRepository(db)
+            confirmed = repo.iter_by_status(OrderStatus.CONFIRMED, chunk_size=5)
+            streamed = [o async for o in confirmed]
+            page = await repo.find_page_by_status(OrderStatus.CONFIRMED, limit=100)
+
+        assert len(streamed) == ORDERS // 3
+        assert {o.status for o in streamed} == {OrderStatus.CONFIRMED}
+        assert [o.id for o in page.items] == [o.id for o in streamed]
+        assert page.next_cursor is None
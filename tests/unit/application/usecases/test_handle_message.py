@@ -29,11 +29,18 @@ o caso de uso de forma isolada.
 """
 
 import pytest
+from decimal import Decimal
 from unittest.mock import AsyncMock
 
-from src.application.dtos.message_dto import IncomingMessageDTO
+from src.application.dtos.message_dto import (
+    BotResponse,
+    IncomingMessageDTO,
+    MessageResponseDTO,
+)
+from src.application.usecases import responses
 from src.application.usecases.handle_message import HandleMessageUseCase
 from src.domain.entities.customer import Customer
+from src.domain.entities.order import Order
 from src.domain.entities.session import Session
 from src.shared.types.enums import SessionState
 
@@ -118,7 +125,9 @@ class TestHandleMessageUseCase:
         Esperado: Recebe menu com opções
         """
         # ARRANGE - Preparar
-        mock_repositories["customer_repo"].find_by_phone.return_value = sample_customer
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
         mock_repositories["session_repo"].find_by_customer.return_value = sample_session
         
         input_dto = IncomingMessageDTO(
@@ -147,7 +156,9 @@ class TestHandleMessageUseCase:
         
         Testa: "oi", "bom dia", "hey"
         """
-        mock_repositories["customer_repo"].find_by_phone.return_value = sample_customer
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
         mock_repositories["session_repo"].find_by_customer.return_value = sample_session
         
         greetings = ["oi", "bom dia", "boa tarde", "hey", "e aí"]
@@ -175,11 +186,16 @@ class TestHandleMessageUseCase:
         Novo cliente deve ser criado se não existir.
         
         Cenário: Telefone não cadastrado
-        Esperado: customer_repo.save é chamado
+        Esperado: customer_repo.get_or_create é chamado (nunca save,
+        que falharia com mensagens simultâneas do mesmo número)
         """
         # ARRANGE
-        mock_repositories["customer_repo"].find_by_phone.return_value = None
+        customer = Customer(phone_number="5511888888888")
+        session = Session(customer_id=customer.id)
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = None
+        mock_repositories["customer_repo"].get_or_create.return_value = (customer, True)
         mock_repositories["session_repo"].find_by_customer.return_value = None
+        mock_repositories["session_repo"].get_or_create.return_value = (session, True)
         
         input_dto = IncomingMessageDTO(
             phone_number="5511888888888",
@@ -189,8 +205,43 @@ class TestHandleMessageUseCase:
         # ACT
         await use_case.execute(input_dto)
         
-        # ASSERT - Verifica que save foi chamado
-        mock_repositories["customer_repo"].save.assert_called_once()
+        # ASSERT - Cliente e sessão criados pelo get_or_create
+        created = mock_repositories["customer_repo"].get_or_create.call_args.args[0]
+        assert created.phone_number == "5511888888888"
+        new_session = mock_repositories["session_repo"].get_or_create.call_args.args[0]
+        assert new_session.customer_id == customer.id
+        mock_repositories["customer_repo"].save.assert_not_called()
+        mock_repositories["session_repo"].save.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_message_reuses_winner_session(
+        self, 
+        use_case: HandleMessageUseCase, 
+        mock_repositories: dict,
+        sample_customer: Customer,
+        sample_session: Session,
+    ):
+        """
+        Mensagem que perdeu a corrida usa a sessão da vizinha.
+        
+        Cenário: get_or_create devolve a sessão já criada (created=False)
+        Esperado: o turno roda e grava sobre essa sessão
+        """
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
+        mock_repositories["session_repo"].find_by_customer.return_value = None
+        mock_repositories["session_repo"].get_or_create.return_value = (
+            sample_session,
+            False,
+        )
+        
+        await use_case.execute(
+            IncomingMessageDTO(phone_number="5511999999999", text="Oi")
+        )
+        
+        updated = mock_repositories["session_repo"].update.call_args.args[0]
+        assert updated is sample_session
     
     @pytest.mark.asyncio
     async def test_existing_customer_not_recreated(
@@ -204,10 +255,12 @@ class TestHandleMessageUseCase:
         Cliente existente NÃO deve ser recriado.
         
         Cenário: Cliente já cadastrado
-        Esperado: customer_repo.save NÃO é chamado
+        Esperado: customer_repo.get_or_create NÃO é chamado
         """
         # ARRANGE
-        mock_repositories["customer_repo"].find_by_phone.return_value = sample_customer
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
         mock_repositories["session_repo"].find_by_customer.return_value = sample_session
         
         input_dto = IncomingMessageDTO(
@@ -218,7 +271,8 @@ class TestHandleMessageUseCase:
         # ACT
         await use_case.execute(input_dto)
         
-        # ASSERT - Verifica que save NÃO foi chamado
+        # ASSERT - Verifica que nada foi criado
+        mock_repositories["customer_repo"].get_or_create.assert_not_called()
         mock_repositories["customer_repo"].save.assert_not_called()
     
     # ===== TESTES DE TRANSFERÊNCIA PARA HUMANO =====
@@ -238,7 +292,9 @@ class TestHandleMessageUseCase:
         Esperado: should_transfer_to_human = True
         """
         # ARRANGE
-        mock_repositories["customer_repo"].find_by_phone.return_value = sample_customer
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
         mock_repositories["session_repo"].find_by_customer.return_value = sample_session
         
         input_dto = IncomingMessageDTO(
@@ -264,7 +320,9 @@ class TestHandleMessageUseCase:
         """
         Várias palavras-chave devem acionar transferência.
         """
-        mock_repositories["customer_repo"].find_by_phone.return_value = sample_customer
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
         mock_repositories["session_repo"].find_by_customer.return_value = sample_session
         
         keywords = ["atendente", "humano", "pessoa", "suporte", "reclamação"]
@@ -297,7 +355,9 @@ class TestHandleMessageUseCase:
         Esperado: Sessão muda para PRODUCTS
         """
         # ARRANGE
-        mock_repositories["customer_repo"].find_by_phone.return_value = sample_customer
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
         mock_repositories["session_repo"].find_by_customer.return_value = sample_session
         mock_repositories["product_repo"].find_all_active.return_value = []
         
@@ -324,7 +384,9 @@ class TestHandleMessageUseCase:
         Se não há produtos, deve informar cliente.
         """
         # ARRANGE
-        mock_repositories["customer_repo"].find_by_phone.return_value = sample_customer
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
         mock_repositories["session_repo"].find_by_customer.return_value = sample_session
         mock_repositories["product_repo"].find_all_active.return_value = []
         
@@ -353,7 +415,9 @@ class TestHandleMessageUseCase:
         Pedido de FAQ deve retornar perguntas frequentes.
         """
         # ARRANGE
-        mock_repositories["customer_repo"].find_by_phone.return_value = sample_customer
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
         mock_repositories["session_repo"].find_by_customer.return_value = sample_session
         
         input_dto = IncomingMessageDTO(
@@ -383,7 +447,9 @@ class TestHandleMessageUseCase:
         """
         # ARRANGE
         sample_session.update_state(SessionState.MENU)  # Força estado MENU
-        mock_repositories["customer_repo"].find_by_phone.return_value = sample_customer
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
         mock_repositories["session_repo"].find_by_customer.return_value = sample_session
         
         input_dto = IncomingMessageDTO(
@@ -414,7 +480,9 @@ class TestHandleMessageUseCase:
         Esperado: session_repo.update é chamado
         """
         # ARRANGE
-        mock_repositories["customer_repo"].find_by_phone.return_value = sample_customer
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
         mock_repositories["session_repo"].find_by_customer.return_value = sample_session
         
         input_dto = IncomingMessageDTO(
@@ -428,6 +496,253 @@ class TestHandleMessageUseCase:
         # ASSERT
         mock_repositories["session_repo"].update.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_unchanged_session_is_not_written(
+        self,
+        use_case: HandleMessageUseCase,
+        mock_repositories: dict,
+        sample_customer: Customer,
+        sample_session: Session,
+    ):
+        """
+        Turno que não muda a sessão não deve gerar escrita.
+
+        Cenário: Mensagem não entendida, sessão já gravada
+        Esperado: session_repo.update NÃO é chamado
+        """
+        # ARRANGE
+        sample_session.mark_clean()  # Simula sessão recém-lida do banco
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
+        mock_repositories["session_repo"].find_by_customer.return_value = sample_session
+
+        input_dto = IncomingMessageDTO(
+            phone_number="5511999999999",
+            text="asdfghjkl qwerty"
+        )
+
+        # ACT
+        await use_case.execute(input_dto)
+
+        # ASSERT
+        mock_repositories["session_repo"].update.assert_not_called()
+
+
+# ===========================================================
+# TESTES DE CONSULTA DE PEDIDO
+# ===========================================================
+
+class TestOrderStatusLookup:
+    """Testes da consulta de pedido pelo número amigável."""
+
+    @pytest.fixture
+    def order_session(self, sample_customer: Customer) -> Session:
+        """Sessão aguardando o número do pedido."""
+        session = Session(customer_id=sample_customer.id)
+        session.update_state(SessionState.ORDER_STATUS)
+        return session
+
+    @pytest.mark.asyncio
+    async def test_lenient_number_is_found(
+        self,
+        use_case: HandleMessageUseCase,
+        mock_repositories: dict,
+        sample_customer: Customer,
+        order_session: Session,
+    ):
+        """Número escrito de forma livre deve ser normalizado e encontrado."""
+        order = Order(
+            customer_id=sample_customer.id,
+            number="PED-123456",
+            total=Decimal("50.00"),
+        )
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
+        mock_repositories["session_repo"].find_by_customer.return_value = order_session
+        mock_repositories["order_repo"].find_by_numbers.return_value = [order]
+
+        response = await use_case.execute(
+            IncomingMessageDTO(phone_number="5511999999999", text="ped 123456")
+        )
+
+        mock_repositories["order_repo"].find_by_numbers.assert_called_once_with(
+            ["PED-123456"]
+        )
+        assert "PED-123456" in response.text
+        assert "R$ 50.00" in response.text
+
+    @pytest.mark.asyncio
+    async def test_number_in_first_message_skips_prompt(
+        self,
+        use_case: HandleMessageUseCase,
+        mock_repositories: dict,
+        sample_customer: Customer,
+        sample_session: Session,
+    ):
+        """Pedido com número na mesma frase deve ser consultado direto."""
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
+        mock_repositories["session_repo"].find_by_customer.return_value = sample_session
+        mock_repositories["order_repo"].find_by_numbers.return_value = []
+
+        response = await use_case.execute(
+            IncomingMessageDTO(
+                phone_number="5511999999999",
+                text="status do pedido #654321",
+            )
+        )
+
+        mock_repositories["order_repo"].find_by_numbers.assert_called_once_with(
+            ["PED-654321"]
+        )
+        assert "não encontrado" in response.text
+        assert sample_session.state == SessionState.ORDER_STATUS
+
+    @pytest.mark.asyncio
+    async def test_multiple_numbers_use_single_lookup(
+        self,
+        use_case: HandleMessageUseCase,
+        mock_repositories: dict,
+        sample_customer: Customer,
+        order_session: Session,
+    ):
+        """Vários números na mensagem devem gerar uma única consulta."""
+        order = Order(
+            customer_id=sample_customer.id,
+            number="PED-111111",
+            total=Decimal("10.00"),
+        )
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
+        mock_repositories["session_repo"].find_by_customer.return_value = order_session
+        mock_repositories["order_repo"].find_by_numbers.return_value = [order]
+
+        response = await use_case.execute(
+            IncomingMessageDTO(
+                phone_number="5511999999999",
+                text="111111 e 222222",
+            )
+        )
+
+        mock_repositories["order_repo"].find_by_numbers.assert_called_once_with(
+            ["PED-111111", "PED-222222"]
+        )
+        assert "*Pedido PED-111111*" in response.text
+        assert "PED-222222* não encontrado" in response.text
+
+    @pytest.mark.asyncio
+    async def test_text_without_number_does_not_query(
+        self,
+        use_case: HandleMessageUseCase,
+        mock_repositories: dict,
+        sample_customer: Customer,
+        order_session: Session,
+    ):
+        """Mensagem sem número não deve consultar o repositório."""
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
+        mock_repositories["session_repo"].find_by_customer.return_value = order_session
+
+        response = await use_case.execute(
+            IncomingMessageDTO(phone_number="5511999999999", text="não sei")
+        )
+
+        mock_repositories["order_repo"].find_by_numbers.assert_not_called()
+        assert "PED-123456" in response.text
+
+
+# ===========================================================
+# TESTES DE ATALHOS NUMÉRICOS
+# ===========================================================
+
+class TestNumericShortcuts:
+    """Testes das opções numéricas do menu e do FAQ."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "text,expected_state",
+        [
+            ("1", SessionState.PRODUCTS),
+            ("2", SessionState.ORDER_STATUS),
+            ("3️⃣", SessionState.FAQ),
+            (" 4 ", SessionState.HUMAN_TRANSFER),
+        ],
+    )
+    async def test_menu_option_selects_flow(
+        self,
+        use_case: HandleMessageUseCase,
+        mock_repositories: dict,
+        sample_customer: Customer,
+        sample_session: Session,
+        text: str,
+        expected_state: SessionState,
+    ):
+        """Dígito no menu deve levar ao fluxo da opção."""
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
+        mock_repositories["session_repo"].find_by_customer.return_value = sample_session
+        mock_repositories["product_repo"].find_all_active.return_value = []
+
+        await use_case.execute(
+            IncomingMessageDTO(phone_number="5511999999999", text=text)
+        )
+
+        assert sample_session.state == expected_state
+
+    @pytest.mark.asyncio
+    async def test_faq_option_answers_without_data_access(
+        self,
+        use_case: HandleMessageUseCase,
+        mock_repositories: dict,
+        sample_customer: Customer,
+    ):
+        """Pergunta do FAQ deve ser respondida da memória, sem escrita."""
+        session = Session(customer_id=sample_customer.id)
+        session.update_state(SessionState.FAQ)
+        session.mark_clean()
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
+        mock_repositories["session_repo"].find_by_customer.return_value = session
+
+        response = await use_case.execute(
+            IncomingMessageDTO(phone_number="5511999999999", text="3")
+        )
+
+        assert "formas de pagamento" in response.text
+        assert session.state == SessionState.FAQ
+        assert mock_repositories["product_repo"].method_calls == []
+        assert mock_repositories["order_repo"].method_calls == []
+        mock_repositories["session_repo"].update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_digit_outside_menu_is_not_a_shortcut(
+        self,
+        use_case: HandleMessageUseCase,
+        mock_repositories: dict,
+        sample_customer: Customer,
+    ):
+        """Em estados sem atalhos, o dígito segue o fluxo normal."""
+        session = Session(customer_id=sample_customer.id)
+        session.update_state(SessionState.PRODUCTS)
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
+        mock_repositories["session_repo"].find_by_customer.return_value = session
+
+        response = await use_case.execute(
+            IncomingMessageDTO(phone_number="5511999999999", text="1")
+        )
+
+        assert "não entendi" in response.text
+        assert session.state == SessionState.PRODUCTS
+
 
 # ===========================================================
 # TESTES DOS DTOs
@@ -466,3 +781,47 @@ class TestIncomingMessageDTO:
                 phone_number="5511999999999",
                 text=""  # Vazio
             )
+
+
+class TestBotResponse:
+    """Testes para a resposta leve (BotResponse) e o catálogo."""
+
+    def test_response_is_immutable(self):
+        """Resposta compartilhada não pode ser alterada."""
+        from dataclasses import FrozenInstanceError
+
+        with pytest.raises(FrozenInstanceError):
+            responses.GREETING.text = "alterado"  # type: ignore[misc]
+
+    def test_to_dto_validates_at_boundary(self):
+        """Conversão para o DTO deve preservar os campos."""
+        dto = responses.HUMAN_TRANSFER.to_dto()
+
+        assert isinstance(dto, MessageResponseDTO)
+        assert dto.text == responses.HUMAN_TRANSFER.text
+        assert dto.should_transfer_to_human is True
+
+    @pytest.mark.asyncio
+    async def test_constant_reply_is_reused(
+        self,
+        use_case: HandleMessageUseCase,
+        mock_repositories: dict,
+        sample_customer: Customer,
+        sample_session: Session,
+    ):
+        """Respostas fixas devem ser o mesmo objeto do catálogo."""
+        mock_repositories["customer_repo"].find_id_by_phone.return_value = (
+            sample_customer.id
+        )
+        mock_repositories["session_repo"].find_by_customer.return_value = sample_session
+
+        first = await use_case.execute(
+            IncomingMessageDTO(phone_number="5511999999999", text="menu")
+        )
+        second = await use_case.execute(
+            IncomingMessageDTO(phone_number="5511999999999", text="oi")
+        )
+
+        assert first is responses.GREETING
+        assert second is first
+        assert isinstance(first, BotResponse)
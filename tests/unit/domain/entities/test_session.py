@@ -7,10 +7,17 @@ Testes unitários para entidade Session.
 Testa gerenciamento de estado, contexto e expiração.
 """
 
+import json
+
 import pytest
 from datetime import datetime, timedelta
 
-from src.domain.entities.session import Session
+from src.domain.entities.session import (
+    MAX_CONTEXT_BYTES,
+    RENEWAL_INTERVAL,
+    SESSION_TTL,
+    Session,
+)
 from src.shared.types.enums import SessionState
 
 
@@ -163,3 +170,191 @@ class TestSession:
         session.renew()
         
         assert session.is_expired is False
+    
+    # ===== TESTES DE DIRTY TRACKING =====
+    
+    def test_new_session_is_clean(self):
+        """Sessão recém-criada não tem alterações pendentes."""
+        session = Session(customer_id="123")
+        
+        assert session.is_dirty is False
+        assert session.changed_fields == frozenset()
+    
+    def test_update_state_marks_state_as_changed(self):
+        """Mudar de estado deve marcar o campo state."""
+        session = Session(customer_id="123")
+        
+        session.update_state(SessionState.MENU)
+        
+        assert session.is_dirty is True
+        assert "state" in session.changed_fields
+    
+    def test_update_to_same_state_is_not_a_change(self):
+        """Repetir o estado atual não deve gerar alteração."""
+        session = Session(customer_id="123", state=SessionState.MENU)
+        
+        session.update_state(SessionState.MENU)
+        
+        assert session.is_dirty is False
+    
+    def test_set_context_tracks_changed_keys(self):
+        """set_context deve registrar a chave alterada."""
+        session = Session(customer_id="123")
+        
+        session.set_context("cart", [1, 2])
+        
+        assert "context" in session.changed_fields
+        assert session.changed_context_keys == frozenset({"cart"})
+    
+    def test_set_same_context_value_is_not_a_change(self):
+        """Gravar o mesmo valor no contexto não gera alteração."""
+        session = Session(customer_id="123", context={"cart": [1, 2]})
+        
+        session.set_context("cart", [1, 2])
+        
+        assert session.is_dirty is False
+    
+    def test_set_same_mutated_object_is_a_change(self):
+        """Lista alterada por dentro e gravada de volta marca a chave."""
+        session = Session(customer_id="123", context={"cart": [1]})
+        
+        cart = session.get_context("cart")
+        cart.append(2)
+        session.set_context("cart", cart)
+        
+        assert session.is_dirty is True
+        assert session.context_delta() == ({"cart": [1, 2]}, frozenset())
+    
+    def test_set_same_scalar_is_not_a_change(self):
+        """Mesmo valor imutável (mesmo objeto) não gera alteração."""
+        session = Session(customer_id="123", context={"page": 1})
+        
+        session.set_context("page", session.get_context("page"))
+        
+        assert session.is_dirty is False
+    
+    def test_remove_missing_context_is_not_a_change(self):
+        """Remover chave inexistente não gera alteração."""
+        session = Session(customer_id="123")
+        
+        session.remove_context("nonexistent")
+        
+        assert session.is_dirty is False
+    
+    def test_mark_clean_resets_changes(self):
+        """mark_clean deve limpar as alterações pendentes."""
+        session = Session(customer_id="123")
+        session.update_state(SessionState.FAQ)
+        session.set_context("key", "value")
+        
+        session.mark_clean()
+        
+        assert session.is_dirty is False
+        assert session.changed_context_keys == frozenset()
+    
+    def test_renewal_is_coalesced_within_interval(self):
+        """Renovação recente não deve gerar nova alteração."""
+        session = Session(customer_id="123")
+        
+        renewed = session.renew_if_due()
+        
+        assert renewed is False
+        assert "expires_at" not in session.changed_fields
+    
+    def test_renewal_happens_after_interval(self):
+        """Após RENEWAL_INTERVAL a expiração deve ser renovada."""
+        session = Session(customer_id="123")
+        session.expires_at = (
+            datetime.now() + SESSION_TTL - RENEWAL_INTERVAL - timedelta(seconds=1)
+        )
+        
+        renewed = session.renew_if_due()
+        
+        assert renewed is True
+        assert "expires_at" in session.changed_fields
+        assert session.time_until_expiration.total_seconds() > 23 * 3600
+    
+    # ===== TESTES DE DELTA E LIMITE DO CONTEXTO =====
+    
+    def test_context_delta_has_set_and_removed_keys(self):
+        """context_delta separa chaves gravadas (com valor) e removidas."""
+        session = Session(customer_id="123", context={"cart": [1], "search": "x"})
+        
+        session.set_context("cart", [1, 2])
+        session.set_context("page", 2)
+        session.remove_context("search")
+        
+        assert session.context_delta() == (
+            {"cart": [1, 2], "page": 2},
+            frozenset({"search"}),
+        )
+        assert session.context_replaced is False
+    
+    def test_set_then_remove_is_a_removal(self):
+        """Chave gravada e removida no mesmo turno vai como remoção."""
+        session = Session(customer_id="123")
+        
+        session.set_context("tmp", 1)
+        session.remove_context("tmp")
+        
+        assert session.context_delta() == ({}, frozenset({"tmp"}))
+    
+    def test_clear_context_replaces_whole_context(self):
+        """clear_context marca troca do contexto inteiro até mark_clean."""
+        session = Session(customer_id="123", context={"cart": [1]})
+        
+        session.clear_context()
+        assert session.context_replaced is True
+        
+        session.mark_clean()
+        assert session.context_replaced is False
+    
+    def test_context_size_in_utf8_bytes(self):
+        """context_size mede o JSON em bytes UTF-8 (acentos contam 2)."""
+        session = Session(customer_id="123", context={"q": "ção"})
+        
+        assert session.context_size == len('{"q": "ção"}'.encode())
+    
+    def test_context_size_is_kept_per_key(self):
+        """Tamanho mantido por chave bate com o JSON do contexto inteiro."""
+        session = Session(customer_id="123", context={"q": "ção", "page": 2})
+        
+        def json_size(value) -> int:
+            return len(json.dumps(value, ensure_ascii=False).encode())
+        
+        session.set_context("cart", [{"sku": "X1", "qty": 2}])
+        session.set_context("q", "camiseta")
+        session.remove_context("page")
+        assert session.context_size == json_size(session.context)
+        assert session.context_delta_size == json_size(session.context_delta()[0])
+        
+        session.clear_context()
+        assert session.context_size == json_size({})
+        session.set_context("a", None)
+        assert session.context_size == json_size({"a": None})
+    
+    def test_set_context_serializes_only_new_value(self, monkeypatch):
+        """set_context não serializa de novo as chaves que já estavam lá."""
+        session = Session(customer_id="123", context={"cart": [1, 2, 3]})
+        session.set_context("q", "a")
+        dumped = []
+        real_dumps = json.dumps
+        
+        def spy(value, **kwargs):
+            dumped.append(value)
+            return real_dumps(value, **kwargs)
+        
+        monkeypatch.setattr("src.domain.entities.session.json.dumps", spy)
+        session.set_context("q", "b")
+        
+        assert dumped == ["q", "b"]
+    
+    def test_oversized_context_is_rejected(self):
+        """set_context acima de MAX_CONTEXT_BYTES levanta erro e não altera nada."""
+        session = Session(customer_id="123", context={"cart": [1]})
+        
+        with pytest.raises(ValueError, match="Contexto da sessão muito grande"):
+            session.set_context("blob", "x" * MAX_CONTEXT_BYTES)
+        
+        assert session.context == {"cart": [1]}
+        assert session.is_dirty is False
@@ -0,0 +1,2 @@
+# tests/unit/domain/services/__init__.py
+"""Testes unitários para serviços de domínio."""
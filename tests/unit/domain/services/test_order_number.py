@@ -0,0 +1,83 @@
+# ===========================================================
+# tests/unit/domain/services/test_order_number.py
+# ===========================================================
+"""
+Testes unitários para o serviço de número de pedido.
+
+Testa a formatação e a extração tolerante de números
+a partir de mensagens livres do cliente.
+"""
+
+import pytest
+
+from src.domain.services.order_number import (
+    extract_order_numbers,
+    format_order_number,
+)
+
+
+class TestFormatOrderNumber:
+    """Testes para format_order_number."""
+
+    def test_formats_with_prefix(self):
+        """Deve montar o número no formato canônico."""
+        assert format_order_number(123456) == "PED-123456"
+
+
+class TestExtractOrderNumbers:
+    """Testes para extract_order_numbers."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "PED-123456",
+            "ped-123456",
+            "ped 123456",
+            "ped123456",
+            "#123456",
+            "123456",
+            " 123456. ",
+            "meu pedido é ped 123456",
+            "Qual o status do PED_123456?",
+        ],
+    )
+    def test_extracts_single_number(self, text: str):
+        """Deve reconhecer o número escrito de várias formas."""
+        assert extract_order_numbers(text) == ["PED-123456"]
+
+    def test_extracts_multiple_numbers_in_order(self):
+        """Deve extrair todos os números, na ordem da mensagem."""
+        text = "pedidos ped 123456, #654321 e PED-111111"
+
+        assert extract_order_numbers(text) == [
+            "PED-123456",
+            "PED-654321",
+            "PED-111111",
+        ]
+
+    def test_removes_duplicates(self):
+        """Número repetido deve aparecer uma vez."""
+        assert extract_order_numbers("ped 123456 e #123456") == ["PED-123456"]
+
+    def test_message_with_only_bare_numbers(self):
+        """Mensagem só com números (sem prefixo) extrai todos."""
+        assert extract_order_numbers("111111, 222222 e 111111") == [
+            "PED-111111",
+            "PED-222222",
+        ]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "oi",
+            "pedido 12345",
+            "meu telefone é 5511999999999",
+            "abc123456",
+            "meu pedido é 123456",
+            "moro no CEP 01310100",
+            "ligue 9 9999-999999",
+        ],
+    )
+    def test_ignores_text_without_order_number(self, text: str):
+        """Textos sem número válido devem retornar lista vazia."""
+        assert extract_order_numbers(text) == []
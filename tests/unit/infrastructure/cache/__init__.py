@@ -0,0 +1,2 @@
+# tests/unit/infrastructure/cache/__init__.py
+"""Testes unitários para infraestrutura de cache."""
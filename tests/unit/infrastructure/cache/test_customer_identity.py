@@ -0,0 +1,287 @@
+# ===========================================================
+# tests/unit/infrastructure/cache/test_customer_identity.py
+# ===========================================================
+# Testes para a identidade de clientes (CachedCustomerRepository).
+#
+# O repositório real é um AsyncMock (conta as idas ao "banco");
+# a origem dos telefones é uma lista em memória.
+# ===========================================================
+"""
+Testes unitários para CustomerIdentityMap e CachedCustomerRepository.
+
+Testa:
+- Cache telefone -> ID (cliente que volta não consulta o banco)
+- Filtro de Bloom: número novo sem consulta; antes da carga, tudo
+  vai ao banco
+- save só alimenta o filtro; update/delete tiram o ID do cache
+- get_or_create: só o cliente que já existia entra no cache
+- Cadastros durante a carga entram no filtro novo
+- Sincronização pela faixa de IDs dos últimos instantes
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.customer import Customer
+from src.infrastructure.cache.customer_identity import (
+    SYNC_OVERLAP_SECONDS,
+    CachedCustomerRepository,
+    CustomerIdentityMap,
+)
+from src.infrastructure.cache.memory_cache import MISSING
+from src.shared.utils.ids import uuid7_floor
+
+
+KNOWN = "5511999999999"
+NEW = "5511888888888"
+NOW = 1_700_000_000.0
+
+
+class FakePhoneSource:
+    """Telefones em memória; registra as faixas pedidas."""
+
+    def __init__(self, phones: list[str]) -> None:
+        self.phones_in_db = phones
+        self.ranges: list[tuple[str | None, str | None]] = []
+        self.during_load = None
+
+    async def count(self) -> int:
+        return len(self.phones_in_db)
+
+    async def phones(self, since_id=None, until_id=None) -> AsyncIterator[str]:
+        self.ranges.append((since_id, until_id))
+        for phone in list(self.phones_in_db):
+            if self.during_load is not None:
+                self.during_load()
+            yield phone
+
+
+@pytest.fixture
+def source() -> FakePhoneSource:
+    return FakePhoneSource([KNOWN])
+
+
+@pytest.fixture
+def identity(source: FakePhoneSource) -> CustomerIdentityMap:
+    return CustomerIdentityMap(source, bloom_capacity=1_000, clock=lambda: NOW)
+
+
+@pytest.fixture
+def inner_repo() -> AsyncMock:
+    """Repositório real simulado."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def repository(
+    inner_repo: AsyncMock, identity: CustomerIdentityMap
+) -> CachedCustomerRepository:
+    return CachedCustomerRepository(inner_repo, identity)
+
+
+class TestLookup:
+    """Testes de find_id_by_phone."""
+
+    @pytest.mark.asyncio
+    async def test_returning_customer_hits_cache(
+        self,
+        repository: CachedCustomerRepository,
+        inner_repo: AsyncMock,
+        identity: CustomerIdentityMap,
+    ):
+        """2ª mensagem do mesmo telefone não consulta o banco."""
+        await identity.load()
+        inner_repo.find_id_by_phone.return_value = "cliente-1"
+
+        assert await repository.find_id_by_phone(KNOWN) == "cliente-1"
+        assert await repository.find_id_by_phone(KNOWN) == "cliente-1"
+
+        inner_repo.find_id_by_phone.assert_awaited_once_with(KNOWN)
+        assert (identity.stats.hits, identity.stats.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_new_number_skips_database(
+        self,
+        repository: CachedCustomerRepository,
+        inner_repo: AsyncMock,
+        identity: CustomerIdentityMap,
+    ):
+        """Telefone fora do filtro: None sem consulta."""
+        await identity.load()
+
+        assert await repository.find_id_by_phone(NEW) is None
+
+        inner_repo.find_id_by_phone.assert_not_awaited()
+        assert identity.stats.new_numbers == 1
+
+    @pytest.mark.asyncio
+    async def test_find_by_phone_always_reads_database(
+        self,
+        repository: CachedCustomerRepository,
+        inner_repo: AsyncMock,
+        identity: CustomerIdentityMap,
+    ):
+        """Cadastro de outro worker ainda fora do filtro: find_by_phone acha."""
+        await identity.load()
+        customer = Customer(phone_number=NEW)
+        inner_repo.find_by_phone.return_value = customer
+
+        assert await repository.find_by_phone(NEW) == customer
+
+        inner_repo.find_by_phone.assert_awaited_once_with(NEW)
+        assert identity.stats.new_numbers == 0
+
+    @pytest.mark.asyncio
+    async def test_before_load_everything_goes_to_database(
+        self,
+        repository: CachedCustomerRepository,
+        inner_repo: AsyncMock,
+        identity: CustomerIdentityMap,
+    ):
+        """Sem filtro carregado, "não sei" nunca vira "é novo"."""
+        inner_repo.find_id_by_phone.return_value = None
+
+        assert await repository.find_id_by_phone(NEW) is None
+
+        inner_repo.find_id_by_phone.assert_awaited_once_with(NEW)
+        assert identity.stats.false_positives == 0
+
+    @pytest.mark.asyncio
+    async def test_false_positive_is_counted(
+        self,
+        repository: CachedCustomerRepository,
+        inner_repo: AsyncMock,
+        identity: CustomerIdentityMap,
+    ):
+        """Filtro diz "talvez", banco diz "não": conta falso positivo."""
+        await identity.load()
+        inner_repo.find_id_by_phone.return_value = None
+
+        assert await repository.find_id_by_phone(KNOWN) is None
+
+        assert identity.stats.false_positives == 1
+
+
+class TestWrites:
+    """Testes de save/update/delete."""
+
+    @pytest.mark.asyncio
+    async def test_save_feeds_filter_but_not_cache(
+        self,
+        repository: CachedCustomerRepository,
+        inner_repo: AsyncMock,
+        identity: CustomerIdentityMap,
+    ):
+        """Depois do save, o número deixa de ser "novo" e vai ao banco."""
+        await identity.load()
+        customer = Customer(phone_number=NEW)
+
+        await repository.save(customer)
+        inner_repo.find_id_by_phone.return_value = customer.id
+
+        # INSERT ainda não comitado: o ID só entra no cache lido do banco
+        assert await repository.find_id_by_phone(NEW) == customer.id
+        inner_repo.save.assert_awaited_once_with(customer)
+        inner_repo.find_id_by_phone.assert_awaited_once_with(NEW)
+
+    @pytest.mark.asyncio
+    async def test_get_or_create_caches_only_existing_customer(
+        self,
+        repository: CachedCustomerRepository,
+        inner_repo: AsyncMock,
+        identity: CustomerIdentityMap,
+    ):
+        """Criado agora: só o filtro. Já existia (comitado): entra no cache."""
+        await identity.load()
+        created = Customer(phone_number=NEW)
+        existing = Customer(phone_number=KNOWN)
+        inner_repo.get_or_create.side_effect = [(created, True), (existing, False)]
+
+        await repository.get_or_create(created)
+        await repository.get_or_create(Customer(phone_number=KNOWN))
+
+        assert not identity.is_new(NEW)
+        assert identity.lookup(NEW) is MISSING
+        assert identity.lookup(KNOWN) == existing.id
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["update", "delete"])
+    async def test_update_and_delete_forget_cached_id(
+        self,
+        repository: CachedCustomerRepository,
+        inner_repo: AsyncMock,
+        identity: CustomerIdentityMap,
+        method: str,
+    ):
+        """Cliente alterado ou removido sai do cache."""
+        await identity.load()
+        customer = Customer(phone_number=KNOWN)
+        inner_repo.find_id_by_phone.return_value = customer.id
+        await repository.find_id_by_phone(KNOWN)
+
+        arg = customer if method == "update" else customer.id
+        await getattr(repository, method)(arg)
+        await repository.find_id_by_phone(KNOWN)
+
+        assert inner_repo.find_id_by_phone.await_count == 2
+
+
+class TestLoadAndSync:
+    """Testes da carga e da sincronização do filtro."""
+
+    @pytest.mark.asyncio
+    async def test_phone_saved_during_load_is_kept(
+        self,
+        source: FakePhoneSource,
+        identity: CustomerIdentityMap,
+    ):
+        """Cadastro no meio da carga entra no filtro novo."""
+        source.during_load = lambda: identity.add_phone(NEW)
+
+        await identity.load()
+
+        assert not identity.is_new(NEW)
+
+    @pytest.mark.asyncio
+    async def test_sync_reads_recent_id_range(
+        self,
+        source: FakePhoneSource,
+        identity: CustomerIdentityMap,
+    ):
+        """Sincronização: faixa de IDs desde a anterior, com folga."""
+        await identity.load()
+        source.phones_in_db.append(NEW)  # criado por outro worker
+
+        await identity.sync()
+
+        assert source.ranges[-1] == (
+            uuid7_floor(NOW - SYNC_OVERLAP_SECONDS),
+            uuid7_floor(NOW + SYNC_OVERLAP_SECONDS),
+        )
+        assert not identity.is_new(NEW)
+        assert identity.stats.syncs == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_start_keeps_serving_from_database(
+        self,
+        repository: CachedCustomerRepository,
+        inner_repo: AsyncMock,
+        identity: CustomerIdentityMap,
+        source: FakePhoneSource,
+    ):
+        """Carga inicial com erro: sem filtro, consultas vão ao banco."""
+        source.count = AsyncMock(side_effect=ConnectionError("banco fora"))
+        inner_repo.find_id_by_phone.return_value = None
+
+        await identity.start()
+        try:
+            await asyncio.sleep(0.01)  # tarefa de fundo tenta a carga
+            await repository.find_id_by_phone(NEW)
+        finally:
+            await identity.stop()
+
+        assert identity.stats.failures == 1
+        inner_repo.find_id_by_phone.assert_awaited_once_with(NEW)
@@ -0,0 +1,309 @@
+# ===========================================================
+# tests/unit/infrastructure/cache/test_order_cache.py
+# ===========================================================
+# Testes para o cache de pedidos (CachedOrderRepository).
+#
+# O repositório real é um AsyncMock: assim conseguimos contar
+# quantas vezes o "banco" foi consultado.
+# ===========================================================
+"""
+Testes unitários para OrderCache e CachedOrderRepository.
+
+Testa:
+- Cache read-through (hit/miss)
+- Cache negativo para pedidos inexistentes
+- Buscas que alimentam o cache usam o loader (primário)
+- Invalidação em save/update (e de novo no fim da transação)
+- TTL curto do nível local com Redis
+- Estatísticas de hit rate
+- TTL e LRU do TTLCache
+"""
+
+from collections.abc import AsyncIterator
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.domain.entities.order import Order
+from src.infrastructure.cache.memory_cache import MISSING, TTLCache
+from src.infrastructure.cache.order_cache import (
+    CachedOrderRepository,
+    OrderCache,
+)
+
+
+@pytest.fixture
+def inner_repo() -> AsyncMock:
+    """Repositório real simulado."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def cache() -> OrderCache:
+    """Cache sem Redis (apenas memória)."""
+    return OrderCache(ttl_seconds=60, negative_ttl_seconds=10)
+
+
+@pytest.fixture
+def repository(inner_repo: AsyncMock, cache: OrderCache) -> CachedOrderRepository:
+    """Repositório com cache."""
+    return CachedOrderRepository(inner_repo, cache)
+
+
+@pytest.fixture
+async def db() -> AsyncIterator[AsyncSession]:
+    """Sessão do banco real (SQLite em memória) para commit/rollback."""
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def sample_order() -> Order:
+    """Pedido de exemplo."""
+    return Order(customer_id="customer-123", total=Decimal("99.90"))
+
+
+class TestReadThrough:
+    """Testes de leitura com cache."""
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_hits_cache(
+        self,
+        repository: CachedOrderRepository,
+        inner_repo: AsyncMock,
+        cache: OrderCache,
+        sample_order: Order,
+    ):
+        """Segunda busca do mesmo pedido não deve ir ao banco."""
+        inner_repo.find_by_id.return_value = sample_order
+
+        first = await repository.find_by_id(sample_order.id)
+        second = await repository.find_by_id(sample_order.id)
+
+        assert first == sample_order
+        assert second == sample_order
+        inner_repo.find_by_id.assert_called_once()
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_returns_copy_of_cached_order(
+        self,
+        repository: CachedOrderRepository,
+        inner_repo: AsyncMock,
+        sample_order: Order,
+    ):
+        """Alterar o pedido retornado não deve alterar o cache."""
+        inner_repo.find_by_id.return_value = sample_order
+        await repository.find_by_id(sample_order.id)
+
+        cached = await repository.find_by_id(sample_order.id)
+        cached.confirm()
+
+        again = await repository.find_by_id(sample_order.id)
+        assert again.status != cached.status
+
+    @pytest.mark.asyncio
+    async def test_unknown_order_is_negatively_cached(
+        self,
+        repository: CachedOrderRepository,
+        inner_repo: AsyncMock,
+        cache: OrderCache,
+    ):
+        """Pedido inexistente digitado várias vezes vai ao banco uma vez."""
+        inner_repo.find_by_id.return_value = None
+
+        for _ in range(3):
+            assert await repository.find_by_id("PED-000000") is None
+
+        inner_repo.find_by_id.assert_called_once()
+        assert cache.stats.negative_hits == 2
+        assert cache.stats.hit_rate == pytest.approx(2 / 3)
+
+
+class TestLoader:
+    """Com réplica, o cache só é alimentado pelo primário."""
+
+    @pytest.mark.asyncio
+    async def test_cache_misses_read_from_loader(
+        self,
+        inner_repo: AsyncMock,
+        cache: OrderCache,
+        sample_order: Order,
+    ):
+        """find_by_id e find_by_numbers vão ao loader; inner não é lido."""
+        sample_order.number = "PED-000001"
+        primary = AsyncMock()
+        primary.find_by_id.return_value = sample_order
+        primary.find_by_numbers.return_value = [sample_order]
+        repository = CachedOrderRepository(inner_repo, cache, loader=primary)
+
+        assert await repository.find_by_id(sample_order.id) == sample_order
+        assert await repository.find_by_number("PED-000001") == sample_order
+
+        primary.find_by_id.assert_called_once_with(sample_order.id)
+        primary.find_by_numbers.assert_called_once_with(["PED-000001"])
+        inner_repo.find_by_id.assert_not_called()
+        inner_repo.find_by_numbers.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lists_still_use_inner(
+        self, inner_repo: AsyncMock, cache: OrderCache
+    ):
+        """Consultas sem cache continuam no inner (podem usar a réplica)."""
+        primary = AsyncMock()
+        repository = CachedOrderRepository(inner_repo, cache, loader=primary)
+
+        await repository.find_by_customer("customer-123")
+
+        inner_repo.find_by_customer.assert_called_once_with("customer-123")
+        primary.find_by_customer.assert_not_called()
+
+
+class TestFindByNumbers:
+    """Testes da busca em lote por número."""
+
+    @pytest.mark.asyncio
+    async def test_only_uncached_numbers_go_to_database(
+        self,
+        repository: CachedOrderRepository,
+        inner_repo: AsyncMock,
+    ):
+        """Números já cacheados não devem ser consultados de novo."""
+        first = Order(customer_id="c", number="PED-100001", total=Decimal("1"))
+        second = Order(customer_id="c", number="PED-100002", total=Decimal("1"))
+        inner_repo.find_by_numbers.side_effect = [[first], [second]]
+
+        await repository.find_by_numbers(["PED-100001"])
+        orders = await repository.find_by_numbers(["PED-100002", "PED-100001"])
+
+        assert [o.number for o in orders] == ["PED-100002", "PED-100001"]
+        assert inner_repo.find_by_numbers.call_args_list[1].args == (["PED-100002"],)
+
+    @pytest.mark.asyncio
+    async def test_unknown_number_is_negatively_cached(
+        self,
+        repository: CachedOrderRepository,
+        inner_repo: AsyncMock,
+    ):
+        """Número inexistente repetido não deve voltar ao banco."""
+        inner_repo.find_by_numbers.return_value = []
+
+        assert await repository.find_by_number("PED-999999") is None
+        assert await repository.find_by_number("PED-999999") is None
+
+        inner_repo.find_by_numbers.assert_called_once_with(["PED-999999"])
+
+
+class TestInvalidation:
+    """Testes de invalidação em escrita."""
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_cached_order(
+        self,
+        repository: CachedOrderRepository,
+        inner_repo: AsyncMock,
+        sample_order: Order,
+    ):
+        """Após update, a próxima leitura deve ir ao banco."""
+        inner_repo.find_by_id.return_value = sample_order
+        await repository.find_by_id(sample_order.id)
+
+        await repository.update(sample_order)
+        await repository.find_by_id(sample_order.id)
+
+        inner_repo.update.assert_called_once_with(sample_order)
+        assert inner_repo.find_by_id.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_save_clears_negative_entry(
+        self,
+        repository: CachedOrderRepository,
+        inner_repo: AsyncMock,
+        sample_order: Order,
+    ):
+        """Pedido criado deve deixar de aparecer como inexistente."""
+        inner_repo.find_by_id.return_value = None
+        assert await repository.find_by_id(sample_order.id) is None
+
+        await repository.save(sample_order)
+        inner_repo.find_by_id.return_value = sample_order
+
+        assert await repository.find_by_id(sample_order.id) == sample_order
+
+
+class TestTransactionEnd:
+    """Invalidação de novo quando a transação do turno termina."""
+
+    @pytest.mark.parametrize("finish", ["commit", "rollback"])
+    @pytest.mark.asyncio
+    async def test_read_before_commit_is_discarded(
+        self,
+        inner_repo: AsyncMock,
+        cache: OrderCache,
+        db: AsyncSession,
+        sample_order: Order,
+        finish: str,
+    ):
+        """Versão lida (e cacheada) entre o UPDATE e o fim da transação é descartada."""
+        repository = CachedOrderRepository(inner_repo, cache, db=db)
+        await db.execute(text("SELECT 1"))
+        await repository.update(sample_order)
+
+        # Leitura concorrente antes do COMMIT: guarda a linha antiga
+        await cache.put(sample_order.id, sample_order)
+        await getattr(db, finish)()
+
+        assert await cache.get(sample_order.id) is MISSING
+
+
+class TestLocalTTL:
+    """TTL próprio do nível local (com Redis)."""
+
+    @pytest.mark.asyncio
+    async def test_local_ttl_caps_local_copy(self, sample_order: Order):
+        """A cópia local expira no TTL curto, não no do Redis."""
+        clock = [0.0]
+        cache = OrderCache(ttl_seconds=60, local_ttl_seconds=5)
+        cache._local = TTLCache(max_entries=10, ttl_seconds=60, clock=lambda: clock[0])
+        await cache.put(sample_order.id, sample_order)
+
+        clock[0] = 6.0
+
+        assert await cache.get(sample_order.id) is MISSING
+
+
+class TestTTLCache:
+    """Testes para o cache em memória."""
+
+    def test_expired_item_is_missing(self):
+        """Item com TTL vencido deve ser tratado como ausente."""
+        now = [0.0]
+        cache: TTLCache[str, int] = TTLCache(
+            max_entries=10, ttl_seconds=5, clock=lambda: now[0]
+        )
+        cache.set("a", 1)
+
+        now[0] = 6.0
+
+        assert cache.get("a") is MISSING
+        assert cache.stats.expirations == 1
+
+    def test_evicts_least_recently_used(self):
+        """Ao encher, deve remover o item usado há mais tempo."""
+        cache: TTLCache[str, int] = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "a" passa a ser o mais recente
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert cache.stats.evictions == 1
@@ -0,0 +1,329 @@
+# ===========================================================
+# tests/unit/infrastructure/cache/test_product_catalog.py
+# ===========================================================
+# Testes para o catálogo de produtos em memória.
+#
+# A origem (banco) é um objeto falso com versão e produtos
+# controlados pelo teste; o repositório real é um AsyncMock
+# para contar quantas leituras foram ao banco.
+# ===========================================================
+"""
+Testes unitários para CatalogSnapshot, ProductCatalog e
+CachedProductRepository.
+
+Testa:
+- Índices do snapshot (ID, categoria, preço, disponíveis)
+- Leituras servidas pela memória, sem ir ao banco
+- Reconstrução só quando a versão muda
+- Escritas deste worker: leituras vão ao banco até reconstruir
+- Cópias independentes
+"""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.entities.product import Product
+from src.infrastructure.cache.product_catalog import (
+    CachedProductRepository,
+    CatalogSnapshot,
+    ProductCatalog,
+)
+
+
+def _product(name: str, category: str, price: str, stock: int = 5) -> Product:
+    return Product(
+        name=name, price=Decimal(price), category=category, stock=stock, id=name
+    )
+
+
+# Em ordem de categoria e nome, como a origem entrega
+PRODUCTS = [
+    _product("Caneca", "Casa", "30.00"),
+    _product("Vaso", "Casa", "80.00", stock=0),
+    _product("Boné", "Vestuário", "30.00"),
+    _product("Calça", "Vestuário", "120.00"),
+    _product("Camiseta", "Vestuário", "50.00"),
+]
+
+
+class FakeSource:
+    """Origem controlada pelo teste."""
+
+    def __init__(self, products: list[Product]) -> None:
+        self.products = products
+        self.current_version = 1
+        self.loads = 0
+
+    async def version(self) -> int:
+        return self.current_version
+
+    async def load(self) -> list[Product]:
+        self.loads += 1
+        return list(self.products)
+
+
+@pytest.fixture
+def source() -> FakeSource:
+    return FakeSource(PRODUCTS)
+
+
+@pytest.fixture
+def catalog(source: FakeSource) -> ProductCatalog:
+    return ProductCatalog(source, refresh_interval_seconds=60)
+
+
+@pytest.fixture
+def inner_repo() -> AsyncMock:
+    """Repositório real simulado."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def repository(
+    inner_repo: AsyncMock, catalog: ProductCatalog
+) -> CachedProductRepository:
+    return CachedProductRepository(inner_repo, catalog)
+
+
+class TestCatalogSnapshot:
+    """Testes dos índices do snapshot."""
+
+    def test_indexes(self):
+        """Cada índice segue a ordem da consulta SQL equivalente."""
+        snapshot = CatalogSnapshot.build(1, PRODUCTS)
+
+        assert len(snapshot) == 5
+        assert snapshot.by_id["Calça"].price == Decimal("120.00")
+        assert [p.name for p in snapshot.by_category["Vestuário"]] == [
+            "Boné",
+            "Calça",
+            "Camiseta",
+        ]
+        assert snapshot.categories == ("Casa", "Vestuário")
+        assert "Vaso" not in [p.name for p in snapshot.available]
+
+    def test_price_order_keeps_category_and_name_on_ties(self):
+        """Empates de preço ficam em ordem de categoria e nome."""
+        snapshot = CatalogSnapshot.build(1, PRODUCTS)
+
+        assert [p.name for p in snapshot.by_price] == [
+            "Caneca", "Boné", "Camiseta", "Vaso", "Calça",
+        ]
+
+    def test_price_range_is_inclusive(self):
+        """Faixa de preço inclui os limites."""
+        snapshot = CatalogSnapshot.build(1, PRODUCTS)
+
+        products = snapshot.price_range(Decimal("30.00"), Decimal("50.00"))
+
+        assert [p.name for p in products] == ["Caneca", "Boné", "Camiseta"]
+        assert snapshot.price_range(Decimal("200"), Decimal("300")) == ()
+
+    def test_is_immutable(self):
+        """O snapshot e seus índices não aceitam alteração."""
+        snapshot = CatalogSnapshot.build(1, PRODUCTS)
+
+        with pytest.raises(AttributeError):
+            snapshot.version = 2
+        with pytest.raises(TypeError):
+            snapshot.by_id["novo"] = PRODUCTS[0]
+
+
+class TestProductCatalog:
+    """Testes da reconstrução do snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_skips_same_version(
+        self, catalog: ProductCatalog, source: FakeSource
+    ):
+        """Versão igual: não recarrega."""
+        assert await catalog.refresh() is True
+        assert await catalog.refresh() is False
+
+        assert source.loads == 1
+        assert catalog.stats.version_checks == 2
+        assert catalog.stats.rebuilds == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_swaps_snapshot_on_new_version(
+        self, catalog: ProductCatalog, source: FakeSource
+    ):
+        """Versão nova: snapshot novo; quem tinha o antigo continua com ele."""
+        await catalog.refresh()
+        old = catalog.snapshot
+
+        source.products = PRODUCTS[:2]
+        source.current_version = 2
+        assert await catalog.refresh() is True
+
+        assert len(catalog.snapshot) == 2
+        assert len(old) == 5
+        assert catalog.stats.products == 2
+
+    @pytest.mark.asyncio
+    async def test_dirty_snapshot_is_hidden_until_rebuild(
+        self, catalog: ProductCatalog
+    ):
+        """Depois de uma escrita, o snapshot só volta após reconstruir."""
+        await catalog.refresh()
+
+        catalog.mark_dirty()
+        assert catalog.snapshot is None
+
+        assert await catalog.refresh() is True
+        assert catalog.snapshot is not None
+
+    @pytest.mark.asyncio
+    async def test_write_during_rebuild_stays_dirty(self, source: FakeSource):
+        """Escrita no meio da carga: o snapshot novo já pode estar velho."""
+        catalog = ProductCatalog(source)
+        original_load = source.load
+
+        async def load_with_write() -> list[Product]:
+            catalog.mark_dirty()
+            return await original_load()
+
+        source.load = load_with_write
+        await catalog.refresh()
+
+        assert catalog.snapshot is None
+
+    @pytest.mark.asyncio
+    async def test_start_survives_load_failure(self, source: FakeSource):
+        """Sem banco na partida: sem snapshot, mas o laço segue."""
+        source.version = AsyncMock(side_effect=ConnectionError("banco fora"))
+        catalog = ProductCatalog(source, refresh_interval_seconds=60)
+
+        await catalog.start()
+        await catalog.stop()
+
+        assert catalog.snapshot is None
+        assert catalog.stats.failures == 1
+
+
+class TestCachedProductRepository:
+    """Testes do decorator do repositório."""
+
+    @pytest.mark.asyncio
+    async def test_reads_come_from_snapshot(
+        self,
+        repository: CachedProductRepository,
+        catalog: ProductCatalog,
+        inner_repo: AsyncMock,
+    ):
+        """Com snapshot, nenhuma leitura vai ao banco."""
+        await catalog.refresh()
+
+        assert (await repository.find_by_id("Calça")).name == "Calça"
+        in_category = await repository.find_by_category("Casa")
+        assert [p.name for p in in_category] == ["Caneca", "Vaso"]
+        assert len(await repository.find_all_active()) == 4
+        assert await repository.list_categories() == ["Casa", "Vestuário"]
+        in_range = await repository.find_by_price_range(Decimal("0"), Decimal("40"))
+        assert len(in_range) == 2
+
+        assert inner_repo.method_calls == []
+        assert catalog.stats.hits == 5
+
+    @pytest.mark.asyncio
+    async def test_reads_go_to_origin_without_snapshot(
+        self, repository: CachedProductRepository, inner_repo: AsyncMock
+    ):
+        """Antes da primeira carga, lê do banco."""
+        inner_repo.find_all_active.return_value = []
+
+        await repository.find_all_active()
+
+        inner_repo.find_all_active.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unknown_id_goes_to_origin(
+        self,
+        repository: CachedProductRepository,
+        catalog: ProductCatalog,
+        inner_repo: AsyncMock,
+    ):
+        """Produto fora do snapshot (ex: inativo) é buscado no banco."""
+        await catalog.refresh()
+        inner_repo.find_by_id.return_value = None
+
+        assert await repository.find_by_id("inativo") is None
+        inner_repo.find_by_id.assert_awaited_once_with("inativo")
+
+    @pytest.mark.asyncio
+    async def test_returns_independent_copies(
+        self, repository: CachedProductRepository, catalog: ProductCatalog
+    ):
+        """Alterar o produto devolvido não altera o snapshot."""
+        await catalog.refresh()
+
+        product = await repository.find_by_id("Camiseta")
+        product.decrease_stock(5)
+
+        assert catalog.snapshot.by_id["Camiseta"].stock == 5
+
+    @pytest.mark.asyncio
+    async def test_update_makes_reads_go_to_origin(
+        self,
+        repository: CachedProductRepository,
+        catalog: ProductCatalog,
+        inner_repo: AsyncMock,
+    ):
+        """Read-your-writes: depois de update, lê do banco."""
+        await catalog.refresh()
+        inner_repo.find_by_category.return_value = []
+
+        await repository.update(PRODUCTS[0])
+        await repository.find_by_category("Casa")
+
+        inner_repo.update.assert_awaited_once()
+        inner_repo.find_by_category.assert_awaited_once_with("Casa")
+
+    @pytest.mark.asyncio
+    async def test_search_goes_to_origin(
+        self,
+        repository: CachedProductRepository,
+        catalog: ProductCatalog,
+        inner_repo: AsyncMock,
+    ):
+        """Busca textual sempre no banco."""
+        await catalog.refresh()
+        inner_repo.search.return_value = []
+
+        await repository.search("caneca", limit=5)
+
+        inner_repo.search.assert_awaited_once_with("caneca", 5, 0)
+
+    @pytest.mark.asyncio
+    async def test_periodic_refresh_picks_up_changes(self, source: FakeSource):
+        """O laço de fundo reconstrói quando a versão muda."""
+        catalog = ProductCatalog(source, refresh_interval_seconds=0.01)
+        await catalog.start()
+
+        source.products = PRODUCTS[:1]
+        source.current_version = 2
+        for _ in range(100):
+            if catalog.stats.rebuilds == 2:
+                break
+            await asyncio.sleep(0.01)
+        await catalog.stop()
+
+        assert len(catalog.snapshot) == 1
+
+    @pytest.mark.asyncio
+    async def test_reserve_stock_goes_to_origin_and_keeps_snapshot(
+        self,
+        repository: CachedProductRepository,
+        catalog: ProductCatalog,
+        inner_repo: AsyncMock,
+    ):
+        """Reserva é checada no banco e não suja o snapshot."""
+        await catalog.refresh()
+        inner_repo.reserve_stock.return_value = 4
+
+        assert await repository.reserve_stock("Camiseta", 1) == 4
+        inner_repo.reserve_stock.assert_awaited_once_with("Camiseta", 1)
+        assert catalog.snapshot is not None
@@ -0,0 +1,330 @@
+# ===========================================================
+# tests/unit/infrastructure/cache/test_redis_session_repository.py
+# ===========================================================
+# Testes para RedisSessionRepository.
+#
+# fakeredis:
+# Implementa os comandos do Redis em memória, no próprio
+# processo. Os testes exercitam os comandos de verdade
+# (HSET, EXPIREAT, WATCH/MULTI...) sem precisar de servidor.
+# ===========================================================
+"""
+Testes unitários para RedisSessionRepository.
+
+Testa:
+- Gravação e leitura (por cliente, ID e telefone)
+- Update parcial via dirty tracking
+- Expiração nativa (TTL) e contagem de ativas
+- Remoção
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from src.domain.entities.customer import Customer
+from src.domain.entities.session import SESSION_TTL, Session
+from src.infrastructure.cache.redis_session_repository import (
+    RedisSessionRepository,
+)
+from src.shared.types.enums import SessionState
+
+
+@pytest.fixture
+def redis() -> FakeAsyncRedis:
+    """Redis em memória (decode_responses igual ao cliente real)."""
+    return FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def customer_repo() -> AsyncMock:
+    """Repositório de clientes simulado."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def repository(
+    redis: FakeAsyncRedis, customer_repo: AsyncMock
+) -> RedisSessionRepository:
+    """Repositório de sessões sobre o Redis falso."""
+    return RedisSessionRepository(redis, customer_repo)
+
+
+@pytest.fixture
+def sample_session() -> Session:
+    """Sessão com estado e contexto."""
+    session = Session(customer_id="customer-123")
+    session.update_state(SessionState.PRODUCTS)
+    session.set_context("search_query", "camiseta")
+    session.set_context("cart", [{"sku": "X1", "qty": 2}])
+    return session
+
+
+class TestSaveAndFind:
+    """Testes de gravação e busca."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_by_customer(
+        self,
+        repository: RedisSessionRepository,
+        sample_session: Session,
+    ):
+        """Sessão gravada deve voltar igual (inclusive o contexto)."""
+        await repository.save(sample_session)
+
+        found = await repository.find_by_customer("customer-123")
+
+        assert found == sample_session
+        assert found.context["cart"] == [{"sku": "X1", "qty": 2}]
+        assert not sample_session.is_dirty
+
+    @pytest.mark.asyncio
+    async def test_find_by_id(
+        self,
+        repository: RedisSessionRepository,
+        sample_session: Session,
+    ):
+        """Busca por ID deve seguir o ponteiro até o cliente."""
+        await repository.save(sample_session)
+
+        assert await repository.find_by_id(sample_session.id) == sample_session
+        assert await repository.find_by_id("inexistente") is None
+
+    @pytest.mark.asyncio
+    async def test_new_session_replaces_previous(
+        self,
+        repository: RedisSessionRepository,
+        sample_session: Session,
+    ):
+        """Cliente tem uma sessão só: a antiga deixa de ser encontrada."""
+        await repository.save(sample_session)
+        newer = Session(customer_id="customer-123")
+        await repository.save(newer)
+
+        assert (await repository.find_by_customer("customer-123")).id == newer.id
+        assert await repository.find_by_id(sample_session.id) is None
+        assert await repository.count_active() == 1
+
+    @pytest.mark.asyncio
+    async def test_find_active_by_phone(
+        self,
+        repository: RedisSessionRepository,
+        customer_repo: AsyncMock,
+    ):
+        """Busca por telefone deve resolver o cliente primeiro."""
+        customer = Customer(phone_number="5511999999999")
+        customer_repo.find_by_phone.return_value = customer
+        session = Session(customer_id=customer.id)
+        await repository.save(session)
+
+        found = await repository.find_active_by_phone("5511999999999")
+
+        assert found.id == session.id
+
+
+class TestGetOrCreate:
+    """Testes de get_or_create (uma sessão ativa por cliente)."""
+
+    @pytest.mark.asyncio
+    async def test_creates_when_customer_has_none(
+        self,
+        repository: RedisSessionRepository,
+        sample_session: Session,
+    ):
+        """Sem sessão: grava a recebida."""
+        session, created = await repository.get_or_create(sample_session)
+
+        assert (session, created) == (sample_session, True)
+        found = await repository.find_by_customer("customer-123")
+        assert found.id == sample_session.id
+        assert not sample_session.is_dirty
+
+    @pytest.mark.asyncio
+    async def test_returns_active_session(
+        self,
+        repository: RedisSessionRepository,
+        sample_session: Session,
+    ):
+        """Mensagens simultâneas: a segunda recebe a sessão da primeira."""
+        first, second = await asyncio.gather(
+            repository.get_or_create(sample_session),
+            repository.get_or_create(Session(customer_id="customer-123")),
+        )
+
+        assert first == (sample_session, True)
+        assert second[1] is False
+        assert second[0].id == sample_session.id
+        assert await repository.count_active() == 1
+
+    @pytest.mark.asyncio
+    async def test_replaces_expired_session(
+        self,
+        repository: RedisSessionRepository,
+        sample_session: Session,
+    ):
+        """Sessão expirada não conta: a nova a substitui."""
+        sample_session.expires_at = datetime.now() - timedelta(seconds=1)
+        await repository.save(sample_session)
+        newer = Session(customer_id="customer-123")
+
+        session, created = await repository.get_or_create(newer)
+
+        assert (session.id, created) == (newer.id, True)
+        assert await repository.find_by_id(sample_session.id) is None
+
+
+class TestUpdate:
+    """Testes de atualização parcial."""
+
+    @pytest.mark.asyncio
+    async def test_update_writes_changes(
+        self,
+        repository: RedisSessionRepository,
+        sample_session: Session,
+    ):
+        """Alterações de estado e contexto devem ser persistidas."""
+        await repository.save(sample_session)
+        sample_session.update_state(SessionState.ORDER_STATUS)
+        sample_session.remove_context("search_query")
+        sample_session.set_context("order", "PED-123456")
+
+        await repository.update(sample_session)
+        found = await repository.find_by_customer("customer-123")
+
+        assert found.state == SessionState.ORDER_STATUS
+        assert found.context == {
+            "cart": [{"sku": "X1", "qty": 2}],
+            "order": "PED-123456",
+        }
+        assert not sample_session.is_dirty
+
+    @pytest.mark.asyncio
+    async def test_update_only_touches_changed_fields(
+        self,
+        repository: RedisSessionRepository,
+        redis: FakeAsyncRedis,
+        sample_session: Session,
+    ):
+        """Campos não alterados não devem ser regravados."""
+        await repository.save(sample_session)
+        key = "session:customer:customer-123"
+        await redis.hset(key, "c:cart", '"marcador"')  # alteração externa
+
+        sample_session.set_context("search_query", "calça")
+        await repository.update(sample_session)
+
+        assert await redis.hget(key, "c:cart") == '"marcador"'
+        assert await redis.hget(key, "c:search_query") == '"calça"'
+
+    @pytest.mark.asyncio
+    async def test_clean_session_is_not_written(
+        self,
+        repository: RedisSessionRepository,
+        redis: FakeAsyncRedis,
+    ):
+        """Sessão sem alterações não deve gerar comandos."""
+        redis.transaction = AsyncMock()
+
+        await repository.update(Session(customer_id="customer-123"))
+
+        redis.transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_missing_session_raises_error(
+        self,
+        repository: RedisSessionRepository,
+        redis: FakeAsyncRedis,
+        sample_session: Session,
+    ):
+        """Atualizar sessão inexistente deve levantar erro (sem criar hash)."""
+        with pytest.raises(ValueError, match="Sessão não encontrada"):
+            await repository.update(sample_session)
+
+        assert await redis.exists("session:customer:customer-123") == 0
+
+
+class TestExpiration:
+    """Testes de expiração nativa."""
+
+    @pytest.mark.asyncio
+    async def test_keys_expire_with_session(
+        self,
+        repository: RedisSessionRepository,
+        redis: FakeAsyncRedis,
+        sample_session: Session,
+    ):
+        """Hash e ponteiro devem ter TTL igual ao da sessão."""
+        await repository.save(sample_session)
+
+        ttl = await redis.ttl("session:customer:customer-123")
+        pointer_ttl = await redis.ttl(f"session:id:{sample_session.id}")
+
+        assert SESSION_TTL.total_seconds() - 5 <= ttl <= SESSION_TTL.total_seconds() + 1
+        assert abs(pointer_ttl - ttl) <= 1
+
+    @pytest.mark.asyncio
+    async def test_renewal_moves_expiration(
+        self,
+        repository: RedisSessionRepository,
+        redis: FakeAsyncRedis,
+    ):
+        """Renovar a sessão deve empurrar o TTL das chaves."""
+        session = Session(
+            customer_id="customer-123",
+            expires_at=datetime.now() + timedelta(minutes=10),
+        )
+        await repository.save(session)
+
+        session.renew()
+        await repository.update(session)
+
+        assert await redis.ttl("session:customer:customer-123") > 3600
+
+    @pytest.mark.asyncio
+    async def test_count_and_delete_expired(
+        self,
+        repository: RedisSessionRepository,
+    ):
+        """Contagem deve ignorar expiradas; delete_expired limpa o índice."""
+        await repository.save(Session(customer_id="ativo"))
+        await repository.save(
+            Session(
+                customer_id="expirado",
+                expires_at=datetime.now() - timedelta(seconds=1),
+            )
+        )
+
+        assert await repository.count_active() == 1
+        assert await repository.find_by_customer("expirado") is None
+        assert await repository.delete_expired() == 1
+        assert await repository.delete_expired() == 0
+
+
+class TestDelete:
+    """Testes de remoção."""
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_session(
+        self,
+        repository: RedisSessionRepository,
+        sample_session: Session,
+    ):
+        """Sessão removida não deve mais ser encontrada."""
+        await repository.save(sample_session)
+
+        await repository.delete(sample_session.id)
+
+        assert await repository.find_by_customer("customer-123") is None
+        assert await repository.count_active() == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_missing_session_raises_error(
+        self,
+        repository: RedisSessionRepository,
+    ):
+        """Remover sessão inexistente deve levantar erro."""
+        with pytest.raises(ValueError, match="Sessão não encontrada"):
+            await repository.delete("inexistente")
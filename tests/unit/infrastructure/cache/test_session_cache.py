@@ -0,0 +1,370 @@
+# ===========================================================
+# tests/unit/infrastructure/cache/test_session_cache.py
+# ===========================================================
+# Testes para o cache de sessões (CachedSessionRepository).
+#
+# O repositório real é um AsyncMock: assim conseguimos contar
+# quantas vezes a "origem" foi consultada.
+# ===========================================================
+"""
+Testes unitários para SessionCache e CachedSessionRepository.
+
+Testa:
+- Leitura da memória após a primeira busca
+- Read-your-writes (save/update alimentam o cache)
+- Escritas só chegam ao cache no COMMIT (ROLLBACK descarta)
+- Cópias independentes
+- Limites de quantidade e memória
+- Invalidação entre workers (Pub/Sub), inclusive após queda do Redis
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.domain.entities.session import Session
+from src.infrastructure.cache.memory_cache import MISSING
+from src.infrastructure.cache.session_cache import (
+    CachedSessionRepository,
+    SessionCache,
+    SessionInvalidationBus,
+)
+from src.shared.types.enums import SessionState
+
+
+@pytest.fixture
+def inner_repo() -> AsyncMock:
+    """Repositório real simulado."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def cache() -> SessionCache:
+    """Cache sem barramento de invalidação."""
+    return SessionCache(ttl_seconds=30)
+
+
+@pytest.fixture
+def repository(inner_repo: AsyncMock, cache: SessionCache) -> CachedSessionRepository:
+    """Repositório com cache."""
+    return CachedSessionRepository(inner_repo, cache)
+
+
+@pytest.fixture
+def sample_session() -> Session:
+    """Sessão gravada (sem alterações pendentes)."""
+    session = Session(customer_id="customer-123")
+    session.mark_clean()
+    return session
+
+
+class TestReadThrough:
+    """Testes de leitura com cache."""
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_hits_memory(
+        self,
+        repository: CachedSessionRepository,
+        inner_repo: AsyncMock,
+        cache: SessionCache,
+        sample_session: Session,
+    ):
+        """Segunda busca da mesma sessão não deve ir à origem."""
+        inner_repo.find_by_customer.return_value = sample_session
+
+        await repository.find_by_customer("customer-123")
+        found = await repository.find_by_customer("customer-123")
+
+        assert found == sample_session
+        inner_repo.find_by_customer.assert_called_once()
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_returns_independent_copy(
+        self,
+        repository: CachedSessionRepository,
+        inner_repo: AsyncMock,
+        sample_session: Session,
+    ):
+        """Alterar a sessão recebida não deve alterar o cache."""
+        inner_repo.find_by_customer.return_value = sample_session
+        await repository.find_by_customer("customer-123")
+
+        first = await repository.find_by_customer("customer-123")
+        first.set_context("cart", ["X1"])
+        second = await repository.find_by_customer("customer-123")
+
+        assert second.context == {}
+        assert not second.is_dirty
+
+    @pytest.mark.asyncio
+    async def test_expired_copy_is_not_served(
+        self,
+        repository: CachedSessionRepository,
+        inner_repo: AsyncMock,
+    ):
+        """Cópia de sessão expirada deve ser tratada como ausente."""
+        expired = Session(
+            customer_id="customer-123",
+            expires_at=datetime.now() - timedelta(seconds=1),
+        )
+        await repository.save(expired)
+        inner_repo.find_by_customer.return_value = None
+
+        assert await repository.find_by_customer("customer-123") is None
+        inner_repo.find_by_customer.assert_called_once()
+
+
+class TestReadYourWrites:
+    """Testes de escrita alimentando o cache."""
+
+    @pytest.mark.asyncio
+    async def test_update_is_visible_without_reading_origin(
+        self,
+        repository: CachedSessionRepository,
+        inner_repo: AsyncMock,
+        sample_session: Session,
+    ):
+        """Após o update, a próxima leitura vem da memória e já atualizada."""
+        await repository.save(sample_session)
+        sample_session.update_state(SessionState.FAQ)
+
+        await repository.update(sample_session)
+        found = await repository.find_by_customer("customer-123")
+
+        assert found.state == SessionState.FAQ
+        inner_repo.update.assert_called_once_with(sample_session)
+        inner_repo.find_by_customer.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_clean_update_is_skipped(
+        self,
+        repository: CachedSessionRepository,
+        inner_repo: AsyncMock,
+        sample_session: Session,
+    ):
+        """Sessão sem alterações não deve ir à origem."""
+        await repository.update(sample_session)
+
+        inner_repo.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_discards_copy(
+        self,
+        repository: CachedSessionRepository,
+        inner_repo: AsyncMock,
+        sample_session: Session,
+    ):
+        """Sessão removida não deve continuar no cache."""
+        await repository.save(sample_session)
+        inner_repo.find_by_customer.return_value = None
+
+        await repository.delete(sample_session.id)
+
+        assert await repository.find_by_customer("customer-123") is None
+        inner_repo.delete.assert_called_once_with(sample_session.id)
+
+
+class TestTransaction:
+    """Com a sessão do banco do turno: cache só no COMMIT."""
+
+    @pytest.fixture
+    async def db(self) -> AsyncIterator[AsyncSession]:
+        """Sessão do banco real (SQLite em memória) para commit/rollback."""
+        pytest.importorskip("aiosqlite")
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with AsyncSession(engine) as session:
+            await session.execute(text("SELECT 1"))
+            yield session
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_create_is_not_cached(
+        self,
+        inner_repo: AsyncMock,
+        cache: SessionCache,
+        db: AsyncSession,
+    ):
+        """get_or_create desfeito: o ID que não existe no banco não fica no cache."""
+        created = Session(customer_id="customer-123")
+        inner_repo.get_or_create.return_value = (created, True)
+        repository = CachedSessionRepository(inner_repo, cache, db=db)
+
+        await repository.get_or_create(created)
+        # O próprio turno vê a sessão que criou
+        assert (await repository.find_by_customer("customer-123")).id == created.id
+
+        await db.rollback()
+
+        assert cache.get("customer-123") is MISSING
+
+    @pytest.mark.asyncio
+    async def test_update_reaches_cache_only_on_commit(
+        self,
+        inner_repo: AsyncMock,
+        cache: SessionCache,
+        db: AsyncSession,
+        sample_session: Session,
+    ):
+        """Antes do COMMIT, outros turnos não veem a versão nova."""
+        await cache.store(sample_session)
+        repository = CachedSessionRepository(inner_repo, cache, db=db)
+        sample_session.update_state(SessionState.FAQ)
+
+        await repository.update(sample_session)
+        assert cache.get("customer-123") is MISSING
+
+        await db.commit()
+
+        assert cache.get("customer-123").state == SessionState.FAQ
+
+
+class TestLimits:
+    """Testes dos limites de memória."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_by_entry_count(self, inner_repo: AsyncMock):
+        """Acima de max_entries, a sessão menos usada sai."""
+        cache = SessionCache(max_entries=2)
+        repository = CachedSessionRepository(inner_repo, cache)
+
+        for customer_id in ("a", "b", "c"):
+            await repository.save(Session(customer_id=customer_id))
+
+        assert cache.get("a") is MISSING
+        assert cache.get("c") is not MISSING
+        assert cache.stats.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_by_memory(self, inner_repo: AsyncMock):
+        """Acima de max_bytes, sessões antigas saem."""
+        cache = SessionCache(max_entries=100, max_bytes=3_000)
+        repository = CachedSessionRepository(inner_repo, cache)
+
+        for index in range(5):
+            session = Session(customer_id=f"c{index}")
+            session.set_context("blob", "x" * 500)
+            await repository.save(session)
+
+        assert cache.size_bytes <= 3_000
+        assert cache.stats.evictions >= 2
+
+
+class TestInvalidationBus:
+    """Testes de invalidação entre workers."""
+
+    @pytest.mark.asyncio
+    async def test_write_on_one_worker_invalidates_other(
+        self,
+        sample_session: Session,
+    ):
+        """Escrita publicada por um worker descarta a cópia do outro."""
+        redis = FakeAsyncRedis(decode_responses=True)
+        writer = SessionCache(bus=SessionInvalidationBus(redis))
+        reader = SessionCache(bus=SessionInvalidationBus(redis))
+        await reader.start()
+        await asyncio.sleep(0.05)  # espera a inscrição no canal
+
+        try:
+            await reader.store(sample_session)
+            await writer.store(sample_session)
+
+            for _ in range(50):
+                if reader.stats.remote_invalidations:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert reader.stats.remote_invalidations == 1
+            assert reader.get("customer-123") is MISSING
+        finally:
+            await reader.stop()
+
+    @pytest.mark.asyncio
+    async def test_delete_without_local_copy_invalidates_other(
+        self,
+        sample_session: Session,
+    ):
+        """Remoção num worker sem a cópia ainda descarta a do outro."""
+        redis = FakeAsyncRedis(decode_responses=True)
+        writer = CachedSessionRepository(
+            AsyncMock(), SessionCache(bus=SessionInvalidationBus(redis))
+        )
+        reader = SessionCache(bus=SessionInvalidationBus(redis))
+        await reader.start()
+        await asyncio.sleep(0.05)  # espera a inscrição no canal
+
+        try:
+            await reader.store(sample_session)
+            await writer.delete(sample_session.id)
+
+            for _ in range(50):
+                if reader.stats.remote_invalidations:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert reader.stats.remote_invalidations == 1
+            assert reader.get("customer-123") is MISSING
+        finally:
+            await reader.stop()
+
+    @pytest.mark.asyncio
+    async def test_listener_recovers_after_redis_failure(
+        self,
+        sample_session: Session,
+    ):
+        """Queda na escuta: volta sozinha, limpa o cache e segue invalidando."""
+        redis = FakeAsyncRedis(decode_responses=True)
+        writer = SessionCache(bus=SessionInvalidationBus(redis))
+        reader = SessionCache(
+            bus=SessionInvalidationBus(_FlakyRedis(redis), retry_min_seconds=0.01)
+        )
+        await reader.store(sample_session)
+        await reader.start()
+
+        try:
+            for _ in range(50):
+                if reader.stats.bus_resyncs:
+                    break
+                await asyncio.sleep(0.01)
+
+            # Avisos podem ter se perdido na queda: nada local sobrevive
+            assert reader.stats.bus_failures == 1
+            assert reader.stats.bus_resyncs == 1
+            assert reader.get("customer-123") is MISSING
+
+            await reader.store(sample_session)
+            await writer.store(sample_session)
+            for _ in range(50):
+                if reader.stats.remote_invalidations:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert reader.stats.remote_invalidations == 1
+        finally:
+            await reader.stop()
+
+
+class _FlakyRedis:
+    """Redis cuja 1ª inscrição no canal falha (conexão caiu)."""
+
+    def __init__(self, redis: FakeAsyncRedis) -> None:
+        self._redis = redis
+        self._failed = False
+
+    def pubsub(self, **kwargs):
+        pubsub = self._redis.pubsub(**kwargs)
+        if not self._failed:
+            self._failed = True
+            pubsub.subscribe = AsyncMock(side_effect=RedisConnectionError("caiu"))
+        return pubsub
+
+    def __getattr__(self, name: str):
+        return getattr(self._redis, name)
@@ -0,0 +1,229 @@
+# ===========================================================
+# tests/unit/infrastructure/database/test_catalog_import.py
+# ===========================================================
+# Testes para a leitura e validação do arquivo de catálogo.
+#
+# O arquivo chega em pedaços pequenos (poucos bytes) de
+# propósito: registros, aspas e caracteres UTF-8 cortados no
+# meio precisam ser remontados. O COPY e o diff no banco são
+# testados em tests/integration/test_catalog_import.py.
+# ===========================================================
+"""
+Testes unitários para catalog_import.
+
+Testa:
+- CSV e JSONL lidos em pedaços
+- Campos entre aspas com quebra de linha
+- Validação de cada linha (e SKU preservado das inválidas)
+- Números de linha nas mensagens
+- Comando do diff (IS DISTINCT FROM, CTEs)
+"""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.database.catalog_import import (
+    MAX_ERRORS,
+    CatalogImportResult,
+    _diff_statement,
+    _drop_duplicates,
+    _staging_records,
+)
+
+
+async def _chunks(data: str, size: int = 5) -> AsyncIterator[bytes]:
+    """Arquivo em pedaços de `size` bytes."""
+    raw = data.encode()
+    for start in range(0, len(raw), size):
+        yield raw[start:start + size]
+
+
+async def _records(
+    data: str, format: str = "csv"
+) -> tuple[list[tuple], CatalogImportResult]:
+    result = CatalogImportResult()
+    staging = _staging_records(_chunks(data), format, result)
+    records = [record async for record in staging]
+    return records, result
+
+
+class TestCsv:
+    """Testes da leitura de CSV."""
+
+    @pytest.mark.asyncio
+    async def test_parses_rows_in_small_chunks(self):
+        """Linhas completas viram registros do staging, na ordem das colunas."""
+        data = (
+            "sku,name,price,category,description,image_url,stock\n"
+            "CAN-1,Caneca Térmica,\"49,90\",Casa,,https://x/1.jpg,7\n"
+            "VAS-2,Vaso,80,Casa,Cerâmica,,\n"
+        )
+
+        records, result = await _records(data)
+
+        assert result.received == 2
+        assert result.rejected == 0
+        (
+            line, valid, sku, id, name, description, price, image_url, category, stock
+        ) = records[0]
+        assert (line, valid, sku, name) == (2, True, "CAN-1", "Caneca Térmica")
+        assert (price, category, image_url, stock) == (
+            Decimal("49.90"), "Casa", "https://x/1.jpg", 7
+        )
+        assert description is None
+        assert id
+        # Estoque vazio: mantém o atual (None no staging)
+        assert records[1][4] == "Vaso"
+        assert records[1][9] is None
+
+    @pytest.mark.asyncio
+    async def test_quoted_field_with_line_breaks(self):
+        """Quebra de linha dentro de aspas não encerra o registro."""
+        data = (
+            "sku,name,price,category,description\n"
+            'A,Caneca,10,Casa,"primeira linha\nsegunda ""com aspas"""\n'
+            "B,Vaso,20,Casa,\n"
+        )
+
+        records, result = await _records(data)
+
+        assert records[0][5] == 'primeira linha\nsegunda "com aspas"'
+        # B começa na linha 4 do arquivo
+        assert [record[0] for record in records] == [2, 4]
+
+    @pytest.mark.asyncio
+    async def test_header_is_case_insensitive_and_crlf(self):
+        """Cabeçalho em maiúsculas, BOM e fim de linha do Windows."""
+        data = "\ufeffSKU,Name,Price,Category\r\nA,Caneca,10,Casa\r\n"
+
+        records, result = await _records(data)
+
+        assert result.received == 1
+        assert records[0][2] == "A"
+
+    @pytest.mark.asyncio
+    async def test_missing_required_column_fails(self):
+        """Sem coluna obrigatória, a importação inteira falha."""
+        with pytest.raises(ValueError, match="price, category"):
+            await _records("sku,name\nA,Caneca\n")
+
+    @pytest.mark.asyncio
+    async def test_invalid_utf8_fails(self):
+        """Arquivo fora de UTF-8 falha com ValueError."""
+        result = CatalogImportResult()
+
+        async def latin1() -> AsyncIterator[bytes]:
+            yield "sku,name,price,category\nA,Calça,10,Vestuário\n".encode("latin-1")
+
+        with pytest.raises(ValueError, match="UTF-8"):
+            [record async for record in _staging_records(latin1(), "csv", result)]
+
+
+class TestJsonl:
+    """Testes da leitura de JSONL."""
+
+    @pytest.mark.asyncio
+    async def test_parses_objects(self):
+        """Cada linha é um objeto; números JSON também servem."""
+        data = (
+            '{"sku": "A", "name": "Caneca", "price": 49.9, '
+            '"category": "Casa", "stock": 3}\n'
+            "\n"
+            '{"sku": 42, "name": "Vaso", "price": "80", "category": "Casa"}'
+        )
+
+        records, result = await _records(data, "jsonl")
+
+        assert result.received == 2
+        assert records[0][6] == Decimal("49.90")
+        assert records[0][9] == 3
+        assert records[1][2] == "42"
+        assert records[1][0] == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_lines_are_rejected(self):
+        """JSON quebrado ou que não é objeto: linha rejeitada."""
+        records, result = await _records('não é json\n[1, 2]\n', "jsonl")
+
+        assert records == []
+        assert result.rejected == 2
+        assert result.errors == [
+            "linha 1: JSON inválido",
+            "linha 2: Linha não é um objeto JSON",
+        ]
+
+
+class TestValidation:
+    """Testes da validação de cada linha."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "row, message",
+        [
+            ("A,,10,Casa,1", "Campo obrigatório vazio: name"),
+            ("A,Caneca,,Casa,1", "Campo obrigatório vazio: price"),
+            ("A,Caneca,abc,Casa,1", "Preço inválido"),
+            ("A,Caneca,-1,Casa,1", "Preço não pode ser negativo"),
+            ("A,Caneca,100000000,Casa,1", "Preço acima do limite"),
+            ("A,Caneca,10,Casa,-2", "Estoque não pode ser negativo"),
+            ("A,Caneca,10,Casa,2.5", "Estoque inválido"),
+            ("A,Caneca,10,Casa", "Número de campos diferente do cabeçalho"),
+        ],
+    )
+    async def test_rejects_invalid_rows(self, row: str, message: str):
+        """Linha inválida é contada, com número e motivo."""
+        _, result = await _records(f"sku,name,price,category,stock\n{row}\n")
+
+        assert result.rejected == 1
+        assert result.errors[0].startswith("linha 2: ")
+        assert message in result.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_invalid_row_keeps_sku_out_of_diff(self):
+        """Linha inválida com SKU vai marcada como inválida (não desativa o produto)."""
+        records, _ = await _records(
+            "sku,name,price,category\nA,Caneca,abc,Casa\n,Vaso,1,Casa\n"
+        )
+
+        assert records == [(2, False, "A", None, None, None, None, None, None, None)]
+
+    @pytest.mark.asyncio
+    async def test_error_messages_are_capped(self):
+        """Só as primeiras MAX_ERRORS mensagens são guardadas."""
+        rows = "".join(f"S{i},,10,Casa\n" for i in range(MAX_ERRORS + 5))
+
+        _, result = await _records(f"sku,name,price,category\n{rows}")
+
+        assert result.rejected == MAX_ERRORS + 5
+        assert len(result.errors) == MAX_ERRORS
+
+
+class TestDiffStatement:
+    """Testes do comando que aplica a diferença."""
+
+    def test_single_statement_with_all_steps(self):
+        """INSERT, UPDATE só do que mudou e desativação em um comando."""
+        statement = _diff_statement(datetime.now(), True)
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "INSERT INTO products" in sql
+        assert "IS DISTINCT FROM" in sql
+        assert "deactivated AS" in sql
+
+    def test_duplicate_skus_keep_last_line(self):
+        """SKU repetido: apaga as linhas anteriores do staging."""
+        sql = str(_drop_duplicates().compile(dialect=postgresql.dialect()))
+
+        assert "USING catalog_import_staging AS newer" in sql
+        assert "newer.line > catalog_import_staging.line" in sql
+
+    def test_partial_import_does_not_deactivate(self):
+        """deactivate_missing=False: o CTE de desativação nem é gerado."""
+        statement = _diff_statement(datetime.now(), False)
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "deactivated AS" not in sql
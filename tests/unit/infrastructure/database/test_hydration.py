@@ -0,0 +1,225 @@
+# ===========================================================
+# tests/unit/infrastructure/database/test_hydration.py
+# ===========================================================
+# Testes para RowHydrator (linha do Core -> entidade com slots).
+# ===========================================================
+"""
+Testes unitários para RowHydrator.
+
+Testa:
+- Colunas na ordem dos campos do construtor
+- Entidade montada sem __init__ (sem default_factory)
+- Campos fora do construtor recebem valor novo
+- Conversores por campo
+- one/all sobre o resultado
+- stream por cursor do servidor (yield_per)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.domain.entities.customer import Customer
+from src.domain.entities.product import Product
+from src.domain.entities.session import Session
+from src.infrastructure.database.hydration import RowHydrator
+from src.infrastructure.database.models import (
+    CustomerModel,
+    ProductModel,
+    SessionModel,
+)
+from src.shared.types.enums import SessionState
+
+
+NOW = datetime(2024, 1, 15, 10, 30)
+
+
+def _session_row(context: dict | None) -> tuple:
+    """Linha de sessões na ordem dos campos de Session."""
+    return (
+        "cliente-1",
+        SessionState.FAQ,
+        context,
+        "sessao-1",
+        NOW,
+        NOW,
+        NOW + timedelta(hours=24),
+    )
+
+
+class TestColumns:
+    """Testes das colunas selecionadas."""
+
+    def test_columns_follow_constructor_fields(self):
+        """Colunas = campos do construtor, na mesma ordem."""
+        hydrator = RowHydrator(Customer, CustomerModel)
+
+        assert [c.key for c in hydrator.columns] == [
+            "phone_number", "name", "email", "id", "created_at", "updated_at",
+        ]
+
+    def test_skips_non_init_fields(self):
+        """Campos de dirty tracking não são colunas."""
+        hydrator = RowHydrator(Session, SessionModel)
+
+        keys = [c.key for c in hydrator.columns]
+        assert "_changed_fields" not in keys
+        assert len(keys) == 7
+
+    def test_select_uses_only_columns(self):
+        """SELECT traz colunas, não o modelo inteiro."""
+        sql = str(RowHydrator(Product, ProductModel).select())
+
+        assert sql.startswith("SELECT products.name, products.price")
+
+    def test_requires_slots(self):
+        """Entidade sem slots=True é recusada."""
+
+        @dataclass
+        class Plain:
+            id: str
+
+        with pytest.raises(TypeError, match="slots=True"):
+            RowHydrator(Plain, CustomerModel)
+
+
+class TestHydrate:
+    """Testes da montagem das entidades."""
+
+    def test_builds_entity_from_row(self):
+        """Valores da linha vão para os campos certos."""
+        hydrator = RowHydrator(Product, ProductModel)
+        row = ("Camiseta", Decimal("49.90"), "Vestuário", None, None, 5, True,
+               "produto-1", NOW, NOW)
+
+        product = hydrator(row)
+
+        assert isinstance(product, Product)
+        assert product.id == "produto-1"
+        assert product.price == Decimal("49.90")
+        assert product.stock == 5
+        assert product.created_at == NOW
+
+    def test_skips_default_factories_and_validation(self):
+        """Não gera UUID nem roda __post_init__ (dado já validado)."""
+        hydrator = RowHydrator(Customer, CustomerModel)
+
+        with patch("src.shared.utils.ids._uuid7_int") as generate_id:
+            customer = hydrator(("123", None, None, "cliente-1", NOW, NOW))
+
+        generate_id.assert_not_called()
+        # Telefone curto passaria pela validação do construtor
+        assert customer.phone_number == "123"
+
+    def test_non_init_fields_are_fresh(self):
+        """Cada sessão ganha seus próprios conjuntos de alterações."""
+        hydrator = RowHydrator(Session, SessionModel)
+
+        first = hydrator(_session_row({}))
+        second = hydrator(_session_row({}))
+        first.set_context("cart", [])
+
+        assert first.is_dirty
+        assert not second.is_dirty
+
+    def test_non_init_plain_defaults_are_set(self):
+        """Campo init=False com default simples também é preenchido."""
+        session = RowHydrator(Session, SessionModel)(_session_row({}))
+
+        assert session.context_replaced is False
+
+    def test_applies_converters(self):
+        """Contexto NULL vira dicionário vazio."""
+        hydrator = RowHydrator(
+            Session,
+            SessionModel,
+            converters={"context": lambda context: context or {}},
+        )
+
+        session = hydrator(_session_row(None))
+
+        assert session.context == {}
+        assert session.state == SessionState.FAQ
+
+
+class TestResult:
+    """Testes de one/all sobre o resultado do execute."""
+
+    def test_one_returns_none_without_row(self):
+        """Resultado vazio vira None."""
+        result = MagicMock()
+        result.first.return_value = None
+
+        assert RowHydrator(Customer, CustomerModel).one(result) is None
+
+    def test_all_hydrates_every_row(self):
+        """Cada linha do resultado vira uma entidade."""
+        rows = [
+            ("5511999999999", None, None, f"cliente-{i}", NOW, NOW)
+            for i in range(3)
+        ]
+
+        customers = RowHydrator(Customer, CustomerModel).all(rows)
+
+        assert [c.id for c in customers] == ["cliente-0", "cliente-1", "cliente-2"]
+
+
+class TestStream:
+    """Testes de stream (cursor do servidor)."""
+
+    @staticmethod
+    def _db(*partitions: list[tuple]) -> tuple[AsyncMock, MagicMock]:
+        """Sessão cujo stream devolve as partições dadas."""
+        async def batches():
+            for rows in partitions:
+                yield rows
+
+        result = MagicMock()
+        result.partitions.return_value = batches()
+        result.close = AsyncMock()
+
+        db = AsyncMock()
+        db.stream.return_value = result
+        return db, result
+
+    @pytest.mark.asyncio
+    async def test_yields_entities_in_batches(self):
+        """Cada lote vira entidades; yield_per = chunk_size."""
+        hydrator = RowHydrator(Customer, CustomerModel)
+        rows = [
+            ("5511999999999", None, None, f"cliente-{i}", NOW, NOW) for i in range(3)
+        ]
+        db, result = self._db(rows[:2], rows[2:])
+
+        customers = [c async for c in hydrator.stream(db, hydrator.select(), 2)]
+
+        assert [c.id for c in customers] == ["cliente-0", "cliente-1", "cliente-2"]
+        assert db.stream.call_args.kwargs["execution_options"] == {"yield_per": 2}
+        result.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_break_closes_cursor(self):
+        """Sair da iteração antes do fim fecha o cursor."""
+        hydrator = RowHydrator(Customer, CustomerModel)
+        row = ("5511999999999", None, None, "cliente-0", NOW, NOW)
+        db, result = self._db([row] * 5)
+
+        stream = hydrator.stream(db, hydrator.select(), 5)
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        result.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_chunk_size_must_be_positive(self):
+        """chunk_size zero: ValueError antes de abrir o cursor."""
+        hydrator = RowHydrator(Customer, CustomerModel)
+        db, _ = self._db()
+
+        with pytest.raises(ValueError, match="chunk_size"):
+            [c async for c in hydrator.stream(db, hydrator.select(), 0)]
+        db.stream.assert_not_called()
@@ -0,0 +1,162 @@
+# ===========================================================
+# tests/unit/infrastructure/database/test_pool.py
+# ===========================================================
+# Testes para o pool de conexões com métricas e para as opções
+# da engine (Settings -> create_async_engine).
+#
+# O pool usa conexões sqlite3 na memória (síncronas): a fila do
+# pool assíncrono só precisa de greenlet_spawn quando ESPERA.
+# ===========================================================
+"""
+Testes unitários para src/infrastructure/database/pool.py
+e engine_options() de connection.py.
+
+Testa:
+- Contadores de checkout, espera e timeouts
+- Estado atual do pool (em uso, overflow, paradas)
+- Contadores sobrevivem ao recreate() (engine.dispose())
+- Espera por conexão no StatementUsage da mensagem
+- Opções da engine, com e sem modo PgBouncer
+"""
+
+import sqlite3
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from src.config.settings import Settings
+from src.infrastructure.database.connection import engine_options
+from src.infrastructure.database.pool import MonitoredQueuePool, PoolStats
+from src.infrastructure.database.query_stats import track_statements
+
+
+def _pool(
+    pool_size: int = 1, max_overflow: int = 1, timeout: float = 0.05
+) -> MonitoredQueuePool:
+    """Pool pequeno de conexões SQLite na memória."""
+    return MonitoredQueuePool(
+        lambda: sqlite3.connect(":memory:"),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        timeout=timeout,
+    )
+
+
+def _settings(**overrides) -> Settings:
+    """Settings mínimas (sem ler .env)."""
+    return Settings(
+        _env_file=None,
+        secret_key="x",
+        database_url="postgresql+asyncpg://u@h/d",
+        **overrides,
+    )
+
+
+class TestPoolStats:
+    """Testes dos contadores."""
+
+    def test_avg_wait_without_checkouts(self):
+        """Sem checkouts: média zero (sem divisão por zero)."""
+        assert PoolStats().avg_wait_ms == 0.0
+
+    def test_as_dict(self):
+        """Contadores arredondados, com a média."""
+        stats = PoolStats(checkouts=4, timeouts=1, wait_ms=10.004, max_wait_ms=7.0)
+
+        assert stats.as_dict() == {
+            "checkouts": 4,
+            "timeouts": 1,
+            "wait_ms": 10.0,
+            "max_wait_ms": 7.0,
+            "avg_wait_ms": 2.5,
+        }
+
+
+class TestMonitoredQueuePool:
+    """Testes do pool com métricas."""
+
+    def test_counts_checkouts_and_gauges(self):
+        """Checkouts contados; em uso e overflow refletem o pool agora."""
+        pool = _pool(pool_size=1, max_overflow=1)
+
+        first, second = pool.connect(), pool.connect()
+        metrics = pool.metrics()
+
+        assert metrics["checkouts"] == 2
+        assert metrics["wait_ms"] >= metrics["max_wait_ms"] > 0
+        assert (metrics["size"], metrics["in_use"], metrics["overflow"]) == (1, 2, 1)
+
+        first.close()
+        second.close()
+        metrics = pool.metrics()
+        assert (metrics["in_use"], metrics["overflow"], metrics["idle"]) == (0, 0, 1)
+
+    def test_overflow_is_never_negative(self):
+        """Pool vazio: overflow 0 (não -pool_size)."""
+        assert _pool(pool_size=3).metrics()["overflow"] == 0
+
+    async def test_timeout_is_counted(self):
+        """Pool esgotado: checkout desiste após o timeout e é contado."""
+        pool = _pool(pool_size=1, max_overflow=0, timeout=0.05)
+        held = pool.connect()
+
+        with pytest.raises(exc.TimeoutError):
+            await greenlet_spawn(pool.connect)
+
+        assert (pool.stats.checkouts, pool.stats.timeouts) == (1, 1)
+        assert pool.stats.max_wait_ms >= 50
+        held.close()
+
+    def test_recreate_keeps_stats(self):
+        """engine.dispose() troca o pool, mas os contadores continuam."""
+        pool = _pool()
+        pool.connect().close()
+
+        new_pool = pool.recreate()
+
+        assert isinstance(new_pool, MonitoredQueuePool)
+        assert new_pool.stats is pool.stats
+        assert new_pool.metrics()["checkouts"] == 1
+
+    def test_wait_goes_to_current_message(self):
+        """Checkout dentro de track_statements() soma pool_wait_ms."""
+        pool = _pool()
+
+        with track_statements() as usage:
+            pool.connect().close()
+
+        assert usage.pool_wait_ms > 0
+        assert usage.statements == 0
+
+
+class TestEngineOptions:
+    """Testes de engine_options()."""
+
+    def test_pool_settings(self):
+        """Parâmetros do pool vêm das Settings."""
+        options = engine_options(_settings(
+            database_pool_size=8,
+            database_pool_max_overflow=2,
+            database_pool_timeout_seconds=1.5,
+            database_pool_recycle_seconds=600,
+            database_pool_pre_ping=False,
+        ))
+
+        assert options["poolclass"] is MonitoredQueuePool
+        assert options["pool_size"] == 8
+        assert options["max_overflow"] == 2
+        assert options["pool_timeout"] == 1.5
+        assert options["pool_recycle"] == 600
+        assert options["pool_pre_ping"] is False
+        assert "connect_args" not in options
+
+    def test_pgbouncer_disables_prepared_statement_caches(self):
+        """Modo PgBouncer: sem caches e com nomes únicos."""
+        options = engine_options(_settings(database_pgbouncer=True))
+        connect_args = options["connect_args"]
+
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        name_func = connect_args["prepared_statement_name_func"]
+        assert name_func() != name_func()
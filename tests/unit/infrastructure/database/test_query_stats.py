@@ -0,0 +1,141 @@
+# ===========================================================
+# tests/unit/infrastructure/database/test_query_stats.py
+# ===========================================================
+# Testes para a contagem de comandos SQL por mensagem.
+#
+# Engine síncrona em SQLite na memória: os eventos da engine
+# são os mesmos da assíncrona (a async usa a sync por baixo).
+# ===========================================================
+"""
+Testes unitários para src/infrastructure/database/query_stats.py.
+
+Testa:
+- Comandos, linhas e tempo dentro de track_statements()
+- Nada é contado fora do bloco
+- Blocos aninhados e tarefas simultâneas não se misturam
+- QueryStats (métricas do processo)
+- Fixture statement_budget
+"""
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+
+from src.infrastructure.database.query_stats import (
+    QueryStats,
+    StatementUsage,
+    instrument_engine,
+    track_statements,
+)
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """SQLite na memória com uma tabela de 3 linhas."""
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (a INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1), (2), (3)"))
+    yield engine
+    engine.dispose()
+
+
+class TestTrackStatements:
+    """Testes de track_statements()."""
+
+    def test_counts_statements_rows_and_time(self, engine: Engine):
+        """Cada comando soma 1; linhas afetadas e tempo também."""
+        with track_statements() as usage, engine.begin() as conn:
+            conn.execute(text("SELECT a FROM t"))
+            conn.execute(text("UPDATE t SET a = a + 1"))
+
+        assert usage.statements == 2
+        assert usage.rows == 3  # SQLite só informa linhas afetadas
+        assert usage.db_ms > 0
+
+    def test_nothing_counted_outside_block(self, engine: Engine):
+        """Comandos fora do bloco não entram em uso nenhum."""
+        with track_statements() as usage:
+            pass
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert usage == StatementUsage()
+
+    def test_nested_block_measures_only_its_part(self, engine: Engine):
+        """O bloco de dentro mede a sua parte; o de fora, o resto."""
+        with engine.connect() as conn:
+            with track_statements() as outer:
+                conn.execute(text("SELECT 1"))
+                with track_statements() as inner:
+                    conn.execute(text("SELECT 2"))
+                conn.execute(text("SELECT 3"))
+
+        assert (outer.statements, inner.statements) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_do_not_mix(self, engine: Engine):
+        """Cada tarefa asyncio (mensagem) vê só o seu uso."""
+
+        async def message(statements: int) -> StatementUsage:
+            with track_statements() as usage:
+                for _ in range(statements):
+                    with engine.connect() as conn:
+                        conn.execute(text("SELECT 1"))
+                    await asyncio.sleep(0)
+            return usage
+
+        first, second = await asyncio.gather(message(2), message(5))
+
+        assert (first.statements, second.statements) == (2, 5)
+
+    def test_instrument_is_idempotent(self, engine: Engine):
+        """Ligar duas vezes não conta cada comando em dobro."""
+        instrument_engine(engine)
+
+        with track_statements() as usage, engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert usage.statements == 1
+
+
+class TestQueryStats:
+    """Testes das métricas do processo."""
+
+    def test_record_sums_messages(self):
+        """Soma, máximo e média por mensagem."""
+        stats = QueryStats()
+        stats.record(StatementUsage(statements=2, rows=1, db_ms=1.5, pool_wait_ms=0.5))
+        stats.record(StatementUsage(statements=6, rows=3, db_ms=2.5))
+
+        assert stats.as_dict() == {
+            "messages": 2,
+            "statements": 8,
+            "rows": 4,
+            "db_ms": 4.0,
+            "pool_wait_ms": 0.5,
+            "max_statements": 6,
+            "avg_statements": 4.0,
+        }
+
+
+class TestStatementBudget:
+    """Testes da fixture statement_budget (tests/conftest.py)."""
+
+    def test_within_budget_passes(self, engine: Engine, statement_budget):
+        """Dentro do orçamento: o bloco devolve o uso medido."""
+        with statement_budget(1) as usage, engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert usage.statements == 1
+
+    def test_over_budget_fails(self, engine: Engine, statement_budget):
+        """Acima do orçamento: o teste falha com a contagem."""
+        expected = "2 comandos SQL, orçamento de 1"
+        with pytest.raises(pytest.fail.Exception, match=expected):
+            with statement_budget(1), engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
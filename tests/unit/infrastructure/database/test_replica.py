@@ -0,0 +1,195 @@
+# ===========================================================
+# tests/unit/infrastructure/database/test_replica.py
+# ===========================================================
+# Testes para o roteamento de leituras (réplica x primário).
+#
+# Dois arquivos SQLite fazem papel de primário e réplica, com
+# dados DIFERENTES: o resultado mostra de onde a leitura veio.
+# Requer aiosqlite (pulado sem ele).
+# ===========================================================
+"""
+Testes unitários para src/infrastructure/database/replica.py.
+
+Testa:
+- Leitura vai para a réplica
+- Turno que escreveu lê do primário (inclusive o não commitado)
+- Réplica atrasada, fora do ar ou com erro: primário
+- count_active do repositório de sessões pela réplica
+"""
+
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import column, select, table, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.infrastructure.database.models import CustomerModel
+from src.infrastructure.database.replica import (
+    ReadReplicaRouter,
+    execute_read,
+    is_pinned,
+)
+from src.infrastructure.database.repositories import SQLAlchemySessionRepository
+
+
+pytest.importorskip("aiosqlite")
+
+# select() e não text(): text() conta como escrita (ver replica.py)
+NAMES = select(column("name")).select_from(table("t")).order_by(column("name"))
+
+
+async def _database(path: Path, names: list[str]) -> AsyncEngine:
+    """Arquivo SQLite com a tabela t(name) e uma tabela sessions mínima."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE t (name TEXT)"))
+        await conn.execute(
+            text("CREATE TABLE sessions (id TEXT PRIMARY KEY, expires_at TIMESTAMP)")
+        )
+        for name in names:
+            await conn.execute(text("INSERT INTO t VALUES (:name)"), {"name": name})
+    return engine
+
+
+@pytest.fixture
+async def primary(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    engine = await _database(tmp_path / "primary.db", ["primario"])
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def replica(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    engine = await _database(tmp_path / "replica.db", ["replica"])
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def router(replica: AsyncEngine) -> ReadReplicaRouter:
+    return ReadReplicaRouter(
+        async_sessionmaker(replica), max_lag_seconds=5, check_seconds=60
+    )
+
+
+async def _names(router: ReadReplicaRouter | None, session: AsyncSession) -> list[str]:
+    result = await execute_read(session, NAMES, router)
+    return list(result.scalars())
+
+
+class TestRouting:
+    """Para onde cada leitura vai."""
+
+    async def test_read_goes_to_replica(self, primary, router):
+        """Turno sem escrita: a leitura vem da réplica."""
+        async with AsyncSession(primary) as session:
+            assert await _names(router, session) == ["replica"]
+
+        assert router.stats.replica_reads == 1
+        assert router.stats.lag_checks == 1
+
+    async def test_without_router_reads_primary(self, primary):
+        """Sem réplica configurada: sessão do turno."""
+        async with AsyncSession(primary) as session:
+            assert await _names(None, session) == ["primario"]
+
+    async def test_turn_that_wrote_reads_own_write(self, primary, router):
+        """Depois de escrever, o turno lê do primário (e vê a escrita não commitada)."""
+        async with AsyncSession(primary) as session:
+            await session.execute(text("INSERT INTO t VALUES ('novo')"))
+
+            assert await _names(router, session) == ["novo", "primario"]
+
+        assert router.stats.pinned_reads == 1
+        assert router.stats.replica_reads == 0
+
+    async def test_pending_orm_object_pins(self, primary):
+        """add() sem flush também prende: a réplica não faria autoflush."""
+        async with AsyncSession(primary) as session:
+            assert not is_pinned(session)
+            session.add(CustomerModel(id="c1", phone_number="5511999999999"))
+
+            assert is_pinned(session)
+
+    async def test_new_turn_is_not_pinned(self, primary, router):
+        """A marca de escrita é da sessão: o turno seguinte volta à réplica."""
+        async with AsyncSession(primary) as session:
+            await session.execute(text("INSERT INTO t VALUES ('novo')"))
+            await session.commit()
+
+        async with AsyncSession(primary) as session:
+            assert await _names(router, session) == ["replica"]
+
+
+class TestFallback:
+    """Réplica atrasada ou com problema: primário."""
+
+    async def test_lagging_replica(self, primary, router, monkeypatch):
+        """Atraso acima do limite: lê do primário."""
+        async def lag(_replica):
+            return 30.0
+
+        monkeypatch.setattr(router, "_lag_seconds", lag)
+
+        async with AsyncSession(primary) as session:
+            assert await _names(router, session) == ["primario"]
+
+        assert router.stats.lag_fallbacks == 1
+        assert router.stats.last_lag_seconds == 30.0
+
+    async def test_unreachable_replica(self, primary, tmp_path):
+        """Réplica que não abre: primário, sem tentar de novo a cada leitura."""
+        broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/nada/replica.db")
+        router = ReadReplicaRouter(async_sessionmaker(broken), check_seconds=60)
+
+        async with AsyncSession(primary) as session:
+            assert await _names(router, session) == ["primario"]
+            assert await _names(router, session) == ["primario"]
+
+        assert router.stats.error_fallbacks == 2
+        assert router.stats.lag_checks == 1
+        await broken.dispose()
+
+    async def test_query_error_on_replica(self, primary, replica, router):
+        """Erro na consulta da réplica: refeita no primário; réplica fica de fora."""
+        async with replica.begin() as conn:
+            await conn.execute(text("DROP TABLE t"))
+
+        async with AsyncSession(primary) as session:
+            assert await _names(router, session) == ["primario"]
+            assert await _names(router, session) == ["primario"]
+
+        assert router.stats.error_fallbacks == 2
+        assert router.stats.replica_reads == 0
+
+    def test_negative_lag_is_rejected(self, replica):
+        """max_lag_seconds negativo não faz sentido."""
+        with pytest.raises(ValueError):
+            ReadReplicaRouter(async_sessionmaker(replica), max_lag_seconds=-1)
+
+
+class TestRepository:
+    """Repositório SQL com réplica."""
+
+    async def test_count_active_reads_replica(self, primary, replica, router):
+        """count_active vem da réplica; depois de escrever, do primário."""
+        tomorrow = datetime.now() + timedelta(days=1)
+        async with replica.begin() as conn:
+            await conn.execute(
+                text("INSERT INTO sessions VALUES ('s1', :at), ('s2', :at)"),
+                {"at": tomorrow.isoformat(" ")},
+            )
+
+        async with AsyncSession(primary) as session:
+            repo = SQLAlchemySessionRepository(session, replica=router)
+            assert await repo.count_active() == 2
+
+            await session.execute(text("DELETE FROM t"))
+            assert await repo.count_active() == 0
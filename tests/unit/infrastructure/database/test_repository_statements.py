@@ -0,0 +1,334 @@
+# ===========================================================
+# tests/unit/infrastructure/database/test_repository_statements.py
+# ===========================================================
+# Quantos comandos SQL cada método de escrita envia ao banco.
+#
+# update() e delete() devem ser UM comando só:
+#   UPDATE ... WHERE id = :id RETURNING id
+#   DELETE ... WHERE id = :id RETURNING id
+# Sem SELECT antes e sem flush depois. "Não encontrado" vem
+# da linha (ausente) do RETURNING.
+# ===========================================================
+"""
+Testes de contagem de comandos dos repositórios SQLAlchemy.
+
+Testa, para cliente, produto, pedido e sessão:
+- update/delete executam exatamente um comando
+- O comando tem RETURNING e filtra pelo ID
+- Nenhuma linha devolvida vira ValueError
+- Contexto da sessão gravado por delta (|| e -)
+"""
+
+import dataclasses
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.entities.customer import Customer
+from src.domain.entities.order import Order
+from src.domain.entities.product import Product
+from src.domain.entities.session import Session
+from src.infrastructure.database.repositories import (
+    SQLAlchemyCustomerRepository,
+    SQLAlchemyOrderRepository,
+    SQLAlchemyProductRepository,
+    SQLAlchemySessionRepository,
+    SessionContextStats,
+)
+from src.shared.types.enums import OrderStatus, SessionState
+
+
+def _db(found: bool = True) -> AsyncMock:
+    """Sessão do banco cujo RETURNING devolve uma linha (ou nenhuma)."""
+    result = MagicMock()
+    result.first.return_value = ("id",) if found else None
+
+    db = AsyncMock()
+    db.execute.return_value = result
+    return db
+
+
+def _dirty_session() -> Session:
+    """Sessão com uma alteração pendente."""
+    session = Session(customer_id="cliente-1")
+    session.mark_clean()
+    session.update_state(SessionState.FAQ)
+    return session
+
+
+# (repositório, método, argumento, tipo do comando, mensagem de erro)
+CASES = [
+    (
+        SQLAlchemyCustomerRepository, "update",
+        lambda: Customer(phone_number="5511999999999"),
+        "UPDATE", "Cliente não encontrado",
+    ),
+    (
+        SQLAlchemyCustomerRepository, "delete",
+        lambda: "cliente-1",
+        "DELETE", "Cliente não encontrado",
+    ),
+    (
+        SQLAlchemyProductRepository, "update",
+        lambda: Product(name="Camiseta", price=Decimal("49.90"), category="roupas"),
+        "UPDATE", "Produto não encontrado",
+    ),
+    (
+        SQLAlchemyProductRepository, "delete",
+        lambda: "produto-1",
+        "DELETE", "Produto não encontrado",
+    ),
+    (
+        SQLAlchemyOrderRepository, "update",
+        lambda: Order(
+            customer_id="cliente-1",
+            total=Decimal("99.90"),
+            status=OrderStatus.SHIPPED,
+        ),
+        "UPDATE", "Pedido não encontrado",
+    ),
+    (
+        SQLAlchemySessionRepository, "update",
+        _dirty_session,
+        "UPDATE", "Sessão não encontrada",
+    ),
+    (
+        SQLAlchemySessionRepository, "delete",
+        lambda: "sessao-1",
+        "DELETE", "Sessão não encontrada",
+    ),
+]
+
+IDS = [f"{repo.__name__}.{method}" for repo, method, *_ in CASES]
+
+
+class TestSingleStatement:
+    """update/delete devem ir ao banco em um único comando."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("repo_class,method,make_arg,kind,error", CASES, ids=IDS)
+    async def test_executes_one_statement(
+        self, repo_class, method, make_arg, kind, error
+    ):
+        """Exatamente um execute, sem SELECT, flush ou delete do ORM."""
+        db = _db(found=True)
+
+        await getattr(repo_class(db), method)(make_arg())
+
+        assert db.execute.call_count == 1
+        db.flush.assert_not_called()
+        db.delete.assert_not_called()
+
+        sql = str(db.execute.call_args.args[0]).upper()
+        assert sql.startswith(kind)
+        assert "RETURNING" in sql
+        assert "SELECT" not in sql
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("repo_class,method,make_arg,kind,error", CASES, ids=IDS)
+    async def test_no_row_raises(self, repo_class, method, make_arg, kind, error):
+        """Nenhuma linha no RETURNING: entidade não existe."""
+        db = _db(found=False)
+
+        with pytest.raises(ValueError, match=error):
+            await getattr(repo_class(db), method)(make_arg())
+
+        assert db.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_clean_session_update_sends_nothing(self):
+        """Sessão sem alterações não gera comando algum."""
+        db = _db()
+        session = Session(customer_id="cliente-1")
+        session.mark_clean()
+
+        await SQLAlchemySessionRepository(db).update(session)
+
+        db.execute.assert_not_called()
+
+
+class TestSessionContextDelta:
+    """Contexto gravado por delta (|| e -) no mesmo UPDATE."""
+
+    @staticmethod
+    def _update(db: AsyncMock):
+        statement = db.execute.call_args.args[0]
+        return statement.compile(dialect=postgresql.dialect())
+
+    @pytest.mark.asyncio
+    async def test_update_sends_only_changed_keys(self):
+        """Só as chaves gravadas/removidas vão no comando, não o contexto inteiro."""
+        db = _db()
+        stats = SessionContextStats()
+        session = Session(
+            customer_id="cliente-1",
+            context={"cart": [1], "search": "x", "history": "y" * 1000},
+        )
+        session.mark_clean()
+        session.set_context("cart", [1, 2])
+        session.remove_context("search")
+
+        await SQLAlchemySessionRepository(db, context_stats=stats).update(session)
+
+        compiled = self._update(db)
+        assert "context=((coalesce(sessions.context," in str(compiled)
+        assert "||" in str(compiled) and ") -" in str(compiled)
+        assert compiled.params["context_set"] == {"cart": [1, 2]}
+        assert compiled.params["context_removed"] == ["search"]
+        assert stats.delta_writes == 1
+        assert (stats.keys_set, stats.keys_removed) == (1, 1)
+        assert stats.delta_bytes < 100 < stats.max_context_bytes == session.context_size
+
+    @pytest.mark.asyncio
+    async def test_same_sql_for_different_keys(self):
+        """Chaves diferentes: mesmo SQL (só os parâmetros mudam)."""
+        sql = []
+        for key in ("cart", "page"):
+            db = _db()
+            session = Session(customer_id="cliente-1")
+            session.set_context(key, 1)
+            await SQLAlchemySessionRepository(db).update(session)
+            sql.append(str(self._update(db)))
+
+        assert sql[0] == sql[1]
+
+    @pytest.mark.asyncio
+    async def test_clear_context_writes_whole_context(self):
+        """clear_context troca o contexto inteiro (sem delta)."""
+        db = _db()
+        stats = SessionContextStats()
+        session = Session(customer_id="cliente-1", context={"cart": [1]})
+        session.clear_context()
+
+        await SQLAlchemySessionRepository(db, context_stats=stats).update(session)
+
+        compiled = self._update(db)
+        assert "coalesce" not in str(compiled)
+        assert compiled.params["context"] == {}
+        assert (stats.full_writes, stats.delta_writes) == (1, 0)
+
+
+class TestSessionGetOrCreate:
+    """Sessão nova: uma sessão ligada por cliente, sem IntegrityError."""
+
+    @staticmethod
+    def _sql(statement) -> str:
+        return str(statement.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_insert_targets_partial_unique_index(self):
+        """Desliga a expirada e insere com ON CONFLICT no índice parcial."""
+        db = _db()
+        db.scalar.return_value = "sessao-1"
+        session = Session(customer_id="cliente-1")
+
+        result, created = await SQLAlchemySessionRepository(db).get_or_create(session)
+
+        assert (result, created) == (session, True)
+        deactivate = self._sql(db.execute.call_args.args[0])
+        assert deactivate.startswith("UPDATE sessions SET")
+        assert "active=" in deactivate
+        assert "expires_at <=" in deactivate
+
+        insert = self._sql(db.scalar.call_args.args[0])
+        assert "ON CONFLICT (customer_id) WHERE active DO NOTHING" in insert
+        assert "RETURNING sessions.id" in insert
+
+    @pytest.mark.asyncio
+    async def test_conflict_returns_active_session(self):
+        """Nada inserido: devolve a sessão ligada (da mensagem vizinha)."""
+        winner = Session(customer_id="cliente-1")
+        db = _db()
+        db.scalar.return_value = None
+        # Linha do SELECT: campos do construtor de Session, em ordem
+        db.execute.return_value.first.return_value = tuple(
+            getattr(winner, f.name) for f in dataclasses.fields(Session) if f.init
+        )
+
+        result, created = await SQLAlchemySessionRepository(db).get_or_create(
+            Session(customer_id="cliente-1")
+        )
+
+        assert created is False
+        assert result.id == winner.id
+        select = self._sql(db.execute.call_args.args[0])
+        assert "sessions.active" in select
+
+    @pytest.mark.asyncio
+    async def test_save_replaces_active_session(self):
+        """save desliga a sessão ligada do cliente antes do INSERT."""
+        db = _db()
+        db.add = MagicMock()
+
+        await SQLAlchemySessionRepository(db).save(Session(customer_id="cliente-1"))
+
+        deactivate = self._sql(db.execute.call_args.args[0])
+        assert deactivate.startswith("UPDATE sessions SET")
+        assert "active=" in deactivate
+        assert "expires_at" not in deactivate
+        db.add.assert_called_once()
+
+
+# (repositório, método, argumento, parâmetros esperados)
+PHONE = "5511999999999"
+
+HOT_READS = [
+    (SQLAlchemyCustomerRepository, "find_by_phone", PHONE, {"phone": PHONE}),
+    (SQLAlchemyCustomerRepository, "find_id_by_phone", PHONE, {"phone": PHONE}),
+    (
+        SQLAlchemySessionRepository,
+        "find_by_customer",
+        "cliente-1",
+        {"customer_id": "cliente-1"},
+    ),
+    (SQLAlchemyOrderRepository, "find_by_id", "pedido-1", {"id": "pedido-1"}),
+    (SQLAlchemyProductRepository, "find_all_active", None, None),
+]
+
+HOT_IDS = [f"{repo.__name__}.{method}" for repo, method, *_ in HOT_READS]
+
+
+class TestPrebuiltStatements:
+    """Buscas de todo turno reutilizam o mesmo comando (valores por parâmetro)."""
+
+    @staticmethod
+    async def _call(repo_class, method, arg) -> tuple:
+        """(comando, parâmetros) enviados ao banco numa chamada."""
+        db = _db()
+        db.execute.return_value.first.return_value = None
+        db.execute.return_value.__iter__.return_value = iter([])
+        db.scalar.return_value = None
+        repo = getattr(repo_class(db), method)
+        await (repo() if arg is None else repo(arg))
+
+        call = db.execute.call_args or db.scalar.call_args
+        params = call.args[1] if len(call.args) > 1 else None
+        return call.args[0], params
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("repo_class,method,arg,expected", HOT_READS, ids=HOT_IDS)
+    async def test_same_statement_object_every_call(
+        self, repo_class, method, arg, expected
+    ):
+        """Duas chamadas: o MESMO objeto de comando; só os valores mudam."""
+        first, first_params = await self._call(repo_class, method, arg)
+        second, _ = await self._call(repo_class, method, arg)
+
+        assert first is second
+        if expected is None:
+            assert first_params is None
+        else:
+            assert expected.items() <= first_params.items()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "repo_class,method,arg,expected", HOT_READS[:-1], ids=HOT_IDS[:-1]
+    )
+    async def test_values_are_not_embedded(self, repo_class, method, arg, expected):
+        """O valor buscado não fica preso no comando (vai em bindparam)."""
+        statement, _ = await self._call(repo_class, method, arg)
+
+        compiled = statement.compile(dialect=postgresql.dialect())
+        assert arg not in compiled.params.values()
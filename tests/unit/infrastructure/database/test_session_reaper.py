@@ -0,0 +1,89 @@
+# ===========================================================
+# tests/unit/infrastructure/database/test_session_reaper.py
+# ===========================================================
+# Testes para o removedor de sessões expiradas.
+#
+# Cada lote abre uma sessão do banco simulada; o resultado do
+# DELETE ... RETURNING é uma lista com N linhas.
+# ===========================================================
+"""
+Testes unitários para ExpiredSessionReaper.
+
+Testa:
+- Lotes até esvaziar (um commit por lote)
+- Contagem via RETURNING
+- Métricas de linhas e latência
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.database.session_reaper import ExpiredSessionReaper
+
+
+def _db_returning(*batch_sizes: int) -> AsyncMock:
+    """Sessão do banco cujo DELETE devolve os tamanhos de lote dados."""
+    results = []
+    for size in batch_sizes:
+        result = MagicMock()
+        result.all.return_value = [(f"id-{i}",) for i in range(size)]
+        results.append(result)
+
+    db = AsyncMock()
+    db.execute.side_effect = results
+    return db
+
+
+def _reaper(db: AsyncMock, batch_size: int = 2) -> ExpiredSessionReaper:
+    """Removedor com fábrica de sessões simulada."""
+
+    @asynccontextmanager
+    async def session_factory():
+        yield db
+
+    return ExpiredSessionReaper(session_factory, batch_size=batch_size, pause_seconds=0)
+
+
+class TestRunOnce:
+    """Testes de uma rodada de limpeza."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_in_batches_until_empty(self):
+        """Lote completo pede outro; lote incompleto encerra a rodada."""
+        db = _db_returning(2, 2, 1)
+        reaper = _reaper(db)
+
+        removed = await reaper.run_once()
+
+        assert removed == 5
+        assert db.execute.call_count == 3
+        assert db.commit.call_count == 3  # uma transação por lote
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_limit_and_returning(self):
+        """O DELETE deve ser limitado, sem bloqueio e com RETURNING."""
+        db = _db_returning(0)
+        reaper = _reaper(db, batch_size=500)
+
+        await reaper.run_once()
+
+        sql = str(db.execute.call_args.args[0]).upper()
+        assert "LIMIT" in sql
+        assert "RETURNING" in sql
+        assert "COUNT" not in sql
+
+    @pytest.mark.asyncio
+    async def test_records_metrics(self):
+        """Métricas devem somar linhas e registrar latência por lote."""
+        db = _db_returning(2, 0)
+        reaper = _reaper(db)
+
+        await reaper.run_once()
+
+        assert reaper.stats.runs == 1
+        assert reaper.stats.batches == 2
+        assert reaper.stats.rows_reaped == 2
+        assert reaper.stats.max_batch_ms >= reaper.stats.last_batch_ms >= 0
+        assert "avg_batch_ms" in reaper.stats.as_dict()
@@ -24,12 +24,16 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from src.domain.entities.customer import Customer
 from src.infrastructure.database.models import CustomerModel
 from src.infrastructure.database.repositories.sqlalchemy_customer_repository import (
+    GET_OR_CREATE_ATTEMPTS,
     SQLAlchemyCustomerRepository,
 )
+from src.shared.utils.ids import new_id
+from src.shared.utils.pagination import decode_cursor, encode_cursor
 
 
 @pytest.fixture
@@ -38,15 +42,14 @@ def mock_session() -> AsyncMock:
     Cria mock da AsyncSession do SQLAlchemy.
     
     Configura comportamento padrão para execute(),
-    scalars(), first(), etc.
+    first(), etc.
     """
     session = AsyncMock()
     
     # Configura cadeia de chamadas:
     # session.execute(query) -> result
-    # result.scalars() -> scalars_result
-    # scalars_result.first() -> model ou None
-    # scalars_result.all() -> [models]
+    # result.first() -> linha (tupla) ou None
+    # iterar o result -> [linhas]
     
     return session
 
@@ -80,6 +83,23 @@ def sample_model() -> CustomerModel:
     )
 
 
+@pytest.fixture
+def sample_row(sample_model: CustomerModel) -> tuple:
+    """
+    Linha do SELECT de colunas (caminho Core).
+    
+    Mesma ordem dos campos do construtor de Customer.
+    """
+    return (
+        sample_model.phone_number,
+        sample_model.name,
+        sample_model.email,
+        sample_model.id,
+        sample_model.created_at,
+        sample_model.updated_at,
+    )
+
+
 class TestFindByPhone:
     """Testes para find_by_phone."""
     
@@ -88,14 +108,12 @@ class TestFindByPhone:
         self,
         repository: SQLAlchemyCustomerRepository,
         mock_session: AsyncMock,
-        sample_model: CustomerModel,
+        sample_row: tuple,
     ):
         """Deve retornar Customer quando encontrado."""
-        # Configura mock para retornar o modelo
+        # Configura mock para retornar a linha
         mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.first.return_value = sample_model
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.first.return_value = sample_row
         mock_session.execute.return_value = mock_result
         
         # Executa
@@ -116,9 +134,7 @@ class TestFindByPhone:
         """Deve retornar None quando não encontrado."""
         # Configura mock para retornar None
         mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.first.return_value = None
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.first.return_value = None
         mock_session.execute.return_value = mock_result
         
         # Executa
@@ -136,9 +152,7 @@ class TestFindByPhone:
         """Deve chamar execute com query correta."""
         # Configura mock
         mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.first.return_value = None
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.first.return_value = None
         mock_session.execute.return_value = mock_result
         
         # Executa
@@ -156,14 +170,12 @@ class TestFindById:
         self,
         repository: SQLAlchemyCustomerRepository,
         mock_session: AsyncMock,
-        sample_model: CustomerModel,
+        sample_row: tuple,
     ):
         """Deve retornar Customer quando encontrado por ID."""
         # Configura mock
         mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.first.return_value = sample_model
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.first.return_value = sample_row
         mock_session.execute.return_value = mock_result
         
         # Executa
@@ -174,6 +186,62 @@ class TestFindById:
         assert result.id == "test-uuid-123"
 
 
+class TestFindPage:
+    """Testes para find_page (keyset por ID)."""
+    
+    @staticmethod
+    def _rows(count: int) -> list[tuple]:
+        ids = sorted(new_id() for _ in range(count))
+        now = datetime.now()
+        return [("5511999999999", None, None, id, now, now) for id in ids]
+    
+    @pytest.mark.asyncio
+    async def test_first_page_with_next_cursor(
+        self,
+        repository: SQLAlchemyCustomerRepository,
+        mock_session: AsyncMock,
+    ):
+        """Pede limit + 1 linhas; a extra vira o cursor da próxima página."""
+        rows = self._rows(3)
+        mock_session.execute.return_value = rows
+        
+        page = await repository.find_page(limit=2)
+        
+        assert [c.id for c in page.items] == [rows[0][3], rows[1][3]]
+        assert decode_cursor(page.next_cursor, str) == [rows[1][3]]
+        sql = str(mock_session.execute.call_args[0][0])
+        assert "ORDER BY customers.id" in sql
+        assert "customers.id >" not in sql
+    
+    @pytest.mark.asyncio
+    async def test_cursor_continues_after_last_id(
+        self,
+        repository: SQLAlchemyCustomerRepository,
+        mock_session: AsyncMock,
+    ):
+        """Com cursor: WHERE id > último; última página sem cursor."""
+        rows = self._rows(1)
+        mock_session.execute.return_value = rows
+        
+        page = await repository.find_page(encode_cursor(new_id()), limit=2)
+        
+        assert len(page.items) == 1
+        assert page.next_cursor is None
+        assert "customers.id >" in str(mock_session.execute.call_args[0][0])
+    
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises(
+        self,
+        repository: SQLAlchemyCustomerRepository,
+        mock_session: AsyncMock,
+    ):
+        """Cursor adulterado: ValueError, sem consultar o banco."""
+        with pytest.raises(ValueError, match="Cursor"):
+            await repository.find_page(encode_cursor("'; DROP TABLE customers"))
+        
+        mock_session.execute.assert_not_called()
+
+
 class TestSave:
     """Testes para save."""
     
@@ -209,40 +277,96 @@ class TestSave:
         mock_session.flush.assert_called_once()
 
 
+class TestGetOrCreate:
+    """Testes para get_or_create (INSERT ... ON CONFLICT DO NOTHING)."""
+    
+    @pytest.mark.asyncio
+    async def test_new_phone_is_inserted(
+        self,
+        repository: SQLAlchemyCustomerRepository,
+        mock_session: AsyncMock,
+        sample_customer: Customer,
+    ):
+        """RETURNING devolveu o id: cliente criado, sem leitura extra."""
+        mock_session.scalar.return_value = sample_customer.id
+        
+        customer, created = await repository.get_or_create(sample_customer)
+        
+        assert (customer, created) == (sample_customer, True)
+        mock_session.execute.assert_not_called()
+        
+        statement = mock_session.scalar.call_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (phone_number) DO NOTHING" in sql
+        assert "RETURNING customers.id" in sql
+    
+    @pytest.mark.asyncio
+    async def test_existing_phone_returns_stored_customer(
+        self,
+        repository: SQLAlchemyCustomerRepository,
+        mock_session: AsyncMock,
+        sample_customer: Customer,
+        sample_row: tuple,
+    ):
+        """Conflito (nada voltou): devolve o cliente já cadastrado."""
+        mock_session.scalar.return_value = None
+        mock_result = MagicMock()
+        mock_result.first.return_value = sample_row
+        mock_session.execute.return_value = mock_result
+        
+        customer, created = await repository.get_or_create(sample_customer)
+        
+        assert created is False
+        assert customer.id == "test-uuid-123"
+    
+    @pytest.mark.asyncio
+    async def test_raises_when_customer_keeps_vanishing(
+        self,
+        repository: SQLAlchemyCustomerRepository,
+        mock_session: AsyncMock,
+        sample_customer: Customer,
+    ):
+        """Conflito sem cliente para ler em todas as tentativas: ValueError."""
+        mock_session.scalar.return_value = None
+        mock_result = MagicMock()
+        mock_result.first.return_value = None
+        mock_session.execute.return_value = mock_result
+        
+        with pytest.raises(ValueError, match="Cliente não pôde ser criado"):
+            await repository.get_or_create(sample_customer)
+        
+        assert mock_session.scalar.await_count == GET_OR_CREATE_ATTEMPTS
+
+
 class TestUpdate:
-    """Testes para update."""
+    """Testes para update (UPDATE ... RETURNING)."""
     
     @pytest.mark.asyncio
     async def test_updates_existing_customer(
         self,
         repository: SQLAlchemyCustomerRepository,
         mock_session: AsyncMock,
-        sample_customer: Customer,
         sample_model: CustomerModel,
     ):
-        """Deve atualizar cliente existente."""
-        # Configura para encontrar o modelo
+        """Deve atualizar cliente existente em um único comando."""
+        # RETURNING devolve a linha atualizada
         mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.first.return_value = sample_model
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.first.return_value = (sample_model.id,)
         mock_session.execute.return_value = mock_result
         
-        # Atualiza o customer
-        sample_customer.name = "Nome Atualizado"
-        
-        # Executa (precisa que o ID seja o mesmo)
-        # Como sample_customer tem ID diferente, criamos um novo
         customer_to_update = Customer(
-            id=sample_model.id,  # Mesmo ID do modelo
+            id=sample_model.id,
             phone_number="5511999999999",
             name="Nome Atualizado",
         )
         
         await repository.update(customer_to_update)
         
-        # Verifica que flush foi chamado
-        mock_session.flush.assert_called_once()
+        # Um único UPDATE, sem SELECT antes e sem flush
+        mock_session.execute.assert_called_once()
+        statement = mock_session.execute.call_args.args[0]
+        assert statement.is_update
+        mock_session.flush.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_raises_error_when_not_found(
@@ -251,12 +375,9 @@ class TestUpdate:
         mock_session: AsyncMock,
         sample_customer: Customer,
     ):
-        """Deve levantar erro quando cliente não existe."""
-        # Configura para retornar None
+        """Deve levantar erro quando nenhuma linha é atualizada."""
         mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.first.return_value = None
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.first.return_value = None
         mock_session.execute.return_value = mock_result
         
         # Executa e espera erro
@@ -265,29 +386,27 @@ class TestUpdate:
 
 
 class TestDelete:
-    """Testes para delete."""
+    """Testes para delete (DELETE ... RETURNING)."""
     
     @pytest.mark.asyncio
     async def test_deletes_existing_customer(
         self,
         repository: SQLAlchemyCustomerRepository,
         mock_session: AsyncMock,
-        sample_model: CustomerModel,
     ):
-        """Deve deletar cliente existente."""
-        # Configura para encontrar
+        """Deve deletar cliente existente em um único comando."""
         mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.first.return_value = sample_model
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.first.return_value = ("test-uuid-123",)
         mock_session.execute.return_value = mock_result
         
         # Executa
         await repository.delete("test-uuid-123")
         
-        # Verifica que delete foi chamado
-        mock_session.delete.assert_called_once_with(sample_model)
-        mock_session.flush.assert_called_once()
+        # Um único DELETE, sem carregar o modelo
+        mock_session.execute.assert_called_once()
+        statement = mock_session.execute.call_args.args[0]
+        assert statement.is_delete
+        mock_session.delete.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_raises_error_when_not_found(
@@ -295,12 +414,9 @@ class TestDelete:
         repository: SQLAlchemyCustomerRepository,
         mock_session: AsyncMock,
     ):
-        """Deve levantar erro quando cliente não existe."""
-        # Configura para retornar None
+        """Deve levantar erro quando nenhuma linha é removida."""
         mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.first.return_value = None
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.first.return_value = None
         mock_session.execute.return_value = mock_result
         
         # Executa e espera erro
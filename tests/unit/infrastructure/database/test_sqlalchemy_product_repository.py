@@ -0,0 +1,227 @@
+# ===========================================================
+# tests/unit/infrastructure/database/test_sqlalchemy_product_repository.py
+# ===========================================================
+# Testes da busca textual do SQLAlchemyProductRepository.
+#
+# O SQL enviado é compilado no dialeto do PostgreSQL (asyncpg)
+# e conferido: full-text search na coluna search_vector, ranking
+# por relevância e paginação. O comportamento real (stemming,
+# índice GIN) é testado em tests/integration/test_query_plans.py.
+# ===========================================================
+"""
+Testes unitários da busca de produtos.
+
+Testa:
+- search usa websearch_to_tsquery na configuração chatbot_pt
+- Ordena por ts_rank_cd e aplica limit/offset
+- Busca aproximada (trigramas) só sem resultados e se ligada
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.database.models import PRODUCT_SEARCH_CONFIG
+from src.infrastructure.database.repositories.sqlalchemy_product_repository import (
+    SQLAlchemyProductRepository,
+)
+
+
+def _row(name: str) -> tuple:
+    """Linha do SELECT de colunas de um produto (ordem dos campos de Product)."""
+    now = datetime.now()
+    return (
+        name, Decimal("10.00"), "Vestuário", None, None, 1, True, "id-" + name, now, now
+    )
+
+
+def _result(rows: list[tuple]) -> MagicMock:
+    """Resultado iterável de um execute()."""
+    result = MagicMock()
+    result.__iter__.return_value = iter(rows)
+    return result
+
+
+def _sql(mock_session: AsyncMock, call: int = 0) -> str:
+    """SQL (PostgreSQL) do n-ésimo execute()."""
+    statement = mock_session.execute.call_args_list[call].args[0]
+    return str(statement.compile(dialect=postgresql.asyncpg.dialect()))
+
+
+@pytest.fixture
+def mock_session() -> AsyncMock:
+    """AsyncSession mockada (sem resultados por padrão)."""
+    session = AsyncMock()
+    session.execute.return_value = _result([])
+    return session
+
+
+class TestSearch:
+    """Testes da busca textual."""
+
+    @pytest.mark.asyncio
+    async def test_uses_full_text_search(self, mock_session: AsyncMock):
+        """Filtra por search_vector @@ websearch_to_tsquery."""
+        await SQLAlchemyProductRepository(mock_session).search("camiseta azul")
+
+        sql = _sql(mock_session)
+        assert "products.search_vector @@ websearch_to_tsquery(" in sql
+        assert "ILIKE" not in sql
+        assert "products.active" in sql
+
+        params = mock_session.execute.call_args.args[0].compile().params
+        assert PRODUCT_SEARCH_CONFIG in params.values()
+        assert "camiseta azul" in params.values()
+
+    @pytest.mark.asyncio
+    async def test_ranks_and_paginates(self, mock_session: AsyncMock):
+        """Ordena por relevância e aplica limit/offset."""
+        repository = SQLAlchemyProductRepository(mock_session)
+        await repository.search("camiseta", limit=5, offset=10)
+
+        sql = _sql(mock_session)
+        assert "ORDER BY ts_rank_cd(products.search_vector" in sql
+        assert "DESC, products.name" in sql
+        assert "LIMIT" in sql and "OFFSET" in sql
+
+        params = mock_session.execute.call_args.args[0].compile().params
+        assert params["param_1"] == 5
+        assert params["param_2"] == 10
+
+    @pytest.mark.asyncio
+    async def test_returns_products_in_result_order(self, mock_session: AsyncMock):
+        """Devolve as entidades na ordem do banco."""
+        mock_session.execute.return_value = _result([_row("Camiseta"), _row("Camisa")])
+
+        products = await SQLAlchemyProductRepository(mock_session).search("camiseta")
+
+        assert [p.name for p in products] == ["Camiseta", "Camisa"]
+
+    @pytest.mark.asyncio
+    async def test_no_fuzzy_fallback_by_default(self, mock_session: AsyncMock):
+        """Sem resultados e sem fuzzy_fallback: um comando só."""
+        products = await SQLAlchemyProductRepository(mock_session).search("camizeta")
+
+        assert products == []
+        assert mock_session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_fallback_when_empty(self, mock_session: AsyncMock):
+        """Sem resultados: tenta nomes parecidos (trigramas)."""
+        mock_session.execute.side_effect = [_result([]), _result([_row("Camiseta")])]
+        repository = SQLAlchemyProductRepository(mock_session, fuzzy_fallback=True)
+
+        products = await repository.search("camizeta")
+
+        assert [p.name for p in products] == ["Camiseta"]
+        sql = _sql(mock_session, call=1)
+        assert "products.name % " in sql
+        assert "ORDER BY similarity(products.name" in sql
+
+    @pytest.mark.asyncio
+    async def test_no_fuzzy_fallback_with_results(self, mock_session: AsyncMock):
+        """Com resultados, a busca aproximada não roda."""
+        mock_session.execute.return_value = _result([_row("Camiseta")])
+        repository = SQLAlchemyProductRepository(mock_session, fuzzy_fallback=True)
+
+        await repository.search("camiseta")
+
+        assert mock_session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_no_fuzzy_fallback_past_first_page(self, mock_session: AsyncMock):
+        """Página vazia além da primeira é fim da lista, não erro de digitação."""
+        repository = SQLAlchemyProductRepository(mock_session, fuzzy_fallback=True)
+
+        await repository.search("camiseta", offset=20)
+
+        assert mock_session.execute.await_count == 1
+
+
+def _returning(rows: list[tuple]) -> MagicMock:
+    """Resultado de um UPDATE ... RETURNING."""
+    result = MagicMock()
+    result.all.return_value = rows
+    result.scalar_one_or_none.return_value = rows[0][0] if rows else None
+    return result
+
+
+class TestReserveStock:
+    """Testes da baixa atômica de estoque."""
+
+    @pytest.mark.asyncio
+    async def test_single_conditional_update(self, mock_session: AsyncMock):
+        """Um comando: UPDATE com a checagem de estoque no WHERE."""
+        mock_session.execute.return_value = _returning([(7,)])
+
+        repository = SQLAlchemyProductRepository(mock_session)
+        remaining = await repository.reserve_stock("p-1", 3)
+
+        assert remaining == 7
+        assert mock_session.execute.await_count == 1
+        sql = _sql(mock_session)
+        assert sql.startswith("UPDATE products SET stock=(products.stock - ")
+        assert "products.stock >= " in sql
+        assert "products.active = true" in sql
+        assert sql.endswith("RETURNING products.stock")
+
+    @pytest.mark.asyncio
+    async def test_returns_none_without_stock(self, mock_session: AsyncMock):
+        """Nenhuma linha atualizada: não reservou."""
+        mock_session.execute.return_value = _returning([])
+
+        repository = SQLAlchemyProductRepository(mock_session)
+        assert await repository.reserve_stock("p-1", 3) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("quantity", [0, -1])
+    async def test_rejects_non_positive_quantity(
+        self, mock_session: AsyncMock, quantity: int
+    ):
+        """Quantidade <= 0 é erro (e não vai ao banco)."""
+        repository = SQLAlchemyProductRepository(mock_session)
+        with pytest.raises(ValueError, match="maior que zero"):
+            await repository.reserve_stock("p-1", quantity)
+
+        mock_session.execute.assert_not_awaited()
+
+
+class TestReserveStockBatch:
+    """Testes da reserva do carrinho inteiro."""
+
+    @pytest.mark.asyncio
+    async def test_single_statement_locks_in_id_order(self, mock_session: AsyncMock):
+        """Um comando; trava as linhas em ordem de ID (sem deadlock)."""
+        mock_session.execute.return_value = _returning([("a", 1), ("b", 4)])
+
+        remaining = await SQLAlchemyProductRepository(mock_session).reserve_stock_batch(
+            {"b": 1, "a": 2}
+        )
+
+        assert remaining == {"a": 1, "b": 4}
+        assert mock_session.execute.await_count == 1
+        sql = _sql(mock_session)
+        assert "ORDER BY products.id FOR UPDATE" in sql
+        assert "UPDATE products SET stock=(products.stock - wanted.quantity)" in sql
+        assert "RETURNING products.id, products.stock" in sql
+
+    @pytest.mark.asyncio
+    async def test_all_or_nothing(self, mock_session: AsyncMock):
+        """Algum item sem estoque: nada atualizado, devolve None."""
+        mock_session.execute.return_value = _returning([])
+
+        remaining = await SQLAlchemyProductRepository(mock_session).reserve_stock_batch(
+            {"a": 1, "b": 99}
+        )
+
+        assert remaining is None
+
+    @pytest.mark.asyncio
+    async def test_empty_cart(self, mock_session: AsyncMock):
+        """Carrinho vazio não vai ao banco."""
+        repository = SQLAlchemyProductRepository(mock_session)
+        assert await repository.reserve_stock_batch({}) == {}
+        mock_session.execute.assert_not_awaited()
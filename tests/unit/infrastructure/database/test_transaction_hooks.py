@@ -0,0 +1,107 @@
+# ===========================================================
+# tests/unit/infrastructure/database/test_transaction_hooks.py
+# ===========================================================
+# Testes para os callbacks de fim de transação.
+#
+# Usa uma sessão real (SQLite em memória): os callbacks dependem
+# dos eventos de commit/rollback do SQLAlchemy.
+# Requer aiosqlite (pulado sem ele).
+# ===========================================================
+"""
+Testes unitários para src/infrastructure/database/transaction_hooks.py.
+
+Testa:
+- COMMIT roda só os callbacks de commit
+- ROLLBACK e fechamento sem commit rodam só os de rollback
+- Callback com erro não impede os seguintes
+- run_soon executa o trabalho assíncrono
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.infrastructure.database.transaction_hooks import (
+    after_commit,
+    after_rollback,
+    run_soon,
+)
+
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    yield engine
+    await engine.dispose()
+
+
+async def _register(db: AsyncSession, calls: list[str]) -> None:
+    """Abre a transação e registra um callback de cada tipo."""
+    await db.execute(text("SELECT 1"))
+    after_commit(db, lambda: calls.append("commit"))
+    after_rollback(db, lambda: calls.append("rollback"))
+
+
+class TestTransactionHooks:
+    """Callbacks chamados conforme o fim da transação."""
+
+    async def test_commit_runs_commit_callbacks(self, engine):
+        """COMMIT: só os de commit, e as listas são esvaziadas."""
+        calls: list[str] = []
+        async with AsyncSession(engine) as db:
+            await _register(db, calls)
+            await db.commit()
+
+            await db.execute(text("SELECT 1"))
+            await db.rollback()
+
+        assert calls == ["commit"]
+
+    async def test_rollback_runs_rollback_callbacks(self, engine):
+        """ROLLBACK: só os de rollback."""
+        calls: list[str] = []
+        async with AsyncSession(engine) as db:
+            await _register(db, calls)
+            await db.rollback()
+
+        assert calls == ["rollback"]
+
+    async def test_close_without_commit_counts_as_rollback(self, engine):
+        """Sessão fechada no meio da transação: callbacks de rollback."""
+        calls: list[str] = []
+        async with AsyncSession(engine) as db:
+            await _register(db, calls)
+
+        assert calls == ["rollback"]
+
+    async def test_failing_callback_does_not_stop_others(self, engine):
+        """Erro em um callback só gera log; os seguintes rodam."""
+        calls: list[str] = []
+
+        def broken() -> None:
+            raise RuntimeError("cache fora")
+
+        async with AsyncSession(engine) as db:
+            await db.execute(text("SELECT 1"))
+            after_commit(db, broken)
+            after_commit(db, lambda: calls.append("depois"))
+            await db.commit()
+
+        assert calls == ["depois"]
+
+    async def test_run_soon_runs_async_work(self):
+        """run_soon agenda a corrotina em uma tarefa de fundo."""
+        done = asyncio.Event()
+
+        async def work() -> None:
+            done.set()
+
+        run_soon(work(), "teste")
+
+        await asyncio.wait_for(done.wait(), 1)
@@ -0,0 +1,430 @@
+# ===========================================================
+# tests/unit/infrastructure/database/test_write_behind_session_repository.py
+# ===========================================================
+# Testes para o write-behind de sessões.
+#
+# A "fábrica de sessões" do banco é simulada: cada flush abre
+# um AsyncMock. O que é gravado (e o que é ignorado) é conferido
+# em um SQLite de verdade (requer aiosqlite; esses testes são
+# pulados sem ele).
+# ===========================================================
+"""
+Testes unitários para SessionWriteBuffer e WriteBehindSessionRepository.
+
+Testa:
+- Coalescência (só a última versão de cada sessão é gravada)
+- Um único comando por lote
+- Leitura da versão pendente
+- Reenfileiramento em caso de erro (até max_attempts)
+- Sessão removida no meio do lote não impede as outras
+- Só entra no buffer após o COMMIT do turno
+- Flush no stop()
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.domain.entities.session import Session
+from src.infrastructure.database.models import SessionModel
+from src.infrastructure.database.repositories.write_behind_session_repository import (
+    SessionWriteBuffer,
+    WriteBehindSessionRepository,
+)
+from src.shared.types.enums import SessionState
+
+
+@pytest.fixture
+def db() -> AsyncMock:
+    """Sessão do banco usada pelos flushes."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def buffer(db: AsyncMock) -> SessionWriteBuffer:
+    """Buffer com fábrica de sessões simulada."""
+
+    @asynccontextmanager
+    async def session_factory():
+        yield db
+
+    return SessionWriteBuffer(session_factory, flush_interval_ms=10_000, max_batch=3)
+
+
+@pytest.fixture
+def inner_repo() -> AsyncMock:
+    """Repositório SQL simulado."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def repository(
+    inner_repo: AsyncMock, buffer: SessionWriteBuffer
+) -> WriteBehindSessionRepository:
+    """Repositório com write-behind."""
+    return WriteBehindSessionRepository(inner_repo, buffer)
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    """SQLite com a tabela sessions (colunas gravadas pelo flush)."""
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE sessions (id CHAR(32) PRIMARY KEY, customer_id CHAR(32), "
+            "state VARCHAR(20), context JSON, created_at TIMESTAMP, "
+            "updated_at TIMESTAMP, expires_at TIMESTAMP, active BOOLEAN)"
+        ))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def stored_buffer(engine: AsyncEngine) -> SessionWriteBuffer:
+    """Buffer que grava no SQLite."""
+    return SessionWriteBuffer(async_sessionmaker(engine), flush_interval_ms=10_000)
+
+
+async def _insert(engine: AsyncEngine, *sessions: Session) -> None:
+    """Grava as sessões no banco, no estado atual."""
+    async with engine.begin() as conn:
+        await conn.execute(insert(SessionModel), [
+            {
+                "id": session.id,
+                "customer_id": session.customer_id,
+                "state": session.state,
+                "context": session.context,
+                "created_at": session.created_at,
+                "updated_at": session.updated_at,
+                "expires_at": session.expires_at,
+                "active": True,
+            }
+            for session in sessions
+        ])
+
+
+async def _stored(engine: AsyncEngine) -> dict[str, tuple]:
+    """id -> (estado, contexto) das sessões no banco."""
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(SessionModel.id, SessionModel.state, SessionModel.context)
+        )
+        return {row.id: (row.state, row.context) for row in result}
+
+
+def _changed_session(customer_id: str = "customer-123") -> Session:
+    """Sessão com alteração pendente."""
+    session = Session(customer_id=customer_id)
+    session.update_state(SessionState.MENU)
+    return session
+
+
+class TestBuffering:
+    """Testes de enfileiramento e gravação em lote."""
+
+    @pytest.mark.asyncio
+    async def test_update_does_not_hit_database(
+        self,
+        repository: WriteBehindSessionRepository,
+        inner_repo: AsyncMock,
+        buffer: SessionWriteBuffer,
+        db: AsyncMock,
+    ):
+        """update() só enfileira e marca a sessão como gravada."""
+        session = _changed_session()
+
+        await repository.update(session)
+
+        assert len(buffer) == 1
+        assert not session.is_dirty
+        inner_repo.update.assert_not_called()
+        db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_only_latest_version_is_written(
+        self,
+        inner_repo: AsyncMock,
+        engine: AsyncEngine,
+        stored_buffer: SessionWriteBuffer,
+    ):
+        """Vários updates da mesma sessão viram uma linha no lote."""
+        session = Session(customer_id="customer-123")
+        other = Session(customer_id="customer-456")
+        await _insert(engine, session, other)
+        repository = WriteBehindSessionRepository(inner_repo, stored_buffer)
+
+        session.update_state(SessionState.MENU)
+        await repository.update(session)
+        session.update_state(SessionState.FAQ)
+        await repository.update(session)
+        other.update_state(SessionState.MENU)
+        await repository.update(other)
+
+        written = await stored_buffer.flush()
+
+        assert written == 2
+        states = {id: state for id, (state, _) in (await _stored(engine)).items()}
+        assert states == {session.id: SessionState.FAQ, other.id: SessionState.MENU}
+        assert stored_buffer.stats.coalesced == 1
+
+    @pytest.mark.asyncio
+    async def test_single_statement_per_batch(
+        self,
+        repository: WriteBehindSessionRepository,
+        buffer: SessionWriteBuffer,
+        db: AsyncMock,
+    ):
+        """O lote inteiro vai em um UPDATE ... FROM VALUES."""
+        await repository.update(_changed_session())
+        await repository.update(_changed_session("customer-456"))
+
+        await buffer.flush()
+
+        db.execute.assert_called_once()
+        db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_buffer_holds_snapshot(
+        self,
+        inner_repo: AsyncMock,
+        engine: AsyncEngine,
+        stored_buffer: SessionWriteBuffer,
+    ):
+        """Alterar a entidade depois do update não muda o que será gravado."""
+        session = Session(customer_id="customer-123")
+        await _insert(engine, session)
+        repository = WriteBehindSessionRepository(inner_repo, stored_buffer)
+
+        session.set_context("cart", ["X1"])
+        await repository.update(session)
+        session.context["cart"].append("X2")
+
+        await stored_buffer.flush()
+
+        assert (await _stored(engine))[session.id][1] == {"cart": ["X1"]}
+
+    @pytest.mark.asyncio
+    async def test_full_batch_triggers_flush(
+        self,
+        repository: WriteBehindSessionRepository,
+        buffer: SessionWriteBuffer,
+        db: AsyncMock,
+    ):
+        """Ao atingir max_batch, a gravação não espera o intervalo."""
+        await buffer.start()
+        try:
+            for index in range(3):
+                await repository.update(_changed_session(f"c{index}"))
+            await asyncio.sleep(0.01)
+
+            assert buffer.stats.flushes == 1
+            assert len(buffer) == 0
+        finally:
+            await buffer.stop()
+
+
+class TestReads:
+    """Testes de leitura com versões pendentes."""
+
+    @pytest.mark.asyncio
+    async def test_read_returns_pending_version(
+        self,
+        repository: WriteBehindSessionRepository,
+        inner_repo: AsyncMock,
+    ):
+        """Busca deve devolver a versão do buffer, não a do banco."""
+        stale = Session(customer_id="customer-123")
+        session = Session(id=stale.id, customer_id="customer-123")
+        session.update_state(SessionState.FAQ)
+        await repository.update(session)
+        inner_repo.find_by_customer.return_value = stale
+
+        found = await repository.find_by_customer("customer-123")
+
+        assert found.state == SessionState.FAQ
+
+    @pytest.mark.asyncio
+    async def test_get_or_create_returns_pending_version(
+        self,
+        repository: WriteBehindSessionRepository,
+        inner_repo: AsyncMock,
+    ):
+        """Sessão ativa que já existia vem com a versão do buffer."""
+        stale = Session(customer_id="customer-123")
+        session = Session(id=stale.id, customer_id="customer-123")
+        session.update_state(SessionState.FAQ)
+        await repository.update(session)
+        inner_repo.get_or_create.return_value = (stale, False)
+
+        found, created = await repository.get_or_create(
+            Session(customer_id="customer-123")
+        )
+
+        assert created is False
+        assert found.state == SessionState.FAQ
+
+
+class TestDurability:
+    """Testes de falha e shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues(
+        self,
+        repository: WriteBehindSessionRepository,
+        buffer: SessionWriteBuffer,
+        db: AsyncMock,
+    ):
+        """Erro no banco devolve as sessões ao buffer para nova tentativa."""
+        db.execute.side_effect = [RuntimeError("banco fora"), None]
+        await repository.update(_changed_session())
+
+        assert await buffer.flush() == 0
+        assert len(buffer) == 1
+        assert buffer.stats.failures == 1
+
+        assert await buffer.flush() == 1
+        assert len(buffer) == 0
+
+    @pytest.mark.asyncio
+    async def test_persistent_failure_is_dropped(
+        self,
+        repository: WriteBehindSessionRepository,
+        db: AsyncMock,
+    ):
+        """Depois de max_attempts falhas, a versão é descartada (não trava o buffer)."""
+        @asynccontextmanager
+        async def session_factory():
+            yield db
+
+        buffer = SessionWriteBuffer(
+            session_factory, flush_interval_ms=10_000, max_attempts=2
+        )
+        repository = WriteBehindSessionRepository(AsyncMock(), buffer)
+        db.execute.side_effect = RuntimeError("erro persistente")
+        await repository.update(_changed_session())
+
+        await buffer.flush()
+        assert len(buffer) == 1
+        await buffer.flush()
+
+        assert len(buffer) == 0
+        assert buffer.stats.dropped == 1
+        assert await buffer.flush() == 0
+        assert buffer.stats.failures == 2
+
+    @pytest.mark.asyncio
+    async def test_deleted_session_does_not_block_batch(
+        self,
+        inner_repo: AsyncMock,
+        engine: AsyncEngine,
+        stored_buffer: SessionWriteBuffer,
+    ):
+        """Sessão removida (ou limpa pelo reaper) antes do flush: o resto é gravado."""
+        gone = Session(customer_id="customer-123")
+        kept = Session(customer_id="customer-456")
+        await _insert(engine, gone, kept)
+        repository = WriteBehindSessionRepository(inner_repo, stored_buffer)
+        for session in (gone, kept):
+            session.update_state(SessionState.FAQ)
+            await repository.update(session)
+
+        async with engine.begin() as conn:
+            await conn.execute(delete(SessionModel).where(SessionModel.id == gone.id))
+
+        assert await stored_buffer.flush() == 2
+        assert len(stored_buffer) == 0
+        assert stored_buffer.stats.failures == 0
+        assert (await _stored(engine)) == {kept.id: (SessionState.FAQ, {})}
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending(
+        self,
+        repository: WriteBehindSessionRepository,
+        buffer: SessionWriteBuffer,
+        db: AsyncMock,
+    ):
+        """Shutdown deve gravar o que estiver pendente."""
+        await buffer.start()
+        await repository.update(_changed_session())
+
+        await buffer.stop()
+
+        db.execute.assert_called_once()
+        assert len(buffer) == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_discards_pending(
+        self,
+        repository: WriteBehindSessionRepository,
+        inner_repo: AsyncMock,
+        buffer: SessionWriteBuffer,
+    ):
+        """Sessão removida não deve ser regravada depois."""
+        session = _changed_session()
+        await repository.update(session)
+
+        await repository.delete(session.id)
+
+        assert len(buffer) == 0
+        inner_repo.delete.assert_called_once_with(session.id)
+
+
+class TestTransaction:
+    """Com a sessão do banco do turno: buffer só no COMMIT."""
+
+    @pytest.fixture
+    async def turn_db(self, engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+        async with AsyncSession(engine) as session:
+            await session.execute(text("SELECT 1"))
+            yield session
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_turn_is_not_buffered(
+        self,
+        inner_repo: AsyncMock,
+        buffer: SessionWriteBuffer,
+        turn_db: AsyncSession,
+    ):
+        """Turno que falhou depois do update não grava nada."""
+        repository = WriteBehindSessionRepository(inner_repo, buffer, db=turn_db)
+        session = _changed_session()
+
+        await repository.update(session)
+        # O próprio turno vê a versão atualizada
+        inner_repo.find_by_id.return_value = Session(
+            id=session.id, customer_id="customer-123"
+        )
+        assert (await repository.find_by_id(session.id)).state == SessionState.MENU
+        assert len(buffer) == 0
+
+        await turn_db.rollback()
+
+        assert len(buffer) == 0
+        assert await buffer.flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_committed_turn_is_buffered(
+        self,
+        inner_repo: AsyncMock,
+        buffer: SessionWriteBuffer,
+        turn_db: AsyncSession,
+    ):
+        """COMMIT do turno: a versão entra no buffer."""
+        repository = WriteBehindSessionRepository(inner_repo, buffer, db=turn_db)
+        session = _changed_session()
+
+        await repository.update(session)
+        await turn_db.commit()
+
+        assert buffer.get(session.id).state == SessionState.MENU
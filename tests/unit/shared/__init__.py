@@ -0,0 +1,2 @@
+# tests/unit/shared/__init__.py
+"""Testes unitários para o módulo shared."""
@@ -0,0 +1,2 @@
+# tests/unit/shared/utils/__init__.py
+"""Testes unitários para funções utilitárias."""
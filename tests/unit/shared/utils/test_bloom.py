@@ -0,0 +1,69 @@
+# ===========================================================
+# tests/unit/shared/utils/test_bloom.py
+# ===========================================================
+# Testes para o filtro de Bloom.
+# ===========================================================
+"""
+Testes unitários para src/shared/utils/bloom.py.
+
+Testa:
+- Nenhum falso negativo
+- Taxa de falso positivo perto da prevista
+- Dimensionamento (bits e funções de hash)
+- Parâmetros inválidos
+"""
+
+import pytest
+
+from src.shared.utils.bloom import BloomFilter
+
+
+def _phones(start: int, count: int) -> list[str]:
+    return [f"5511{i:09d}" for i in range(start, start + count)]
+
+
+class TestMembership:
+    """Testes de add / in."""
+
+    def test_no_false_negatives(self):
+        """Todo item adicionado é encontrado."""
+        bloom = BloomFilter(capacity=10_000)
+        phones = _phones(0, 10_000)
+        for phone in phones:
+            bloom.add(phone)
+
+        assert all(phone in bloom for phone in phones)
+        assert len(bloom) == 10_000
+
+    def test_false_positive_rate_near_target(self):
+        """Na capacidade, ~0,1% de falsos positivos (margem de 3x)."""
+        bloom = BloomFilter(capacity=10_000, error_rate=0.001)
+        for phone in _phones(0, 10_000):
+            bloom.add(phone)
+
+        false_positives = sum(phone in bloom for phone in _phones(10_000, 50_000))
+
+        assert false_positives / 50_000 < 0.003
+
+    def test_empty_filter_contains_nothing(self):
+        """Filtro vazio: nenhum item "talvez" presente."""
+        assert "5511999999999" not in BloomFilter(capacity=100)
+
+
+class TestSizing:
+    """Testes do dimensionamento."""
+
+    def test_million_phones_fit_in_two_megabytes(self):
+        """1 milhão de itens a 0,1%: ~1,8 MB."""
+        bloom = BloomFilter(capacity=1_000_000, error_rate=0.001)
+
+        assert 1_700_000 < bloom.size_bytes < 1_900_000
+
+    @pytest.mark.parametrize(
+        "capacity, error_rate",
+        [(0, 0.01), (100, 0.0), (100, 1.0)],
+    )
+    def test_invalid_parameters_raise(self, capacity: int, error_rate: float):
+        """Capacidade zero ou taxa fora de (0, 1): ValueError."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=capacity, error_rate=error_rate)
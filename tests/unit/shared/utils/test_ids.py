@@ -0,0 +1,78 @@
+# ===========================================================
+# tests/unit/shared/utils/test_ids.py
+# ===========================================================
+# Testes para a geração de IDs UUIDv7.
+# ===========================================================
+"""
+Testes unitários para src/shared/utils/ids.py.
+
+Testa:
+- Formato (UUID válido, versão 7, variante RFC)
+- Ordem: IDs gerados depois são maiores
+- Timestamp embutido
+- Estouro do contador no mesmo milissegundo
+- Limite inferior de faixa por instante
+"""
+
+import time
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from src.shared.utils import ids
+from src.shared.utils.ids import new_id, uuid7, uuid7_floor, uuid7_timestamp
+
+
+class TestFormat:
+    """Testes do formato do ID."""
+
+    def test_new_id_is_canonical_uuid_text(self):
+        """Texto de 36 caracteres, igual ao str() do UUID."""
+        value = new_id()
+
+        assert len(value) == 36
+        assert str(uuid.UUID(value)) == value
+
+    def test_version_and_variant(self):
+        """Versão 7 e variante RFC 9562."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+
+class TestOrdering:
+    """Testes da ordenação por tempo."""
+
+    def test_ids_are_monotonic(self):
+        """Mesmo no mesmo milissegundo, cada ID é maior que o anterior."""
+        values = [new_id() for _ in range(5_000)]
+
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+
+    def test_counter_overflow_advances_timestamp(self):
+        """Contador estourado avança 1 ms em vez de quebrar a ordem."""
+        frozen_ns = 1_700_000_000_000 * 1_000_000
+        with patch.object(ids.time, "time_ns", return_value=frozen_ns):
+            values = [uuid7() for _ in range(5_000)]
+
+        assert values == sorted(values)
+        assert uuid7_timestamp(values[-1]) > uuid7_timestamp(values[0])
+
+    def test_embeds_current_time(self):
+        """O timestamp do ID é o instante da geração."""
+        before = time.time()
+        value = new_id()
+
+        assert abs(uuid7_timestamp(value) - before) < 1
+
+    def test_floor_bounds_ids_of_the_instant(self):
+        """IDs gerados a partir do instante ficam acima do limite."""
+        now = time.time()
+        floor = uuid7_floor(now - 1)
+
+        assert floor < new_id()
+        assert uuid7_floor(now + 60) > new_id()
+        assert uuid7_timestamp(floor) == pytest.approx(now - 1, abs=0.001)
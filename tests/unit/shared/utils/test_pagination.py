@@ -0,0 +1,88 @@
+# ===========================================================
+# tests/unit/shared/utils/test_pagination.py
+# ===========================================================
+# Testes para a paginação por cursor (keyset).
+# ===========================================================
+"""
+Testes unitários para src/shared/utils/pagination.py.
+
+Testa:
+- Linha extra (limit + 1) indica a próxima página
+- Cursor: ida e volta, conversores, adulteração
+- Limites do tamanho de página
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.shared.utils.ids import canonical_id, new_id
+from src.shared.utils.pagination import (
+    MAX_PAGE_SIZE,
+    check_limit,
+    decode_cursor,
+    encode_cursor,
+    page_of,
+)
+
+
+class TestPageOf:
+    """Testes da montagem da página."""
+
+    def test_extra_row_means_next_page(self):
+        """limit + 1 linhas: devolve limit e cursor do último item."""
+        page = page_of([1, 2, 3], 2, lambda n: (str(n),))
+
+        assert page.items == [1, 2]
+        assert decode_cursor(page.next_cursor, int) == [2]
+
+    def test_last_page_has_no_cursor(self):
+        """limit linhas ou menos: última página."""
+        page = page_of([1, 2], 2, lambda n: (str(n),))
+
+        assert page.items == [1, 2]
+        assert page.next_cursor is None
+
+
+class TestCursor:
+    """Testes da codificação do cursor."""
+
+    def test_round_trip_with_converters(self):
+        """Os valores voltam pelos conversores, na ordem."""
+        created_at = datetime(2024, 1, 15, 10, 30, 0, 123456)
+        id = new_id()
+
+        cursor = encode_cursor(created_at.isoformat(), id)
+
+        decoded = decode_cursor(cursor, datetime.fromisoformat, canonical_id)
+        assert decoded == [created_at, id]
+        assert "=" not in cursor
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "não é base64!",
+            encode_cursor("a", "b"),               # quantidade errada
+            encode_cursor("não-é-uuid"),           # conversor recusa
+            "eyJhIjoxfQ",                          # {"a":1}: não é lista
+        ],
+    )
+    def test_invalid_cursor_raises(self, cursor: str):
+        """Cursor adulterado ou de outra listagem: ValueError."""
+        with pytest.raises(ValueError, match="Cursor de paginação inválido"):
+            decode_cursor(cursor, canonical_id)
+
+
+class TestLimit:
+    """Testes do tamanho de página."""
+
+    @pytest.mark.parametrize("limit", [0, -1, MAX_PAGE_SIZE + 1])
+    def test_out_of_range_raises(self, limit: int):
+        """Fora de 1..MAX_PAGE_SIZE: ValueError."""
+        with pytest.raises(ValueError, match="Tamanho de página"):
+            check_limit(limit)
+
+    def test_bounds_are_accepted(self):
+        """1 e MAX_PAGE_SIZE são válidos."""
+        check_limit(1)
+        check_limit(MAX_PAGE_SIZE)